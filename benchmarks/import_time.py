@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+"""
+Measures import time of dfhack_rpc in fresh interpreters.
+
+    python benchmarks/import_time.py --repeat 20
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CASES = [
+    ('import dfhack_rpc', 'import dfhack_rpc'),
+    ('+ RemoteFortressReader', 'import dfhack_rpc; dfhack_rpc.DFHackRPC.get_proto("RemoteFortressReader.BlockList")'),
+    ('+ all plugin modules', 'import dfhack_rpc.proto; dfhack_rpc.proto.load_all()'),
+]
+
+TIMER = '''
+import time
+start = time.perf_counter()
+{}
+print(time.perf_counter() - start)
+'''
+
+
+def measure(statement, repeat):
+    """
+    :return: list of times in seconds, one per fresh interpreter
+    """
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [ROOT, os.environ.get('PYTHONPATH')])))
+    times = []
+    for _ in range(repeat):
+        output = subprocess.check_output([sys.executable, '-c', TIMER.format(statement)], env=env)
+        times.append(float(output))
+    return times
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Measure import time of dfhack_rpc')
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    for name, statement in CASES:
+        times = sorted(measure(statement, args.repeat))
+        print('{:<24} min {:7.1f} ms   median {:7.1f} ms'.format(name, times[0] * 1000, times[len(times) // 2] * 1000))
@@ -1 +1,10 @@
 from .dfhack_rpc import DFHackRPC
+from .reports import ReportTail
+from .batching import CommandBatcher
+from .adventure import AdventureController
+from .cache import ResponseCache
+from .fleet import DFHackFleet
+from .exceptions import RPCError, RPCConnectionError, RPCTimeoutError, RPCReplyFail, MethodNotBound
+from .retry import RetryPolicy
+from .queries import UnitQuery, MaterialQuery
+from .lua_batch import LuaBatch
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+from collections import namedtuple, deque
+
+import logging
+
+_logger = logging.getLogger(__name__)
+
+# menu - AdventureControl.MenuContents, view - RemoteFortressReader.ViewInfo, units - RemoteFortressReader.UnitList
+# results - list of (serialized response, response text) or exception of sent commands,
+# menu, view and units are None if not queried, or the exception if their query failed
+AdventureState = namedtuple('AdventureState', ['menu', 'view', 'units', 'results'])
+
+DEFAULT_STATE_QUERIES = ['MenuQuery', 'GetViewInfo', 'GetUnitList']
+
+# attribute of AdventureState for every supported state query
+STATE_FIELDS = {
+    'MenuQuery': 'menu',
+    'GetViewInfo': 'view',
+    'GetUnitList': 'units',
+}
+
+
+class AdventureController(object):
+    """
+    Adventure mode control loop helper.
+
+    Every step sends the movement command(s) followed by state queries (MenuQuery, GetViewInfo, GetUnitList)
+    with one write, so one step costs one round trip and returns combined state snapshot.
+
+    Moves can also be queued ahead (up to lookahead moves) and sent together by flush.
+
+    Usage:
+
+        adventure = AdventureController(rpc)
+        state = adventure.move(1, 0)
+        print(state.menu.current_menu, state.view.view_pos_x)
+
+        adventure.queue_move(0, 1)
+        adventure.queue_move(0, 1)
+        state = adventure.flush()
+    """
+
+    def __init__(self, rpc, state_queries=None, lookahead=8):
+        """
+        :param rpc: DFHackRPC instance with bound adventure mode methods
+        :param state_queries: methods called after commands, subset of STATE_FIELDS keys
+        :param lookahead: max number of queued moves
+        """
+        self.rpc = rpc
+        self.state_queries = list(DEFAULT_STATE_QUERIES if state_queries is None else state_queries)
+        self.lookahead = lookahead
+        self.queue = deque()
+
+        for method in self.state_queries:
+            if method not in STATE_FIELDS:
+                raise Exception('Unsupported state query "{}"'.format(method))
+
+    def _move_params(self, x, y, z):
+        params = self.rpc.get_proto('AdventureControl.MoveCommandParams')()
+        params.direction.x = x
+        params.direction.y = y
+        params.direction.z = z
+        return params
+
+    def move_command(self, x, y, z=0, jump=False):
+        """
+        :return: (method, data_obj) call of MoveCommand or JumpCommand
+        """
+        return 'JumpCommand' if jump else 'MoveCommand', self._move_params(x, y, z)
+
+    def queue_move(self, x, y, z=0, jump=False):
+        """
+        Adds move to queue, raises exception if the queue is full
+        """
+        if len(self.queue) >= self.lookahead:
+            raise Exception('Move queue is full')
+        self.queue.append(self.move_command(x, y, z, jump))
+
+    def queue_command(self, method, data_obj=None):
+        """
+        Adds any other command (eg. MiscMoveCommand, MovementSelectCommand) to queue
+        """
+        if len(self.queue) >= self.lookahead:
+            raise Exception('Move queue is full')
+        self.queue.append((method, data_obj))
+
+    def execute(self, commands):
+        """
+        Sends commands followed by state queries with one write.
+        Failed calls don't stop the rest of calls and don't discard results of commands which already ran:
+        exceptions of commands are returned in state.results, exceptions of state queries in their state fields.
+        :param commands: list of (method, data_obj) tuples
+        :return: AdventureState
+        """
+        calls = list(commands) + [(method, None) for method in self.state_queries]
+        responses = self.rpc.call_methods_raw(calls, return_exceptions=True)
+
+        command_results = responses[:len(commands)]
+        state = dict.fromkeys(STATE_FIELDS.values())
+        for method, response in zip(self.state_queries, responses[len(commands):]):
+            if isinstance(response, Exception):
+                state[STATE_FIELDS[method]] = response
+                continue
+            resp_obj = self.rpc.get_proto(self.rpc.bound_methods[method]['output_msg'])()
+            resp_obj.ParseFromString(response[0])
+            state[STATE_FIELDS[method]] = resp_obj
+
+        return AdventureState(results=command_results, **state)
+
+    def flush(self):
+        """
+        Sends all queued commands and state queries with one write
+        :return: AdventureState
+        """
+        commands = list(self.queue)
+        self.queue.clear()
+        return self.execute(commands)
+
+    def move(self, x, y, z=0, jump=False):
+        """
+        Sends queued commands, the move and state queries with one write. The move is queued by queue_move,
+        so it raises exception if the queue is full.
+        :return: AdventureState
+        """
+        self.queue_move(x, y, z, jump)
+        return self.flush()
+
+    def jump(self, x, y, z=0):
+        return self.move(x, y, z, jump=True)
+
+    def state(self):
+        """
+        :return: AdventureState without sending any commands
+        """
+        return self.execute([])
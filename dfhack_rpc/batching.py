@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+from .proto import get_enum
+
+from collections import namedtuple
+
+import time
+import logging
+
+_logger = logging.getLogger(__name__)
+
+# result of one sent message, error is None if call succeeded
+BatchResult = namedtuple('BatchResult', ['method', 'designation', 'size', 'error'])
+
+
+class CommandBatcher(object):
+    """
+    Collects dig designations and keyboard events and sends them in batches.
+
+    Dig designations are grouped by TileDigDesignation into large DigCommand messages, keyboard events
+    are sent as separate PassKeyboardEvent messages. All messages of one flush are sent with one write
+    (see DFHackRPC.call_methods), so the whole flush costs one round trip.
+
+    Pending commands are flushed when their count reaches max_size, when the oldest pending command
+    is older than max_age and on leaving the context. There is no timer, max_age is checked only when
+    commands are added or when the caller polls flush_if_due, eg. once per frame of its loop.
+
+    Commands are sent in submission order: a flush is split into runs of dig commands and runs of keyboard
+    events at each change of command kind. Dig commands of one run are grouped by designation, a tile
+    designated several times in a run keeps its last designation.
+
+    Usage:
+
+        with CommandBatcher(rpc) as batcher:
+            for x, y in tiles:
+                batcher.dig(x, y, z)
+            batcher.key(sym=13, type=2)
+        print(batcher.results)
+    """
+
+    def __init__(self, rpc, max_size=50000, max_age=None, max_locations=10000):
+        """
+        :param rpc: DFHackRPC instance with bound SendDigCommand and PassKeyboardEvent methods
+        :param max_size: flush when number of pending locations and keyboard events reaches this
+        :param max_age: flush when oldest pending command is older than this (seconds), None disables;
+            checked only by calls of the batcher, see flush_if_due
+        :param max_locations: max number of locations in one DigCommand message
+        """
+        self.rpc = rpc
+        self.max_size = max_size
+        self.max_age = max_age
+        self.max_locations = max_locations
+
+        self.pending = []  # runs of commands: ('dig', {(x, y, z): designation}) or ('key', [KeyboardEvent])
+        self.pending_size = 0
+        self.pending_since = None
+
+        self.results = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.flush()
+
+    def _get_designation(self, designation):
+        if isinstance(designation, str):
+            enum = get_enum('RemoteFortressReader.TileDigDesignation')
+            return enum.values_by_name[designation].number
+        return designation
+
+    def _added(self, count):
+        if self.pending_since is None:
+            self.pending_since = time.time()
+        self.pending_size += count
+
+        if self.pending_size >= self.max_size:
+            self.flush()
+        else:
+            self.flush_if_due()
+
+    def dig(self, x, y, z, designation='DEFAULT_DIG'):
+        """
+        :param x: local map tile coordinate
+        :param y: local map tile coordinate
+        :param z: local map tile coordinate
+        :param designation: TileDigDesignation value or name
+        """
+        self.dig_many([(x, y, z)], designation)
+
+    def dig_many(self, locations, designation='DEFAULT_DIG'):
+        """
+        :param locations: iterable of (x, y, z) local map tile coordinates
+        :param designation: TileDigDesignation value or name
+        """
+        locations = list(locations)
+        designation = self._get_designation(designation)
+        digs = self._run('dig', dict)
+        for location in locations:
+            location = tuple(location)
+            digs.pop(location, None)
+            digs[location] = designation
+        self._added(len(locations))
+
+    def key(self, event=None, **kwargs):
+        """
+        :param event: RemoteFortressReader.KeyboardEvent, or None to build it from kwargs
+        :param kwargs: KeyboardEvent fields (type, which, state, scancode, sym, mod, unicode)
+        """
+        self.keys([event or self.rpc.get_proto('RemoteFortressReader.KeyboardEvent')(**kwargs)])
+
+    def keys(self, events):
+        """
+        :param events: iterable of RemoteFortressReader.KeyboardEvent, sent in given order
+        """
+        events = list(events)
+        self._run('key', list).extend(events)
+        self._added(len(events))
+
+    def _run(self, kind, factory):
+        """
+        :return: commands of the last pending run if it is of given kind, commands of a new run otherwise
+        """
+        if not self.pending or self.pending[-1][0] != kind:
+            self.pending.append((kind, factory()))
+        return self.pending[-1][1]
+
+    def flush_if_due(self):
+        """
+        Flushes pending commands if the oldest one is older than max_age. Must be polled by the caller
+        to flush commands while no new ones are added.
+        :return: list of BatchResult
+        """
+        if self.max_age is None or self.pending_since is None:
+            return []
+        if time.time() - self.pending_since < self.max_age:
+            return []
+        return self.flush()
+
+    def build_calls(self):
+        """
+        :return: (calls for DFHackRPC.call_methods, list of (method, designation, size))
+        """
+        calls = []
+        info = []
+
+        dig_cls = self.rpc.get_proto('RemoteFortressReader.DigCommand')
+        for kind, commands in self.pending:
+            if kind == 'key':
+                for event in commands:
+                    calls.append(('PassKeyboardEvent', event))
+                    info.append(('PassKeyboardEvent', None, 1))
+                continue
+
+            by_designation = {}
+            for location, designation in commands.items():
+                by_designation.setdefault(designation, []).append(location)
+            for designation in sorted(by_designation):
+                locations = by_designation[designation]
+                for start in range(0, len(locations), self.max_locations):
+                    chunk = locations[start:start + self.max_locations]
+                    dig_obj = dig_cls(designation=designation)
+                    for x, y, z in chunk:
+                        dig_obj.locations.add(x=x, y=y, z=z)
+                    calls.append(('SendDigCommand', dig_obj))
+                    info.append(('SendDigCommand', designation, len(chunk)))
+
+        return calls, info
+
+    def flush(self):
+        """
+        Sends all pending commands with one write
+        :return: list of BatchResult
+        """
+        calls, info = self.build_calls()
+        self.pending = []
+        self.pending_size = 0
+        self.pending_since = None
+
+        if not calls:
+            return []
+
+        _logger.debug('Flushing {} batched messages'.format(len(calls)))
+        responses = self.rpc.call_methods_raw(calls, return_exceptions=True)
+
+        results = []
+        for (method, designation, size), response in zip(info, responses):
+            error = response if isinstance(response, Exception) else None
+            results.append(BatchResult(method, designation, size, error))
+
+        self.results.extend(results)
+        return results
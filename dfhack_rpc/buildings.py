@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+"""
+Index of buildings sent in RemoteFortressReader.MapBlock.buildings.
+
+BuildingInstance is repeated in every block the building overlaps. BuildingIndex keeps one record per
+BuildingInstance.index, decodes room extents once per update and indexes buildings by type and by
+spatial cell (x // 16, y // 16, z), so that queries don't scan blocks:
+
+    index = BuildingIndex()
+    index.update(block_list.map_blocks, complete=True)
+    beds = index.by_type(BED)
+    here = index.at(x, y, z)
+
+Later GetBlockList responses update it with the changed blocks only (index.update(block_list.map_blocks)).
+
+Coordinates are local map tile coordinates, the same as in MapBlock (see map_volume).
+"""
+from .map_volume import BLOCK_SIZE, block_key
+
+from collections import namedtuple
+
+import numpy as np
+import logging
+
+_logger = logging.getLogger(__name__)
+
+# index - BuildingInstance.index, instance - copy of latest BuildingInstance, origin - (x, y) of mask [0, 0],
+# mask - bool array [y, x] of tiles of the building (room extents or the whole bounding box)
+IndexedBuilding = namedtuple('IndexedBuilding', ['index', 'instance', 'origin', 'mask'])
+
+
+def building_type_key(instance):
+    """
+    :return: (building_type, building_subtype, building_custom) of BuildingInstance
+    """
+    building_type = instance.building_type
+    return building_type.building_type, building_type.building_subtype, building_type.building_custom
+
+
+def decode_extents(extents):
+    """
+    :param extents: RemoteFortressReader.BuildingExtents
+    :return: array [y, x] of df.building_extents_type values, flattened extents are stored row by row
+    """
+    values = np.array(extents.extents[:], dtype=np.int8)
+    if len(values) != extents.width * extents.height:
+        raise Exception('Building extents have {} values, expected {}x{}'.format(
+            len(values), extents.width, extents.height))
+    return values.reshape(extents.height, extents.width)
+
+
+def building_mask(instance):
+    """
+    :param instance: RemoteFortressReader.BuildingInstance
+    :return: ((x, y) origin, bool array [y, x]), room extents if building has them, bounding box otherwise
+    """
+    if instance.HasField('room') and instance.room.width and instance.room.height:
+        return (instance.room.pos_x, instance.room.pos_y), decode_extents(instance.room) != 0
+    shape = (instance.pos_y_max - instance.pos_y_min + 1, instance.pos_x_max - instance.pos_x_min + 1)
+    return (instance.pos_x_min, instance.pos_y_min), np.ones(shape, dtype=np.bool_)
+
+
+def building_cells(instance):
+    """
+    :return: list of spatial cells (x // 16, y // 16, z) overlapped by bounding box of building
+    """
+    return [
+        (x, y, z)
+        for z in range(instance.pos_z_min, instance.pos_z_max + 1)
+        for y in range(instance.pos_y_min // BLOCK_SIZE, instance.pos_y_max // BLOCK_SIZE + 1)
+        for x in range(instance.pos_x_min // BLOCK_SIZE, instance.pos_x_max // BLOCK_SIZE + 1)
+    ]
+
+
+class BuildingIndex(object):
+    """
+    Buildings deduplicated by index, with type and spatial cell indexes
+    """
+
+    def __init__(self):
+        self.buildings = {}  # {index: IndexedBuilding}
+        self.types = {}  # {(type, subtype, custom): set of indices}
+        self.cells = {}  # {(cell x, cell y, z): set of indices}
+        self.block_buildings = {}  # {block key: set of indices sent in the block}
+        self.building_blocks = {}  # {index: set of block keys}
+
+    def __len__(self):
+        return len(self.buildings)
+
+    def __contains__(self, index):
+        return index in self.buildings
+
+    def __iter__(self):
+        return iter(self.buildings.values())
+
+    def get(self, index):
+        """
+        :return: IndexedBuilding or None
+        """
+        return self.buildings.get(index)
+
+    def _add(self, instance):
+        # with upb and cpp protobuf backends sub-message keeps the whole response alive, the copy doesn't
+        copy = type(instance)()
+        copy.CopyFrom(instance)
+        instance = copy
+
+        self._remove(instance.index)
+        origin, mask = building_mask(instance)
+        self.buildings[instance.index] = IndexedBuilding(instance.index, instance, origin, mask)
+        self.types.setdefault(building_type_key(instance), set()).add(instance.index)
+        for cell in building_cells(instance):
+            self.cells.setdefault(cell, set()).add(instance.index)
+
+    def _remove(self, index):
+        building = self.buildings.pop(index, None)
+        if building is None:
+            return
+        type_key = building_type_key(building.instance)
+        self.types[type_key].discard(index)
+        if not self.types[type_key]:
+            del self.types[type_key]
+        for cell in building_cells(building.instance):
+            self.cells[cell].discard(index)
+            if not self.cells[cell]:
+                del self.cells[cell]
+
+    def update(self, blocks, complete=False):
+        """
+        Updates index from blocks. Building list of a block replaces buildings previously sent in the block,
+        buildings not sent in any block anymore are removed.
+
+        RemoteFortressReader sends buildings of a block only when they changed, a block sent because of tile
+        changes has empty building list and is skipped. Blocks with empty list clear their buildings only
+        when complete is set, eg. when blocks were requested after ResetMapHashes.
+
+        :param blocks: iterable of RemoteFortressReader.MapBlock
+        :param complete: blocks contain complete building lists
+        :return: set of indices of added, changed or removed buildings
+        """
+        changed = set()
+        seen = set()
+        for block in blocks:
+            if not len(block.buildings) and not complete:
+                continue
+            key = block_key(block)
+            indices = set()
+            for instance in block.buildings:
+                indices.add(instance.index)
+                if instance.index in seen:
+                    continue
+                seen.add(instance.index)
+                current = self.buildings.get(instance.index)
+                if current is None or current.instance != instance:
+                    self._add(instance)
+                    changed.add(instance.index)
+
+            for index in self.block_buildings.get(key, set()) - indices:
+                blocks_of_building = self.building_blocks[index]
+                blocks_of_building.discard(key)
+                if not blocks_of_building:
+                    del self.building_blocks[index]
+                    self._remove(index)
+                    changed.add(index)
+            for index in indices:
+                self.building_blocks.setdefault(index, set()).add(key)
+            if indices:
+                self.block_buildings[key] = indices
+            else:
+                self.block_buildings.pop(key, None)
+
+        if changed:
+            _logger.debug('{} buildings changed, {} indexed'.format(len(changed), len(self.buildings)))
+        return changed
+
+    def clear(self):
+        self.__init__()
+
+    def by_type(self, building_type, subtype=None, custom=None):
+        """
+        :param building_type: df.building_type value
+        :param subtype: building subtype, any if None
+        :param custom: building custom type, any if None
+        :return: list of IndexedBuilding
+        """
+        return [
+            self.buildings[index]
+            for (type_value, subtype_value, custom_value), indices in self.types.items()
+            if type_value == building_type
+            and (subtype is None or subtype_value == subtype)
+            and (custom is None or custom_value == custom)
+            for index in sorted(indices)
+        ]
+
+    def contains(self, index, x, y, z):
+        """
+        :return: True if tile is in extents (or bounding box) of building
+        """
+        building = self.buildings[index]
+        instance = building.instance
+        if not instance.pos_z_min <= z <= instance.pos_z_max:
+            return False
+        mask_x, mask_y = x - building.origin[0], y - building.origin[1]
+        if not (0 <= mask_y < building.mask.shape[0] and 0 <= mask_x < building.mask.shape[1]):
+            return False
+        return bool(building.mask[mask_y, mask_x])
+
+    def at(self, x, y, z):
+        """
+        :return: list of IndexedBuilding containing the tile, eg. a bed and the bedroom around it
+        """
+        indices = self.cells.get((x // BLOCK_SIZE, y // BLOCK_SIZE, z), ())
+        return [self.buildings[index] for index in sorted(indices) if self.contains(index, x, y, z)]
+
+    def in_box(self, min_x, min_y, min_z, max_x, max_y, max_z):
+        """
+        :return: list of IndexedBuilding with bounding box overlapping the box (inclusive bounds)
+        """
+        indices = set()
+        for z in range(min_z, max_z + 1):
+            for y in range(min_y // BLOCK_SIZE, max_y // BLOCK_SIZE + 1):
+                for x in range(min_x // BLOCK_SIZE, max_x // BLOCK_SIZE + 1):
+                    indices.update(self.cells.get((x, y, z), ()))
+
+        buildings = []
+        for index in sorted(indices):
+            instance = self.buildings[index].instance
+            if (instance.pos_x_min <= max_x and instance.pos_x_max >= min_x
+                    and instance.pos_y_min <= max_y and instance.pos_y_max >= min_y
+                    and instance.pos_z_min <= max_z and instance.pos_z_max >= min_z):
+                buildings.append(self.buildings[index])
+        return buildings
+
+    def rooms(self):
+        """
+        :return: list of IndexedBuilding which are rooms (is_room set)
+        """
+        return [building for _, building in sorted(self.buildings.items()) if building.instance.is_room]
+
+    def rooms_at(self, x, y, z):
+        """
+        :return: list of rooms containing the tile
+        """
+        return [building for building in self.at(x, y, z) if building.instance.is_room]
+
+    def footprint(self, shape, origin=(0, 0, 0), indices=None):
+        """
+        :param shape: (z, y, x) shape of volume
+        :param origin: (x, y, z) map coordinates of volume [0, 0, 0]
+        :param indices: building indices, all buildings if None
+        :return: int32 array [z, y, x] of building index covering tile (the last one if several do), -1 if none
+        """
+        volume = np.full(shape, -1, dtype=np.int32)
+        for index in (sorted(self.buildings) if indices is None else indices):
+            building = self.buildings[index]
+            instance = building.instance
+            x0, y0 = building.origin[0] - origin[0], building.origin[1] - origin[1]
+            height, width = building.mask.shape
+            y_min, y_max = max(y0, 0), min(y0 + height, shape[1])
+            x_min, x_max = max(x0, 0), min(x0 + width, shape[2])
+            if y_min >= y_max or x_min >= x_max:
+                continue
+            mask = building.mask[y_min - y0:y_max - y0, x_min - x0:x_max - x0]
+            for z in range(max(instance.pos_z_min - origin[2], 0), min(instance.pos_z_max - origin[2] + 1, shape[0])):
+                volume[z, y_min:y_max, x_min:x_max][mask] = index
+        return volume
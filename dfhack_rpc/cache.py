@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+"""
+Cache of responses of methods returning static data.
+
+Cache policy of method is one of:
+
+    'connection' - response is valid until the connection which received it is (re)opened, DF could have been
+        restarted in the meantime (versions, enums). Responses are cached separately for every connection.
+    'save' - response is valid until save changes (raws, material and tiletype lists). Responses are shared
+        by all connections and dropped only when ResponseCache.set_save gets another save (eg. from polling
+        GetWorldInfo().save_dir), reconnecting doesn't drop them
+    number - response is valid for given number of seconds
+
+Responses are keyed on method name and serialized request (and connection key for 'connection' policy,
+see DFHackRPC.connection_key). One cache can be shared by several DFHackRPC
+connections to the same DF:
+
+    cache = ResponseCache()
+    rpc = DFHackRPC(cache=cache)
+
+Cached response objects are shared by all callers, they must not be modified.
+"""
+from collections import OrderedDict
+
+import threading
+import time
+import logging
+
+_logger = logging.getLogger(__name__)
+
+CONNECTION = 'connection'
+SAVE = 'save'
+
+DEFAULT_POLICIES = {
+    'GetVersion': CONNECTION,
+    'GetDFVersion': CONNECTION,
+    'GetVersionInfo': CONNECTION,
+    'ListEnums': CONNECTION,
+    'ListJobSkills': CONNECTION,
+    'GetTiletypeList': SAVE,
+    'GetMaterialList': SAVE,
+    'GetBuildingDefList': SAVE,
+    'GetLanguage': SAVE,
+    'GetCreatureRaws': SAVE,
+    'GetPlantRaws': SAVE,
+    'GetItemList': SAVE,
+}
+
+
+class CacheEntry(object):
+    __slots__ = ['policy', 'expires', 'raw', 'parsed']
+
+    def __init__(self, policy, expires, raw):
+        self.policy = policy
+        self.expires = expires
+        self.raw = raw  # (serialized response, response text)
+        self.parsed = None  # (resp_obj, resp_text)
+
+
+class ResponseCache(object):
+    """
+    LRU cache of method responses with per-method policies, thread safe
+    """
+
+    def __init__(self, policies=None, max_entries=1024, clock=time.monotonic):
+        """
+        :param policies: {method: policy}, DEFAULT_POLICIES if None, methods without policy are not cached
+        :param max_entries: max number of cached responses, least recently used are dropped first
+        :param clock: time source of TTL policies
+        """
+        self.policies = dict(DEFAULT_POLICIES if policies is None else policies)
+        self.max_entries = max_entries
+        self.clock = clock
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()  # {(method, request, connection key or None): CacheEntry}
+        self.save = None
+        self.hits = 0
+        self.misses = 0
+
+        for method, policy in self.policies.items():
+            if policy not in (CONNECTION, SAVE) and not isinstance(policy, (int, float)):
+                raise Exception('Invalid cache policy "{}" of method "{}"'.format(policy, method))
+
+    def cacheable(self, method):
+        return method in self.policies
+
+    def set_policy(self, method, policy):
+        """
+        :param policy: 'connection', 'save', TTL in seconds or None to stop caching method
+        """
+        if policy is None:
+            self.policies.pop(method, None)
+            self.invalidate(method)
+        else:
+            self.policies[method] = policy
+
+    def _key(self, method, request, connection):
+        return method, request, connection if self.policies.get(method) == CONNECTION else None
+
+    def _get(self, method, request, connection):
+        key = self._key(method, request, connection)
+        entry = self.entries.get(key)
+        if entry is not None and entry.expires is not None and entry.expires <= self.clock():
+            del self.entries[key]
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def get(self, method, request, connection=None):
+        """
+        :param request: serialized request
+        :param connection: key of connection asking, see DFHackRPC.connection_key
+        :return: (serialized response, response text) or None
+        """
+        with self.lock:
+            entry = self._get(method, request, connection)
+            return entry and entry.raw
+
+    def get_parsed(self, method, request, connection=None):
+        """
+        :return: (resp_obj, resp_text), (serialized response, response text) if the response wasn't parsed yet,
+            or None
+        """
+        with self.lock:
+            entry = self._get(method, request, connection)
+            return entry and (entry.parsed or entry.raw)
+
+    def put(self, method, request, raw, parsed=None, connection=None):
+        """
+        :param request: serialized request
+        :param raw: (serialized response, response text)
+        :param parsed: (resp_obj, resp_text)
+        :param connection: key of connection which received the response
+        """
+        policy = self.policies.get(method)
+        if policy is None:
+            return
+        expires = None if policy in (CONNECTION, SAVE) else self.clock() + policy
+
+        with self.lock:
+            key = self._key(method, request, connection)
+            entry = self.entries.get(key)
+            if entry is None or entry.raw[0] != raw[0]:
+                entry = self.entries[key] = CacheEntry(policy, expires, raw)
+            entry.parsed = parsed or entry.parsed
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def invalidate(self, method=None, request=None, policy=None, connection=None):
+        """
+        Drops cached responses, all of them if called without arguments
+        :param method: drop only responses of this method
+        :param request: drop only response of this serialized request (method must be given)
+        :param policy: drop only responses cached with this policy
+        :param connection: drop only responses of this connection ('connection' policy)
+        """
+        with self.lock:
+            for key in list(self.entries):
+                if method is not None and key[0] != method:
+                    continue
+                if request is not None and key[1] != request:
+                    continue
+                if policy is not None and self.entries[key].policy != policy:
+                    continue
+                if connection is not None and key[2] != connection:
+                    continue
+                del self.entries[key]
+
+    def connection_opened(self, connection=None):
+        """
+        Called by DFHackRPC.open_connection, drops responses with 'connection' policy of the connection.
+        Responses with 'save' policy are kept for other connections sharing the cache, see set_save.
+        :param connection: key of opened connection, responses of all connections are dropped if None
+        """
+        self.invalidate(policy=CONNECTION, connection=connection)
+
+    def set_save(self, save):
+        """
+        Drops responses with 'save' policy if save differs from the last one
+        :param save: any identifier of loaded save, eg. GetMapInfo().save_name or GetWorldInfo().save_dir
+        """
+        with self.lock:
+            changed = save != self.save
+            self.save = save
+        if changed:
+            _logger.debug('Save changed to "{}"'.format(save))
+            self.invalidate(policy=SAVE)
+
+    def stats(self):
+        with self.lock:
+            return {'entries': len(self.entries), 'hits': self.hits, 'misses': self.misses}
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+"""
+Coalescing of identical concurrent calls.
+
+When several threads call the same method with the same serialized input while the first call is still
+waiting for DFHack, only the first one sends the request, the others wait for its result.
+All of them get the same response object, which must not be modified.
+
+Only read-only methods are coalesced (retry.IDEMPOTENT_METHODS, or the given methods), concurrent commands
+like PassKeyboardEvent or SendDigCommand are all sent:
+
+    rpc = DFHackRPC(coalesce=True)
+    rpc = DFHackRPC(coalesce=['GetUnitList', 'GetViewInfo'])
+"""
+from concurrent.futures import Future
+
+import threading
+import logging
+
+_logger = logging.getLogger(__name__)
+
+
+class SingleFlight(object):
+    """
+    Runs at most one function call per key at a time, concurrent callers with the same key share its result
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.flights = {}  # {key: Future}
+        self.calls = 0
+        self.shared = 0
+
+    def do(self, key, func):
+        """
+        :param key: hashable call identifier
+        :param func: function without arguments
+        :return: result of func, or of the same key call which was already running
+        """
+        with self.lock:
+            self.calls += 1
+            flight = self.flights.get(key)
+            leader = False
+            if flight is not None:
+                self.shared += 1
+            else:
+                flight = self.flights[key] = Future()
+                leader = True
+                flight.set_running_or_notify_cancel()
+
+        if not leader:
+            return flight.result()
+
+        try:
+            result = func()
+        except BaseException as e:
+            self._land(key)
+            flight.set_exception(e)
+            raise
+        self._land(key)
+        flight.set_result(result)
+        return result
+
+    def _land(self, key):
+        # calls started after this get a new flight
+        with self.lock:
+            del self.flights[key]
+
+    def stats(self):
+        """
+        :return: {'calls': all calls, 'shared': calls which got result of another call}
+        """
+        with self.lock:
+            return {'calls': self.calls, 'shared': self.shared}
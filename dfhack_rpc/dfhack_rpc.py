@@ -1,9 +1,17 @@
 #!/usr/bin/env python3
 # encoding: utf-8
-from .proto import proto_db
+from .proto import get_proto, backend as proto_backend
 from .default_methods import DEFAULT_METHODS
-
+from .tracing import CallTrace, StatsHook
+from .coalescing import SingleFlight
+from .retry import IDEMPOTENT_METHODS
+from .suspend import SuspendedBatch, SUSPEND_METHODS
+from .exceptions import RPCConnectionError, RPCTimeoutError, MethodNotBound, ProtocolError, reply_fail
+
+import contextlib
+import itertools
 import socket
+import threading
 import struct
 import time
 import json
@@ -12,6 +20,12 @@ import logging
 
 _logger = logging.getLogger(__name__)
 
+# keys of DFHackRPC instances in shared response cache
+_connection_keys = itertools.count()
+
+# methods with ids reserved by protocol, they are never bound
+RESERVED_METHODS = set(method for method, _, _, _, assigned_id in DEFAULT_METHODS if assigned_id is not None)
+
 
 class DFHackRPC(object):
     """
@@ -19,7 +33,7 @@ class DFHackRPC(object):
 
         open_connection, close_connection,
         bind_method, bind_all_methods,
-        call_method, call_method_dict, run_command
+        call_method, call_method_async, call_method_dict, call_methods, suspended, run_command
 
     If you are getting "In RPC server: I/O error in receive header." messages in DFHack,
     check that you didn't forget to close API connection with dfhack_rpc.close_connection().
@@ -63,20 +77,49 @@ class DFHackRPC(object):
     """
 
     def __init__(self, dfhack_host='localhost', dfhack_port=5000, sock_timeout=0.000000001, sock_buff_size=10000,
-                 response_timeout=5):
+                 response_timeout=5, recorder=None, collect_stats=True, cache=None,
+                 coalesce=False, retry=None):
         """
         :param dfhack_host: Address of computer running DF
         :param dfhack_port: DFHack API port
         :param sock_timeout: Max time between reads from socket
         :param sock_buff_size:
         :param response_timeout: How long we will wait for data from DFHack API before raising exception
+        :param recorder: replay.SessionRecorder, records all method calls (same as add_hook(recorder))
+        :param collect_stats: collect per-method statistics returned by stats()
+        :param cache: cache.ResponseCache of static responses, can be shared by several connections
+        :param coalesce: identical concurrent call_method calls of read-only methods share one request,
+            see coalescing. True coalesces retry.IDEMPOTENT_METHODS, or give an iterable of method names.
+            Calls of other methods (commands) are always sent.
+        :param retry: retry.RetryPolicy, calls of idempotent methods interrupted by broken connection are retried
+            after reconnect, see retry
         """
         self.dfhack_host = dfhack_host
         self.dfhack_port = dfhack_port
         self.sock = None
+        self.recv_buffer = bytearray()
         self.sock_timeout = sock_timeout
         self.sock_buff_size = sock_buff_size
         self.response_timeout = response_timeout
+        self.cache = cache
+        self.connection_key = next(_connection_keys)  # key of 'connection' policy responses in cache
+        self.single_flight = SingleFlight() if coalesce else None
+        self.coalesced_methods = IDEMPOTENT_METHODS if coalesce is True else frozenset(coalesce or ())
+        self.retry = retry
+        self.rebind_needed = False  # connection was dropped, bound methods have to be bound again
+        self.connection_number = 0  # number of opened connections, see suspend.SuspendedBatch
+
+        # socket is used by one thread at a time
+        self.lock = threading.RLock()
+
+        # call hooks, see tracing
+        self.hooks = []
+        self.stats_hook = None
+        if collect_stats:
+            self.stats_hook = StatsHook()
+            self.add_hook(self.stats_hook)
+        if recorder:
+            self.add_hook(recorder)
 
         # bound methods
         self.bound_methods = {}
@@ -92,30 +135,100 @@ class DFHackRPC(object):
     # API calls
 
     def open_connection(self):
-        _logger.info('Opening connection')
-        if self.sock:
-            _logger.debug('Connection already opened')
-            return
-
-        self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self.sock.connect((self.dfhack_host, self.dfhack_port))
+        _logger.info('Opening connection (protobuf backend: {})'.format(proto_backend()))
+        with self.lock:
+            if self.sock:
+                _logger.debug('Connection already opened')
+                return
 
-        assert self.sock_timeout > 0
-        self.sock.settimeout(self.sock_timeout)
-
-        # handshake
-        resp = self.rpc_call(self.build_handshake())
-        self.parse_handshake(resp)  # raises exception if any problems
+            self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            try:
+                self.sock.connect((self.dfhack_host, self.dfhack_port))
+
+                assert self.sock_timeout > 0
+                self.sock.settimeout(self.sock_timeout)
+
+                # handshake, read exactly its 12 bytes, so closed or silent peer ends in response_timeout
+                self.recv_buffer = bytearray()
+                self.sock.sendall(self.build_handshake())
+                self.parse_handshake(self.rpc_recv(12))  # raises exception if any problems
+            except (OSError, RPCConnectionError) as e:
+                # next call will try to connect again
+                self.sock.close()
+                self.sock = None
+                raise RPCConnectionError('Connecting to {}:{} failed: {}'.format(self.dfhack_host, self.dfhack_port, e))
+            except BaseException:
+                self.sock.close()
+                self.sock = None
+                raise
+            self.connection_number += 1
+
+        if self.cache is not None:
+            self.cache.connection_opened(self.connection_key)
 
     def close_connection(self):
         _logger.info('Closing connection')
-        if not self.sock:
-            _logger.debug('Connection already closed')
-            return
+        with self.lock:
+            if not self.sock:
+                _logger.debug('Connection already closed')
+                return
 
-        self.sock.sendall(self.build_message(b'', -4))
-        self.sock.close()
-        self.sock = None
+            try:
+                self.sock.sendall(self.build_message(b'', -4))
+            except OSError:
+                pass
+            self.sock.close()
+            self.sock = None
+            self.recv_buffer = bytearray()
+
+    def drop_connection(self):
+        """
+        Closes broken connection without quit message. Methods bound in it are bound again when connection
+        is opened by the next call.
+        """
+        _logger.warning('Dropping connection to {}:{}'.format(self.dfhack_host, self.dfhack_port))
+        with self.lock:
+            if self.sock:
+                try:
+                    self.sock.close()
+                except OSError:
+                    pass
+            self.sock = None
+            self.recv_buffer = bytearray()
+            self.rebind_needed = any(
+                info['assigned_id'] is not None
+                for method, info in self.bound_methods.items() if method not in RESERVED_METHODS
+            )
+
+    def ensure_connection(self):
+        """
+        Opens connection if it's closed and binds again methods bound in dropped connection (with one write)
+        """
+        with self.lock:
+            if not self.sock:
+                self.open_connection()
+            if self.rebind_needed:
+                self.rebind_needed = False
+                methods = [
+                    (method, info['input_msg'], info['output_msg'], info['plugin'])
+                    for method, info in self.bound_methods.items()
+                    if method not in RESERVED_METHODS and info['assigned_id'] is not None
+                ]
+                _logger.info('Binding again {} methods'.format(len(methods)))
+                for method, result in zip(methods, self.bind_methods(methods, return_exceptions=True)):
+                    if isinstance(result, RPCConnectionError):
+                        raise result
+                    if isinstance(result, Exception):
+                        _logger.warning('Binding method "{}" again failed: {}'.format(method[0], result))
+                        self.bound_methods[method[0]]['assigned_id'] = None
+
+    def reconnect(self):
+        """
+        Drops connection, opens new one and binds again all bound methods
+        """
+        with self.lock:
+            self.drop_connection()
+            self.ensure_connection()
 
     def rpc_call(self, data):
         if not self.sock:
@@ -128,12 +241,16 @@ class DFHackRPC(object):
         while True:
             try:
                 chunk = self.sock.recv(self.sock_buff_size)
+                if not chunk:
+                    if len(fragments) > 0:
+                        break
+                    raise RPCConnectionError('Connection closed by DFHack')
                 fragments.append(chunk)
             except socket.timeout:
                 if len(fragments) > 0:
                     break
             if len(fragments) == 0 and (time.time() > start_time + self.response_timeout):
-                raise Exception('No API response detected')
+                raise RPCTimeoutError('No API response detected')
         resp = b''.join(fragments)
 
         return resp
@@ -156,6 +273,82 @@ class DFHackRPC(object):
 
         return output
 
+    def rpc_recv(self, size):
+        """
+        Reads exactly size bytes from socket
+        :param size: number of bytes to read
+        :return: binary string
+        """
+        self.sock.settimeout(self.response_timeout)
+        try:
+            while len(self.recv_buffer) < size:
+                try:
+                    chunk = self.sock.recv(max(self.sock_buff_size, size - len(self.recv_buffer)))
+                except socket.timeout:
+                    raise RPCTimeoutError('No API response detected')
+                except OSError as e:
+                    raise RPCConnectionError('Receiving failed: {}'.format(e))
+                if not chunk:
+                    raise RPCConnectionError('Connection closed by DFHack')
+                self.recv_buffer += chunk
+        finally:
+            self.sock.settimeout(self.sock_timeout)
+
+        data = bytes(self.recv_buffer[:size])
+        del self.recv_buffer[:size]
+        return data
+
+    def read_message(self):
+        """
+        Reads one whole message (header + data) from socket
+        :return: binary string
+        """
+        header = self.rpc_recv(8)
+        id, size, _ = self.parse_header(header)
+        if id == -2:  # size field holds error code
+            return header
+        return header + self.rpc_recv(size)
+
+    def rpc_pipeline(self, messages, reply_times=None):
+        """
+        Sends request messages with one write and reads replies of all of them.
+        DFHack processes requests of one connection in order, so replies come in the same order.
+        :param messages: list of binary strings, every one is a whole request message
+        :param reply_times: optional list, time when the whole reply was received is appended to it for every request
+        :return: list of lists of binary strings, reply messages (text messages followed by result or fail)
+            of every request
+        :raises RPCConnectionError: connection is dropped, replies received until then are in its replies attribute
+        """
+        replies = []
+        with self.lock:
+            if not self.sock:
+                self.open_connection()
+
+            try:
+                try:
+                    self.sock.sendall(b''.join(messages))
+                except OSError as e:
+                    raise RPCConnectionError('Sending failed: {}'.format(e))
+
+                for _ in messages:
+                    reply = []
+                    while True:
+                        resp_msg = self.read_message()
+                        reply.append(resp_msg)
+                        id, _, _ = self.parse_header(resp_msg)
+                        if id in (-1, -2):
+                            break
+                    replies.append(reply)
+                    if reply_times is not None:
+                        reply_times.append(time.time())
+            except RPCConnectionError as e:
+                # replies of the rest of requests could still come, stream can't be used anymore
+                self.drop_connection()
+                e.replies = replies
+                raise
+
+        return replies
+
     def parse_handshake(self, data):
         if len(data) < 12:
             data = data + b'\x00' * (12 - len(data))
@@ -201,6 +394,8 @@ class DFHackRPC(object):
 
     def parse_message(self, data):
         id, size, read_size = self.parse_header(data)
+        if id == -2:  # size field holds error code
+            return b'', id, read_size
         return data[read_size:read_size+size], id, (read_size+size)
 
     def build_message(self, data, id=0):
@@ -216,7 +411,7 @@ class DFHackRPC(object):
 
     @classmethod
     def get_proto(cls, full_name):
-        return proto_db.GetSymbol(full_name)
+        return get_proto(full_name)
 
     @classmethod
     def proto2dict(cls, data_obj, including_default_value_fields=True):
@@ -233,37 +428,307 @@ class DFHackRPC(object):
 
     # Tools
 
-    def call_method(self, method, data_obj=None):
-        _logger.debug('Calling method "{}"'.format(method))
-
+    def serialize_input(self, method, data_obj=None):
+        """
+        :param method: method name
+        :param data_obj: input proto object or already serialized input, default input object is used if None
+        :return: serialized input
+        """
         if method not in self.bound_methods or self.bound_methods[method]['assigned_id'] is None:
-            raise Exception('method not bound')
+            raise MethodNotBound('method not bound', method)
+
+        if isinstance(data_obj, bytes):
+            return data_obj
+
         data_obj = data_obj or self.get_proto(self.bound_methods[method]['input_msg'])()
         assert self.bound_methods[method]['input_msg'] == data_obj.DESCRIPTOR.full_name
+        return data_obj.SerializeToString()
 
-        data_msg = self.build_message(data_obj.SerializeToString(), id=self.bound_methods[method]['assigned_id'])
-        resp_msgs = self.rpc_messages(data_msg)
+    def build_method_message(self, method, data_obj=None):
+        """
+        :param method: method name
+        :param data_obj: input proto object or already serialized input, default input object is used if None
+        :return: request message
+        """
+        data = self.serialize_input(method, data_obj)
+        return self.build_message(data, id=self.bound_methods[method]['assigned_id'])
 
-        resp_cls = self.get_proto(self.bound_methods[method]['output_msg'])
-        resp_obj = resp_cls()
+    def parse_reply(self, resp_msgs, method=None, elapsed=None):
+        """
+        :param resp_msgs: reply messages of one request
+        :param method: method name, only for exceptions
+        :param elapsed: time of the call, only for exceptions
+        :return: (serialized response, response text)
+        :raises RPCReplyFail: subclass for error code of RPC_REPLY_FAIL message, see exceptions
+        """
+        resp_data = b''
         resp_text = b''
 
         for resp_msg in resp_msgs:
             resp, id, _ = self.parse_message(resp_msg)
             if id == -1:
-                resp_obj.ParseFromString(resp)
+                resp_data = resp
             elif id == -2:
-                raise Exception('RPC fail')
+                # size field holds error code
+                raise reply_fail(self.parse_header(resp_msg)[1], method, elapsed)
             elif id == -3:
                 resp_text += resp
             else:
-                raise Exception('Unexpected message id {}'.format(id))
+                raise ProtocolError('Unexpected message id {}'.format(id), method, elapsed)
+
+        return resp_data, resp_text
+
+    # Hooks
 
-        return resp_obj, resp_text
+    def add_hook(self, hook):
+        """
+        :param hook: object with on_call(trace) method, see tracing.RPCHook
+        """
+        self.hooks.append(hook)
+
+    def remove_hook(self, hook):
+        self.hooks.remove(hook)
+
+    def run_hooks(self, traces):
+        for hook in self.hooks:
+            for trace in traces:
+                try:
+                    hook.on_call(trace)
+                except Exception:
+                    _logger.exception('Call hook {} failed'.format(hook))
+
+    def stats(self):
+        """
+        :return: {method: stats dict} snapshot of per-method statistics, see tracing.StatsHook
+        """
+        return self.stats_hook.snapshot() if self.stats_hook else {}
+
+    def pipeline_requests(self, methods, requests, reply_times):
+        """
+        Sends serialized requests of bound methods with one write and reads their replies.
+        Dropped connection is opened again before sending. If connection breaks and all calls without reply
+        can be retried by retry policy, reconnects with backoff and sends them again.
+        :param methods: method names
+        :param requests: serialized requests
+        :param reply_times: list, time when the whole reply was received is appended to it for every request
+        :return: list of reply messages of every request, see rpc_pipeline
+        :raises RPCConnectionError: replies received in all attempts are in its replies attribute
+        :raises MethodNotBound: method of a call without reply wasn't bound again after reconnect,
+            replies received until then are in its replies attribute
+        """
+        replies = []
+        attempt = 0
+        start_time = time.time()
+        while True:
+            try:
+                with self.lock:
+                    self.ensure_connection()
+                    # binding again after reconnect can fail, requests of such method can't be sent
+                    for method in methods[len(replies):]:
+                        if self.bound_methods[method]['assigned_id'] is None:
+                            raise MethodNotBound('method not bound again after reconnect', method)
+                    messages = [
+                        self.build_message(request, id=self.bound_methods[method]['assigned_id'])
+                        for method, request in zip(methods[len(replies):], requests[len(replies):])
+                    ]
+                    try:
+                        replies += self.rpc_pipeline(messages, reply_times)
+                    except RPCConnectionError as e:
+                        replies += e.replies
+                        raise
+                return replies
+            except MethodNotBound as e:
+                e.replies = replies
+                raise
+            except RPCConnectionError as e:
+                if e.method is None and len(replies) < len(methods):
+                    e.method = methods[len(replies)]
+                    e.elapsed = time.time() - start_time
+                e.replies = replies
+                if self.retry is None or not self.retry.can_retry(methods[len(replies):]):
+                    raise
+                delay = self.retry.delay(attempt)
+                if delay is None:
+                    raise
+                attempt += 1
+                _logger.warning('{}, retrying {} calls in {:.2f}s'.format(e, len(methods) - len(replies), delay))
+                time.sleep(delay)
+
+    def pipeline_calls(self, calls, traces=None):
+        """
+        Sends calls with one write and reads their replies
+        :param calls: list of (method, data_obj) tuples
+        :param traces: list, CallTrace of every call is appended to it, also when connection error is raised
+            (calls without reply have the error set)
+        :return: (list of (serialized response, response text) tuples or exceptions, list of CallTrace)
+        """
+        traces = [] if traces is None else traces
+        for method, data_obj in calls:
+            _logger.debug('Calling method "{}"'.format(method))
+            start_time = time.time()
+            data = self.serialize_input(method, data_obj)
+            traces.append(CallTrace(method, data, start_time, time.time() - start_time))
+
+        reply_times = []
+        send_time = time.time()
+        try:
+            replies = self.pipeline_requests([trace.method for trace in traces],
+                                             [trace.request for trace in traces], reply_times)
+        except (RPCConnectionError, MethodNotBound) as e:
+            self.trace_replies(traces, e.replies, reply_times, send_time)
+            for trace in traces[len(e.replies):]:
+                trace.network_time = time.time() - send_time
+                trace.error = e
+            raise
+
+        # all replies are read before raising, so that connection stays usable
+        results = []
+        for trace, resp_msgs in zip(traces, self.trace_replies(traces, replies, reply_times, send_time)):
+            try:
+                results.append(self.parse_reply(resp_msgs, trace.method, trace.network_time))
+            except Exception as e:
+                trace.error = e
+                results.append(e)
+
+        return results, traces
+
+    @classmethod
+    def trace_replies(cls, traces, replies, reply_times, send_time):
+        """
+        Fills reply measurements of traces of calls which received reply
+        :return: replies
+        """
+        for trace, resp_msgs, reply_time in zip(traces, replies, reply_times):
+            trace.reply = resp_msgs
+            trace.network_time = reply_time - send_time
+            trace.response_bytes = sum(len(resp_msg) for resp_msg in resp_msgs)
+            trace.text_frames = len(resp_msgs) - 1
+        return replies
+
+    @classmethod
+    def check_results(cls, results, return_exceptions=False):
+        if not return_exceptions:
+            for result in results:
+                if isinstance(result, Exception):
+                    raise result
+        return results
+
+    def parse_result(self, method, result):
+        """
+        :param result: (serialized response, response text)
+        :return: (resp_obj, resp_text)
+        """
+        resp_obj = self.get_proto(self.bound_methods[method]['output_msg'])()
+        resp_obj.ParseFromString(result[0])
+        return resp_obj, result[1]
+
+    def cached_calls(self, calls, parse=True):
+        """
+        Answers calls of cached methods from response cache, the rest is sent with one write
+        :param calls: list of (method, data_obj) tuples
+        :param parse: parse responses
+        :return: list of (resp_obj or serialized response, response text) tuples or exceptions
+        """
+        results = [None] * len(calls)
+        pending = []  # (index, method, data_obj or serialized input, serialized input of cacheable call)
+        for i, (method, data_obj) in enumerate(calls):
+            if self.cache is None or not self.cache.cacheable(method):
+                pending.append((i, method, data_obj, None))
+                continue
+
+            request = self.serialize_input(method, data_obj)
+            if parse:
+                cached = self.cache.get_parsed(method, request, self.connection_key)
+            else:
+                cached = self.cache.get(method, request, self.connection_key)
+            if cached is None:
+                pending.append((i, method, request, request))
+            elif parse and isinstance(cached[0], bytes):
+                results[i] = self.parse_result(method, cached)
+                self.cache.put(method, request, cached, results[i], self.connection_key)
+            else:
+                results[i] = cached
+
+        if not pending:
+            return results
+
+        # hooks get traces of all calls, also when connection error is raised
+        traces = []
+        try:
+            raw_results, _ = self.pipeline_calls([(method, data) for _, method, data, _ in pending], traces)
+            for (i, method, _, request), result, trace in zip(pending, raw_results, traces):
+                if isinstance(result, Exception):
+                    results[i] = result
+                    continue
+
+                parsed = None
+                if parse:
+                    start_time = time.time()
+                    try:
+                        parsed = self.parse_result(method, result)
+                    except Exception as e:
+                        trace.error = e
+                        parsed = e
+                    trace.parse_time = time.time() - start_time
+
+                if request is not None and not isinstance(parsed, Exception):
+                    self.cache.put(method, request, result, parsed, self.connection_key)
+                results[i] = parsed if parse else result
+        finally:
+            self.run_hooks(traces)
+        return results
+
+    def call_methods_raw(self, calls, return_exceptions=False):
+        """
+        Calls several methods with one write to socket, so round trip is paid only once.
+        Responses are not parsed.
+        :param calls: list of (method, data_obj) tuples, data_obj can be None or already serialized input
+        :param return_exceptions: failed calls return exception instead of raising it
+        :return: list of (serialized response, response text) tuples
+        """
+        return self.check_results(self.cached_calls(calls, parse=False), return_exceptions)
+
+    def call_methods(self, calls, return_exceptions=False):
+        """
+        Calls several methods with one write to socket, so round trip is paid only once.
+        Responses of cached methods (see cache.ResponseCache) are returned without calling DFHack.
+        :param calls: list of (method, data_obj) tuples, data_obj can be None or already serialized input
+        :param return_exceptions: failed calls return exception instead of raising it
+        :return: list of (resp_obj, resp_text) tuples
+        """
+        return self.check_results(self.cached_calls(calls, parse=True), return_exceptions)
+
+    def call_method_raw(self, method, data_obj=None):
+        """
+        Calls bound method and returns its response without parsing it.
+        :param method: method name
+        :param data_obj: input proto object or already serialized input, default input object is used if None
+        :return: (serialized response, response text)
+        """
+        return self.call_methods_raw([(method, data_obj)])[0]
+
+    def call_method(self, method, data_obj=None):
+        if self.single_flight is None or method not in self.coalesced_methods:
+            return self.call_methods([(method, data_obj)])[0]
+
+        data = self.serialize_input(method, data_obj)
+        return self.single_flight.do((method, data), lambda: self.call_methods([(method, data)])[0])
+
+    async def call_method_async(self, method, data_obj=None, executor=None):
+        """
+        Calls method in executor, so that event loop isn't blocked. Concurrent identical calls are coalesced
+        the same way as threaded ones (see coalesce).
+        :param executor: concurrent.futures executor, default executor of event loop if None
+        :return: (resp_obj, resp_text)
+        """
+        import asyncio  # see reports.ReportTail.afollow
+
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(executor, self.call_method, method, data_obj)
 
     def call_method_dict(self, method, data_dict=None):
         if method not in self.bound_methods or self.bound_methods[method]['assigned_id'] is None:
-            raise Exception('method not bound')
+            raise MethodNotBound('method not bound', method)
 
         data_obj = self.dict2proto(self.bound_methods[method]['input_msg'], data_dict or {})
         resp_obj, text = self.call_method(method, data_obj)
@@ -289,27 +754,73 @@ class DFHackRPC(object):
         self.get_proto(input_msg)
         self.get_proto(output_msg)
 
-        # send and receive
+        return self.bind_methods([(method, input_msg, output_msg, plugin)])[0]
+
+    def bind_methods(self, methods, return_exceptions=False):
+        """
+        Binds several methods with one write
+        :param methods: list of (method, input_msg, output_msg, plugin) tuples
+        :param return_exceptions: failed binds return exception instead of raising it
+        :return: list of bound method dicts
+        """
         data_cls = self.get_proto('dfproto.CoreBindRequest')
-        data_obj = data_cls(method=method, input_msg=input_msg, output_msg=output_msg, plugin=plugin)
-        resp_obj, resp_text = self.call_method('BindMethod', data_obj)
+        calls = [
+            ('BindMethod', data_cls(method=method, input_msg=input_msg, output_msg=output_msg, plugin=plugin))
+            for method, input_msg, output_msg, plugin in methods
+        ]
+        results = self.call_methods(calls, return_exceptions=True)
+
+        bound = []
+        for (method, input_msg, output_msg, plugin), result in zip(methods, results):
+            if isinstance(result, Exception):
+                bound.append(result)
+                continue
 
-        # save bound method and it's id to cache
-        self.bound_methods[method] = {
-            'method': method,
-            'input_msg': input_msg,
-            'output_msg': output_msg,
-            'plugin': plugin,
-            'assigned_id': resp_obj.assigned_id,
-        }
+            # save bound method and it's id to cache
+            self.bound_methods[method] = {
+                'method': method,
+                'input_msg': input_msg,
+                'output_msg': output_msg,
+                'plugin': plugin,
+                'assigned_id': result[0].assigned_id,
+            }
+            bound.append(self.bound_methods[method])
 
-        return self.bound_methods[method]
+        return self.check_results(bound, return_exceptions)
 
     def bind_all_methods(self):
-        for method in self.bound_methods:
-            if self.bound_methods[method]['assigned_id'] is not None:
-                continue
-            self.bind_method(method)
+        """
+        Binds all not yet bound methods with one write
+        """
+        self.bind_methods([
+            (method, info['input_msg'], info['output_msg'], info['plugin'])
+            for method, info in self.bound_methods.items() if info['assigned_id'] is None
+        ])
+
+    @contextlib.contextmanager
+    def suspended(self):
+        """
+        Context manager queuing calls which are sent together with CoreSuspend and CoreResume on exit,
+        so that all of them see the same DF state, see suspend.SuspendedBatch
+
+            with rpc.suspended() as batch:
+                units = batch.call('GetUnitList')
+            unit_list, _ = units.result()
+        """
+        unbound = [method for method in SUSPEND_METHODS if self.bound_methods[method]['assigned_id'] is None]
+        if unbound:
+            self.bind_methods([
+                (method, self.bound_methods[method]['input_msg'], self.bound_methods[method]['output_msg'], None)
+                for method in unbound
+            ])
+
+        batch = SuspendedBatch(self)
+        try:
+            yield batch
+        except BaseException:
+            batch.abort()
+            raise
+        batch.finish()
 
     def run_command(self, command, arguments=None):
         arguments = arguments or []
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+"""
+Builds SendDigCommand payloads from NumPy volumes.
+
+DigCommand messages are serialized directly with NumPy instead of building Coord proto objects one by one,
+so that designating hundreds of thousands of tiles takes milliseconds.
+"""
+from .proto import get_enum
+from .map_volume import map_shape
+
+from collections import namedtuple
+
+import numpy as np
+import logging
+
+_logger = logging.getLogger(__name__)
+
+# designation - TileDigDesignation value, size - number of locations, data - serialized DigCommand
+DigPlan = namedtuple('DigPlan', ['designation', 'size', 'data'])
+
+NO_DIG = 0
+DEFAULT_DIG = 1
+
+# DigCommand.designation, DigCommand.locations, Coord.x, Coord.y, Coord.z
+_DESIGNATION_TAG = 0x08
+_LOCATIONS_TAG = 0x12
+_COORD_TAGS = (0x08, 0x10, 0x18)
+_VARINT_LIMITS = np.array([1 << 7, 1 << 14, 1 << 21, 1 << 28], dtype=np.uint32)
+
+
+def get_designation(designation):
+    """
+    :param designation: TileDigDesignation value or name
+    :return: TileDigDesignation value
+    """
+    if isinstance(designation, str):
+        enum = get_enum('RemoteFortressReader.TileDigDesignation')
+        return enum.values_by_name[designation].number
+    return int(designation)
+
+
+def _varint_bytes(values):
+    """
+    :param values: array of non-negative integers < 2**32
+    :return: ((N, W) uint8 array of varint bytes, (N, W) bool array of used bytes),
+        W is size of the longest varint
+    """
+    values = values.astype(np.uint32)
+    sizes = 1 + np.searchsorted(_VARINT_LIMITS, values, side='right')
+    width = int(sizes.max())
+
+    shifts = np.arange(width, dtype=np.uint32) * np.uint32(7)
+    groups = ((values[:, None] >> shifts) & np.uint32(0x7f)).astype(np.uint8)
+    positions = np.arange(width)
+    used = positions < sizes[:, None]
+    continued = positions < (sizes - 1)[:, None]
+
+    return groups | (continued.view(np.uint8) << 7), used
+
+
+def encode_locations(x, y, z):
+    """
+    Serializes DigCommand.locations field.
+    :param x: array of local map x coordinates
+    :param y: array of local map y coordinates
+    :param z: array of local map z coordinates
+    :return: serialized repeated Coord field
+    """
+    if len(x) == 0:
+        return b''
+    if min(x.min(), y.min(), z.min()) < 0:
+        raise Exception('Dig locations must not be negative')
+
+    count = len(x)
+    columns = [np.full((count, 1), _LOCATIONS_TAG, dtype=np.uint8), None]
+    masks = [np.ones((count, 1), dtype=bool), np.ones((count, 1), dtype=bool)]
+    coord_size = np.zeros(count, dtype=np.int64)
+
+    for tag, values in zip(_COORD_TAGS, (x, y, z)):
+        value_bytes, used = _varint_bytes(np.asarray(values))
+        columns += [np.full((count, 1), tag, dtype=np.uint8), value_bytes]
+        masks += [np.ones((count, 1), dtype=bool), used]
+        coord_size += 1 + used.sum(axis=1)
+
+    # Coord is at most 18 bytes long, so its length fits to one varint byte
+    columns[1] = coord_size.astype(np.uint8)[:, None]
+
+    return np.hstack(columns)[np.hstack(masks)].tobytes()
+
+
+def encode_dig_command(designation, x, y, z):
+    """
+    :return: serialized RemoteFortressReader.DigCommand
+    """
+    designation_bytes, used = _varint_bytes(np.array([get_designation(designation)]))
+    return bytes([_DESIGNATION_TAG]) + designation_bytes[used].tobytes() + encode_locations(x, y, z)
+
+
+def plan_dig(volume, designation=DEFAULT_DIG, current=None, origin=(0, 0, 0), skip_value=NO_DIG,
+             max_locations=50000):
+    """
+    Turns volume of wanted designations into minimal list of DigCommand payloads, one or more per designation.
+    :param volume: array [z, y, x], either bool (True tiles get designation) or TileDigDesignation values
+    :param designation: TileDigDesignation used for bool volume
+    :param current: array [z, y, x] of current tile_dig_designation (see map_volume.decode_volume),
+        tiles which already have wanted designation are skipped
+    :param origin: (x, y, z) map coordinates of volume [0, 0, 0]
+    :param skip_value: tiles of designation-coded volume with this value are left alone,
+        use -1 to be able to clear designations with NO_DIG
+    :param max_locations: max number of locations in one DigCommand
+    :return: list of DigPlan
+    """
+    volume = np.asarray(volume)
+    if volume.dtype == np.bool_:
+        wanted = np.where(volume, get_designation(designation), skip_value)
+    else:
+        wanted = volume
+
+    changed = wanted != skip_value
+    if current is not None:
+        changed &= wanted != current
+
+    z, y, x = np.nonzero(changed)
+    values = wanted[z, y, x]
+    x = x + origin[0]
+    y = y + origin[1]
+    z = z + origin[2]
+
+    plans = []
+    for value in np.unique(values):
+        selected = values == value
+        sel_x, sel_y, sel_z = x[selected], y[selected], z[selected]
+        for start in range(0, len(sel_x), max_locations):
+            end = start + max_locations
+            data = encode_dig_command(int(value), sel_x[start:end], sel_y[start:end], sel_z[start:end])
+            plans.append(DigPlan(int(value), len(sel_x[start:end]), data))
+
+    _logger.debug('Planned {} dig locations in {} commands'.format(len(x), len(plans)))
+    return plans
+
+
+def send_dig_plans(rpc, plans):
+    """
+    Sends DigCommand payloads with one write
+    :param rpc: DFHackRPC instance with bound SendDigCommand method
+    :param plans: list of DigPlan
+    :return: list of errors, None for successful commands
+    """
+    results = rpc.call_methods_raw([('SendDigCommand', plan.data) for plan in plans], return_exceptions=True)
+    return [result if isinstance(result, Exception) else None for result in results]
+
+
+def check_volume_shape(volume, map_info):
+    """
+    Raises exception if volume doesn't cover the whole map described by RemoteFortressReader.MapInfo
+    """
+    if tuple(np.shape(volume)) != map_shape(map_info):
+        raise Exception('Volume shape {} does not match map shape {}'.format(np.shape(volume), map_shape(map_info)))
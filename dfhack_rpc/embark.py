@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+"""
+Embark grid of isoworldremote as NumPy volumes.
+
+GetEmbarkTile returns one embark tile (3x3 map blocks) with one EmbarkTileLayer per z-level. Every layer
+has square tables (48x48 in isoworldremote, one cell per map tile) stored row by row. fetch_embark reads
+embark size from GetEmbarkInfo and requests all tiles with pipelined GetEmbarkTile calls, then layers are
+assembled into volumes indexed [z, y, x] in layer cells of the whole embark:
+
+    raster = fetch_embark(rpc)
+    top_colors = raster.color[-1]  # (y, x, 3) RGB of the top z-level
+    walls = raster.shape == WALL   # isoworldremote.BasicShape
+
+Cells of invalid, missing or failed tiles are AIR / NONE with color (0, 0, 0). Failed GetEmbarkTile calls don't
+stop the rest, their exceptions are in raster.errors.
+"""
+from collections import namedtuple
+
+import itertools
+import math
+import numpy as np
+import logging
+
+_logger = logging.getLogger(__name__)
+
+# mat_type - isoworldremote.BasicMaterial [z, y, x], mat_subtype - [z, y, x], shape - isoworldremote.BasicShape
+# [z, y, x], color - RGB [z, y, x, 3], valid - [tile y, tile x] bool, cells - layer cells per tile side,
+# info - isoworldremote.MapReply, errors - {(tile x, tile y): exception} of failed GetEmbarkTile calls
+EmbarkRaster = namedtuple('EmbarkRaster', [
+    'mat_type', 'mat_subtype', 'shape', 'color', 'valid', 'cells', 'info', 'errors',
+])
+
+# tiles requested with one write, bounds memory used by responses not assembled yet
+DEFAULT_TILES_PER_WRITE = 16
+
+# isoworldremote.BasicMaterial.AIR, isoworldremote.BasicShape.NONE
+_AIR = 0
+_NONE = 0
+
+
+def embark_info(rpc):
+    """
+    :param rpc: DFHackRPC instance with bound GetEmbarkInfo
+    :return: isoworldremote.MapReply, raises exception if no map is loaded
+    """
+    info, _ = rpc.call_method('GetEmbarkInfo')
+    if not info.available:
+        raise Exception('Embark info is not available, no map is loaded')
+    return info
+
+
+def embark_tiles(info):
+    """
+    :param info: isoworldremote.MapReply
+    :return: list of (want_x, want_y) of all embark tiles, row by row
+    """
+    return [(x, y) for y in range(info.region_size_y) for x in range(info.region_size_x)]
+
+
+def tile_arrays(tile):
+    """
+    :param tile: isoworldremote.EmbarkTile
+    :return: (mat_type, mat_subtype, shape, color) arrays [z, y, x] ([z, y, x, 3] for color),
+        None if tile has no layers
+    """
+    layers = tile.tile_layer
+    if not len(layers):
+        return None
+
+    size = len(layers[0].mat_type_table)
+    cells = math.isqrt(size)
+    if cells * cells != size:
+        raise Exception('Embark tile layer has {} cells, layer is not square'.format(size))
+    shape = (len(layers), cells, cells)
+
+    count = shape[0] * size
+    tables = ('mat_type_table', 'mat_subtype_table', 'tile_shape_table', 'tile_color_table')
+    if any(len(getattr(layer, table)) != size for layer in layers for table in tables):
+        raise Exception('Embark tile ({}, {}) has layers of different sizes'.format(tile.world_x, tile.world_y))
+
+    def column(table, dtype):
+        return np.fromiter(itertools.chain.from_iterable(getattr(layer, table) for layer in layers), dtype, count)
+
+    colors = [value for layer in layers for value in layer.tile_color_table]
+    color = np.empty((count, 3), dtype=np.uint8)
+    for channel, name in enumerate(('red', 'green', 'blue')):
+        color[:, channel] = np.fromiter(map(getattr, colors, itertools.repeat(name)), np.uint8, count)
+
+    return (
+        column('mat_type_table', np.int16).reshape(shape),
+        column('mat_subtype_table', np.int32).reshape(shape),
+        column('tile_shape_table', np.int8).reshape(shape),
+        color.reshape(shape + (3,)),
+    )
+
+
+class EmbarkAssembler(object):
+    """
+    Writes embark tiles into volumes of the whole embark, volumes are allocated with the first valid tile
+    """
+
+    def __init__(self, info):
+        """
+        :param info: isoworldremote.MapReply
+        """
+        self.info = info
+        self.valid = np.zeros((info.region_size_y, info.region_size_x), dtype=np.bool_)
+        self.errors = {}  # {(want_x, want_y): exception}
+        self.cells = None
+        self.volumes = None
+
+    def allocate(self, z_count, cells):
+        self.cells = cells
+        shape = (z_count, self.info.region_size_y * cells, self.info.region_size_x * cells)
+        self.volumes = (
+            np.full(shape, _AIR, dtype=np.int16),
+            np.zeros(shape, dtype=np.int32),
+            np.full(shape, _NONE, dtype=np.int8),
+            np.zeros(shape + (3,), dtype=np.uint8),
+        )
+
+    def add(self, want_x, want_y, tile):
+        """
+        :param want_x: x of tile in embark, as requested with TileRequest
+        :param want_y: y of tile in embark
+        :param tile: isoworldremote.EmbarkTile
+        """
+        if not tile.is_valid:
+            return
+        arrays = tile_arrays(tile)
+        if arrays is None:
+            return
+
+        z_count, cells = arrays[0].shape[0], arrays[0].shape[1]
+        if self.volumes is None:
+            self.allocate(z_count, cells)
+        elif cells != self.cells or z_count != self.volumes[0].shape[0]:
+            raise Exception('Embark tile ({}, {}) has {} layers of {} cells, expected {} layers of {} cells'.format(
+                want_x, want_y, z_count, cells, self.volumes[0].shape[0], self.cells))
+
+        window = (slice(None), slice(want_y * cells, (want_y + 1) * cells), slice(want_x * cells, (want_x + 1) * cells))
+        for volume, values in zip(self.volumes, arrays):
+            volume[window] = values
+        self.valid[want_y, want_x] = True
+
+    def fail(self, want_x, want_y, error):
+        """
+        Marks tile whose GetEmbarkTile call failed, the tile stays invalid
+        """
+        self.errors[(want_x, want_y)] = error
+
+    def raster(self):
+        """
+        :return: EmbarkRaster, volumes have no z-levels if no tile was valid
+        """
+        if self.volumes is None:
+            self.allocate(0, 0)
+        return EmbarkRaster(*(self.volumes + (self.valid, self.cells, self.info, self.errors)))
+
+
+def fetch_embark(rpc, info=None, tiles_per_write=DEFAULT_TILES_PER_WRITE):
+    """
+    Reads all tiles of embark with pipelined GetEmbarkTile calls
+    :param rpc: DFHackRPC instance with bound GetEmbarkInfo and GetEmbarkTile
+    :param info: isoworldremote.MapReply, read with GetEmbarkInfo if None
+    :param tiles_per_write: tiles requested with one write, tiles of one write are assembled before the next
+    :return: EmbarkRaster
+    """
+    if info is None:
+        info = embark_info(rpc)
+    request_cls = rpc.get_proto('isoworldremote.TileRequest')
+    assembler = EmbarkAssembler(info)
+
+    tiles = embark_tiles(info)
+    for start in range(0, len(tiles), tiles_per_write):
+        chunk = tiles[start:start + tiles_per_write]
+        results = rpc.call_methods([
+            ('GetEmbarkTile', request_cls(want_x=x, want_y=y)) for x, y in chunk
+        ], return_exceptions=True)
+        for (x, y), result in zip(chunk, results):
+            if isinstance(result, Exception):
+                assembler.fail(x, y, result)
+            else:
+                assembler.add(x, y, result[0])
+
+    raster = assembler.raster()
+    _logger.debug('Fetched {} embark tiles ({} valid, {} failed), volume shape {}'.format(
+        len(tiles), int(raster.valid.sum()), len(raster.errors), raster.shape.shape))
+    return raster
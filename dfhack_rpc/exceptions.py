@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+"""
+Exceptions raised by DFHackRPC.
+
+    RPCError
+        RPCConnectionError
+            RPCTimeoutError
+        RPCReplyFail - DFHack answered with RPC_REPLY_FAIL, code is dfproto.CoreErrorNotification.ErrorCode
+            LinkFailure, WouldBreak, MethodNotImplemented, CommandFailure, WrongUsage, NotFound
+        MethodNotBound
+        ProtocolError
+"""
+
+# dfproto.CoreErrorNotification.ErrorCode
+CR_LINK_FAILURE = -3
+CR_WOULD_BREAK = -2
+CR_NOT_IMPLEMENTED = -1
+CR_OK = 0
+CR_FAILURE = 1
+CR_WRONG_USAGE = 2
+CR_NOT_FOUND = 3
+
+ERROR_CODE_NAMES = {
+    CR_LINK_FAILURE: 'CR_LINK_FAILURE',
+    CR_WOULD_BREAK: 'CR_WOULD_BREAK',
+    CR_NOT_IMPLEMENTED: 'CR_NOT_IMPLEMENTED',
+    CR_OK: 'CR_OK',
+    CR_FAILURE: 'CR_FAILURE',
+    CR_WRONG_USAGE: 'CR_WRONG_USAGE',
+    CR_NOT_FOUND: 'CR_NOT_FOUND',
+}
+
+
+class RPCError(Exception):
+    """
+    Base class of DFHackRPC errors
+    """
+
+    transient = False  # the same call can succeed when repeated later
+
+    def __init__(self, message, method=None, elapsed=None):
+        """
+        :param message: error description
+        :param method: name of called method, if known
+        :param elapsed: seconds from sending the request until the error, if known
+        """
+        Exception.__init__(self, message)
+        self.message = message
+        self.method = method
+        self.elapsed = elapsed
+
+    def __str__(self):
+        if self.method is None:
+            return self.message
+        return '{} (method "{}")'.format(self.message, self.method)
+
+
+class RPCConnectionError(RPCError):
+    """
+    Connection to DFHack is broken (closed, refused, reset). Connection is dropped, the next call reconnects
+    and binds again all methods which were bound.
+    """
+
+    transient = True
+
+
+class RPCTimeoutError(RPCConnectionError):
+    """
+    DFHack didn't answer in response_timeout. State of the stream is unknown, so connection is dropped
+    the same way as for RPCConnectionError.
+    """
+    pass
+
+
+class RPCReplyFail(RPCError):
+    """
+    DFHack answered with RPC_REPLY_FAIL. Subclass is chosen by error code, see reply_fail.
+    """
+
+    def __init__(self, code, method=None, elapsed=None):
+        """
+        :param code: dfproto.CoreErrorNotification.ErrorCode sent in header of the reply
+        """
+        RPCError.__init__(self, 'RPC fail: {}'.format(ERROR_CODE_NAMES.get(code, code)), method, elapsed)
+        self.code = code
+
+    @property
+    def code_name(self):
+        return ERROR_CODE_NAMES.get(self.code)
+
+
+class LinkFailure(RPCReplyFail):
+    """
+    CR_LINK_FAILURE, RPC call failed due to I/O or protocol error
+    """
+    pass
+
+
+class WouldBreak(RPCReplyFail):
+    """
+    CR_WOULD_BREAK, attempt to call interface in wrong thread or context. Usually goes away when repeated.
+    """
+
+    transient = True
+
+
+class MethodNotImplemented(RPCReplyFail):
+    """
+    CR_NOT_IMPLEMENTED, method not found or plugin not loaded
+    """
+    pass
+
+
+class CommandFailure(RPCReplyFail):
+    """
+    CR_FAILURE, command or method failed
+    """
+    pass
+
+
+class WrongUsage(RPCReplyFail):
+    """
+    CR_WRONG_USAGE, wrong arguments or ui state
+    """
+    pass
+
+
+class NotFound(RPCReplyFail):
+    """
+    CR_NOT_FOUND, target object not found
+    """
+    pass
+
+
+REPLY_FAIL_CLASSES = {
+    CR_LINK_FAILURE: LinkFailure,
+    CR_WOULD_BREAK: WouldBreak,
+    CR_NOT_IMPLEMENTED: MethodNotImplemented,
+    CR_FAILURE: CommandFailure,
+    CR_WRONG_USAGE: WrongUsage,
+    CR_NOT_FOUND: NotFound,
+}
+
+
+def reply_fail(code, method=None, elapsed=None):
+    """
+    :param code: error code from header of RPC_REPLY_FAIL message
+    :return: RPCReplyFail subclass instance for the code
+    """
+    return REPLY_FAIL_CLASSES.get(code, RPCReplyFail)(code, method, elapsed)
+
+
+class MethodNotBound(RPCError):
+    """
+    Method wasn't bound with bind_method
+    """
+    pass
+
+
+class ProtocolError(RPCError):
+    """
+    DFHack sent message which doesn't follow the protocol
+    """
+    pass
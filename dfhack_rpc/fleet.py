@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+"""
+Calls to many DF instances at once.
+
+Every target (host, port) has its own DFHackRPC connection. Calls are fanned out to a thread pool and every
+target has its own timeout, so a slow or dead instance only produces an error in its own FleetResult.
+
+A target whose call timed out keeps its worker thread busy until DFHack answers. Until then the target is
+skipped by new calls (its FleetResult error says it's busy) instead of queueing more work behind it.
+
+Usage:
+
+    with DFHackFleet([('10.0.0.1', 5000), ('10.0.0.1', 5001)], timeout=2.0) as fleet:
+        for target, result in fleet.call('GetPauseState').items():
+            print(target, result.error or result.result[0].Value)
+
+        for target, result in fleet.reports_since().items():
+            ...
+"""
+from .dfhack_rpc import DFHackRPC
+from .reports import ReportTail
+
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+
+import threading
+import time
+import logging
+
+_logger = logging.getLogger(__name__)
+
+# target - (host, port), result - return value of the call or None, error - exception or None,
+# elapsed - seconds from submitting the call until its result or timeout
+FleetResult = namedtuple('FleetResult', ['target', 'result', 'error', 'elapsed'])
+
+
+class TargetBusy(Exception):
+    pass
+
+
+class DFHackFleet(object):
+    """
+    Connections to many DFHack servers with concurrent fan-out of calls
+    """
+
+    def __init__(self, targets, timeout=5.0, timeouts=None, max_workers=None, **rpc_kwargs):
+        """
+        :param targets: list of (host, port)
+        :param timeout: default per-target timeout in seconds
+        :param timeouts: {(host, port): timeout} overrides of default timeout
+        :param max_workers: thread pool size, number of targets by default
+        :param rpc_kwargs: keyword arguments of DFHackRPC, eg. response_timeout
+        """
+        self.targets = [tuple(target) for target in targets]
+        self.timeout = timeout
+        self.timeouts = {tuple(target): value for target, value in (timeouts or {}).items()}
+        self.executor = ThreadPoolExecutor(max_workers=max_workers or max(len(self.targets), 1))
+
+        self.connections = {
+            target: DFHackRPC(dfhack_host=target[0], dfhack_port=target[1], **rpc_kwargs) for target in self.targets
+        }
+        self.tails = {}  # {target: ReportTail}
+        self.pending_polls = {}  # {target: Future} of report polls which timed out, delivered by next reports_since
+
+        self.lock = threading.Lock()
+        self.busy = {}  # {target: Future} of calls which timed out and are still running
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def target_timeout(self, target):
+        return self.timeouts.get(target, self.timeout)
+
+    def _bind(self, rpc, methods):
+        for method in methods:
+            if rpc.bound_methods.get(method, {}).get('assigned_id') is None:
+                rpc.bind_method(method)
+
+    def _submit(self, func, targets):
+        """
+        :param func: function(rpc) called for every target
+        :return: {target: (Future or None if busy, submit time)}
+        """
+        futures = {}
+        with self.lock:
+            for target in targets:
+                busy = self.busy.get(target)
+                if busy is not None and not busy.done():
+                    futures[target] = (None, time.time())
+                    continue
+                self.busy.pop(target, None)
+                futures[target] = (self.executor.submit(func, self.connections[target]), time.time())
+        return futures
+
+    def _busy_result(self, target):
+        return FleetResult(target, None, TargetBusy('Previous call of {}:{} is still running'.format(*target)), 0.0)
+
+    def _timeout_result(self, target, future, start_time):
+        timeout = self.target_timeout(target)
+        with self.lock:
+            self.busy[target] = future
+        _logger.warning('{}:{} did not answer in {}s'.format(target[0], target[1], timeout))
+        return FleetResult(target, None, TimeoutError('No answer in {}s'.format(timeout)), time.time() - start_time)
+
+    def _collect(self, target, future, start_time):
+        if future is None:
+            return self._busy_result(target)
+        try:
+            result = future.result(timeout=max(start_time + self.target_timeout(target) - time.time(), 0))
+            return FleetResult(target, result, None, time.time() - start_time)
+        except TimeoutError:
+            return self._timeout_result(target, future, start_time)
+        except Exception as e:
+            return FleetResult(target, None, e, time.time() - start_time)
+
+    def run(self, func, targets=None):
+        """
+        Calls func(rpc) for every target concurrently
+        :param func: function(DFHackRPC), its return value is FleetResult.result
+        :param targets: subset of targets, all if None
+        :return: {target: FleetResult}
+        """
+        futures = self._submit(func, self.targets if targets is None else [tuple(target) for target in targets])
+        return {target: self._collect(target, future, start_time) for target, (future, start_time) in futures.items()}
+
+    async def arun(self, func, targets=None):
+        """
+        Same as run, but waits for results without blocking event loop
+        """
+        import asyncio  # see reports.ReportTail.afollow
+
+        async def collect(target, future, start_time):
+            if future is None:
+                return self._busy_result(target)
+            try:
+                # shield keeps the call running after timeout, the target is marked busy
+                result = await asyncio.wait_for(
+                    asyncio.shield(asyncio.wrap_future(future)),
+                    max(start_time + self.target_timeout(target) - time.time(), 0),
+                )
+                return FleetResult(target, result, None, time.time() - start_time)
+            except (asyncio.TimeoutError, TimeoutError):
+                return self._timeout_result(target, future, start_time)
+            except Exception as e:
+                return FleetResult(target, None, e, time.time() - start_time)
+
+        futures = self._submit(func, self.targets if targets is None else [tuple(target) for target in targets])
+        results = await asyncio.gather(*[
+            collect(target, future, start_time) for target, (future, start_time) in futures.items()
+        ])
+        return {result.target: result for result in results}
+
+    def open(self, methods=(), targets=None):
+        """
+        Opens connections and binds methods
+        :param methods: names of methods to bind, all default methods if None. Methods are also bound on first call.
+        :return: {target: FleetResult}
+        """
+        def open_target(rpc):
+            rpc.open_connection()
+            if methods is None:
+                rpc.bind_all_methods()
+            else:
+                self._bind(rpc, methods)
+
+        return self.run(open_target, targets)
+
+    def call(self, method, data_obj=None, targets=None):
+        """
+        :return: {target: FleetResult with (resp_obj, resp_text) result}
+        """
+        def call_target(rpc):
+            self._bind(rpc, [method])
+            return rpc.call_method(method, data_obj)
+
+        return self.run(call_target, targets)
+
+    async def acall(self, method, data_obj=None, targets=None):
+        def call_target(rpc):
+            self._bind(rpc, [method])
+            return rpc.call_method(method, data_obj)
+
+        return await self.arun(call_target, targets)
+
+    def call_batch(self, calls, targets=None):
+        """
+        Sends the same pipelined calls to every target, failed calls of one target don't stop the rest of them
+        :param calls: list of (method, data_obj) tuples
+        :return: {target: FleetResult with list of (resp_obj, resp_text) tuples or exceptions}
+        """
+        def call_target(rpc):
+            self._bind(rpc, [method for method, _ in calls])
+            return rpc.call_methods(calls, return_exceptions=True)
+
+        return self.run(call_target, targets)
+
+    def reports_since(self, cursors=None, targets=None):
+        """
+        New reports of every target since its cursor, see reports.ReportTail
+
+        A poll which timed out still advances cursor of its target when it finishes, its reports are returned
+        by the next reports_since call before the newer ones, so no reports are lost.
+
+        :param cursors: {target: highest seen Report.id}, cursors of previous call are used for missing targets
+        :return: {target: FleetResult with list of new RemoteFortressReader.Report}
+        """
+        for target, cursor in (cursors or {}).items():
+            target = tuple(target)
+            self.tails[target] = ReportTail(self.connections[target], cursor)
+            self.pending_polls.pop(target, None)
+        for target in self.targets:
+            if target not in self.tails:
+                self.tails[target] = ReportTail(self.connections[target])
+
+        def poll_target(rpc):
+            target = (rpc.dfhack_host, rpc.dfhack_port)
+            # new call of a target is submitted only after its previous one finished
+            with self.lock:
+                previous = self.pending_polls.pop(target, None)
+            reports = []
+            if previous is not None and previous.exception() is None:
+                reports = list(previous.result())
+            self._bind(rpc, ['GetReports'])
+            return reports + self.tails[target].poll()
+
+        results = self.run(poll_target, targets)
+        with self.lock:
+            for target, result in results.items():
+                if isinstance(result.error, TimeoutError):
+                    self.pending_polls[target] = self.busy[target]
+        return results
+
+    def cursors(self):
+        """
+        :return: {target: highest seen Report.id}
+        """
+        return {target: tail.cursor for target, tail in self.tails.items()}
+
+    def close(self):
+        """
+        Closes connections, connections of busy targets are closed when their calls finish
+        """
+        def close_target(rpc):
+            try:
+                rpc.close_connection()
+            except Exception as e:
+                _logger.warning('Closing {}:{} failed: {}'.format(rpc.dfhack_host, rpc.dfhack_port, e))
+
+        with self.lock:
+            busy = dict(self.busy)
+            self.busy = {}
+        for target in self.targets:
+            rpc = self.connections[target]
+            if target in busy:
+                busy[target].add_done_callback(lambda _, rpc=rpc: close_target(rpc))
+            else:
+                close_target(rpc)
+        self.executor.shutdown(wait=False)
@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+"""
+Item store merging items of MapBlock.items, BuildingInstance.items and UnitDefinition.inventory.
+
+Every item is stored once by Item.id with its location (on floor of a block, in a building, carried by
+a unit) and indexed by type (MatPair type, subtype), material and z-level:
+
+    store = ItemStore()
+    store.update_blocks(block_list.map_blocks, complete=True)
+    store.update_units(unit_list.creature_list, complete=True)
+    steel_bars = store.find(item_type=BAR, material=(0, steel_index), z_min=120, z_max=130)
+
+Later GetBlockList responses and unit lists update it incrementally. When sources disagree (an item dropped
+by a unit is on the floor of a re-sent block, but the unit wasn't re-sent yet), the location the item
+entered most recently wins.
+"""
+from .buildings import BuildingIndex
+from .map_volume import block_key
+
+from collections import namedtuple
+
+import logging
+
+_logger = logging.getLogger(__name__)
+
+FLOOR = 'floor'
+BUILDING = 'building'
+UNIT = 'unit'
+
+# preferred location of item seen in several sources by the same update, eg. items of building are also
+# listed in the block
+_PRIORITY = {FLOOR: 0, BUILDING: 1, UNIT: 2}
+
+# kind - FLOOR, BUILDING or UNIT, owner - block key, building index or unit id,
+# mode - BuildingItem.mode / InventoryItem.mode, None on floor
+ItemLocation = namedtuple('ItemLocation', ['kind', 'owner', 'mode'])
+
+# id - Item.id, item - RemoteFortressReader.Item from the source of location, location - ItemLocation, pos - (x, y, z)
+StoredItem = namedtuple('StoredItem', ['id', 'item', 'location', 'pos'])
+
+
+def item_type_key(item):
+    """
+    :return: (item type, subtype) of Item
+    """
+    return item.type.mat_type, item.type.mat_index
+
+
+def item_material_key(item):
+    """
+    :return: (mat_type, mat_index) of Item
+    """
+    return item.material.mat_type, item.material.mat_index
+
+
+def _index_add(index, key, item_id):
+    index.setdefault(key, set()).add(item_id)
+
+
+def _index_remove(index, key, item_id):
+    values = index.get(key)
+    if values is not None:
+        values.discard(item_id)
+        if not values:
+            del index[key]
+
+
+class ItemStore(object):
+    """
+    Items keyed by id with containment and type, material, z-level and location indexes
+    """
+
+    def __init__(self):
+        self.items = {}  # {id: StoredItem}
+        self.sources = {}  # {(kind, owner): {id: (mode, copy of Item)}}
+        self.item_sources = {}  # {id: {(kind, owner): update number when item entered the source}}
+        self.types = {}  # {(type, subtype): set of ids}
+        self.materials = {}  # {(mat_type, mat_index): set of ids}
+        self.z_levels = {}  # {z: set of ids}
+        self.kinds = {}  # {kind: set of ids}
+        self.unit_positions = {}  # {unit id: (x, y, z)}
+        self.buildings = BuildingIndex()
+        self.update_number = 0
+
+    def __len__(self):
+        return len(self.items)
+
+    def __contains__(self, item_id):
+        return item_id in self.items
+
+    def __iter__(self):
+        return iter(self.items.values())
+
+    def get(self, item_id):
+        """
+        :return: StoredItem or None
+        """
+        return self.items.get(item_id)
+
+    def _set_source(self, kind, owner, entries, touched):
+        """
+        Replaces items of source. Items are copied, with upb and cpp protobuf backends sub-message keeps the whole
+        response alive.
+        :param entries: list of (Item, mode)
+        :param touched: set collecting ids of items whose sources changed
+        """
+        source = (kind, owner)
+        old = self.sources.pop(source, {})
+        new = {}
+        for item, mode in entries:
+            copy = type(item)()
+            copy.CopyFrom(item)
+            new[item.id] = (mode, copy)
+            self.item_sources.setdefault(item.id, {}).setdefault(source, self.update_number)
+            touched.add(item.id)
+        if new:
+            self.sources[source] = new
+
+        for item_id in old:
+            if item_id not in new:
+                del self.item_sources[item_id][source]
+                touched.add(item_id)
+
+    def _location(self, item_id):
+        sources = self.item_sources.get(item_id)
+        if not sources:
+            return None
+        kind, owner = max(sources, key=lambda source: (sources[source], _PRIORITY[source[0]]))
+        return ItemLocation(kind, owner, self.sources[(kind, owner)][item_id][0])
+
+    def _position(self, item, location):
+        if location.kind == UNIT and location.owner in self.unit_positions:
+            return self.unit_positions[location.owner]
+        return item.pos.x, item.pos.y, item.pos.z
+
+    def _unindex(self, stored):
+        _index_remove(self.types, item_type_key(stored.item), stored.id)
+        _index_remove(self.materials, item_material_key(stored.item), stored.id)
+        _index_remove(self.z_levels, stored.pos[2], stored.id)
+        _index_remove(self.kinds, stored.location.kind, stored.id)
+
+    def _index(self, stored):
+        _index_add(self.types, item_type_key(stored.item), stored.id)
+        _index_add(self.materials, item_material_key(stored.item), stored.id)
+        _index_add(self.z_levels, stored.pos[2], stored.id)
+        _index_add(self.kinds, stored.location.kind, stored.id)
+
+    def _refresh(self, item_ids):
+        """
+        Updates location and indexes of items
+        :return: set of ids of added, changed or removed items
+        """
+        changed = set()
+        for item_id in item_ids:
+            current = self.items.get(item_id)
+            location = self._location(item_id)
+            if location is None:
+                self.item_sources.pop(item_id, None)
+                if current is not None:
+                    self._unindex(current)
+                    del self.items[item_id]
+                    changed.add(item_id)
+                continue
+
+            # message of the source where the item is
+            item = self.sources[location[:2]][item_id][1]
+            stored = StoredItem(item_id, item, location, self._position(item, location))
+            if current == stored:
+                continue
+            if current is not None:
+                self._unindex(current)
+            self.items[item_id] = stored
+            self._index(stored)
+            changed.add(item_id)
+        return changed
+
+    def update_blocks(self, blocks, complete=False):
+        """
+        Updates items on floor and in buildings from blocks. Item list of a block replaces items previously
+        on its floor, items of changed buildings replace previous items of the buildings.
+
+        Blocks with empty item list are skipped unless complete is set, see BuildingIndex.update.
+
+        :param blocks: list of RemoteFortressReader.MapBlock
+        :param complete: blocks contain complete item and building lists
+        :return: set of ids of added, changed or removed items
+        """
+        self.update_number += 1
+        touched = set()
+        for block in blocks:
+            if len(block.items) or complete:
+                self._set_source(FLOOR, block_key(block), [(item, None) for item in block.items], touched)
+
+        for index in self.buildings.update(blocks, complete):
+            building = self.buildings.get(index)
+            entries = [] if building is None else [
+                (building_item.item, building_item.mode) for building_item in building.instance.items
+            ]
+            self._set_source(BUILDING, index, entries, touched)
+
+        changed = self._refresh(touched)
+        _logger.debug('{} items changed by {} blocks, {} stored'.format(len(changed), len(blocks), len(self.items)))
+        return changed
+
+    def update_units(self, units, complete=False):
+        """
+        Updates carried items from unit inventories. Inventory of a unit replaces items previously carried
+        by it.
+
+        :param units: list of RemoteFortressReader.UnitDefinition, eg. UnitList.creature_list
+        :param complete: units are all units, items of units missing in the list are removed
+        :return: set of ids of added, changed or removed items
+        """
+        self.update_number += 1
+        touched = set()
+        unit_ids = set()
+        for unit in units:
+            unit_ids.add(unit.id)
+            position = (unit.pos_x, unit.pos_y, unit.pos_z)
+            if self.unit_positions.get(unit.id) != position:
+                self.unit_positions[unit.id] = position
+                touched.update(self.sources.get((UNIT, unit.id), ()))
+            self._set_source(UNIT, unit.id, [(entry.item, entry.mode) for entry in unit.inventory], touched)
+
+        if complete:
+            for unit_id in set(self.unit_positions) - unit_ids:
+                del self.unit_positions[unit_id]
+                self._set_source(UNIT, unit_id, [], touched)
+
+        changed = self._refresh(touched)
+        _logger.debug('{} items changed by {} units, {} stored'.format(len(changed), len(units), len(self.items)))
+        return changed
+
+    def find(self, item_type=None, subtype=None, material=None, z_min=None, z_max=None, kind=None):
+        """
+        Items matching all given conditions, found with indexes
+        :param item_type: df.item_type value (Item.type.mat_type)
+        :param subtype: item subtype (Item.type.mat_index), any if None
+        :param material: (mat_type, mat_index)
+        :param z_min: lowest z-level
+        :param z_max: highest z-level
+        :param kind: FLOOR, BUILDING or UNIT
+        :return: list of StoredItem sorted by id
+        """
+        candidates = []
+        if item_type is not None:
+            candidates.append(set().union(*[
+                ids for (type_value, subtype_value), ids in self.types.items()
+                if type_value == item_type and (subtype is None or subtype_value == subtype)
+            ]))
+        if material is not None:
+            candidates.append(self.materials.get(tuple(material), set()))
+        if z_min is not None or z_max is not None:
+            levels = [z for z in self.z_levels if (z_min is None or z >= z_min) and (z_max is None or z <= z_max)]
+            candidates.append(set().union(*[self.z_levels[z] for z in levels]))
+        if kind is not None:
+            candidates.append(self.kinds.get(kind, set()))
+
+        if not candidates:
+            return [self.items[item_id] for item_id in sorted(self.items)]
+        candidates.sort(key=len)
+        ids = candidates[0].intersection(*candidates[1:])
+        return [self.items[item_id] for item_id in sorted(ids)]
+
+    def _owned(self, kind, owner):
+        return [
+            self.items[item_id] for item_id in sorted(self.sources.get((kind, owner), ()))
+            if self.items[item_id].location[:2] == (kind, owner)
+        ]
+
+    def on_floor(self, block):
+        """
+        :param block: block key (map_x, map_y, map_z), see map_volume.block_key
+        :return: list of StoredItem lying in the block
+        """
+        return self._owned(FLOOR, tuple(block))
+
+    def in_building(self, index):
+        """
+        :return: list of StoredItem of building
+        """
+        return self._owned(BUILDING, index)
+
+    def carried_by(self, unit_id):
+        """
+        :return: list of StoredItem in inventory of unit
+        """
+        return self._owned(UNIT, unit_id)
+
+    def counts(self, key=item_type_key, items=None):
+        """
+        :param key: function of Item returning the counted key, eg. item_type_key, item_material_key
+        :param items: list of StoredItem, all items if None
+        :return: {key: stack size total}
+        """
+        totals = {}
+        for stored in (self.items.values() if items is None else items):
+            value = key(stored.item)
+            totals[value] = totals.get(value, 0) + max(stored.item.stack_size, 1)
+        return totals
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+"""
+Labor assignment with NumPy matrices.
+
+LaborManager keeps enabled labors of units as bool matrix [unit, labor] read with one ListUnits call.
+Desired matrix is compared with it and only the flipped labors are sent, all in one SetUnitLabors call:
+
+    labors = LaborManager(rpc)
+    desired = labors.matrix.copy()
+    desired[:, MINING] = False
+    desired[labors.unit_index([miner_id]), MINING] = True
+    labors.apply(desired)
+"""
+from .queries import UnitQuery
+
+import numpy as np
+import logging
+import copy
+
+_logger = logging.getLogger(__name__)
+
+
+class LaborManager(object):
+    """
+    Local copy of units x labors matrix synchronized with SetUnitLabors
+    """
+
+    def __init__(self, rpc, query=None, labor_count=None):
+        """
+        :param rpc: DFHackRPC instance with bound ListUnits, SetUnitLabors (and ListJobSkills if labor_count is None)
+        :param query: queries.UnitQuery selecting managed units, all sane units of player civilization if None
+        :param labor_count: number of labors, read from ListJobSkills if None
+        """
+        self.rpc = rpc
+        self.query = query
+        self.labor_count = labor_count
+        self.unit_ids = np.zeros(0, dtype=np.int32)
+        self.matrix = np.zeros((0, 0), dtype=np.bool_)
+        self.rows = {}  # {unit_id: row}
+        self.refresh()
+
+    def default_query(self):
+        world_info, _ = self.rpc.call_method('GetWorldInfo')
+        return UnitQuery(self.rpc).civ(world_info.civ_id).sane()
+
+    def refresh(self):
+        """
+        Reads labors of all managed units again
+        """
+        if self.labor_count is None:
+            job_skills, _ = self.rpc.call_method('ListJobSkills')
+            self.labor_count = max((labor.id for labor in job_skills.labor), default=-1) + 1
+        if self.query is None:
+            self.query = self.default_query()
+
+        # copy, so that fields of caller's query stay unchanged
+        units = copy.copy(self.query).fields('unit_id', 'labors').fetch()
+        self.unit_ids = np.array([unit.unit_id for unit in units], dtype=np.int32)
+        self.rows = {unit_id: row for row, unit_id in enumerate(self.unit_ids.tolist())}
+
+        self.matrix = np.zeros((len(units), self.labor_count), dtype=np.bool_)
+        rows = np.repeat(np.arange(len(units)), [len(unit.labors) for unit in units])
+        columns = np.array([labor for unit in units for labor in unit.labors], dtype=np.int64)
+        self.matrix[rows, columns] = True
+
+    def unit_index(self, unit_ids):
+        """
+        :return: array of matrix rows of units
+        """
+        return np.array([self.rows[unit_id] for unit_id in unit_ids], dtype=np.int64)
+
+    def diff(self, desired):
+        """
+        :param desired: bool array [unit, labor] with the same shape as matrix
+        :return: (rows, labors) arrays of flipped labors
+        """
+        desired = np.asarray(desired, dtype=np.bool_)
+        if desired.shape != self.matrix.shape:
+            raise Exception('Labor matrix shape {} does not match {}'.format(desired.shape, self.matrix.shape))
+        return np.nonzero(desired != self.matrix)
+
+    def build_changes(self, desired):
+        """
+        :return: (SetUnitLaborsIn, rows, labors)
+        """
+        rows, labors = self.diff(desired)
+        values = np.asarray(desired, dtype=np.bool_)[rows, labors]
+
+        data_obj = self.rpc.get_proto('dfproto.SetUnitLaborsIn')()
+        for unit_id, labor, value in zip(self.unit_ids[rows].tolist(), labors.tolist(), values.tolist()):
+            data_obj.change.add(unit_id=unit_id, labor=labor, value=value)
+        return data_obj, rows, labors
+
+    def apply(self, desired):
+        """
+        Sends labors differing from local matrix with one SetUnitLabors call and updates local matrix
+        :param desired: bool array [unit, labor] with the same shape as matrix
+        :return: number of changed labors
+        """
+        data_obj, rows, labors = self.build_changes(desired)
+        if not len(rows):
+            return 0
+
+        self.rpc.call_method('SetUnitLabors', data_obj)
+        self.matrix[rows, labors] = np.asarray(desired, dtype=np.bool_)[rows, labors]
+        _logger.debug('Changed {} labors of {} units'.format(len(rows), len(np.unique(rows))))
+        return len(rows)
+
+    def set(self, unit_ids, labors, value=True):
+        """
+        Enables or disables labors of units
+        :param unit_ids: list of unit ids
+        :param labors: list of labor ids
+        :return: number of changed labors
+        """
+        desired = self.matrix.copy()
+        desired[np.ix_(self.unit_index(unit_ids), np.asarray(labors, dtype=np.int64))] = value
+        return self.apply(desired)
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+"""
+Liquid and flow analysis of RemoteFortressReader.MapBlock data with NumPy volumes.
+
+LiquidMap keeps water and magma depth volumes (0-7) of the map and updates them from changed blocks
+of GetBlockList responses. Each update returns per z-level volume deltas:
+
+    liquids = LiquidMap(map_shape(map_info))
+    liquids.update(block_list.map_blocks, complete=True)
+    ...
+    delta = liquids.update(block_list.map_blocks)
+    rising = np.nonzero(delta.water > 0)[0]
+
+    labels, count = liquids.bodies('water')
+    sizes, volumes = body_stats(labels, count, liquids.water)
+
+Flows (miasma, smoke, dust, ...) of blocks are summed into density volumes with liquids.flow_density().
+"""
+from .map_volume import BLOCK_SIZE, PLANE_DIAGONAL_OFFSETS, block_key, block_window, block_array, \
+    label_components
+
+from collections import namedtuple
+
+import numpy as np
+import logging
+
+_logger = logging.getLogger(__name__)
+
+LIQUIDS = ['water', 'magma']
+# per-tile flags of liquids
+LIQUID_FLAGS = ['water_stagnant', 'water_salt', 'aquifer']
+
+MAX_DEPTH = 7
+
+# water, magma - change of liquid volume per z-level, changed_tiles - number of tiles whose depth changed,
+# changed_blocks - keys of blocks with changed depth
+LiquidDelta = namedtuple('LiquidDelta', ['water', 'magma', 'changed_tiles', 'changed_blocks'])
+
+
+def body_stats(labels, count, depth):
+    """
+    :param labels: component labels of label_components
+    :param count: number of components
+    :param depth: depth volume labels were computed from
+    :return: (tile count array, liquid volume array) indexed by component number, [0] is background
+    """
+    flat = labels.reshape(-1)
+    sizes = np.bincount(flat, minlength=count + 1)
+    volumes = np.bincount(flat, weights=depth.reshape(-1), minlength=count + 1).astype(np.int64)
+    return sizes, volumes
+
+
+def flow_density(flows, shape, origin=(0, 0, 0), flow_type=None):
+    """
+    :param flows: iterable of RemoteFortressReader.FlowInfo
+    :param shape: (z, y, x) shape of volume
+    :param origin: (x, y, z) map coordinates of volume [0, 0, 0]
+    :param flow_type: RemoteFortressReader.FlowType value, all types if None
+    :return: int32 array [z, y, x] of summed flow densities
+    """
+    values = np.array([
+        (flow.pos.z, flow.pos.y, flow.pos.x, flow.density)
+        for flow in flows if flow_type is None or flow.type == flow_type
+    ], dtype=np.int64).reshape(-1, 4)
+    z, y, x = values[:, 0] - origin[2], values[:, 1] - origin[1], values[:, 2] - origin[0]
+    inside = (z >= 0) & (z < shape[0]) & (y >= 0) & (y < shape[1]) & (x >= 0) & (x < shape[2])
+
+    volume = np.zeros(shape, dtype=np.int32)
+    np.add.at(volume, (z[inside], y[inside], x[inside]), values[inside, 3])
+    return volume
+
+
+class LiquidMap(object):
+    """
+    Water and magma volumes of the map updated from changed blocks
+    """
+
+    def __init__(self, shape, origin=(0, 0, 0)):
+        """
+        :param shape: (z, y, x) shape of volumes, see map_volume.map_shape
+        :param origin: (x, y, z) map coordinates of volume [0, 0, 0]
+        """
+        self.shape = tuple(shape)
+        self.origin = tuple(origin)
+        self.water = np.zeros(self.shape, dtype=np.uint8)
+        self.magma = np.zeros(self.shape, dtype=np.uint8)
+        self.flags = {name: np.zeros(self.shape, dtype=np.bool_) for name in LIQUID_FLAGS}
+        self.totals = {name: np.zeros(self.shape[0], dtype=np.int64) for name in LIQUIDS}
+        self.flows = {}  # {block key: list of FlowInfo}
+
+    def update(self, blocks, complete=False):
+        """
+        Writes liquid fields of blocks into volumes. Blocks without the fields are skipped, because
+        RemoteFortressReader sends only changed parts of blocks.
+
+        Flow list of a block replaces flows previously sent in the block. Blocks with empty flow list
+        clear their flows only when complete is set, see buildings.BuildingIndex.update.
+
+        :param blocks: iterable of RemoteFortressReader.MapBlock
+        :param complete: blocks contain complete flow lists
+        :return: LiquidDelta
+        """
+        deltas = {name: np.zeros(self.shape[0], dtype=np.int64) for name in LIQUIDS}
+        changed_tiles = 0
+        changed_blocks = set()
+
+        for block in blocks:
+            if len(block.flows) or complete:
+                if len(block.flows):
+                    self.flows[block_key(block)] = [self._copy_flow(flow) for flow in block.flows]
+                else:
+                    self.flows.pop(block_key(block), None)
+
+            window = block_window(block, self.shape, self.origin)
+            if window is None:
+                continue
+            z = window[0][0]
+            for name in LIQUIDS:
+                values = block_array(block, name, np.uint8)
+                if values is None:
+                    continue
+                volume = getattr(self, name)
+                new = values[window[1]]
+                old = volume[window[0]]
+                differ = int(np.count_nonzero(new != old))
+                if not differ:
+                    continue
+                change = int(new.sum(dtype=np.int64)) - int(old.sum(dtype=np.int64))
+                deltas[name][z] += change
+                self.totals[name][z] += change
+                changed_tiles += differ
+                changed_blocks.add(block_key(block))
+                volume[window[0]] = new
+            for name in LIQUID_FLAGS:
+                values = block_array(block, name)
+                if values is not None:
+                    self.flags[name][window[0]] = values[window[1]]
+
+        if changed_blocks:
+            _logger.debug('Liquids changed in {} blocks, {} tiles'.format(len(changed_blocks), changed_tiles))
+        return LiquidDelta(deltas['water'], deltas['magma'], changed_tiles, changed_blocks)
+
+    def volume_per_z(self, liquid='water'):
+        """
+        :return: int64 array of liquid volume (sum of depths) of every z-level
+        """
+        return self.totals[liquid].copy()
+
+    def bodies(self, liquid='water', min_depth=1, offsets=PLANE_DIAGONAL_OFFSETS):
+        """
+        Connected bodies of liquid. Liquids flow to diagonal tiles of the same z-level and up and down,
+        so diagonal neighbours in z-level plane are connected by default.
+        :param liquid: 'water' or 'magma'
+        :param min_depth: tiles with lower depth are not part of bodies
+        :param offsets: neighbour offsets, see map_volume.label_components
+        :return: (int32 array [z, y, x] of body numbers 1..count, 0 outside of bodies; count)
+        """
+        return label_components(getattr(self, liquid) >= min_depth, offsets)
+
+    def pressure_mask(self, liquid='water'):
+        """
+        Full tiles (depth 7) under another full tile, liquid in them can flow up through pressure
+        :return: bool array [z, y, x]
+        """
+        full = getattr(self, liquid) == MAX_DEPTH
+        mask = np.zeros(self.shape, dtype=np.bool_)
+        mask[:-1] = full[:-1] & full[1:]
+        return mask
+
+    @classmethod
+    def _copy_flow(cls, flow):
+        # with upb and cpp protobuf backends sub-message keeps the whole response alive, the copy doesn't
+        copy = type(flow)()
+        copy.CopyFrom(flow)
+        return copy
+
+    def flow_density(self, flow_type=None):
+        """
+        :param flow_type: RemoteFortressReader.FlowType value, all types if None
+        :return: int32 array [z, y, x] of summed densities of flows of blocks
+        """
+        return flow_density(
+            (flow for flows in self.flows.values() for flow in flows), self.shape, self.origin, flow_type
+        )
+
+    def flow_densities(self):
+        """
+        :return: {FlowType value: int32 array [z, y, x] of summed densities}
+        """
+        types = sorted(set(flow.type for flows in self.flows.values() for flow in flows))
+        return {flow_type: self.flow_density(flow_type) for flow_type in types}
+
+    def block_totals(self, liquid='water'):
+        """
+        :return: int64 array [z, block y, block x] of liquid volume of 16x16 blocks of every z-level
+        """
+        volume = getattr(self, liquid)
+        z, y, x = self.shape
+        padded = np.zeros((z, -(-y // BLOCK_SIZE) * BLOCK_SIZE, -(-x // BLOCK_SIZE) * BLOCK_SIZE), dtype=np.int64)
+        padded[:, :y, :x] = volume
+        return padded.reshape(z, padded.shape[1] // BLOCK_SIZE, BLOCK_SIZE, padded.shape[2] // BLOCK_SIZE,
+                              BLOCK_SIZE).sum(axis=(2, 4))
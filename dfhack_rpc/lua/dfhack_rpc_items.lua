@@ -0,0 +1,89 @@
+-- Item totals computed inside DF, see dfhack_rpc.lua_batch, called as rpc.dfhack_rpc_items
+
+local _ENV = mkmodule('rpc.dfhack_rpc_items')
+
+local pack = require('rpc.dfhack_rpc_pack')
+
+local function is_stock(item)
+    local flags = item.flags
+    return not (flags.garbage_collect or flags.construction or flags.in_building or flags.in_inventory
+        or flags.removed or flags.trader or flags.hostile)
+end
+
+-- item_type: optional df.item_type name, only_stock: '1' skips carried, built and foreign items
+local function each_item(item_type, only_stock, callback)
+    local items = df.global.world.items.other.IN_PLAY
+    if item_type and item_type ~= '' then
+        items = df.global.world.items.other[item_type]
+    end
+    for _, item in ipairs(items) do
+        if only_stock ~= '1' or is_stock(item) then
+            callback(item)
+        end
+    end
+end
+
+-- item count and stack size total of every item type
+function totals_by_type(only_stock)
+    local totals = {}
+    each_item(nil, only_stock, function(item)
+        local name = df.item_type[item:getType()]
+        local total = totals[name]
+        if not total then
+            total = {name, 0, 0}
+            totals[name] = total
+        end
+        total[2] = total[2] + 1
+        total[3] = total[3] + item:getStackSize()
+    end)
+
+    local rows = {}
+    for _, total in pairs(totals) do
+        rows[#rows + 1] = total
+    end
+    return table.unpack(pack.rows({'item_type', 'count', 'stack'}, 'sii', rows))
+end
+
+-- stack size total of every item type and material pair
+function stock_summary(item_type)
+    local totals = {}
+    each_item(item_type, '1', function(item)
+        local material = dfhack.matinfo.decode(item)
+        local key = df.item_type[item:getType()] .. ':' .. (material and material:getToken() or '?')
+        totals[key] = (totals[key] or 0) + item:getStackSize()
+    end)
+    return table.unpack(pack.counts(totals))
+end
+
+-- ids, types, materials, stack sizes and positions of items as packed arrays
+function dump(item_type, only_stock)
+    local columns = {'id', 'type', 'subtype', 'mat_type', 'mat_index', 'stack', 'x', 'y', 'z'}
+    local types = {'i4', 'i2', 'i2', 'i2', 'i4', 'i4', 'i2', 'i2', 'i2'}
+    local values = {}
+    for i = 1, #columns do
+        values[i] = {}
+    end
+
+    local n = 0
+    each_item(item_type, only_stock, function(item)
+        n = n + 1
+        local x, y, z = dfhack.items.getPosition(item)
+        values[1][n] = item.id
+        values[2][n] = item:getType()
+        values[3][n] = item:getSubtype()
+        values[4][n] = item:getMaterial()
+        values[5][n] = item:getMaterialIndex()
+        values[6][n] = item:getStackSize()
+        values[7][n] = x or -30000
+        values[8][n] = y or -30000
+        values[9][n] = z or -30000
+    end)
+
+    local packed = {}
+    for i, name in ipairs(columns) do
+        packed[i] = {name, types[i], values[i]}
+    end
+    return table.unpack(pack.arrays(packed))
+end
+
+return _ENV
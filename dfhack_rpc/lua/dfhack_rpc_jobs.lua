@@ -0,0 +1,33 @@
+-- Job statistics computed inside DF, see dfhack_rpc.lua_batch, called as rpc.dfhack_rpc_jobs
+
+local _ENV = mkmodule('rpc.dfhack_rpc_jobs')
+
+local utils = require('utils')
+local pack = require('rpc.dfhack_rpc_pack')
+
+-- number of jobs of every job type
+function counts_by_type()
+    local counts = {}
+    for _, job in utils.listpairs(df.global.world.jobs.list) do
+        local name = df.job_type[job.job_type]
+        counts[name] = (counts[name] or 0) + 1
+    end
+    return table.unpack(pack.counts(counts))
+end
+
+-- number of jobs with and without assigned worker
+function counts_by_state()
+    local counts = {active = 0, waiting = 0, suspended = 0}
+    for _, job in utils.listpairs(df.global.world.jobs.list) do
+        if job.flags.suspend then
+            counts.suspended = counts.suspended + 1
+        elseif dfhack.job.getWorker(job) then
+            counts.active = counts.active + 1
+        else
+            counts.waiting = counts.waiting + 1
+        end
+    end
+    return table.unpack(pack.counts(counts))
+end
+
+return _ENV
@@ -0,0 +1,103 @@
+-- Compact results of dfhack_rpc Lua modules, decoded by dfhack_rpc.lua_batch.decode_result.
+--
+-- RunLua converts every returned value to one string of StringListMessage, tables are not expanded.
+-- Helpers build packed result as table, functions called by RunLua return its elements as multiple values
+-- (return table.unpack(pack.counts(totals))). Packed results start with format tag:
+--
+--   {'counts1', keys joined by TAB, counts joined by ','}
+--   {'table1', column names joined by TAB, column types ('s' string, 'i' integer, 'f' float),
+--    one string per column with values joined by TAB}
+--   {'packed1 name:type:count ...', base64 of little-endian arrays of all columns}
+--
+-- Packed arrays are decoded by client without parsing every value, use them for large numeric results.
+-- Types: i1, u1, i2, u2, i4, u4, i8, u8 (integers), f4, f8 (floats).
+
+local _ENV = mkmodule('rpc.dfhack_rpc_pack')
+
+FORMAT_COUNTS = 'counts1'
+FORMAT_TABLE = 'table1'
+FORMAT_PACKED = 'packed1'
+
+-- string.pack codes of packed types
+PACK_CODES = {
+    i1 = 'i1', u1 = 'I1', i2 = 'i2', u2 = 'I2', i4 = 'i4', u4 = 'I4', i8 = 'i8', u8 = 'I8', f4 = 'f', f8 = 'd',
+}
+
+-- values packed by one string.pack call, table.unpack has limited stack
+local PACK_CHUNK = 256
+
+local B64 = {}
+for i = 0, 63 do
+    B64[i] = ('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/'):sub(i + 1, i + 1)
+end
+
+function counts(tbl)
+    local keys, values = {}, {}
+    for key, value in pairs(tbl) do
+        keys[#keys + 1] = tostring(key)
+        values[#values + 1] = tostring(value)
+    end
+    return {FORMAT_COUNTS, table.concat(keys, '\t'), table.concat(values, ',')}
+end
+
+-- columns: list of column names, types: string of column types, rows: list of lists
+function rows(columns, types, rows)
+    local result = {FORMAT_TABLE, table.concat(columns, '\t'), types}
+    for column = 1, #columns do
+        local values = {}
+        for i, row in ipairs(rows) do
+            values[i] = tostring(row[column])
+        end
+        result[#result + 1] = table.concat(values, '\t')
+    end
+    return result
+end
+
+function base64(data)
+    local out = {}
+    local size = #data
+    for i = 1, size - 2, 3 do
+        local a, b, c = data:byte(i, i + 2)
+        local n = a << 16 | b << 8 | c
+        out[#out + 1] = B64[n >> 18] .. B64[n >> 12 & 63] .. B64[n >> 6 & 63] .. B64[n & 63]
+    end
+
+    local rest = size % 3
+    if rest == 1 then
+        local n = data:byte(size) << 16
+        out[#out + 1] = B64[n >> 18] .. B64[n >> 12 & 63] .. '=='
+    elseif rest == 2 then
+        local a, b = data:byte(size - 1, size)
+        local n = a << 16 | b << 8
+        out[#out + 1] = B64[n >> 18] .. B64[n >> 12 & 63] .. B64[n >> 6 & 63] .. '='
+    end
+    return table.concat(out)
+end
+
+local function pack_values(type, values)
+    local code = PACK_CODES[type]
+    if not code then
+        error('Unsupported packed type ' .. tostring(type))
+    end
+
+    local parts = {}
+    for first = 1, #values, PACK_CHUNK do
+        local last = math.min(first + PACK_CHUNK - 1, #values)
+        parts[#parts + 1] = string.pack('<' .. code:rep(last - first + 1), table.unpack(values, first, last))
+    end
+    return table.concat(parts)
+end
+
+-- columns: list of {name, type, values}
+function arrays(columns)
+    local header = {FORMAT_PACKED}
+    local parts = {}
+    for _, column in ipairs(columns) do
+        local name, type, values = column[1], column[2], column[3]
+        header[#header + 1] = name .. ':' .. type .. ':' .. #values
+        parts[#parts + 1] = pack_values(type, values)
+    end
+    return {table.concat(header, ' '), base64(table.concat(parts))}
+end
+
+return _ENV
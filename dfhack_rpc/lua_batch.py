@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+"""
+Pipelined RunLua calls and aggregation Lua modules.
+
+RunLua calls function of Lua module with string arguments and returns StringListMessage with one string per
+returned value (tables are not expanded, functions return several values instead). DFHack accepts only
+modules named rpc.*, *.rpc or *-rpc. LuaBatch sends many calls with one write:
+
+    batch = LuaBatch(rpc)
+    jobs = batch.call('rpc.dfhack_rpc_jobs', 'counts_by_type')
+    stock = batch.call('rpc.dfhack_rpc_items', 'stock_summary', 'BAR')
+    batch.execute()
+    print(jobs.result(), stock.result())
+
+Modules in dfhack_rpc/lua compute aggregates inside DF and return them packed (see lua/dfhack_rpc_pack.lua),
+they have to be installed into hack/lua/rpc of DF first:
+
+    install_lua_modules('/path/to/df')
+
+Large numeric results are returned as packed arrays (little-endian, base64 encoded, schema in value[0])
+and decoded without parsing every value, to NumPy arrays if NumPy is installed, to array.array otherwise:
+
+    items = item_dump(rpc)
+    print(items['id'][items['type'] == BAR])
+"""
+from .suspend import PendingCall
+
+import os
+import sys
+import array
+import base64
+import shutil
+import logging
+
+_logger = logging.getLogger(__name__)
+
+LUA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'lua')
+# Lua modules are installed into hack/lua/rpc, RunLua calls only modules of rpc package
+LUA_PACKAGE = 'rpc'
+JOBS_MODULE = 'rpc.dfhack_rpc_jobs'
+ITEMS_MODULE = 'rpc.dfhack_rpc_items'
+
+FORMAT_COUNTS = 'counts1'
+FORMAT_TABLE = 'table1'
+FORMAT_PACKED = 'packed1'
+
+_COLUMN_TYPES = {'s': str, 'i': int, 'f': float}
+
+# packed type: (NumPy dtype, array.array typecode)
+PACKED_TYPES = {
+    'i1': ('<i1', 'b'), 'u1': ('<u1', 'B'),
+    'i2': ('<i2', 'h'), 'u2': ('<u2', 'H'),
+    'i4': ('<i4', 'i'), 'u4': ('<u4', 'I'),
+    'i8': ('<i8', 'q'), 'u8': ('<u8', 'Q'),
+    'f4': ('<f4', 'f'), 'f8': ('<f8', 'd'),
+}
+
+
+def install_lua_modules(df_path, overwrite=True):
+    """
+    Copies Lua modules into hack/lua/rpc of DF installation
+    :param df_path: DF directory
+    :return: list of installed files
+    """
+    target = os.path.join(df_path, 'hack', 'lua', LUA_PACKAGE)
+    os.makedirs(target, exist_ok=True)
+
+    installed = []
+    for name in sorted(os.listdir(LUA_DIR)):
+        if not name.endswith('.lua'):
+            continue
+        path = os.path.join(target, name)
+        if overwrite or not os.path.exists(path):
+            shutil.copyfile(os.path.join(LUA_DIR, name), path)
+            installed.append(path)
+    return installed
+
+
+def _split(data, separator):
+    return data.split(separator) if data else []
+
+
+def decode_counts(values):
+    """
+    :param values: ['counts1', keys, counts]
+    :return: {key: count}
+    """
+    return dict(zip(_split(values[1], '\t'), map(int, _split(values[2], ','))))
+
+
+def decode_table(values):
+    """
+    :param values: ['table1', column names, column types, column values...]
+    :return: {column name: list of values}
+    """
+    columns = _split(values[1], '\t')
+    return {
+        name: list(map(_COLUMN_TYPES[column_type], _split(data, '\t')))
+        for name, column_type, data in zip(columns, values[2], values[3:])
+    }
+
+
+def decode_packed(values, use_numpy=True):
+    """
+    :param values: ['packed1 name:type:count ...', base64 of little-endian arrays of all columns]
+    :param use_numpy: return NumPy arrays if NumPy is installed, array.array otherwise
+    :return: {column name: array}
+    """
+    if use_numpy:
+        # imported here, so that importing dfhack_rpc doesn't load NumPy
+        try:
+            import numpy as np
+        except ImportError:
+            use_numpy = False
+
+    columns = values[0].split(' ')[1:]
+    data = base64.b64decode(values[1]) if len(values) > 1 else b''
+
+    arrays = {}
+    offset = 0
+    for column in columns:
+        name, column_type, count = column.split(':')
+        dtype, typecode = PACKED_TYPES[column_type]
+        count = int(count)
+        size = count * int(column_type[1])
+        if offset + size > len(data):
+            raise Exception('Packed column "{}" ends at {}, data has {} bytes'.format(name, offset + size, len(data)))
+
+        if use_numpy:
+            arrays[name] = np.frombuffer(data, dtype=dtype, count=count, offset=offset)
+        else:
+            arrays[name] = array.array(typecode, data[offset:offset + size])
+            if sys.byteorder == 'big':
+                arrays[name].byteswap()
+        offset += size
+    return arrays
+
+
+DECODERS = {
+    FORMAT_COUNTS: decode_counts,
+    FORMAT_TABLE: decode_table,
+    FORMAT_PACKED: decode_packed,
+}
+
+
+def decode_result(values):
+    """
+    :param values: StringListMessage.value
+    :return: decoded packed result, or list of strings if result is not packed
+    """
+    values = values[:]
+    tag = values[0].split(' ', 1)[0] if values else None
+    if tag in DECODERS:
+        return DECODERS[tag](values)
+    return values
+
+
+class LuaBatch(object):
+    """
+    RunLua calls sent with one write
+    """
+
+    def __init__(self, rpc, decode=True):
+        """
+        :param rpc: DFHackRPC instance with bound RunLua
+        :param decode: decode packed results, see decode_result
+        """
+        self.rpc = rpc
+        self.decode = decode
+        self.queue = []
+
+    def call(self, module, function, *arguments):
+        """
+        Queues call of Lua function
+        :return: PendingCall, result is decoded result or list of strings
+        """
+        data_obj = self.rpc.get_proto('dfproto.CoreRunLuaRequest')(
+            module=module, function=function, arguments=[str(argument) for argument in arguments]
+        )
+        pending = PendingCall('RunLua', data_obj)
+        self.queue.append(pending)
+        return pending
+
+    def execute(self):
+        """
+        Sends all queued calls with one write. Failed calls don't stop the rest, their PendingCall raises.
+        :return: list of PendingCall
+        """
+        pending, self.queue = self.queue, []
+        if not pending:
+            return pending
+
+        results = self.rpc.call_methods([(call.method, call.data_obj) for call in pending], return_exceptions=True)
+        for call, result in zip(pending, results):
+            if isinstance(result, Exception):
+                call.set(result)
+            else:
+                call.set(decode_result(result[0].value) if self.decode else result[0].value[:])
+        return pending
+
+
+def run_lua(rpc, module, function, *arguments):
+    """
+    :return: decoded result of one Lua function call
+    """
+    batch = LuaBatch(rpc)
+    pending = batch.call(module, function, *arguments)
+    batch.execute()
+    return pending.result()
+
+
+def job_counts(rpc):
+    """
+    :return: {job type name: number of jobs}
+    """
+    return run_lua(rpc, JOBS_MODULE, 'counts_by_type')
+
+
+def item_totals(rpc, only_stock=False):
+    """
+    :return: {'item_type': [...], 'count': [...], 'stack': [...]}
+    """
+    return run_lua(rpc, ITEMS_MODULE, 'totals_by_type', '1' if only_stock else '0')
+
+
+def stock_summary(rpc, item_type=''):
+    """
+    :param item_type: df.item_type name, eg. 'BAR', all items if empty
+    :return: {'ITEM_TYPE:MATERIAL_TOKEN': stack size total}
+    """
+    return run_lua(rpc, ITEMS_MODULE, 'stock_summary', item_type)
+
+
+def item_dump(rpc, item_type='', only_stock=False):
+    """
+    :param item_type: df.item_type name, eg. 'BAR', all items if empty
+    :return: {'id', 'type', 'subtype', 'mat_type', 'mat_index', 'stack', 'x', 'y', 'z': array}, position
+        is -30000 for items without one
+    """
+    return run_lua(rpc, ITEMS_MODULE, 'dump', item_type, '1' if only_stock else '0')
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+"""
+Conversion of per-tile data of RemoteFortressReader.MapBlock messages to NumPy volumes.
+
+Volumes are indexed [z, y, x] in local map tile coordinates (the same coordinates as MapBlock.map_x/y/z
+and DigCommand locations). Volume covering the whole map has shape map_shape(GetMapInfo response)
+and origin (0, 0, 0), smaller volumes are described by origin (x, y, z) of their [0, 0, 0] tile.
+
+Per-tile fields of MapBlock are stored row by row, index of tile is y * 16 + x.
+"""
+import numpy as np
+
+BLOCK_SIZE = 16
+
+# dtype used for per-tile MapBlock fields
+FIELD_DTYPES = {
+    'tiles': np.int32,
+    'magma': np.uint8,
+    'water': np.uint8,
+    'hidden': np.bool_,
+    'light': np.bool_,
+    'subterranean': np.bool_,
+    'outside': np.bool_,
+    'aquifer': np.bool_,
+    'water_stagnant': np.bool_,
+    'water_salt': np.bool_,
+    'tree_percent': np.int32,
+    'tree_x': np.int32,
+    'tree_y': np.int32,
+    'tree_z': np.int32,
+    'tile_dig_designation': np.uint8,
+    'tile_dig_designation_marker': np.bool_,
+    'tile_dig_designation_auto': np.bool_,
+    'grass_percent': np.uint8,
+}
+
+# MatPair per-tile MapBlock fields
+MATPAIR_FIELDS = ['materials', 'layer_materials', 'vein_materials', 'base_materials', 'construction_items']
+
+
+def map_shape(map_info):
+    """
+    :param map_info: RemoteFortressReader.MapInfo
+    :return: (z, y, x) shape of the whole map in tiles
+    """
+    return (
+        map_info.block_size_z,
+        map_info.block_size_y * BLOCK_SIZE,
+        map_info.block_size_x * BLOCK_SIZE,
+    )
+
+
+def block_key(block):
+    """
+    :return: (map_x, map_y, map_z) of block, identifies block between block list requests
+    """
+    return block.map_x, block.map_y, block.map_z
+
+
+def block_window(block, shape, origin=(0, 0, 0)):
+    """
+    :param block: RemoteFortressReader.MapBlock
+    :param shape: (z, y, x) shape of volume
+    :param origin: (x, y, z) map coordinates of volume [0, 0, 0]
+    :return: (volume index, block index) pair of slice tuples, or None if block is outside of volume
+    """
+    z = block.map_z - origin[2]
+    y = block.map_y - origin[1]
+    x = block.map_x - origin[0]
+    if not 0 <= z < shape[0]:
+        return None
+
+    y_min, y_max = max(y, 0), min(y + BLOCK_SIZE, shape[1])
+    x_min, x_max = max(x, 0), min(x + BLOCK_SIZE, shape[2])
+    if y_min >= y_max or x_min >= x_max:
+        return None
+
+    return (
+        (z, slice(y_min, y_max), slice(x_min, x_max)),
+        (slice(y_min - y, y_max - y), slice(x_min - x, x_max - x)),
+    )
+
+
+def block_array(block, field, dtype=None):
+    """
+    :return: (16, 16) array [y, x] of per-tile field of block, None if block doesn't contain the field
+    """
+    values = getattr(block, field)
+    if len(values) != BLOCK_SIZE * BLOCK_SIZE:
+        return None
+    # slice is converted to list much faster than the repeated field container itself
+    return np.array(values[:], dtype=dtype or FIELD_DTYPES.get(field, np.int32)).reshape(BLOCK_SIZE, BLOCK_SIZE)
+
+
+def block_matpair_arrays(block, field):
+    """
+    :return: ((16, 16) mat_type array, (16, 16) mat_index array) of MatPair field of block,
+        None if block doesn't contain the field
+    """
+    values = getattr(block, field)
+    if len(values) != BLOCK_SIZE * BLOCK_SIZE:
+        return None
+    pairs = np.array([(value.mat_type, value.mat_index) for value in values[:]], dtype=np.int32)
+    return pairs[:, 0].reshape(BLOCK_SIZE, BLOCK_SIZE), pairs[:, 1].reshape(BLOCK_SIZE, BLOCK_SIZE)
+
+
+def fill_volume(volume, blocks, field, origin=(0, 0, 0)):
+    """
+    Writes per-tile field of blocks into existing volume. Blocks without the field are skipped,
+    because RemoteFortressReader sends only changed parts of blocks.
+    :param volume: array [z, y, x]
+    :param blocks: iterable of RemoteFortressReader.MapBlock
+    :param field: name of per-tile field, eg. 'tiles', 'water'
+    :param origin: (x, y, z) map coordinates of volume [0, 0, 0]
+    :return: volume
+    """
+    for block in blocks:
+        window = block_window(block, volume.shape, origin)
+        if window is None:
+            continue
+        values = block_array(block, field, volume.dtype)
+        if values is None:
+            continue
+        volume[window[0]] = values[window[1]]
+    return volume
+
+
+def fill_matpair_volume(types, indices, blocks, field, origin=(0, 0, 0)):
+    """
+    Same as fill_volume, but for MatPair fields, which are split into mat_type and mat_index volumes
+    :return: (types, indices)
+    """
+    for block in blocks:
+        window = block_window(block, types.shape, origin)
+        if window is None:
+            continue
+        values = block_matpair_arrays(block, field)
+        if values is None:
+            continue
+        types[window[0]] = values[0][window[1]]
+        indices[window[0]] = values[1][window[1]]
+    return types, indices
+
+
+def decode_volume(blocks, field, shape, dtype=None, fill=0, origin=(0, 0, 0)):
+    """
+    :param blocks: iterable of RemoteFortressReader.MapBlock
+    :param field: name of per-tile field, eg. 'tiles', 'water'
+    :param shape: (z, y, x) shape of volume, see map_shape
+    :param dtype: dtype of volume, default depends on field
+    :param fill: value of tiles not covered by blocks
+    :param origin: (x, y, z) map coordinates of volume [0, 0, 0]
+    :return: array [z, y, x]
+    """
+    volume = np.full(shape, fill, dtype=dtype or FIELD_DTYPES.get(field, np.int32))
+    return fill_volume(volume, blocks, field, origin)
+
+
+def decode_matpair_volume(blocks, field, shape, fill=-1, origin=(0, 0, 0)):
+    """
+    :return: (mat_type array [z, y, x], mat_index array [z, y, x])
+    """
+    types = np.full(shape, fill, dtype=np.int32)
+    indices = np.full(shape, fill, dtype=np.int32)
+    return fill_matpair_volume(types, indices, blocks, field, origin)
+
+
+# (dz, dy, dx) neighbour offsets, every pair of neighbouring tiles is listed once
+FACE_OFFSETS = [(1, 0, 0), (0, 1, 0), (0, 0, 1)]
+# face neighbours and diagonal neighbours in the same z-level
+PLANE_DIAGONAL_OFFSETS = FACE_OFFSETS + [(0, 1, 1), (0, 1, -1)]
+
+
+def offset_slices(shape, offset):
+    """
+    :return: (first slices, second slices) selecting tiles and their neighbours at offset
+    """
+    first, second = [], []
+    for size, delta in zip(shape, offset):
+        if delta >= 0:
+            first.append(slice(0, size - delta))
+            second.append(slice(delta, size))
+        else:
+            first.append(slice(-delta, size))
+            second.append(slice(0, size + delta))
+    return tuple(first), tuple(second)
+
+
+def offset_edges(ids, first_mask, second_mask, offsets):
+    """
+    :param ids: node ids array [z, y, x], -1 for tiles which are not nodes
+    :param first_mask: bool array [z, y, x] of tiles where edges can start
+    :param second_mask: bool array [z, y, x] of tiles where edges can end
+    :param offsets: list of (dz, dy, dx) offsets of edge end from edge start
+    :return: (a, b) arrays of node ids of edge starts and ends
+    """
+    first_ids, second_ids = [np.zeros(0, dtype=ids.dtype)], [np.zeros(0, dtype=ids.dtype)]
+    for offset in offsets:
+        first, second = offset_slices(ids.shape, offset)
+        both = first_mask[first] & second_mask[second]
+        first_ids.append(ids[first][both])
+        second_ids.append(ids[second][both])
+    return np.concatenate(first_ids), np.concatenate(second_ids)
+
+
+def node_ids(mask, dtype=np.int64):
+    """
+    :return: array [z, y, x] of node ids 0..count-1 of tiles of mask in C order, -1 outside of mask
+    """
+    ids = np.full(mask.shape, -1, dtype=dtype)
+    ids[mask] = np.arange(int(np.count_nonzero(mask)), dtype=dtype)
+    return ids
+
+
+def neighbour_edges(mask, offsets=FACE_OFFSETS):
+    """
+    :param mask: bool array [z, y, x]
+    :param offsets: list of (dz, dy, dx) neighbour offsets
+    :return: (node ids array [z, y, x], -1 outside of mask; (a, b) arrays of node ids of neighbouring tiles)
+    """
+    ids = node_ids(mask)
+    return ids, offset_edges(ids, mask, mask, offsets)
+
+
+def connected_labels(node_count, a, b):
+    """
+    Connected components of graph given by edge list. Every component is a tree of labels, trees are
+    hooked by their smallest root and flattened with pointer jumping, so that only O(log n) passes over
+    edges are needed.
+    :param node_count: number of nodes
+    :param a: array of node ids of edge ends
+    :param b: array of node ids of the other edge ends
+    :return: array of component root (the smallest node id of component) of every node
+    """
+    labels = np.arange(node_count, dtype=np.int64)
+    while len(a):
+        label_a, label_b = labels[a], labels[b]
+        differ = label_a != label_b
+        # edges inside a component stay inside it, drop them
+        a, b, label_a, label_b = a[differ], b[differ], label_a[differ], label_b[differ]
+        if not len(a):
+            break
+        np.minimum.at(labels, np.maximum(label_a, label_b), np.minimum(label_a, label_b))
+        while True:
+            jumped = labels[labels]
+            if np.array_equal(jumped, labels):
+                break
+            labels = jumped
+    return labels
+
+
+def label_components(mask, offsets=FACE_OFFSETS):
+    """
+    Labels connected components of tiles of mask
+    :param mask: bool array [z, y, x]
+    :param offsets: neighbour offsets, FACE_OFFSETS or PLANE_DIAGONAL_OFFSETS
+    :return: (int32 array [z, y, x] of component numbers 1..count, 0 outside of mask; count)
+    """
+    mask = np.asarray(mask, dtype=np.bool_)
+    ids, (a, b) = neighbour_edges(mask, offsets)
+    roots = connected_labels(int(np.count_nonzero(mask)), a, b)
+    _, numbers = np.unique(roots, return_inverse=True)
+
+    labels = np.zeros(mask.shape, dtype=np.int32)
+    labels[mask] = numbers.reshape(-1) + 1
+    return labels, int(numbers.max()) + 1 if len(numbers) else 0
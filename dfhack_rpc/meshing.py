@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+"""
+Chunked greedy meshing of voxel volumes for 3D viewers.
+
+Voxel volume [z, y, x] holds 0 for empty tiles and material code of solid tiles. Faces between solid and
+empty voxels are kept (hidden faces are culled), faces of the same material and plane are merged into
+rectangles (greedy meshing) and split into chunks, every chunk gets its own ready-to-upload buffers:
+
+    mesher = ChunkMesher(tiletype_voxels(tiletype_list), map_shape(map_info))
+    mesher.update(block_list.map_blocks)
+    for key, mesh in mesher.regenerate().items():
+        upload(key, mesh.positions, mesh.normals, mesh.materials, mesh.indices)
+
+Later GetBlockList responses mark only chunks with changed voxels (and chunks next to them, their border
+faces could change) for regeneration. Meshing is vectorized over all dirty chunks at once.
+
+Vertex positions are (x, y, z) map tile coordinates of voxel corners, voxel [z, y, x] spans
+x..x+1, y..y+1, z..z+1. Triangles are counter-clockwise seen from outside.
+"""
+from .map_volume import block_window, block_array
+
+from collections import namedtuple
+
+import numpy as np
+import logging
+
+_logger = logging.getLogger(__name__)
+
+# positions - float32 (N, 3) x, y, z; normals - int8 (N, 3); materials - int32 (N,) voxel values;
+# indices - uint32 (M,) triangle list
+ChunkMesh = namedtuple('ChunkMesh', ['positions', 'normals', 'materials', 'indices'])
+
+# (z, y, x) chunk size in tiles, one map block per chunk
+DEFAULT_CHUNK_SHAPE = (1, 16, 16)
+
+# RemoteFortressReader.TiletypeShape names of solid tiles
+SOLID_SHAPES = ['WALL', 'FORTIFICATION', 'TREE_SHAPE']
+
+# world (x, y, z) unit vector of volume axis
+_AXIS_VECTORS = np.array([[0, 0, 1], [0, 1, 0], [1, 0, 0]], dtype=np.int64)
+
+# corners of a quad in (u, v) units
+_CORNERS_U = np.array([0, 1, 1, 0], dtype=np.int64)
+_CORNERS_V = np.array([0, 0, 1, 1], dtype=np.int64)
+_QUAD_TRIANGLES = np.array([0, 1, 2, 0, 2, 3], dtype=np.uint32)
+
+
+def tiletype_voxels(tiletype_list, solid_shapes=SOLID_SHAPES):
+    """
+    :param tiletype_list: RemoteFortressReader.TiletypeList
+    :param solid_shapes: TiletypeShape names of solid tiles
+    :return: int32 array indexed by tiletype id, voxel value of tiletype: TiletypeMaterial value + 2 for
+        solid tiles, 0 for the rest
+    """
+    tiletypes = tiletype_list.tiletype_list
+    size = max([tiletype.id for tiletype in tiletypes] + [-1]) + 1
+    voxels = np.zeros(size, dtype=np.int32)
+    if not len(tiletypes):
+        return voxels
+
+    shape_enum = tiletypes[0].DESCRIPTOR.fields_by_name['shape'].enum_type
+    solid = set(shape_enum.values_by_name[name].number for name in solid_shapes)
+    for tiletype in tiletypes:
+        if tiletype.shape in solid:
+            voxels[tiletype.id] = tiletype.material + 2
+    return voxels
+
+
+def heightmap(voxels, origin=(0, 0, 0), empty=-1):
+    """
+    :param voxels: array [z, y, x], 0 is empty
+    :param origin: (x, y, z) map coordinates of volume [0, 0, 0]
+    :return: (int32 array [y, x] of z of the highest solid voxel, empty where column is empty;
+        array [y, x] of its voxel value)
+    """
+    solid = voxels != 0
+    from_top = np.argmax(solid[::-1], axis=0)
+    top = voxels.shape[0] - 1 - from_top
+    has_solid = solid.any(axis=0)
+    rows, columns = np.indices(top.shape)
+    heights = np.where(has_solid, top + origin[2], empty).astype(np.int32)
+    values = np.where(has_solid, voxels[top, rows, columns], 0)
+    return heights, values
+
+
+def _padded(voxels, region):
+    """
+    :return: voxels of region with one voxel margin on every side, 0 outside of volume
+    """
+    padded = np.zeros(tuple(stop - start + 2 for start, stop in region), dtype=voxels.dtype)
+    source = tuple(slice(max(start - 1, 0), min(stop + 1, size)) for (start, stop), size in zip(region, voxels.shape))
+    target = tuple(slice(s.start - start + 1, s.stop - start + 1) for s, (start, _) in zip(source, region))
+    padded[target] = voxels[source]
+    return padded
+
+
+def _axis_quads(values, axis, sign, offset, chunk_shape):
+    """
+    Greedy merged faces of one direction
+    :param values: voxel values of visible faces [z, y, x] of region, 0 where there's no face
+    :param axis: volume axis of face normal
+    :param sign: 1 or -1, direction of face normal
+    :param offset: (z, y, x) volume index of region [0, 0, 0]
+    :param chunk_shape: runs and rectangles don't cross chunk borders
+    :return: (quad arrays (d, u, v, height, width, value) in volume indices, (u axis, v axis))
+    """
+    u_axis, v_axis = [other for other in range(3) if other != axis]
+    faces = np.moveaxis(values, axis, 0)  # [d, u, v]
+    v_global = np.arange(faces.shape[2]) + offset[v_axis]
+
+    previous = np.zeros_like(faces)
+    previous[..., 1:] = faces[..., :-1]
+    following = np.zeros_like(faces)
+    following[..., :-1] = faces[..., 1:]
+    present = faces != 0
+    starts = present & ((faces != previous) | (v_global % chunk_shape[v_axis] == 0))
+    ends = present & ((faces != following) | ((v_global + 1) % chunk_shape[v_axis] == 0))
+
+    d, u, v = np.nonzero(starts)
+    widths = np.nonzero(ends)[2] - v + 1
+    value = faces[d, u, v]
+
+    # rows of equal runs in consecutive u form a rectangle
+    order = np.lexsort((u, value, widths, v, d))
+    d, u, v, widths, value = d[order], u[order], v[order], widths[order], value[order]
+    new = np.ones(len(d), dtype=np.bool_)
+    new[1:] = (
+        (d[1:] != d[:-1]) | (v[1:] != v[:-1]) | (widths[1:] != widths[:-1]) | (value[1:] != value[:-1])
+        | (u[1:] != u[:-1] + 1)
+    )
+    new |= (u + offset[u_axis]) % chunk_shape[u_axis] == 0
+    firsts = np.nonzero(new)[0]
+    heights = np.diff(np.append(firsts, len(d)))
+
+    quads = (
+        d[firsts] + offset[axis], u[firsts] + offset[u_axis], v[firsts] + offset[v_axis],
+        heights, widths[firsts], value[firsts],
+    )
+    return quads, (u_axis, v_axis)
+
+
+def mesh_region(voxels, region, chunk_shape=DEFAULT_CHUNK_SHAPE, origin=(0, 0, 0)):
+    """
+    Greedy meshes faces of voxels in region, voxels outside of region are used only for culling
+    :param voxels: array [z, y, x], 0 is empty
+    :param region: ((z start, z stop), (y start, y stop), (x start, x stop)) volume indices
+    :param chunk_shape: (z, y, x) chunk size
+    :param origin: (x, y, z) map coordinates of volume [0, 0, 0]
+    :return: {(chunk z, chunk y, chunk x): ChunkMesh} of chunks with faces
+    """
+    padded = _padded(voxels, region)
+    inner = padded[1:-1, 1:-1, 1:-1]
+    offset = tuple(start for start, _ in region)
+    solid = inner != 0
+
+    parts = []
+    for axis in range(3):
+        for sign in (1, -1):
+            neighbour = [slice(1, -1)] * 3
+            neighbour[axis] = slice(1 + sign, padded.shape[axis] - 1 + sign)
+            visible = solid & (padded[tuple(neighbour)] == 0)
+            quads, (u_axis, v_axis) = _axis_quads(np.where(visible, inner, 0), axis, sign, offset, chunk_shape)
+            if len(quads[0]):
+                parts.append((axis, sign, u_axis, v_axis, quads))
+
+    meshes = {}
+    chunk_keys = []
+    vertex_parts = []
+    for axis, sign, u_axis, v_axis, (d, u, v, heights, widths, value) in parts:
+        # corners [quad, corner, volume axis]
+        corners = np.zeros((len(d), 4, 3), dtype=np.int64)
+        corners[:, :, axis] = (d + (1 if sign > 0 else 0))[:, None]
+        corners[:, :, u_axis] = u[:, None] + heights[:, None] * _CORNERS_U
+        corners[:, :, v_axis] = v[:, None] + widths[:, None] * _CORNERS_V
+        facing = np.dot(np.cross(_AXIS_VECTORS[u_axis], _AXIS_VECTORS[v_axis]), _AXIS_VECTORS[axis]) * sign
+        if facing < 0:
+            corners = corners[:, ::-1]
+
+        voxel_index = np.zeros((len(d), 3), dtype=np.int64)
+        voxel_index[:, axis], voxel_index[:, u_axis], voxel_index[:, v_axis] = d, u, v
+        chunk_keys.append(voxel_index // np.array(chunk_shape))
+        positions = corners[:, :, ::-1] + np.array(origin)
+        normal = _AXIS_VECTORS[axis] * sign
+        vertex_parts.append((positions, np.broadcast_to(normal, positions.shape), np.repeat(value, 4)))
+
+    if not parts:
+        return meshes
+
+    keys = np.concatenate(chunk_keys)
+    positions = np.concatenate([part[0] for part in vertex_parts]).astype(np.float32)
+    normals = np.concatenate([part[1] for part in vertex_parts]).astype(np.int8)
+    materials = np.concatenate([part[2] for part in vertex_parts]).astype(np.int32).reshape(-1, 4)
+
+    order = np.lexsort(keys.T[::-1])
+    keys, positions, normals, materials = keys[order], positions[order], normals[order], materials[order]
+    boundaries = np.nonzero(np.any(keys[1:] != keys[:-1], axis=1))[0] + 1
+    for start, stop in zip(np.concatenate([[0], boundaries]), np.concatenate([boundaries, [len(keys)]])):
+        count = stop - start
+        indices = (np.arange(count, dtype=np.uint32)[:, None] * 4 + _QUAD_TRIANGLES).reshape(-1)
+        meshes[tuple(keys[start].tolist())] = ChunkMesh(
+            positions[start:stop].reshape(-1, 3),
+            normals[start:stop].reshape(-1, 3),
+            materials[start:stop].reshape(-1),
+            indices,
+        )
+    return meshes
+
+
+class ChunkMesher(object):
+    """
+    Voxel volume of the map with meshes of chunks regenerated when their voxels change
+    """
+
+    def __init__(self, voxel_table, shape, chunk_shape=DEFAULT_CHUNK_SHAPE, origin=(0, 0, 0)):
+        """
+        :param voxel_table: array of voxel value indexed by tiletype id, see tiletype_voxels
+        :param shape: (z, y, x) shape of volume, see map_volume.map_shape
+        :param chunk_shape: (z, y, x) chunk size
+        :param origin: (x, y, z) map coordinates of volume [0, 0, 0]
+        """
+        self.voxel_table = np.asarray(voxel_table, dtype=np.int32)
+        self.shape = tuple(shape)
+        self.chunk_shape = tuple(chunk_shape)
+        self.origin = tuple(origin)
+        self.voxels = np.zeros(self.shape, dtype=np.int32)
+        self.chunk_counts = tuple(-(-size // chunk) for size, chunk in zip(self.shape, self.chunk_shape))
+        self.meshes = {}  # {chunk key: ChunkMesh}
+        self.dirty = set()
+
+    def chunk_of(self, z, y, x):
+        """
+        :return: chunk key (chunk z, chunk y, chunk x) of volume index
+        """
+        return z // self.chunk_shape[0], y // self.chunk_shape[1], x // self.chunk_shape[2]
+
+    def mark_dirty(self, chunks):
+        """
+        Marks chunks and their face neighbours (border faces depend on neighbour voxels) for regeneration
+        """
+        for key in chunks:
+            for axis in range(3):
+                for delta in (-1, 1):
+                    neighbour = list(key)
+                    neighbour[axis] += delta
+                    if 0 <= neighbour[axis] < self.chunk_counts[axis]:
+                        self.dirty.add(tuple(neighbour))
+            self.dirty.add(tuple(key))
+
+    def set_voxels(self, voxels):
+        """
+        Replaces the whole volume, all chunks are regenerated
+        """
+        self.voxels[...] = voxels
+        self.meshes = {}
+        self.dirty = set(np.ndindex(*self.chunk_counts))
+
+    def update(self, blocks):
+        """
+        Writes voxels of tiles of blocks, blocks without tiles are skipped
+        :param blocks: iterable of RemoteFortressReader.MapBlock
+        :return: set of chunk keys with changed voxels
+        """
+        changed = set()
+        for block in blocks:
+            window = block_window(block, self.shape, self.origin)
+            if window is None:
+                continue
+            tiles = block_array(block, 'tiles')
+            if tiles is None:
+                continue
+            tiles = tiles[window[1]]
+            valid = (tiles >= 0) & (tiles < len(self.voxel_table))
+            voxels = np.zeros(tiles.shape, dtype=np.int32)
+            voxels[valid] = self.voxel_table[tiles[valid]]
+
+            current = self.voxels[window[0]]
+            differ = voxels != current
+            if not differ.any():
+                continue
+            current[...] = voxels
+            z = window[0][0]
+            y_start, x_start = window[0][1].start, window[0][2].start
+            ys, xs = np.nonzero(differ)
+            changed.update(set(zip(
+                [z // self.chunk_shape[0]] * len(ys),
+                ((ys + y_start) // self.chunk_shape[1]).tolist(),
+                ((xs + x_start) // self.chunk_shape[2]).tolist(),
+            )))
+
+        self.mark_dirty(changed)
+        return changed
+
+    def regenerate(self):
+        """
+        Meshes dirty chunks, chunks of one chunk z-level are meshed together
+        :return: {chunk key: ChunkMesh or None} of regenerated chunks, None for chunks without faces
+        """
+        dirty, self.dirty = self.dirty, set()
+        regenerated = dict.fromkeys(dirty)
+        levels = {}
+        for key in dirty:
+            levels.setdefault(key[0], []).append(key)
+
+        for chunk_z, keys in levels.items():
+            keys = np.array(keys)
+            region = (
+                (chunk_z * self.chunk_shape[0], min((chunk_z + 1) * self.chunk_shape[0], self.shape[0])),
+                (keys[:, 1].min() * self.chunk_shape[1], min((keys[:, 1].max() + 1) * self.chunk_shape[1], self.shape[1])),
+                (keys[:, 2].min() * self.chunk_shape[2], min((keys[:, 2].max() + 1) * self.chunk_shape[2], self.shape[2])),
+            )
+            for key, mesh in mesh_region(self.voxels, region, self.chunk_shape, self.origin).items():
+                if key in regenerated:
+                    regenerated[key] = mesh
+
+        for key, mesh in regenerated.items():
+            if mesh is None:
+                self.meshes.pop(key, None)
+            else:
+                self.meshes[key] = mesh
+        _logger.debug('Regenerated {} chunks'.format(len(regenerated)))
+        return regenerated
+
+    def heightmap(self, empty=-1):
+        """
+        :return: (int32 array [y, x] of z of the highest solid voxel, array [y, x] of its voxel value)
+        """
+        return heightmap(self.voxels, self.origin, empty)
@@ -0,0 +1,517 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+"""
+Walkability and connectivity of the map built from MapBlock.tiles and TiletypeShape of GetTiletypeList.
+
+NavigationGrid classifies tiles by shape of their tiletype (walkable, stairs, ramps, open space), stores
+possible moves of every tile as bits of a move volume and labels connected components with NumPy:
+
+    tiletype_list, _ = rpc.call_method('GetTiletypeList')
+    grid = NavigationGrid(tiletype_list, map_shape(map_info))
+    grid.update(block_list.map_blocks)
+
+    grid.connected(dwarf_pos, workshop_pos)  # component lookup, no search
+    path = grid.path(dwarf_pos, workshop_pos)  # A*, list of (x, y, z)
+
+Moves: to the 8 neighbours in the same z-level, up and down stairs (STAIR_UP / STAIR_UPDOWN below
+STAIR_DOWN / STAIR_UPDOWN) and from RAMP to the 8 neighbours one z-level up, if the tile above the ramp
+is open. Hidden tiles are not walkable unless hidden_walkable is set. All moves cost 1.
+
+Components are kept per block: tiles of a block are labeled by moves inside the block, and these local
+components are joined by moves between blocks. update() marks blocks where walkability changed, the next
+query recomputes moves of the blocks and their 1 tile border and local components of the blocks only,
+then joins local components of the whole map, which is a much smaller graph than the tiles.
+
+Cached paths are dropped when blocks on them change, or when the change touches their component (a new
+move could make a shorter path), so a cached path is always a shortest one.
+
+Positions are (x, y, z) local map tile coordinates, see map_volume.
+"""
+from .map_volume import BLOCK_SIZE, block_key, block_window, block_array, node_ids, offset_slices, \
+    connected_labels
+
+import heapq
+import numpy as np
+import logging
+
+_logger = logging.getLogger(__name__)
+
+# tile classes, bits of class volume
+WALKABLE = 1
+STAIR_UP = 2
+STAIR_DOWN = 4
+RAMP = 8
+OPEN = 16  # not solid, ramps can be climbed only with open tile above
+
+# RemoteFortressReader.TiletypeShape name: tile class
+SHAPE_CLASSES = {
+    'NO_SHAPE': 0,
+    'EMPTY': OPEN,
+    'FLOOR': WALKABLE | OPEN,
+    'BOULDER': WALKABLE | OPEN,
+    'PEBBLES': WALKABLE | OPEN,
+    'WALL': 0,
+    'FORTIFICATION': 0,
+    'STAIR_UP': WALKABLE | OPEN | STAIR_UP,
+    'STAIR_DOWN': WALKABLE | OPEN | STAIR_DOWN,
+    'STAIR_UPDOWN': WALKABLE | OPEN | STAIR_UP | STAIR_DOWN,
+    'RAMP': WALKABLE | OPEN | RAMP,
+    'RAMP_TOP': OPEN,
+    'BROOK_BED': WALKABLE | OPEN,
+    'BROOK_TOP': WALKABLE | OPEN,
+    'TREE_SHAPE': 0,
+    'SAPLING': WALKABLE | OPEN,
+    'SHRUB': WALKABLE | OPEN,
+    'ENDLESS_PIT': OPEN,
+    'BRANCH': WALKABLE | OPEN,
+    'TRUNK_BRANCH': WALKABLE | OPEN,
+    'TWIG': OPEN,
+}
+
+# (dy, dx) moves in z-level
+PLANE_MOVES = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
+
+# (dz, dy, dx) of moves, bit i of move volume is set when move MOVES[i] from the tile is possible:
+# in z-level, stairs up and down, from ramp up and back down to ramp
+MOVES = (
+    [(0, dy, dx) for dy, dx in PLANE_MOVES]
+    + [(1, 0, 0), (-1, 0, 0)]
+    + [(1, dy, dx) for dy, dx in PLANE_MOVES]
+    + [(-1, dy, dx) for dy, dx in PLANE_MOVES]
+)
+# moves in z-level going forward in C order, the rest of them are the same moves backwards
+PLANE_FORWARD_BITS = [MOVES.index(offset) for offset in [(0, 0, 1), (0, 1, -1), (0, 1, 0), (0, 1, 1)]]
+# moves one z-level up, moves down are the same moves backwards
+UP_BITS = [bit for bit, offset in enumerate(MOVES) if offset[0] == 1]
+
+# blocks changed since the last query, above this fraction of all blocks the whole map is rebuilt at once
+INCREMENTAL_MAX_FRACTION = 0.125
+
+
+def tiletype_classes(tiletype_list, shape_classes=None):
+    """
+    :param tiletype_list: RemoteFortressReader.TiletypeList
+    :param shape_classes: {TiletypeShape name: tile class}, SHAPE_CLASSES if None
+    :return: uint8 array of tile class indexed by tiletype id
+    """
+    shape_classes = SHAPE_CLASSES if shape_classes is None else shape_classes
+    shape_enum = tiletype_list.tiletype_list[0].DESCRIPTOR.fields_by_name['shape'].enum_type \
+        if len(tiletype_list.tiletype_list) else None
+
+    size = max([tiletype.id for tiletype in tiletype_list.tiletype_list] + [-1]) + 1
+    classes = np.zeros(size, dtype=np.uint8)
+    for tiletype in tiletype_list.tiletype_list:
+        classes[tiletype.id] = shape_classes.get(shape_enum.values_by_number[tiletype.shape].name, 0)
+    return classes
+
+
+def move_volume(classes):
+    """
+    :param classes: uint8 array [z, y, x] of tile classes
+    :return: uint32 array [z, y, x] of possible moves from tiles, bit i for move MOVES[i]
+    """
+    walkable = (classes & WALKABLE) != 0
+    stair_up = (classes & STAIR_UP) != 0
+    stair_down = (classes & STAIR_DOWN) != 0
+    ramp_open = np.zeros(classes.shape, dtype=np.bool_)
+    ramp_open[:-1] = ((classes[:-1] & RAMP) != 0) & ((classes[1:] & OPEN) != 0)
+    # (start mask, end mask) of every move
+    ends = [(walkable, walkable)] * len(PLANE_MOVES) + [(stair_up, stair_down), (stair_down, stair_up)] \
+        + [(ramp_open, walkable)] * len(PLANE_MOVES) + [(walkable, ramp_open)] * len(PLANE_MOVES)
+
+    moves = np.zeros(classes.shape, dtype=np.uint32)
+    for bit, (offset, (first_mask, second_mask)) in enumerate(zip(MOVES, ends)):
+        first, second = offset_slices(classes.shape, offset)
+        moves[first] |= (first_mask[first] & second_mask[second]).astype(np.uint32) << np.uint32(bit)
+    return moves
+
+
+def _block_cell(x, y, z):
+    return x // BLOCK_SIZE, y // BLOCK_SIZE, z
+
+
+def _expand(box, shape, size):
+    """
+    :return: slices of box grown by size tiles in every direction, clipped to shape
+    """
+    return tuple(slice(max(part.start - size, 0), min(part.stop + size, limit)) for part, limit in zip(box, shape))
+
+
+class NavigationGrid(object):
+    """
+    Tile classes and moves of the map with per-block components, global components and A* paths
+    """
+
+    def __init__(self, tiletype_list, shape, origin=(0, 0, 0), hidden_walkable=False, shape_classes=None):
+        """
+        :param tiletype_list: RemoteFortressReader.TiletypeList, see tiletype_classes
+        :param shape: (z, y, x) shape of grid, see map_volume.map_shape
+        :param origin: (x, y, z) map coordinates of grid [0, 0, 0]
+        :param hidden_walkable: hidden tiles are classified by their shape as well
+        :param shape_classes: {TiletypeShape name: tile class}, SHAPE_CLASSES if None
+        """
+        self.tile_classes = tiletype_classes(tiletype_list, shape_classes)
+        self.shape = tuple(shape)
+        self.origin = tuple(origin)
+        self.hidden_walkable = hidden_walkable
+        self.tiles = np.zeros(self.shape, dtype=np.int32)
+        self.hidden = np.zeros(self.shape, dtype=np.bool_)
+        self.classes = np.zeros(self.shape, dtype=np.uint8)
+
+        # nodes of the graph are walkable tiles, node id is index of tile in C order
+        self.dirty = True
+        self.dirty_blocks = None  # keys of blocks changed since the last query, None if all
+        self.moves = np.zeros(self.shape, dtype=np.uint32)  # see move_volume
+        self.local = np.full(self.shape, -1, dtype=np.int32)  # local component (its smallest node) of tiles
+        self.is_root = np.zeros(self.shape, dtype=np.bool_)  # tile is the smallest node of its local component
+        self.components = np.zeros(self.local.size, dtype=np.int32)  # component (smallest node) of local roots
+        self.root_index = np.zeros(self.local.size, dtype=np.int32)  # index of local roots in sorted roots
+        self.between = None  # (a, b) arrays of nodes of moves between blocks
+        self.steps = [(dz * self.shape[1] + dy) * self.shape[2] + dx for dz, dy, dx in MOVES]
+        self.paths = {}  # {(start, goal): (path, set of block cells)}
+
+    def classify(self, tiles, hidden):
+        valid = (tiles >= 0) & (tiles < len(self.tile_classes))
+        classes = np.zeros(tiles.shape, dtype=np.uint8)
+        classes[valid] = self.tile_classes[tiles[valid]]
+        if not self.hidden_walkable:
+            classes[hidden] = 0
+        return classes
+
+    def update(self, blocks):
+        """
+        Writes tiles and hidden flags of blocks, blocks without the fields are skipped
+        :param blocks: iterable of RemoteFortressReader.MapBlock
+        :return: set of keys of blocks where tile classes changed
+        """
+        changed = set()
+        for block in blocks:
+            window = block_window(block, self.shape, self.origin)
+            if window is None:
+                continue
+            tiles = block_array(block, 'tiles')
+            hidden = block_array(block, 'hidden')
+            if tiles is None and hidden is None:
+                continue
+            if tiles is not None:
+                self.tiles[window[0]] = tiles[window[1]]
+            if hidden is not None:
+                self.hidden[window[0]] = hidden[window[1]]
+
+            classes = self.classify(self.tiles[window[0]], self.hidden[window[0]])
+            if not np.array_equal(classes, self.classes[window[0]]):
+                self.classes[window[0]] = classes
+                changed.add(block_key(block))
+
+        if changed:
+            self.invalidate(changed)
+        return changed
+
+    def invalidate(self, block_keys=None):
+        """
+        Marks blocks for update by the next query and drops cached paths going through them
+        :param block_keys: keys of changed blocks, the whole grid is rebuilt and all cached paths are dropped if None
+        """
+        self.dirty = True
+        if block_keys is None:
+            self.dirty_blocks = None
+            self.paths = {}
+            return
+        if self.dirty_blocks is not None:
+            self.dirty_blocks.update(block_keys)
+        cells = set(_block_cell(*key) for key in block_keys)
+        self.paths = {key: value for key, value in self.paths.items() if not value[1] & cells}
+
+    def block_box(self, key):
+        """
+        :param key: (map_x, map_y, map_z) block key
+        :return: slices of block tiles in grid, None if block is outside of grid
+        """
+        z, y, x = key[2] - self.origin[2], key[1] - self.origin[1], key[0] - self.origin[0]
+        box = (slice(z, z + 1), slice(max(y, 0), min(y + BLOCK_SIZE, self.shape[1])),
+               slice(max(x, 0), min(x + BLOCK_SIZE, self.shape[2])))
+        if not 0 <= z < self.shape[0] or box[1].start >= box[1].stop or box[2].start >= box[2].stop:
+            return None
+        return box
+
+    def _update_moves(self, box):
+        """
+        Recomputes moves of tiles of box and its 1 tile border, moves depend on classes of neighbours
+        """
+        border = _expand(box, self.shape, 1)
+        window = _expand(box, self.shape, 2)
+        moves = move_volume(self.classes[window])
+        self.moves[border] = moves[tuple(
+            slice(part.start - outer.start, part.stop - outer.start) for part, outer in zip(border, window)
+        )]
+
+    def _block_indices(self, axis, part):
+        """
+        :return: block coordinate of grid coordinates of part along axis (1 - y, 2 - x)
+        """
+        return (np.arange(part.start, part.stop) + self.origin[2 - axis]) // BLOCK_SIZE
+
+    def _label_local(self, box):
+        """
+        Labels local components of blocks in box by moves in z-level inside the blocks
+        :param box: slices of whole blocks (clipped by grid)
+        """
+        walkable = (self.classes[box] & WALKABLE) != 0
+        moves = self.moves[box]
+        ids = node_ids(walkable, np.int64)
+        block_y, block_x = self._block_indices(1, box[1]), self._block_indices(2, box[2])
+
+        a, b = [], []
+        for bit in PLANE_FORWARD_BITS:
+            first, second = offset_slices(walkable.shape, MOVES[bit])
+            inside = (block_y[first[1]] == block_y[second[1]])[:, None] & (block_x[first[2]] == block_x[second[2]])
+            has = ((moves[first] >> np.uint32(bit)) & 1).astype(np.bool_) & inside
+            a.append(ids[first][has])
+            b.append(ids[second][has])
+        count = int(np.count_nonzero(walkable))
+        labels = connected_labels(count, np.concatenate(a), np.concatenate(b))
+
+        # nodes are in C order in box as well as in grid, the smallest node of box is the smallest in grid
+        z, y, x = np.nonzero(walkable)
+        nodes = np.ravel_multi_index((z + box[0].start, y + box[1].start, x + box[2].start), self.shape)
+        local = self.local[box]
+        local[...] = -1
+        local[walkable] = nodes[labels]
+        is_root = self.is_root[box]
+        is_root[...] = False
+        is_root[walkable] = labels == np.arange(count)
+
+    def _between_blocks(self, nodes):
+        """
+        :param nodes: array of nodes, moves starting in them are checked
+        :return: (a, b) arrays of nodes of moves between blocks starting in nodes, every move once
+        """
+        values = self.moves.reshape(-1)[nodes]
+        _, y, x = np.unravel_index(nodes, self.shape)
+        block_y = self._block_indices(1, slice(0, self.shape[1]))
+        block_x = self._block_indices(2, slice(0, self.shape[2]))
+
+        a, b = [], []
+        for bit in PLANE_FORWARD_BITS + UP_BITS:
+            has = ((values >> np.uint32(bit)) & 1).astype(np.bool_)
+            _, dy, dx = MOVES[bit]
+            if MOVES[bit][0] == 0:
+                # move exists, so the neighbour is in grid
+                has &= (block_y[y] != block_y[np.minimum(y + dy, self.shape[1] - 1)]) \
+                    | (block_x[x] != block_x[np.clip(x + dx, 0, self.shape[2] - 1)])
+            a.append(nodes[has])
+            b.append(nodes[has] + self.steps[bit])
+        return np.concatenate(a), np.concatenate(b)
+
+    def _edge_nodes(self):
+        """
+        :return: array of nodes where moves between blocks can start: on block edges and with moves up
+        """
+        moves = self.moves
+        block_y = self._block_indices(1, slice(0, self.shape[1]))
+        block_x = self._block_indices(2, slice(0, self.shape[2]))
+        # forward moves in z-level leave block from its last row, last column or first column
+        rows = np.flatnonzero(block_y[1:] != block_y[:-1])
+        columns = np.union1d(np.flatnonzero(block_x[1:] != block_x[:-1]),
+                             np.flatnonzero(block_x[1:] != block_x[:-1]) + 1)
+
+        plane_mask = np.uint32(sum(1 << bit for bit in PLANE_FORWARD_BITS))
+        candidates = (moves & np.uint32(sum(1 << bit for bit in UP_BITS))) != 0
+        candidates[:, rows, :] |= (moves[:, rows, :] & plane_mask) != 0
+        candidates[:, :, columns] |= (moves[:, :, columns] & plane_mask) != 0
+        return np.flatnonzero(candidates)
+
+    def _label_components(self):
+        """
+        Joins local components by moves between blocks
+        """
+        roots = np.flatnonzero(self.is_root)
+        self.root_index[roots] = np.arange(len(roots), dtype=np.int32)
+        local = self.local.reshape(-1)
+        a, b = self.between
+        labels = connected_labels(len(roots), self.root_index[local[a]], self.root_index[local[b]])
+        self.components[roots] = roots[labels]
+        _logger.debug('{} local components joined by {} moves between blocks'.format(len(roots), len(a)))
+
+    def rebuild(self):
+        """
+        Builds moves and components of the whole grid
+        """
+        self.moves = move_volume(self.classes)
+        self._label_local((slice(0, self.shape[0]), slice(0, self.shape[1]), slice(0, self.shape[2])))
+        self.between = self._between_blocks(self._edge_nodes())
+        self._label_components()
+        self.paths = {}
+        self.dirty = False
+        self.dirty_blocks = set()
+        _logger.debug('Navigation graph of {} tiles built'.format(int(np.count_nonzero(self.local >= 0))))
+
+    def _update_blocks(self, block_keys):
+        """
+        Updates moves, local components and moves between blocks around changed blocks and joins components again
+        """
+        boxes = [box for box in (self.block_box(key) for key in block_keys) if box is not None]
+        borders = [_expand(box, self.shape, 1) for box in boxes]
+        for box in boxes:
+            self._update_moves(box)
+        for box in boxes:
+            self._label_local(box)
+
+        # moves changed only in blocks and their borders
+        changed = np.zeros(self.shape, dtype=np.bool_)
+        for border in borders:
+            changed[border] = True
+        changed = changed.reshape(-1)
+        a, b = self.between
+        keep = ~changed[a]
+        new_a, new_b = self._between_blocks(np.flatnonzero(changed))
+        self.between = np.concatenate([a[keep], new_a]), np.concatenate([b[keep], new_b])
+        self._label_components()
+
+        # changed tiles could make shorter paths in components around them
+        touched = set()
+        for border in borders:
+            local = self.local[border]
+            touched.update(np.unique(self.components[local[local >= 0]]).tolist())
+        paths = {}
+        for key, value in self.paths.items():
+            start = self.node(key[0])
+            if start is not None and int(self.components[self.local.flat[start]]) not in touched:
+                paths[key] = value
+        self.paths = paths
+        _logger.debug('Navigation graph updated in {} blocks'.format(len(boxes)))
+
+    def ensure_graph(self):
+        if not self.dirty:
+            return
+        block_count = self.shape[0] * -(-self.shape[1] // BLOCK_SIZE) * -(-self.shape[2] // BLOCK_SIZE)
+        if self.dirty_blocks is None or len(self.dirty_blocks) > block_count * INCREMENTAL_MAX_FRACTION:
+            self.rebuild()
+            return
+        self._update_blocks(self.dirty_blocks)
+        self.dirty = False
+        self.dirty_blocks = set()
+
+    def node(self, pos):
+        """
+        :param pos: (x, y, z) map coordinates
+        :return: node id (index in C order) of walkable tile, None if tile isn't walkable or is outside of grid
+        """
+        z, y, x = pos[2] - self.origin[2], pos[1] - self.origin[1], pos[0] - self.origin[0]
+        if not (0 <= z < self.shape[0] and 0 <= y < self.shape[1] and 0 <= x < self.shape[2]):
+            return None
+        if not self.classes[z, y, x] & WALKABLE:
+            return None
+        return (z * self.shape[1] + y) * self.shape[2] + x
+
+    def position(self, node):
+        """
+        :return: (x, y, z) map coordinates of node
+        """
+        z, rest = divmod(node, self.shape[1] * self.shape[2])
+        y, x = divmod(rest, self.shape[2])
+        return x + self.origin[0], y + self.origin[1], z + self.origin[2]
+
+    def walkable(self, pos):
+        return self.node(pos) is not None
+
+    def component(self, pos):
+        """
+        :return: component id (smallest node id of component) of tile, None if tile isn't walkable
+        """
+        node = self.node(pos)
+        if node is None:
+            return None
+        self.ensure_graph()
+        return int(self.components[self.local.flat[node]])
+
+    def connected(self, start, goal):
+        """
+        :return: True if goal can be reached from start
+        """
+        start_component = self.component(start)
+        return start_component is not None and start_component == self.component(goal)
+
+    def reachable(self, pos):
+        """
+        :return: bool array [z, y, x] of tiles reachable from tile
+        """
+        component = self.component(pos)
+        if component is None:
+            return np.zeros(self.shape, dtype=np.bool_)
+        return (self.local >= 0) & (self.components[np.maximum(self.local, 0)] == component)
+
+    def neighbours(self, node):
+        """
+        :return: list of nodes reachable from node with one move
+        """
+        moves = int(self.moves.flat[node])
+        return [node + step for bit, step in enumerate(self.steps) if moves >> bit & 1]
+
+    def path(self, start, goal, max_nodes=None):
+        """
+        Shortest path found with A*, cached until blocks on it or tiles of its component change
+        :param start: (x, y, z) map coordinates
+        :param goal: (x, y, z) map coordinates
+        :param max_nodes: gives up after expanding this many tiles
+        :return: list of (x, y, z) from start to goal, None if goal is unreachable
+        """
+        key = (tuple(start), tuple(goal))
+        if not self.connected(start, goal):
+            return None
+        if key in self.paths:
+            return list(self.paths[key][0])
+
+        start_node, goal_node = self.node(start), self.node(goal)
+        plane = self.shape[1] * self.shape[2]
+        width = self.shape[2]
+        goal_z, rest = divmod(goal_node, plane)
+        goal_y, goal_x = divmod(rest, width)
+        moves, steps = self.moves.reshape(-1), self.steps
+
+        came_from = {start_node: None}
+        costs = {start_node: 0}
+        # (cost + estimate, estimate, node), cost is their difference
+        queue = [(0, 0, start_node)]
+        expanded = 0
+        while queue:
+            total, estimate, node = heapq.heappop(queue)
+            cost = total - estimate
+            if cost > costs[node]:
+                # node was queued again with lower cost and already expanded
+                continue
+            if node == goal_node:
+                break
+            expanded += 1
+            if max_nodes is not None and expanded > max_nodes:
+                return None
+
+            cost += 1
+            node_moves = int(moves[node])
+            while node_moves:
+                lowest = node_moves & -node_moves
+                node_moves ^= lowest
+                neighbour = node + steps[lowest.bit_length() - 1]
+                if cost < costs.get(neighbour, cost + 1):
+                    costs[neighbour] = cost
+                    came_from[neighbour] = node
+                    z, rest = divmod(neighbour, plane)
+                    y, x = divmod(rest, width)
+                    # Chebyshev distance, every move changes each coordinate by at most 1
+                    estimate = max(abs(z - goal_z), abs(y - goal_y), abs(x - goal_x))
+                    heapq.heappush(queue, (cost + estimate, estimate, neighbour))
+
+        nodes = []
+        node = goal_node
+        while node is not None:
+            nodes.append(node)
+            node = came_from[node]
+        path = [self.position(node) for node in reversed(nodes)]
+        self.paths[key] = (path, set(_block_cell(*pos) for pos in path))
+        return list(path)
+
+    def packed(self):
+        """
+        :return: walkability bitmap packed to bits with np.packbits along x
+        """
+        return np.packbits((self.classes & WALKABLE) != 0, axis=-1)
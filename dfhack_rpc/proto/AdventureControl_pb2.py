@@ -1,14 +1,11 @@
+# -*- coding: utf-8 -*-
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
 # source: AdventureControl.proto
-
-import sys
-_b=sys.version_info[0]<3 and (lambda x:x) or (lambda x:x.encode('latin1'))
-from google.protobuf.internal import enum_type_wrapper
+"""Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
 from google.protobuf import descriptor as _descriptor
-from google.protobuf import message as _message
-from google.protobuf import reflection as _reflection
+from google.protobuf import descriptor_pool as _descriptor_pool
 from google.protobuf import symbol_database as _symbol_database
-from google.protobuf import descriptor_pb2
 # @@protoc_insertion_point(imports)
 
 _sym_db = _symbol_database.Default()
@@ -17,574 +14,26 @@ _sym_db = _symbol_database.Default()
 from . import RemoteFortressReader_pb2 as RemoteFortressReader__pb2
 
 
-DESCRIPTOR = _descriptor.FileDescriptor(
-  name='AdventureControl.proto',
-  package='AdventureControl',
-  syntax='proto2',
-  serialized_pb=_b('\n\x16\x41\x64ventureControl.proto\x12\x10\x41\x64ventureControl\x1a\x1aRemoteFortressReader.proto\"C\n\x11MoveCommandParams\x12.\n\tdirection\x18\x01 \x01(\x0b\x32\x1b.RemoteFortressReader.Coord\"\xd1\x01\n\x0eMovementOption\x12)\n\x04\x64\x65st\x18\x01 \x01(\x0b\x32\x1b.RemoteFortressReader.Coord\x12+\n\x06source\x18\x02 \x01(\x0b\x32\x1b.RemoteFortressReader.Coord\x12)\n\x04grab\x18\x03 \x01(\x0b\x32\x1b.RemoteFortressReader.Coord\x12<\n\rmovement_type\x18\x04 \x01(\x0e\x32%.AdventureControl.CarefulMovementType\"x\n\x0cMenuContents\x12\x33\n\x0c\x63urrent_menu\x18\x01 \x01(\x0e\x32\x1d.AdventureControl.AdvmodeMenu\x12\x33\n\tmovements\x18\x02 \x03(\x0b\x32 .AdventureControl.MovementOption\">\n\x0eMiscMoveParams\x12,\n\x04type\x18\x01 \x01(\x0e\x32\x1e.AdventureControl.MiscMoveType*\xc7\x05\n\x0b\x41\x64vmodeMenu\x12\x0b\n\x07\x44\x65\x66\x61ult\x10\x00\x12\x08\n\x04Look\x10\x01\x12\x17\n\x13\x43onversationAddress\x10\x02\x12\x16\n\x12\x43onversationSelect\x10\x03\x12\x15\n\x11\x43onversationSpeak\x10\x04\x12\r\n\tInventory\x10\x05\x12\x08\n\x04\x44rop\x10\x06\x12\r\n\tThrowItem\x10\x07\x12\x08\n\x04Wear\x10\x08\x12\n\n\x06Remove\x10\t\x12\x0c\n\x08Interact\x10\n\x12\x07\n\x03Put\x10\x0b\x12\x10\n\x0cPutContainer\x10\x0c\x12\x07\n\x03\x45\x61t\x10\r\x12\x0c\n\x08ThrowAim\x10\x0e\x12\x08\n\x04\x46ire\x10\x0f\x12\x07\n\x03Get\x10\x10\x12\t\n\x05Unk17\x10\x11\x12\x0f\n\x0b\x43ombatPrefs\x10\x12\x12\x0e\n\nCompanions\x10\x13\x12\x11\n\rMovementPrefs\x10\x14\x12\x0e\n\nSpeedPrefs\x10\x15\x12\x12\n\x0eInteractAction\x10\x16\x12\x11\n\rMoveCarefully\x10\x17\x12\x11\n\rAnnouncements\x10\x18\x12\x0f\n\x0bUseBuilding\x10\x19\x12\n\n\x06Travel\x10\x1a\x12\t\n\x05Unk27\x10\x1b\x12\t\n\x05Unk28\x10\x1c\x12\x10\n\x0cSleepConfirm\x10\x1d\x12\x1b\n\x17SelectInteractionTarget\x10\x1e\x12\t\n\x05Unk31\x10\x1f\x12\t\n\x05Unk32\x10 \x12\x0e\n\nFallAction\x10!\x12\x0e\n\nViewTracks\x10\"\x12\x08\n\x04Jump\x10#\x12\t\n\x05Unk36\x10$\x12\x11\n\rAttackConfirm\x10%\x12\x0e\n\nAttackType\x10&\x12\x12\n\x0e\x41ttackBodypart\x10\'\x12\x10\n\x0c\x41ttackStrike\x10(\x12\t\n\x05Unk41\x10)\x12\t\n\x05Unk42\x10*\x12\x12\n\x0e\x44odgeDirection\x10+\x12\t\n\x05Unk44\x10,\x12\t\n\x05Unk45\x10-\x12\t\n\x05\x42uild\x10.*\x94\x02\n\x13\x43\x61refulMovementType\x12\x14\n\x10\x44\x45\x46\x41ULT_MOVEMENT\x10\x00\x12\x15\n\x11RELEASE_ITEM_HOLD\x10\x01\x12\x15\n\x11RELEASE_TILE_HOLD\x10\x02\x12\x13\n\x0f\x41TTACK_CREATURE\x10\x03\x12\r\n\tHOLD_TILE\x10\x04\x12\x08\n\x04MOVE\x10\x05\x12\t\n\x05\x43LIMB\x10\x06\x12\r\n\tHOLD_ITEM\x10\x07\x12\x15\n\x11\x42UILDING_INTERACT\x10\x08\x12\x11\n\rITEM_INTERACT\x10\t\x12\x17\n\x13ITEM_INTERACT_GUIDE\x10\n\x12\x16\n\x12ITEM_INTERACT_RIDE\x10\x0b\x12\x16\n\x12ITEM_INTERACT_PUSH\x10\x0c*<\n\x0cMiscMoveType\x12\r\n\tSET_CLIMB\x10\x00\x12\r\n\tSET_STAND\x10\x01\x12\x0e\n\nSET_CANCEL\x10\x02\x42\x02H\x03')
-  ,
-  dependencies=[RemoteFortressReader__pb2.DESCRIPTOR,])
-_sym_db.RegisterFileDescriptor(DESCRIPTOR)
-
-_ADVMODEMENU = _descriptor.EnumDescriptor(
-  name='AdvmodeMenu',
-  full_name='AdventureControl.AdvmodeMenu',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='Default', index=0, number=0,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='Look', index=1, number=1,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='ConversationAddress', index=2, number=2,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='ConversationSelect', index=3, number=3,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='ConversationSpeak', index=4, number=4,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='Inventory', index=5, number=5,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='Drop', index=6, number=6,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='ThrowItem', index=7, number=7,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='Wear', index=8, number=8,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='Remove', index=9, number=9,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='Interact', index=10, number=10,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='Put', index=11, number=11,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='PutContainer', index=12, number=12,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='Eat', index=13, number=13,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='ThrowAim', index=14, number=14,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='Fire', index=15, number=15,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='Get', index=16, number=16,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='Unk17', index=17, number=17,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='CombatPrefs', index=18, number=18,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='Companions', index=19, number=19,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='MovementPrefs', index=20, number=20,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='SpeedPrefs', index=21, number=21,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='InteractAction', index=22, number=22,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='MoveCarefully', index=23, number=23,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='Announcements', index=24, number=24,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='UseBuilding', index=25, number=25,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='Travel', index=26, number=26,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='Unk27', index=27, number=27,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='Unk28', index=28, number=28,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='SleepConfirm', index=29, number=29,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='SelectInteractionTarget', index=30, number=30,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='Unk31', index=31, number=31,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='Unk32', index=32, number=32,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='FallAction', index=33, number=33,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='ViewTracks', index=34, number=34,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='Jump', index=35, number=35,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='Unk36', index=36, number=36,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='AttackConfirm', index=37, number=37,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='AttackType', index=38, number=38,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='AttackBodypart', index=39, number=39,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='AttackStrike', index=40, number=40,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='Unk41', index=41, number=41,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='Unk42', index=42, number=42,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='DodgeDirection', index=43, number=43,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='Unk44', index=44, number=44,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='Unk45', index=45, number=45,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='Build', index=46, number=46,
-      options=None,
-      type=None),
-  ],
-  containing_type=None,
-  options=None,
-  serialized_start=540,
-  serialized_end=1251,
-)
-_sym_db.RegisterEnumDescriptor(_ADVMODEMENU)
-
-AdvmodeMenu = enum_type_wrapper.EnumTypeWrapper(_ADVMODEMENU)
-_CAREFULMOVEMENTTYPE = _descriptor.EnumDescriptor(
-  name='CarefulMovementType',
-  full_name='AdventureControl.CarefulMovementType',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='DEFAULT_MOVEMENT', index=0, number=0,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='RELEASE_ITEM_HOLD', index=1, number=1,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='RELEASE_TILE_HOLD', index=2, number=2,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='ATTACK_CREATURE', index=3, number=3,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='HOLD_TILE', index=4, number=4,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='MOVE', index=5, number=5,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='CLIMB', index=6, number=6,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='HOLD_ITEM', index=7, number=7,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='BUILDING_INTERACT', index=8, number=8,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='ITEM_INTERACT', index=9, number=9,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='ITEM_INTERACT_GUIDE', index=10, number=10,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='ITEM_INTERACT_RIDE', index=11, number=11,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='ITEM_INTERACT_PUSH', index=12, number=12,
-      options=None,
-      type=None),
-  ],
-  containing_type=None,
-  options=None,
-  serialized_start=1254,
-  serialized_end=1530,
-)
-_sym_db.RegisterEnumDescriptor(_CAREFULMOVEMENTTYPE)
-
-CarefulMovementType = enum_type_wrapper.EnumTypeWrapper(_CAREFULMOVEMENTTYPE)
-_MISCMOVETYPE = _descriptor.EnumDescriptor(
-  name='MiscMoveType',
-  full_name='AdventureControl.MiscMoveType',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='SET_CLIMB', index=0, number=0,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='SET_STAND', index=1, number=1,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='SET_CANCEL', index=2, number=2,
-      options=None,
-      type=None),
-  ],
-  containing_type=None,
-  options=None,
-  serialized_start=1532,
-  serialized_end=1592,
-)
-_sym_db.RegisterEnumDescriptor(_MISCMOVETYPE)
-
-MiscMoveType = enum_type_wrapper.EnumTypeWrapper(_MISCMOVETYPE)
-Default = 0
-Look = 1
-ConversationAddress = 2
-ConversationSelect = 3
-ConversationSpeak = 4
-Inventory = 5
-Drop = 6
-ThrowItem = 7
-Wear = 8
-Remove = 9
-Interact = 10
-Put = 11
-PutContainer = 12
-Eat = 13
-ThrowAim = 14
-Fire = 15
-Get = 16
-Unk17 = 17
-CombatPrefs = 18
-Companions = 19
-MovementPrefs = 20
-SpeedPrefs = 21
-InteractAction = 22
-MoveCarefully = 23
-Announcements = 24
-UseBuilding = 25
-Travel = 26
-Unk27 = 27
-Unk28 = 28
-SleepConfirm = 29
-SelectInteractionTarget = 30
-Unk31 = 31
-Unk32 = 32
-FallAction = 33
-ViewTracks = 34
-Jump = 35
-Unk36 = 36
-AttackConfirm = 37
-AttackType = 38
-AttackBodypart = 39
-AttackStrike = 40
-Unk41 = 41
-Unk42 = 42
-DodgeDirection = 43
-Unk44 = 44
-Unk45 = 45
-Build = 46
-DEFAULT_MOVEMENT = 0
-RELEASE_ITEM_HOLD = 1
-RELEASE_TILE_HOLD = 2
-ATTACK_CREATURE = 3
-HOLD_TILE = 4
-MOVE = 5
-CLIMB = 6
-HOLD_ITEM = 7
-BUILDING_INTERACT = 8
-ITEM_INTERACT = 9
-ITEM_INTERACT_GUIDE = 10
-ITEM_INTERACT_RIDE = 11
-ITEM_INTERACT_PUSH = 12
-SET_CLIMB = 0
-SET_STAND = 1
-SET_CANCEL = 2
-
-
-
-_MOVECOMMANDPARAMS = _descriptor.Descriptor(
-  name='MoveCommandParams',
-  full_name='AdventureControl.MoveCommandParams',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='direction', full_name='AdventureControl.MoveCommandParams.direction', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=72,
-  serialized_end=139,
-)
-
-
-_MOVEMENTOPTION = _descriptor.Descriptor(
-  name='MovementOption',
-  full_name='AdventureControl.MovementOption',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='dest', full_name='AdventureControl.MovementOption.dest', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='source', full_name='AdventureControl.MovementOption.source', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='grab', full_name='AdventureControl.MovementOption.grab', index=2,
-      number=3, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='movement_type', full_name='AdventureControl.MovementOption.movement_type', index=3,
-      number=4, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=142,
-  serialized_end=351,
-)
-
-
-_MENUCONTENTS = _descriptor.Descriptor(
-  name='MenuContents',
-  full_name='AdventureControl.MenuContents',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='current_menu', full_name='AdventureControl.MenuContents.current_menu', index=0,
-      number=1, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='movements', full_name='AdventureControl.MenuContents.movements', index=1,
-      number=2, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=353,
-  serialized_end=473,
-)
-
-
-_MISCMOVEPARAMS = _descriptor.Descriptor(
-  name='MiscMoveParams',
-  full_name='AdventureControl.MiscMoveParams',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='type', full_name='AdventureControl.MiscMoveParams.type', index=0,
-      number=1, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=475,
-  serialized_end=537,
-)
-
-_MOVECOMMANDPARAMS.fields_by_name['direction'].message_type = RemoteFortressReader__pb2._COORD
-_MOVEMENTOPTION.fields_by_name['dest'].message_type = RemoteFortressReader__pb2._COORD
-_MOVEMENTOPTION.fields_by_name['source'].message_type = RemoteFortressReader__pb2._COORD
-_MOVEMENTOPTION.fields_by_name['grab'].message_type = RemoteFortressReader__pb2._COORD
-_MOVEMENTOPTION.fields_by_name['movement_type'].enum_type = _CAREFULMOVEMENTTYPE
-_MENUCONTENTS.fields_by_name['current_menu'].enum_type = _ADVMODEMENU
-_MENUCONTENTS.fields_by_name['movements'].message_type = _MOVEMENTOPTION
-_MISCMOVEPARAMS.fields_by_name['type'].enum_type = _MISCMOVETYPE
-DESCRIPTOR.message_types_by_name['MoveCommandParams'] = _MOVECOMMANDPARAMS
-DESCRIPTOR.message_types_by_name['MovementOption'] = _MOVEMENTOPTION
-DESCRIPTOR.message_types_by_name['MenuContents'] = _MENUCONTENTS
-DESCRIPTOR.message_types_by_name['MiscMoveParams'] = _MISCMOVEPARAMS
-DESCRIPTOR.enum_types_by_name['AdvmodeMenu'] = _ADVMODEMENU
-DESCRIPTOR.enum_types_by_name['CarefulMovementType'] = _CAREFULMOVEMENTTYPE
-DESCRIPTOR.enum_types_by_name['MiscMoveType'] = _MISCMOVETYPE
-
-MoveCommandParams = _reflection.GeneratedProtocolMessageType('MoveCommandParams', (_message.Message,), dict(
-  DESCRIPTOR = _MOVECOMMANDPARAMS,
-  __module__ = 'AdventureControl_pb2'
-  # @@protoc_insertion_point(class_scope:AdventureControl.MoveCommandParams)
-  ))
-_sym_db.RegisterMessage(MoveCommandParams)
-
-MovementOption = _reflection.GeneratedProtocolMessageType('MovementOption', (_message.Message,), dict(
-  DESCRIPTOR = _MOVEMENTOPTION,
-  __module__ = 'AdventureControl_pb2'
-  # @@protoc_insertion_point(class_scope:AdventureControl.MovementOption)
-  ))
-_sym_db.RegisterMessage(MovementOption)
-
-MenuContents = _reflection.GeneratedProtocolMessageType('MenuContents', (_message.Message,), dict(
-  DESCRIPTOR = _MENUCONTENTS,
-  __module__ = 'AdventureControl_pb2'
-  # @@protoc_insertion_point(class_scope:AdventureControl.MenuContents)
-  ))
-_sym_db.RegisterMessage(MenuContents)
-
-MiscMoveParams = _reflection.GeneratedProtocolMessageType('MiscMoveParams', (_message.Message,), dict(
-  DESCRIPTOR = _MISCMOVEPARAMS,
-  __module__ = 'AdventureControl_pb2'
-  # @@protoc_insertion_point(class_scope:AdventureControl.MiscMoveParams)
-  ))
-_sym_db.RegisterMessage(MiscMoveParams)
-
-
-DESCRIPTOR.has_options = True
-DESCRIPTOR._options = _descriptor._ParseOptions(descriptor_pb2.FileOptions(), _b('H\003'))
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x16\x41\x64ventureControl.proto\x12\x10\x41\x64ventureControl\x1a\x1aRemoteFortressReader.proto\"C\n\x11MoveCommandParams\x12.\n\tdirection\x18\x01 \x01(\x0b\x32\x1b.RemoteFortressReader.Coord\"\xd1\x01\n\x0eMovementOption\x12)\n\x04\x64\x65st\x18\x01 \x01(\x0b\x32\x1b.RemoteFortressReader.Coord\x12+\n\x06source\x18\x02 \x01(\x0b\x32\x1b.RemoteFortressReader.Coord\x12)\n\x04grab\x18\x03 \x01(\x0b\x32\x1b.RemoteFortressReader.Coord\x12<\n\rmovement_type\x18\x04 \x01(\x0e\x32%.AdventureControl.CarefulMovementType\"x\n\x0cMenuContents\x12\x33\n\x0c\x63urrent_menu\x18\x01 \x01(\x0e\x32\x1d.AdventureControl.AdvmodeMenu\x12\x33\n\tmovements\x18\x02 \x03(\x0b\x32 .AdventureControl.MovementOption\">\n\x0eMiscMoveParams\x12,\n\x04type\x18\x01 \x01(\x0e\x32\x1e.AdventureControl.MiscMoveType*\xc7\x05\n\x0b\x41\x64vmodeMenu\x12\x0b\n\x07\x44\x65\x66\x61ult\x10\x00\x12\x08\n\x04Look\x10\x01\x12\x17\n\x13\x43onversationAddress\x10\x02\x12\x16\n\x12\x43onversationSelect\x10\x03\x12\x15\n\x11\x43onversationSpeak\x10\x04\x12\r\n\tInventory\x10\x05\x12\x08\n\x04\x44rop\x10\x06\x12\r\n\tThrowItem\x10\x07\x12\x08\n\x04Wear\x10\x08\x12\n\n\x06Remove\x10\t\x12\x0c\n\x08Interact\x10\n\x12\x07\n\x03Put\x10\x0b\x12\x10\n\x0cPutContainer\x10\x0c\x12\x07\n\x03\x45\x61t\x10\r\x12\x0c\n\x08ThrowAim\x10\x0e\x12\x08\n\x04\x46ire\x10\x0f\x12\x07\n\x03Get\x10\x10\x12\t\n\x05Unk17\x10\x11\x12\x0f\n\x0b\x43ombatPrefs\x10\x12\x12\x0e\n\nCompanions\x10\x13\x12\x11\n\rMovementPrefs\x10\x14\x12\x0e\n\nSpeedPrefs\x10\x15\x12\x12\n\x0eInteractAction\x10\x16\x12\x11\n\rMoveCarefully\x10\x17\x12\x11\n\rAnnouncements\x10\x18\x12\x0f\n\x0bUseBuilding\x10\x19\x12\n\n\x06Travel\x10\x1a\x12\t\n\x05Unk27\x10\x1b\x12\t\n\x05Unk28\x10\x1c\x12\x10\n\x0cSleepConfirm\x10\x1d\x12\x1b\n\x17SelectInteractionTarget\x10\x1e\x12\t\n\x05Unk31\x10\x1f\x12\t\n\x05Unk32\x10 \x12\x0e\n\nFallAction\x10!\x12\x0e\n\nViewTracks\x10\"\x12\x08\n\x04Jump\x10#\x12\t\n\x05Unk36\x10$\x12\x11\n\rAttackConfirm\x10%\x12\x0e\n\nAttackType\x10&\x12\x12\n\x0e\x41ttackBodypart\x10\'\x12\x10\n\x0c\x41ttackStrike\x10(\x12\t\n\x05Unk41\x10)\x12\t\n\x05Unk42\x10*\x12\x12\n\x0e\x44odgeDirection\x10+\x12\t\n\x05Unk44\x10,\x12\t\n\x05Unk45\x10-\x12\t\n\x05\x42uild\x10.*\x94\x02\n\x13\x43\x61refulMovementType\x12\x14\n\x10\x44\x45\x46\x41ULT_MOVEMENT\x10\x00\x12\x15\n\x11RELEASE_ITEM_HOLD\x10\x01\x12\x15\n\x11RELEASE_TILE_HOLD\x10\x02\x12\x13\n\x0f\x41TTACK_CREATURE\x10\x03\x12\r\n\tHOLD_TILE\x10\x04\x12\x08\n\x04MOVE\x10\x05\x12\t\n\x05\x43LIMB\x10\x06\x12\r\n\tHOLD_ITEM\x10\x07\x12\x15\n\x11\x42UILDING_INTERACT\x10\x08\x12\x11\n\rITEM_INTERACT\x10\t\x12\x17\n\x13ITEM_INTERACT_GUIDE\x10\n\x12\x16\n\x12ITEM_INTERACT_RIDE\x10\x0b\x12\x16\n\x12ITEM_INTERACT_PUSH\x10\x0c*<\n\x0cMiscMoveType\x12\r\n\tSET_CLIMB\x10\x00\x12\r\n\tSET_STAND\x10\x01\x12\x0e\n\nSET_CANCEL\x10\x02\x42\x02H\x03')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'dfhack_rpc.proto.AdventureControl_pb2', globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  DESCRIPTOR._serialized_options = b'H\003'
+  _ADVMODEMENU._serialized_start=540
+  _ADVMODEMENU._serialized_end=1251
+  _CAREFULMOVEMENTTYPE._serialized_start=1254
+  _CAREFULMOVEMENTTYPE._serialized_end=1530
+  _MISCMOVETYPE._serialized_start=1532
+  _MISCMOVETYPE._serialized_end=1592
+  _MOVECOMMANDPARAMS._serialized_start=72
+  _MOVECOMMANDPARAMS._serialized_end=139
+  _MOVEMENTOPTION._serialized_start=142
+  _MOVEMENTOPTION._serialized_end=351
+  _MENUCONTENTS._serialized_start=353
+  _MENUCONTENTS._serialized_end=473
+  _MISCMOVEPARAMS._serialized_start=475
+  _MISCMOVEPARAMS._serialized_end=537
 # @@protoc_insertion_point(module_scope)
@@ -1,13 +1,11 @@
+# -*- coding: utf-8 -*-
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
 # source: BasicApi.proto
-
-import sys
-_b=sys.version_info[0]<3 and (lambda x:x) or (lambda x:x.encode('latin1'))
+"""Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
 from google.protobuf import descriptor as _descriptor
-from google.protobuf import message as _message
-from google.protobuf import reflection as _reflection
+from google.protobuf import descriptor_pool as _descriptor_pool
 from google.protobuf import symbol_database as _symbol_database
-from google.protobuf import descriptor_pb2
 # @@protoc_insertion_point(imports)
 
 _sym_db = _symbol_database.Default()
@@ -16,684 +14,34 @@ _sym_db = _symbol_database.Default()
 from . import Basic_pb2 as Basic__pb2
 
 
-DESCRIPTOR = _descriptor.FileDescriptor(
-  name='BasicApi.proto',
-  package='dfproto',
-  syntax='proto2',
-  serialized_pb=_b('\n\x0e\x42\x61sicApi.proto\x12\x07\x64\x66proto\x1a\x0b\x42\x61sic.proto\"\xcb\x02\n\x0fGetWorldInfoOut\x12+\n\x04mode\x18\x01 \x02(\x0e\x32\x1d.dfproto.GetWorldInfoOut.Mode\x12\x10\n\x08save_dir\x18\x02 \x02(\t\x12%\n\nworld_name\x18\x03 \x01(\x0b\x32\x11.dfproto.NameInfo\x12\x0e\n\x06\x63iv_id\x18\x04 \x01(\x05\x12\x0f\n\x07site_id\x18\x05 \x01(\x05\x12\x10\n\x08group_id\x18\x06 \x01(\x05\x12\x0f\n\x07race_id\x18\x07 \x01(\x05\x12\x16\n\x0eplayer_unit_id\x18\x08 \x01(\x05\x12\x19\n\x11player_histfig_id\x18\t \x01(\x05\x12\x1d\n\x15\x63ompanion_histfig_ids\x18\n \x03(\x05\"<\n\x04Mode\x12\x0e\n\nMODE_DWARF\x10\x01\x12\x12\n\x0eMODE_ADVENTURE\x10\x02\x12\x10\n\x0cMODE_LEGENDS\x10\x03\"\x86\x04\n\x0cListEnumsOut\x12-\n\x0ematerial_flags\x18\x01 \x03(\x0b\x32\x15.dfproto.EnumItemName\x12.\n\x0finorganic_flags\x18\x02 \x03(\x0b\x32\x15.dfproto.EnumItemName\x12*\n\x0bunit_flags1\x18\x03 \x03(\x0b\x32\x15.dfproto.EnumItemName\x12*\n\x0bunit_flags2\x18\x04 \x03(\x0b\x32\x15.dfproto.EnumItemName\x12*\n\x0bunit_flags3\x18\x05 \x03(\x0b\x32\x15.dfproto.EnumItemName\x12)\n\nunit_labor\x18\x06 \x03(\x0b\x32\x15.dfproto.EnumItemName\x12(\n\tjob_skill\x18\x07 \x03(\x0b\x32\x15.dfproto.EnumItemName\x12\x30\n\x11\x63ie_add_tag_mask1\x18\x08 \x03(\x0b\x32\x15.dfproto.EnumItemName\x12\x30\n\x11\x63ie_add_tag_mask2\x18\t \x03(\x0b\x32\x15.dfproto.EnumItemName\x12/\n\x10\x64\x65\x61th_info_flags\x18\n \x03(\x0b\x32\x15.dfproto.EnumItemName\x12)\n\nprofession\x18\x0b \x03(\x0b\x32\x15.dfproto.EnumItemName\"\x8c\x01\n\x10ListJobSkillsOut\x12$\n\x05skill\x18\x01 \x03(\x0b\x32\x15.dfproto.JobSkillAttr\x12+\n\nprofession\x18\x02 \x03(\x0b\x32\x17.dfproto.ProfessionAttr\x12%\n\x05labor\x18\x03 \x03(\x0b\x32\x16.dfproto.UnitLaborAttr\"\xb1\x01\n\x0fListMaterialsIn\x12,\n\x04mask\x18\x01 \x01(\x0b\x32\x1e.dfproto.BasicMaterialInfoMask\x12)\n\x07id_list\x18\x02 \x03(\x0b\x32\x18.dfproto.BasicMaterialId\x12\x0f\n\x07\x62uiltin\x18\x03 \x01(\x08\x12\x11\n\tinorganic\x18\x04 \x01(\x08\x12\x11\n\tcreatures\x18\x05 \x01(\x08\x12\x0e\n\x06plants\x18\x06 \x01(\x08\"=\n\x10ListMaterialsOut\x12)\n\x05value\x18\x01 \x03(\x0b\x32\x1a.dfproto.BasicMaterialInfo\"\xa3\x01\n\x0bListUnitsIn\x12(\n\x04mask\x18\x01 \x01(\x0b\x32\x1a.dfproto.BasicUnitInfoMask\x12\x0f\n\x07id_list\x18\x02 \x03(\x05\x12\x10\n\x08scan_all\x18\x05 \x01(\x08\x12\x0c\n\x04race\x18\x03 \x01(\x05\x12\x0e\n\x06\x63iv_id\x18\x04 \x01(\x05\x12\x0c\n\x04\x64\x65\x61\x64\x18\x06 \x01(\x08\x12\r\n\x05\x61live\x18\x07 \x01(\x08\x12\x0c\n\x04sane\x18\x08 \x01(\x08\"5\n\x0cListUnitsOut\x12%\n\x05value\x18\x01 \x03(\x0b\x32\x16.dfproto.BasicUnitInfo\"\x0e\n\x0cListSquadsIn\"7\n\rListSquadsOut\x12&\n\x05value\x18\x01 \x03(\x0b\x32\x17.dfproto.BasicSquadInfo\":\n\x0fSetUnitLaborsIn\x12\'\n\x06\x63hange\x18\x01 \x03(\x0b\x32\x17.dfproto.UnitLaborStateB\x02H\x03')
-  ,
-  dependencies=[Basic__pb2.DESCRIPTOR,])
-_sym_db.RegisterFileDescriptor(DESCRIPTOR)
-
-
-
-_GETWORLDINFOOUT_MODE = _descriptor.EnumDescriptor(
-  name='Mode',
-  full_name='dfproto.GetWorldInfoOut.Mode',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='MODE_DWARF', index=0, number=1,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='MODE_ADVENTURE', index=1, number=2,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='MODE_LEGENDS', index=2, number=3,
-      options=None,
-      type=None),
-  ],
-  containing_type=None,
-  options=None,
-  serialized_start=312,
-  serialized_end=372,
-)
-_sym_db.RegisterEnumDescriptor(_GETWORLDINFOOUT_MODE)
-
-
-_GETWORLDINFOOUT = _descriptor.Descriptor(
-  name='GetWorldInfoOut',
-  full_name='dfproto.GetWorldInfoOut',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='mode', full_name='dfproto.GetWorldInfoOut.mode', index=0,
-      number=1, type=14, cpp_type=8, label=2,
-      has_default_value=False, default_value=1,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='save_dir', full_name='dfproto.GetWorldInfoOut.save_dir', index=1,
-      number=2, type=9, cpp_type=9, label=2,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='world_name', full_name='dfproto.GetWorldInfoOut.world_name', index=2,
-      number=3, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='civ_id', full_name='dfproto.GetWorldInfoOut.civ_id', index=3,
-      number=4, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='site_id', full_name='dfproto.GetWorldInfoOut.site_id', index=4,
-      number=5, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='group_id', full_name='dfproto.GetWorldInfoOut.group_id', index=5,
-      number=6, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='race_id', full_name='dfproto.GetWorldInfoOut.race_id', index=6,
-      number=7, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='player_unit_id', full_name='dfproto.GetWorldInfoOut.player_unit_id', index=7,
-      number=8, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='player_histfig_id', full_name='dfproto.GetWorldInfoOut.player_histfig_id', index=8,
-      number=9, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='companion_histfig_ids', full_name='dfproto.GetWorldInfoOut.companion_histfig_ids', index=9,
-      number=10, type=5, cpp_type=1, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-    _GETWORLDINFOOUT_MODE,
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=41,
-  serialized_end=372,
-)
-
-
-_LISTENUMSOUT = _descriptor.Descriptor(
-  name='ListEnumsOut',
-  full_name='dfproto.ListEnumsOut',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='material_flags', full_name='dfproto.ListEnumsOut.material_flags', index=0,
-      number=1, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='inorganic_flags', full_name='dfproto.ListEnumsOut.inorganic_flags', index=1,
-      number=2, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='unit_flags1', full_name='dfproto.ListEnumsOut.unit_flags1', index=2,
-      number=3, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='unit_flags2', full_name='dfproto.ListEnumsOut.unit_flags2', index=3,
-      number=4, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='unit_flags3', full_name='dfproto.ListEnumsOut.unit_flags3', index=4,
-      number=5, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='unit_labor', full_name='dfproto.ListEnumsOut.unit_labor', index=5,
-      number=6, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='job_skill', full_name='dfproto.ListEnumsOut.job_skill', index=6,
-      number=7, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='cie_add_tag_mask1', full_name='dfproto.ListEnumsOut.cie_add_tag_mask1', index=7,
-      number=8, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='cie_add_tag_mask2', full_name='dfproto.ListEnumsOut.cie_add_tag_mask2', index=8,
-      number=9, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='death_info_flags', full_name='dfproto.ListEnumsOut.death_info_flags', index=9,
-      number=10, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='profession', full_name='dfproto.ListEnumsOut.profession', index=10,
-      number=11, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=375,
-  serialized_end=893,
-)
-
-
-_LISTJOBSKILLSOUT = _descriptor.Descriptor(
-  name='ListJobSkillsOut',
-  full_name='dfproto.ListJobSkillsOut',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='skill', full_name='dfproto.ListJobSkillsOut.skill', index=0,
-      number=1, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='profession', full_name='dfproto.ListJobSkillsOut.profession', index=1,
-      number=2, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='labor', full_name='dfproto.ListJobSkillsOut.labor', index=2,
-      number=3, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=896,
-  serialized_end=1036,
-)
-
-
-_LISTMATERIALSIN = _descriptor.Descriptor(
-  name='ListMaterialsIn',
-  full_name='dfproto.ListMaterialsIn',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='mask', full_name='dfproto.ListMaterialsIn.mask', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='id_list', full_name='dfproto.ListMaterialsIn.id_list', index=1,
-      number=2, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='builtin', full_name='dfproto.ListMaterialsIn.builtin', index=2,
-      number=3, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='inorganic', full_name='dfproto.ListMaterialsIn.inorganic', index=3,
-      number=4, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='creatures', full_name='dfproto.ListMaterialsIn.creatures', index=4,
-      number=5, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='plants', full_name='dfproto.ListMaterialsIn.plants', index=5,
-      number=6, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1039,
-  serialized_end=1216,
-)
-
-
-_LISTMATERIALSOUT = _descriptor.Descriptor(
-  name='ListMaterialsOut',
-  full_name='dfproto.ListMaterialsOut',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='value', full_name='dfproto.ListMaterialsOut.value', index=0,
-      number=1, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1218,
-  serialized_end=1279,
-)
-
-
-_LISTUNITSIN = _descriptor.Descriptor(
-  name='ListUnitsIn',
-  full_name='dfproto.ListUnitsIn',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='mask', full_name='dfproto.ListUnitsIn.mask', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='id_list', full_name='dfproto.ListUnitsIn.id_list', index=1,
-      number=2, type=5, cpp_type=1, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='scan_all', full_name='dfproto.ListUnitsIn.scan_all', index=2,
-      number=5, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='race', full_name='dfproto.ListUnitsIn.race', index=3,
-      number=3, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='civ_id', full_name='dfproto.ListUnitsIn.civ_id', index=4,
-      number=4, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='dead', full_name='dfproto.ListUnitsIn.dead', index=5,
-      number=6, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='alive', full_name='dfproto.ListUnitsIn.alive', index=6,
-      number=7, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='sane', full_name='dfproto.ListUnitsIn.sane', index=7,
-      number=8, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1282,
-  serialized_end=1445,
-)
-
-
-_LISTUNITSOUT = _descriptor.Descriptor(
-  name='ListUnitsOut',
-  full_name='dfproto.ListUnitsOut',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='value', full_name='dfproto.ListUnitsOut.value', index=0,
-      number=1, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1447,
-  serialized_end=1500,
-)
-
-
-_LISTSQUADSIN = _descriptor.Descriptor(
-  name='ListSquadsIn',
-  full_name='dfproto.ListSquadsIn',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1502,
-  serialized_end=1516,
-)
-
-
-_LISTSQUADSOUT = _descriptor.Descriptor(
-  name='ListSquadsOut',
-  full_name='dfproto.ListSquadsOut',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='value', full_name='dfproto.ListSquadsOut.value', index=0,
-      number=1, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1518,
-  serialized_end=1573,
-)
-
-
-_SETUNITLABORSIN = _descriptor.Descriptor(
-  name='SetUnitLaborsIn',
-  full_name='dfproto.SetUnitLaborsIn',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='change', full_name='dfproto.SetUnitLaborsIn.change', index=0,
-      number=1, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1575,
-  serialized_end=1633,
-)
-
-_GETWORLDINFOOUT.fields_by_name['mode'].enum_type = _GETWORLDINFOOUT_MODE
-_GETWORLDINFOOUT.fields_by_name['world_name'].message_type = Basic__pb2._NAMEINFO
-_GETWORLDINFOOUT_MODE.containing_type = _GETWORLDINFOOUT
-_LISTENUMSOUT.fields_by_name['material_flags'].message_type = Basic__pb2._ENUMITEMNAME
-_LISTENUMSOUT.fields_by_name['inorganic_flags'].message_type = Basic__pb2._ENUMITEMNAME
-_LISTENUMSOUT.fields_by_name['unit_flags1'].message_type = Basic__pb2._ENUMITEMNAME
-_LISTENUMSOUT.fields_by_name['unit_flags2'].message_type = Basic__pb2._ENUMITEMNAME
-_LISTENUMSOUT.fields_by_name['unit_flags3'].message_type = Basic__pb2._ENUMITEMNAME
-_LISTENUMSOUT.fields_by_name['unit_labor'].message_type = Basic__pb2._ENUMITEMNAME
-_LISTENUMSOUT.fields_by_name['job_skill'].message_type = Basic__pb2._ENUMITEMNAME
-_LISTENUMSOUT.fields_by_name['cie_add_tag_mask1'].message_type = Basic__pb2._ENUMITEMNAME
-_LISTENUMSOUT.fields_by_name['cie_add_tag_mask2'].message_type = Basic__pb2._ENUMITEMNAME
-_LISTENUMSOUT.fields_by_name['death_info_flags'].message_type = Basic__pb2._ENUMITEMNAME
-_LISTENUMSOUT.fields_by_name['profession'].message_type = Basic__pb2._ENUMITEMNAME
-_LISTJOBSKILLSOUT.fields_by_name['skill'].message_type = Basic__pb2._JOBSKILLATTR
-_LISTJOBSKILLSOUT.fields_by_name['profession'].message_type = Basic__pb2._PROFESSIONATTR
-_LISTJOBSKILLSOUT.fields_by_name['labor'].message_type = Basic__pb2._UNITLABORATTR
-_LISTMATERIALSIN.fields_by_name['mask'].message_type = Basic__pb2._BASICMATERIALINFOMASK
-_LISTMATERIALSIN.fields_by_name['id_list'].message_type = Basic__pb2._BASICMATERIALID
-_LISTMATERIALSOUT.fields_by_name['value'].message_type = Basic__pb2._BASICMATERIALINFO
-_LISTUNITSIN.fields_by_name['mask'].message_type = Basic__pb2._BASICUNITINFOMASK
-_LISTUNITSOUT.fields_by_name['value'].message_type = Basic__pb2._BASICUNITINFO
-_LISTSQUADSOUT.fields_by_name['value'].message_type = Basic__pb2._BASICSQUADINFO
-_SETUNITLABORSIN.fields_by_name['change'].message_type = Basic__pb2._UNITLABORSTATE
-DESCRIPTOR.message_types_by_name['GetWorldInfoOut'] = _GETWORLDINFOOUT
-DESCRIPTOR.message_types_by_name['ListEnumsOut'] = _LISTENUMSOUT
-DESCRIPTOR.message_types_by_name['ListJobSkillsOut'] = _LISTJOBSKILLSOUT
-DESCRIPTOR.message_types_by_name['ListMaterialsIn'] = _LISTMATERIALSIN
-DESCRIPTOR.message_types_by_name['ListMaterialsOut'] = _LISTMATERIALSOUT
-DESCRIPTOR.message_types_by_name['ListUnitsIn'] = _LISTUNITSIN
-DESCRIPTOR.message_types_by_name['ListUnitsOut'] = _LISTUNITSOUT
-DESCRIPTOR.message_types_by_name['ListSquadsIn'] = _LISTSQUADSIN
-DESCRIPTOR.message_types_by_name['ListSquadsOut'] = _LISTSQUADSOUT
-DESCRIPTOR.message_types_by_name['SetUnitLaborsIn'] = _SETUNITLABORSIN
-
-GetWorldInfoOut = _reflection.GeneratedProtocolMessageType('GetWorldInfoOut', (_message.Message,), dict(
-  DESCRIPTOR = _GETWORLDINFOOUT,
-  __module__ = 'BasicApi_pb2'
-  # @@protoc_insertion_point(class_scope:dfproto.GetWorldInfoOut)
-  ))
-_sym_db.RegisterMessage(GetWorldInfoOut)
-
-ListEnumsOut = _reflection.GeneratedProtocolMessageType('ListEnumsOut', (_message.Message,), dict(
-  DESCRIPTOR = _LISTENUMSOUT,
-  __module__ = 'BasicApi_pb2'
-  # @@protoc_insertion_point(class_scope:dfproto.ListEnumsOut)
-  ))
-_sym_db.RegisterMessage(ListEnumsOut)
-
-ListJobSkillsOut = _reflection.GeneratedProtocolMessageType('ListJobSkillsOut', (_message.Message,), dict(
-  DESCRIPTOR = _LISTJOBSKILLSOUT,
-  __module__ = 'BasicApi_pb2'
-  # @@protoc_insertion_point(class_scope:dfproto.ListJobSkillsOut)
-  ))
-_sym_db.RegisterMessage(ListJobSkillsOut)
-
-ListMaterialsIn = _reflection.GeneratedProtocolMessageType('ListMaterialsIn', (_message.Message,), dict(
-  DESCRIPTOR = _LISTMATERIALSIN,
-  __module__ = 'BasicApi_pb2'
-  # @@protoc_insertion_point(class_scope:dfproto.ListMaterialsIn)
-  ))
-_sym_db.RegisterMessage(ListMaterialsIn)
-
-ListMaterialsOut = _reflection.GeneratedProtocolMessageType('ListMaterialsOut', (_message.Message,), dict(
-  DESCRIPTOR = _LISTMATERIALSOUT,
-  __module__ = 'BasicApi_pb2'
-  # @@protoc_insertion_point(class_scope:dfproto.ListMaterialsOut)
-  ))
-_sym_db.RegisterMessage(ListMaterialsOut)
-
-ListUnitsIn = _reflection.GeneratedProtocolMessageType('ListUnitsIn', (_message.Message,), dict(
-  DESCRIPTOR = _LISTUNITSIN,
-  __module__ = 'BasicApi_pb2'
-  # @@protoc_insertion_point(class_scope:dfproto.ListUnitsIn)
-  ))
-_sym_db.RegisterMessage(ListUnitsIn)
-
-ListUnitsOut = _reflection.GeneratedProtocolMessageType('ListUnitsOut', (_message.Message,), dict(
-  DESCRIPTOR = _LISTUNITSOUT,
-  __module__ = 'BasicApi_pb2'
-  # @@protoc_insertion_point(class_scope:dfproto.ListUnitsOut)
-  ))
-_sym_db.RegisterMessage(ListUnitsOut)
-
-ListSquadsIn = _reflection.GeneratedProtocolMessageType('ListSquadsIn', (_message.Message,), dict(
-  DESCRIPTOR = _LISTSQUADSIN,
-  __module__ = 'BasicApi_pb2'
-  # @@protoc_insertion_point(class_scope:dfproto.ListSquadsIn)
-  ))
-_sym_db.RegisterMessage(ListSquadsIn)
-
-ListSquadsOut = _reflection.GeneratedProtocolMessageType('ListSquadsOut', (_message.Message,), dict(
-  DESCRIPTOR = _LISTSQUADSOUT,
-  __module__ = 'BasicApi_pb2'
-  # @@protoc_insertion_point(class_scope:dfproto.ListSquadsOut)
-  ))
-_sym_db.RegisterMessage(ListSquadsOut)
-
-SetUnitLaborsIn = _reflection.GeneratedProtocolMessageType('SetUnitLaborsIn', (_message.Message,), dict(
-  DESCRIPTOR = _SETUNITLABORSIN,
-  __module__ = 'BasicApi_pb2'
-  # @@protoc_insertion_point(class_scope:dfproto.SetUnitLaborsIn)
-  ))
-_sym_db.RegisterMessage(SetUnitLaborsIn)
-
-
-DESCRIPTOR.has_options = True
-DESCRIPTOR._options = _descriptor._ParseOptions(descriptor_pb2.FileOptions(), _b('H\003'))
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0e\x42\x61sicApi.proto\x12\x07\x64\x66proto\x1a\x0b\x42\x61sic.proto\"\xcb\x02\n\x0fGetWorldInfoOut\x12+\n\x04mode\x18\x01 \x02(\x0e\x32\x1d.dfproto.GetWorldInfoOut.Mode\x12\x10\n\x08save_dir\x18\x02 \x02(\t\x12%\n\nworld_name\x18\x03 \x01(\x0b\x32\x11.dfproto.NameInfo\x12\x0e\n\x06\x63iv_id\x18\x04 \x01(\x05\x12\x0f\n\x07site_id\x18\x05 \x01(\x05\x12\x10\n\x08group_id\x18\x06 \x01(\x05\x12\x0f\n\x07race_id\x18\x07 \x01(\x05\x12\x16\n\x0eplayer_unit_id\x18\x08 \x01(\x05\x12\x19\n\x11player_histfig_id\x18\t \x01(\x05\x12\x1d\n\x15\x63ompanion_histfig_ids\x18\n \x03(\x05\"<\n\x04Mode\x12\x0e\n\nMODE_DWARF\x10\x01\x12\x12\n\x0eMODE_ADVENTURE\x10\x02\x12\x10\n\x0cMODE_LEGENDS\x10\x03\"\x86\x04\n\x0cListEnumsOut\x12-\n\x0ematerial_flags\x18\x01 \x03(\x0b\x32\x15.dfproto.EnumItemName\x12.\n\x0finorganic_flags\x18\x02 \x03(\x0b\x32\x15.dfproto.EnumItemName\x12*\n\x0bunit_flags1\x18\x03 \x03(\x0b\x32\x15.dfproto.EnumItemName\x12*\n\x0bunit_flags2\x18\x04 \x03(\x0b\x32\x15.dfproto.EnumItemName\x12*\n\x0bunit_flags3\x18\x05 \x03(\x0b\x32\x15.dfproto.EnumItemName\x12)\n\nunit_labor\x18\x06 \x03(\x0b\x32\x15.dfproto.EnumItemName\x12(\n\tjob_skill\x18\x07 \x03(\x0b\x32\x15.dfproto.EnumItemName\x12\x30\n\x11\x63ie_add_tag_mask1\x18\x08 \x03(\x0b\x32\x15.dfproto.EnumItemName\x12\x30\n\x11\x63ie_add_tag_mask2\x18\t \x03(\x0b\x32\x15.dfproto.EnumItemName\x12/\n\x10\x64\x65\x61th_info_flags\x18\n \x03(\x0b\x32\x15.dfproto.EnumItemName\x12)\n\nprofession\x18\x0b \x03(\x0b\x32\x15.dfproto.EnumItemName\"\x8c\x01\n\x10ListJobSkillsOut\x12$\n\x05skill\x18\x01 \x03(\x0b\x32\x15.dfproto.JobSkillAttr\x12+\n\nprofession\x18\x02 \x03(\x0b\x32\x17.dfproto.ProfessionAttr\x12%\n\x05labor\x18\x03 \x03(\x0b\x32\x16.dfproto.UnitLaborAttr\"\xb1\x01\n\x0fListMaterialsIn\x12,\n\x04mask\x18\x01 \x01(\x0b\x32\x1e.dfproto.BasicMaterialInfoMask\x12)\n\x07id_list\x18\x02 \x03(\x0b\x32\x18.dfproto.BasicMaterialId\x12\x0f\n\x07\x62uiltin\x18\x03 \x01(\x08\x12\x11\n\tinorganic\x18\x04 \x01(\x08\x12\x11\n\tcreatures\x18\x05 \x01(\x08\x12\x0e\n\x06plants\x18\x06 \x01(\x08\"=\n\x10ListMaterialsOut\x12)\n\x05value\x18\x01 \x03(\x0b\x32\x1a.dfproto.BasicMaterialInfo\"\xa3\x01\n\x0bListUnitsIn\x12(\n\x04mask\x18\x01 \x01(\x0b\x32\x1a.dfproto.BasicUnitInfoMask\x12\x0f\n\x07id_list\x18\x02 \x03(\x05\x12\x10\n\x08scan_all\x18\x05 \x01(\x08\x12\x0c\n\x04race\x18\x03 \x01(\x05\x12\x0e\n\x06\x63iv_id\x18\x04 \x01(\x05\x12\x0c\n\x04\x64\x65\x61\x64\x18\x06 \x01(\x08\x12\r\n\x05\x61live\x18\x07 \x01(\x08\x12\x0c\n\x04sane\x18\x08 \x01(\x08\"5\n\x0cListUnitsOut\x12%\n\x05value\x18\x01 \x03(\x0b\x32\x16.dfproto.BasicUnitInfo\"\x0e\n\x0cListSquadsIn\"7\n\rListSquadsOut\x12&\n\x05value\x18\x01 \x03(\x0b\x32\x17.dfproto.BasicSquadInfo\":\n\x0fSetUnitLaborsIn\x12\'\n\x06\x63hange\x18\x01 \x03(\x0b\x32\x17.dfproto.UnitLaborStateB\x02H\x03')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'dfhack_rpc.proto.BasicApi_pb2', globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  DESCRIPTOR._serialized_options = b'H\003'
+  _GETWORLDINFOOUT._serialized_start=41
+  _GETWORLDINFOOUT._serialized_end=372
+  _GETWORLDINFOOUT_MODE._serialized_start=312
+  _GETWORLDINFOOUT_MODE._serialized_end=372
+  _LISTENUMSOUT._serialized_start=375
+  _LISTENUMSOUT._serialized_end=893
+  _LISTJOBSKILLSOUT._serialized_start=896
+  _LISTJOBSKILLSOUT._serialized_end=1036
+  _LISTMATERIALSIN._serialized_start=1039
+  _LISTMATERIALSIN._serialized_end=1216
+  _LISTMATERIALSOUT._serialized_start=1218
+  _LISTMATERIALSOUT._serialized_end=1279
+  _LISTUNITSIN._serialized_start=1282
+  _LISTUNITSIN._serialized_end=1445
+  _LISTUNITSOUT._serialized_start=1447
+  _LISTUNITSOUT._serialized_end=1500
+  _LISTSQUADSIN._serialized_start=1502
+  _LISTSQUADSIN._serialized_end=1516
+  _LISTSQUADSOUT._serialized_start=1518
+  _LISTSQUADSOUT._serialized_end=1573
+  _SETUNITLABORSIN._serialized_start=1575
+  _SETUNITLABORSIN._serialized_end=1633
 # @@protoc_insertion_point(module_scope)
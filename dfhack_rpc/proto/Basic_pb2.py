@@ -1,13 +1,11 @@
+# -*- coding: utf-8 -*-
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
 # source: Basic.proto
-
-import sys
-_b=sys.version_info[0]<3 and (lambda x:x) or (lambda x:x.encode('latin1'))
+"""Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
 from google.protobuf import descriptor as _descriptor
-from google.protobuf import message as _message
-from google.protobuf import reflection as _reflection
+from google.protobuf import descriptor_pool as _descriptor_pool
 from google.protobuf import symbol_database as _symbol_database
-from google.protobuf import descriptor_pb2
 # @@protoc_insertion_point(imports)
 
 _sym_db = _symbol_database.Default()
@@ -15,1282 +13,48 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor.FileDescriptor(
-  name='Basic.proto',
-  package='dfproto',
-  syntax='proto2',
-  serialized_pb=_b('\n\x0b\x42\x61sic.proto\x12\x07\x64\x66proto\"@\n\x0c\x45numItemName\x12\r\n\x05value\x18\x01 \x02(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x08\x62it_size\x18\x03 \x01(\x05:\x01\x31\".\n\x0f\x42\x61sicMaterialId\x12\x0c\n\x04type\x18\x01 \x02(\x05\x12\r\n\x05index\x18\x02 \x02(\x11\"\xa0\x03\n\x11\x42\x61sicMaterialInfo\x12\x0c\n\x04type\x18\x01 \x02(\x05\x12\r\n\x05index\x18\x02 \x02(\x11\x12\r\n\x05token\x18\x03 \x02(\t\x12\r\n\x05\x66lags\x18\x04 \x03(\x05\x12\x13\n\x07subtype\x18\x05 \x01(\x05:\x02-1\x12\x17\n\x0b\x63reature_id\x18\x06 \x01(\x05:\x02-1\x12\x14\n\x08plant_id\x18\x07 \x01(\x05:\x02-1\x12\x16\n\nhistfig_id\x18\x08 \x01(\x05:\x02-1\x12\x15\n\x0bname_prefix\x18\t \x01(\t:\x00\x12\x13\n\x0bstate_color\x18\n \x03(\x07\x12\x12\n\nstate_name\x18\x0b \x03(\t\x12\x11\n\tstate_adj\x18\x0c \x03(\t\x12\x16\n\x0ereaction_class\x18\r \x03(\t\x12<\n\x10reaction_product\x18\x0e \x03(\x0b\x32\".dfproto.BasicMaterialInfo.Product\x12\x17\n\x0finorganic_flags\x18\x0f \x03(\x05\x1a\x32\n\x07Product\x12\n\n\x02id\x18\x01 \x02(\t\x12\x0c\n\x04type\x18\x02 \x02(\x05\x12\r\n\x05index\x18\x03 \x02(\x11\"\xed\x01\n\x15\x42\x61sicMaterialInfoMask\x12\x38\n\x06states\x18\x01 \x03(\x0e\x32(.dfproto.BasicMaterialInfoMask.StateType\x12\x1a\n\x0btemperature\x18\x04 \x01(\x05:\x05\x31\x30\x30\x31\x35\x12\x14\n\x05\x66lags\x18\x02 \x01(\x08:\x05\x66\x61lse\x12\x17\n\x08reaction\x18\x03 \x01(\x08:\x05\x66\x61lse\"O\n\tStateType\x12\t\n\x05Solid\x10\x00\x12\n\n\x06Liquid\x10\x01\x12\x07\n\x03Gas\x10\x02\x12\n\n\x06Powder\x10\x03\x12\t\n\x05Paste\x10\x04\x12\x0b\n\x07Pressed\x10\x05\"\x7f\n\x0cJobSkillAttr\x12\n\n\x02id\x18\x01 \x02(\x05\x12\x0b\n\x03key\x18\x02 \x02(\t\x12\x0f\n\x07\x63\x61ption\x18\x03 \x01(\t\x12\x14\n\x0c\x63\x61ption_noun\x18\x04 \x01(\t\x12\x12\n\nprofession\x18\x05 \x01(\x05\x12\r\n\x05labor\x18\x06 \x01(\x05\x12\x0c\n\x04type\x18\x07 \x01(\t\"v\n\x0eProfessionAttr\x12\n\n\x02id\x18\x01 \x02(\x05\x12\x0b\n\x03key\x18\x02 \x02(\t\x12\x0f\n\x07\x63\x61ption\x18\x03 \x01(\t\x12\x10\n\x08military\x18\x04 \x01(\x08\x12\x18\n\x10\x63\x61n_assign_labor\x18\x05 \x01(\x08\x12\x0e\n\x06parent\x18\x06 \x01(\x05\"9\n\rUnitLaborAttr\x12\n\n\x02id\x18\x01 \x02(\x05\x12\x0b\n\x03key\x18\x02 \x02(\t\x12\x0f\n\x07\x63\x61ption\x18\x03 \x01(\t\"r\n\x08NameInfo\x12\x12\n\nfirst_name\x18\x01 \x01(\t\x12\x10\n\x08nickname\x18\x02 \x01(\t\x12\x17\n\x0blanguage_id\x18\x03 \x01(\x05:\x02-1\x12\x11\n\tlast_name\x18\x04 \x01(\t\x12\x14\n\x0c\x65nglish_name\x18\x05 \x01(\t\"?\n\nNameTriple\x12\x0e\n\x06normal\x18\x01 \x02(\t\x12\x0e\n\x06plural\x18\x02 \x01(\t\x12\x11\n\tadjective\x18\x03 \x01(\t\"~\n\rUnitCurseInfo\x12\x11\n\tadd_tags1\x18\x01 \x02(\x07\x12\x11\n\trem_tags1\x18\x02 \x02(\x07\x12\x11\n\tadd_tags2\x18\x03 \x02(\x07\x12\x11\n\trem_tags2\x18\x04 \x02(\x07\x12!\n\x04name\x18\x05 \x01(\x0b\x32\x13.dfproto.NameTriple\":\n\tSkillInfo\x12\n\n\x02id\x18\x01 \x02(\x05\x12\r\n\x05level\x18\x02 \x02(\x05\x12\x12\n\nexperience\x18\x03 \x02(\x05\"*\n\rUnitMiscTrait\x12\n\n\x02id\x18\x01 \x02(\x05\x12\r\n\x05value\x18\x02 \x02(\x05\"\xa4\x04\n\rBasicUnitInfo\x12\x0f\n\x07unit_id\x18\x01 \x02(\x05\x12\r\n\x05pos_x\x18\r \x02(\x05\x12\r\n\x05pos_y\x18\x0e \x02(\x05\x12\r\n\x05pos_z\x18\x0f \x02(\x05\x12\x1f\n\x04name\x18\x02 \x01(\x0b\x32\x11.dfproto.NameInfo\x12\x0e\n\x06\x66lags1\x18\x03 \x02(\x07\x12\x0e\n\x06\x66lags2\x18\x04 \x02(\x07\x12\x0e\n\x06\x66lags3\x18\x05 \x02(\x07\x12\x0c\n\x04race\x18\x06 \x02(\x05\x12\r\n\x05\x63\x61ste\x18\x07 \x02(\x05\x12\x12\n\x06gender\x18\x08 \x01(\x05:\x02-1\x12\x12\n\x06\x63iv_id\x18\t \x01(\x05:\x02-1\x12\x16\n\nhistfig_id\x18\n \x01(\x05:\x02-1\x12\x14\n\x08\x64\x65\x61th_id\x18\x11 \x01(\x05:\x02-1\x12\x13\n\x0b\x64\x65\x61th_flags\x18\x12 \x01(\r\x12\x14\n\x08squad_id\x18\x13 \x01(\x05:\x02-1\x12\x1a\n\x0esquad_position\x18\x14 \x01(\x05:\x02-1\x12\x16\n\nprofession\x18\x16 \x01(\x05:\x02-1\x12\x19\n\x11\x63ustom_profession\x18\x17 \x01(\t\x12\x0e\n\x06labors\x18\x0b \x03(\x05\x12\"\n\x06skills\x18\x0c \x03(\x0b\x32\x12.dfproto.SkillInfo\x12+\n\x0bmisc_traits\x18\x18 \x03(\x0b\x32\x16.dfproto.UnitMiscTrait\x12%\n\x05\x63urse\x18\x10 \x01(\x0b\x32\x16.dfproto.UnitCurseInfo\x12\x0f\n\x07\x62urrows\x18\x15 \x03(\x05\"x\n\x11\x42\x61sicUnitInfoMask\x12\x15\n\x06labors\x18\x01 \x01(\x08:\x05\x66\x61lse\x12\x15\n\x06skills\x18\x02 \x01(\x08:\x05\x66\x61lse\x12\x19\n\nprofession\x18\x03 \x01(\x08:\x05\x66\x61lse\x12\x1a\n\x0bmisc_traits\x18\x04 \x01(\x08:\x05\x66\x61lse\"c\n\x0e\x42\x61sicSquadInfo\x12\x10\n\x08squad_id\x18\x01 \x02(\x05\x12\x1f\n\x04name\x18\x02 \x01(\x0b\x32\x11.dfproto.NameInfo\x12\r\n\x05\x61lias\x18\x03 \x01(\t\x12\x0f\n\x07members\x18\x04 \x03(\x11\"?\n\x0eUnitLaborState\x12\x0f\n\x07unit_id\x18\x01 \x02(\x05\x12\r\n\x05labor\x18\x02 \x02(\x05\x12\r\n\x05value\x18\x03 \x02(\x08\x42\x02H\x03')
-)
-_sym_db.RegisterFileDescriptor(DESCRIPTOR)
-
-
-
-_BASICMATERIALINFOMASK_STATETYPE = _descriptor.EnumDescriptor(
-  name='StateType',
-  full_name='dfproto.BasicMaterialInfoMask.StateType',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='Solid', index=0, number=0,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='Liquid', index=1, number=1,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='Gas', index=2, number=2,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='Powder', index=3, number=3,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='Paste', index=4, number=4,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='Pressed', index=5, number=5,
-      options=None,
-      type=None),
-  ],
-  containing_type=None,
-  options=None,
-  serialized_start=716,
-  serialized_end=795,
-)
-_sym_db.RegisterEnumDescriptor(_BASICMATERIALINFOMASK_STATETYPE)
-
-
-_ENUMITEMNAME = _descriptor.Descriptor(
-  name='EnumItemName',
-  full_name='dfproto.EnumItemName',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='value', full_name='dfproto.EnumItemName.value', index=0,
-      number=1, type=5, cpp_type=1, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='name', full_name='dfproto.EnumItemName.name', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='bit_size', full_name='dfproto.EnumItemName.bit_size', index=2,
-      number=3, type=5, cpp_type=1, label=1,
-      has_default_value=True, default_value=1,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=24,
-  serialized_end=88,
-)
-
-
-_BASICMATERIALID = _descriptor.Descriptor(
-  name='BasicMaterialId',
-  full_name='dfproto.BasicMaterialId',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='type', full_name='dfproto.BasicMaterialId.type', index=0,
-      number=1, type=5, cpp_type=1, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='index', full_name='dfproto.BasicMaterialId.index', index=1,
-      number=2, type=17, cpp_type=1, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=90,
-  serialized_end=136,
-)
-
-
-_BASICMATERIALINFO_PRODUCT = _descriptor.Descriptor(
-  name='Product',
-  full_name='dfproto.BasicMaterialInfo.Product',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='id', full_name='dfproto.BasicMaterialInfo.Product.id', index=0,
-      number=1, type=9, cpp_type=9, label=2,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='type', full_name='dfproto.BasicMaterialInfo.Product.type', index=1,
-      number=2, type=5, cpp_type=1, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='index', full_name='dfproto.BasicMaterialInfo.Product.index', index=2,
-      number=3, type=17, cpp_type=1, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=505,
-  serialized_end=555,
-)
-
-_BASICMATERIALINFO = _descriptor.Descriptor(
-  name='BasicMaterialInfo',
-  full_name='dfproto.BasicMaterialInfo',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='type', full_name='dfproto.BasicMaterialInfo.type', index=0,
-      number=1, type=5, cpp_type=1, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='index', full_name='dfproto.BasicMaterialInfo.index', index=1,
-      number=2, type=17, cpp_type=1, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='token', full_name='dfproto.BasicMaterialInfo.token', index=2,
-      number=3, type=9, cpp_type=9, label=2,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='flags', full_name='dfproto.BasicMaterialInfo.flags', index=3,
-      number=4, type=5, cpp_type=1, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='subtype', full_name='dfproto.BasicMaterialInfo.subtype', index=4,
-      number=5, type=5, cpp_type=1, label=1,
-      has_default_value=True, default_value=-1,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='creature_id', full_name='dfproto.BasicMaterialInfo.creature_id', index=5,
-      number=6, type=5, cpp_type=1, label=1,
-      has_default_value=True, default_value=-1,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='plant_id', full_name='dfproto.BasicMaterialInfo.plant_id', index=6,
-      number=7, type=5, cpp_type=1, label=1,
-      has_default_value=True, default_value=-1,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='histfig_id', full_name='dfproto.BasicMaterialInfo.histfig_id', index=7,
-      number=8, type=5, cpp_type=1, label=1,
-      has_default_value=True, default_value=-1,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='name_prefix', full_name='dfproto.BasicMaterialInfo.name_prefix', index=8,
-      number=9, type=9, cpp_type=9, label=1,
-      has_default_value=True, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='state_color', full_name='dfproto.BasicMaterialInfo.state_color', index=9,
-      number=10, type=7, cpp_type=3, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='state_name', full_name='dfproto.BasicMaterialInfo.state_name', index=10,
-      number=11, type=9, cpp_type=9, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='state_adj', full_name='dfproto.BasicMaterialInfo.state_adj', index=11,
-      number=12, type=9, cpp_type=9, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='reaction_class', full_name='dfproto.BasicMaterialInfo.reaction_class', index=12,
-      number=13, type=9, cpp_type=9, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='reaction_product', full_name='dfproto.BasicMaterialInfo.reaction_product', index=13,
-      number=14, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='inorganic_flags', full_name='dfproto.BasicMaterialInfo.inorganic_flags', index=14,
-      number=15, type=5, cpp_type=1, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[_BASICMATERIALINFO_PRODUCT, ],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=139,
-  serialized_end=555,
-)
-
-
-_BASICMATERIALINFOMASK = _descriptor.Descriptor(
-  name='BasicMaterialInfoMask',
-  full_name='dfproto.BasicMaterialInfoMask',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='states', full_name='dfproto.BasicMaterialInfoMask.states', index=0,
-      number=1, type=14, cpp_type=8, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='temperature', full_name='dfproto.BasicMaterialInfoMask.temperature', index=1,
-      number=4, type=5, cpp_type=1, label=1,
-      has_default_value=True, default_value=10015,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='flags', full_name='dfproto.BasicMaterialInfoMask.flags', index=2,
-      number=2, type=8, cpp_type=7, label=1,
-      has_default_value=True, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='reaction', full_name='dfproto.BasicMaterialInfoMask.reaction', index=3,
-      number=3, type=8, cpp_type=7, label=1,
-      has_default_value=True, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-    _BASICMATERIALINFOMASK_STATETYPE,
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=558,
-  serialized_end=795,
-)
-
-
-_JOBSKILLATTR = _descriptor.Descriptor(
-  name='JobSkillAttr',
-  full_name='dfproto.JobSkillAttr',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='id', full_name='dfproto.JobSkillAttr.id', index=0,
-      number=1, type=5, cpp_type=1, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='key', full_name='dfproto.JobSkillAttr.key', index=1,
-      number=2, type=9, cpp_type=9, label=2,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='caption', full_name='dfproto.JobSkillAttr.caption', index=2,
-      number=3, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='caption_noun', full_name='dfproto.JobSkillAttr.caption_noun', index=3,
-      number=4, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='profession', full_name='dfproto.JobSkillAttr.profession', index=4,
-      number=5, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='labor', full_name='dfproto.JobSkillAttr.labor', index=5,
-      number=6, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='type', full_name='dfproto.JobSkillAttr.type', index=6,
-      number=7, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=797,
-  serialized_end=924,
-)
-
-
-_PROFESSIONATTR = _descriptor.Descriptor(
-  name='ProfessionAttr',
-  full_name='dfproto.ProfessionAttr',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='id', full_name='dfproto.ProfessionAttr.id', index=0,
-      number=1, type=5, cpp_type=1, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='key', full_name='dfproto.ProfessionAttr.key', index=1,
-      number=2, type=9, cpp_type=9, label=2,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='caption', full_name='dfproto.ProfessionAttr.caption', index=2,
-      number=3, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='military', full_name='dfproto.ProfessionAttr.military', index=3,
-      number=4, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='can_assign_labor', full_name='dfproto.ProfessionAttr.can_assign_labor', index=4,
-      number=5, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='parent', full_name='dfproto.ProfessionAttr.parent', index=5,
-      number=6, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=926,
-  serialized_end=1044,
-)
-
-
-_UNITLABORATTR = _descriptor.Descriptor(
-  name='UnitLaborAttr',
-  full_name='dfproto.UnitLaborAttr',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='id', full_name='dfproto.UnitLaborAttr.id', index=0,
-      number=1, type=5, cpp_type=1, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='key', full_name='dfproto.UnitLaborAttr.key', index=1,
-      number=2, type=9, cpp_type=9, label=2,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='caption', full_name='dfproto.UnitLaborAttr.caption', index=2,
-      number=3, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1046,
-  serialized_end=1103,
-)
-
-
-_NAMEINFO = _descriptor.Descriptor(
-  name='NameInfo',
-  full_name='dfproto.NameInfo',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='first_name', full_name='dfproto.NameInfo.first_name', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='nickname', full_name='dfproto.NameInfo.nickname', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='language_id', full_name='dfproto.NameInfo.language_id', index=2,
-      number=3, type=5, cpp_type=1, label=1,
-      has_default_value=True, default_value=-1,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='last_name', full_name='dfproto.NameInfo.last_name', index=3,
-      number=4, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='english_name', full_name='dfproto.NameInfo.english_name', index=4,
-      number=5, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1105,
-  serialized_end=1219,
-)
-
-
-_NAMETRIPLE = _descriptor.Descriptor(
-  name='NameTriple',
-  full_name='dfproto.NameTriple',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='normal', full_name='dfproto.NameTriple.normal', index=0,
-      number=1, type=9, cpp_type=9, label=2,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='plural', full_name='dfproto.NameTriple.plural', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='adjective', full_name='dfproto.NameTriple.adjective', index=2,
-      number=3, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1221,
-  serialized_end=1284,
-)
-
-
-_UNITCURSEINFO = _descriptor.Descriptor(
-  name='UnitCurseInfo',
-  full_name='dfproto.UnitCurseInfo',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='add_tags1', full_name='dfproto.UnitCurseInfo.add_tags1', index=0,
-      number=1, type=7, cpp_type=3, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='rem_tags1', full_name='dfproto.UnitCurseInfo.rem_tags1', index=1,
-      number=2, type=7, cpp_type=3, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='add_tags2', full_name='dfproto.UnitCurseInfo.add_tags2', index=2,
-      number=3, type=7, cpp_type=3, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='rem_tags2', full_name='dfproto.UnitCurseInfo.rem_tags2', index=3,
-      number=4, type=7, cpp_type=3, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='name', full_name='dfproto.UnitCurseInfo.name', index=4,
-      number=5, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1286,
-  serialized_end=1412,
-)
-
-
-_SKILLINFO = _descriptor.Descriptor(
-  name='SkillInfo',
-  full_name='dfproto.SkillInfo',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='id', full_name='dfproto.SkillInfo.id', index=0,
-      number=1, type=5, cpp_type=1, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='level', full_name='dfproto.SkillInfo.level', index=1,
-      number=2, type=5, cpp_type=1, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='experience', full_name='dfproto.SkillInfo.experience', index=2,
-      number=3, type=5, cpp_type=1, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1414,
-  serialized_end=1472,
-)
-
-
-_UNITMISCTRAIT = _descriptor.Descriptor(
-  name='UnitMiscTrait',
-  full_name='dfproto.UnitMiscTrait',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='id', full_name='dfproto.UnitMiscTrait.id', index=0,
-      number=1, type=5, cpp_type=1, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='value', full_name='dfproto.UnitMiscTrait.value', index=1,
-      number=2, type=5, cpp_type=1, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1474,
-  serialized_end=1516,
-)
-
-
-_BASICUNITINFO = _descriptor.Descriptor(
-  name='BasicUnitInfo',
-  full_name='dfproto.BasicUnitInfo',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='unit_id', full_name='dfproto.BasicUnitInfo.unit_id', index=0,
-      number=1, type=5, cpp_type=1, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='pos_x', full_name='dfproto.BasicUnitInfo.pos_x', index=1,
-      number=13, type=5, cpp_type=1, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='pos_y', full_name='dfproto.BasicUnitInfo.pos_y', index=2,
-      number=14, type=5, cpp_type=1, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='pos_z', full_name='dfproto.BasicUnitInfo.pos_z', index=3,
-      number=15, type=5, cpp_type=1, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='name', full_name='dfproto.BasicUnitInfo.name', index=4,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='flags1', full_name='dfproto.BasicUnitInfo.flags1', index=5,
-      number=3, type=7, cpp_type=3, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='flags2', full_name='dfproto.BasicUnitInfo.flags2', index=6,
-      number=4, type=7, cpp_type=3, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='flags3', full_name='dfproto.BasicUnitInfo.flags3', index=7,
-      number=5, type=7, cpp_type=3, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='race', full_name='dfproto.BasicUnitInfo.race', index=8,
-      number=6, type=5, cpp_type=1, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='caste', full_name='dfproto.BasicUnitInfo.caste', index=9,
-      number=7, type=5, cpp_type=1, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='gender', full_name='dfproto.BasicUnitInfo.gender', index=10,
-      number=8, type=5, cpp_type=1, label=1,
-      has_default_value=True, default_value=-1,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='civ_id', full_name='dfproto.BasicUnitInfo.civ_id', index=11,
-      number=9, type=5, cpp_type=1, label=1,
-      has_default_value=True, default_value=-1,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='histfig_id', full_name='dfproto.BasicUnitInfo.histfig_id', index=12,
-      number=10, type=5, cpp_type=1, label=1,
-      has_default_value=True, default_value=-1,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='death_id', full_name='dfproto.BasicUnitInfo.death_id', index=13,
-      number=17, type=5, cpp_type=1, label=1,
-      has_default_value=True, default_value=-1,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='death_flags', full_name='dfproto.BasicUnitInfo.death_flags', index=14,
-      number=18, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='squad_id', full_name='dfproto.BasicUnitInfo.squad_id', index=15,
-      number=19, type=5, cpp_type=1, label=1,
-      has_default_value=True, default_value=-1,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='squad_position', full_name='dfproto.BasicUnitInfo.squad_position', index=16,
-      number=20, type=5, cpp_type=1, label=1,
-      has_default_value=True, default_value=-1,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='profession', full_name='dfproto.BasicUnitInfo.profession', index=17,
-      number=22, type=5, cpp_type=1, label=1,
-      has_default_value=True, default_value=-1,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='custom_profession', full_name='dfproto.BasicUnitInfo.custom_profession', index=18,
-      number=23, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='labors', full_name='dfproto.BasicUnitInfo.labors', index=19,
-      number=11, type=5, cpp_type=1, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='skills', full_name='dfproto.BasicUnitInfo.skills', index=20,
-      number=12, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='misc_traits', full_name='dfproto.BasicUnitInfo.misc_traits', index=21,
-      number=24, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='curse', full_name='dfproto.BasicUnitInfo.curse', index=22,
-      number=16, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='burrows', full_name='dfproto.BasicUnitInfo.burrows', index=23,
-      number=21, type=5, cpp_type=1, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1519,
-  serialized_end=2067,
-)
-
-
-_BASICUNITINFOMASK = _descriptor.Descriptor(
-  name='BasicUnitInfoMask',
-  full_name='dfproto.BasicUnitInfoMask',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='labors', full_name='dfproto.BasicUnitInfoMask.labors', index=0,
-      number=1, type=8, cpp_type=7, label=1,
-      has_default_value=True, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='skills', full_name='dfproto.BasicUnitInfoMask.skills', index=1,
-      number=2, type=8, cpp_type=7, label=1,
-      has_default_value=True, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='profession', full_name='dfproto.BasicUnitInfoMask.profession', index=2,
-      number=3, type=8, cpp_type=7, label=1,
-      has_default_value=True, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='misc_traits', full_name='dfproto.BasicUnitInfoMask.misc_traits', index=3,
-      number=4, type=8, cpp_type=7, label=1,
-      has_default_value=True, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=2069,
-  serialized_end=2189,
-)
-
-
-_BASICSQUADINFO = _descriptor.Descriptor(
-  name='BasicSquadInfo',
-  full_name='dfproto.BasicSquadInfo',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='squad_id', full_name='dfproto.BasicSquadInfo.squad_id', index=0,
-      number=1, type=5, cpp_type=1, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='name', full_name='dfproto.BasicSquadInfo.name', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='alias', full_name='dfproto.BasicSquadInfo.alias', index=2,
-      number=3, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='members', full_name='dfproto.BasicSquadInfo.members', index=3,
-      number=4, type=17, cpp_type=1, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=2191,
-  serialized_end=2290,
-)
-
-
-_UNITLABORSTATE = _descriptor.Descriptor(
-  name='UnitLaborState',
-  full_name='dfproto.UnitLaborState',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='unit_id', full_name='dfproto.UnitLaborState.unit_id', index=0,
-      number=1, type=5, cpp_type=1, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='labor', full_name='dfproto.UnitLaborState.labor', index=1,
-      number=2, type=5, cpp_type=1, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='value', full_name='dfproto.UnitLaborState.value', index=2,
-      number=3, type=8, cpp_type=7, label=2,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=2292,
-  serialized_end=2355,
-)
-
-_BASICMATERIALINFO_PRODUCT.containing_type = _BASICMATERIALINFO
-_BASICMATERIALINFO.fields_by_name['reaction_product'].message_type = _BASICMATERIALINFO_PRODUCT
-_BASICMATERIALINFOMASK.fields_by_name['states'].enum_type = _BASICMATERIALINFOMASK_STATETYPE
-_BASICMATERIALINFOMASK_STATETYPE.containing_type = _BASICMATERIALINFOMASK
-_UNITCURSEINFO.fields_by_name['name'].message_type = _NAMETRIPLE
-_BASICUNITINFO.fields_by_name['name'].message_type = _NAMEINFO
-_BASICUNITINFO.fields_by_name['skills'].message_type = _SKILLINFO
-_BASICUNITINFO.fields_by_name['misc_traits'].message_type = _UNITMISCTRAIT
-_BASICUNITINFO.fields_by_name['curse'].message_type = _UNITCURSEINFO
-_BASICSQUADINFO.fields_by_name['name'].message_type = _NAMEINFO
-DESCRIPTOR.message_types_by_name['EnumItemName'] = _ENUMITEMNAME
-DESCRIPTOR.message_types_by_name['BasicMaterialId'] = _BASICMATERIALID
-DESCRIPTOR.message_types_by_name['BasicMaterialInfo'] = _BASICMATERIALINFO
-DESCRIPTOR.message_types_by_name['BasicMaterialInfoMask'] = _BASICMATERIALINFOMASK
-DESCRIPTOR.message_types_by_name['JobSkillAttr'] = _JOBSKILLATTR
-DESCRIPTOR.message_types_by_name['ProfessionAttr'] = _PROFESSIONATTR
-DESCRIPTOR.message_types_by_name['UnitLaborAttr'] = _UNITLABORATTR
-DESCRIPTOR.message_types_by_name['NameInfo'] = _NAMEINFO
-DESCRIPTOR.message_types_by_name['NameTriple'] = _NAMETRIPLE
-DESCRIPTOR.message_types_by_name['UnitCurseInfo'] = _UNITCURSEINFO
-DESCRIPTOR.message_types_by_name['SkillInfo'] = _SKILLINFO
-DESCRIPTOR.message_types_by_name['UnitMiscTrait'] = _UNITMISCTRAIT
-DESCRIPTOR.message_types_by_name['BasicUnitInfo'] = _BASICUNITINFO
-DESCRIPTOR.message_types_by_name['BasicUnitInfoMask'] = _BASICUNITINFOMASK
-DESCRIPTOR.message_types_by_name['BasicSquadInfo'] = _BASICSQUADINFO
-DESCRIPTOR.message_types_by_name['UnitLaborState'] = _UNITLABORSTATE
-
-EnumItemName = _reflection.GeneratedProtocolMessageType('EnumItemName', (_message.Message,), dict(
-  DESCRIPTOR = _ENUMITEMNAME,
-  __module__ = 'Basic_pb2'
-  # @@protoc_insertion_point(class_scope:dfproto.EnumItemName)
-  ))
-_sym_db.RegisterMessage(EnumItemName)
-
-BasicMaterialId = _reflection.GeneratedProtocolMessageType('BasicMaterialId', (_message.Message,), dict(
-  DESCRIPTOR = _BASICMATERIALID,
-  __module__ = 'Basic_pb2'
-  # @@protoc_insertion_point(class_scope:dfproto.BasicMaterialId)
-  ))
-_sym_db.RegisterMessage(BasicMaterialId)
-
-BasicMaterialInfo = _reflection.GeneratedProtocolMessageType('BasicMaterialInfo', (_message.Message,), dict(
-
-  Product = _reflection.GeneratedProtocolMessageType('Product', (_message.Message,), dict(
-    DESCRIPTOR = _BASICMATERIALINFO_PRODUCT,
-    __module__ = 'Basic_pb2'
-    # @@protoc_insertion_point(class_scope:dfproto.BasicMaterialInfo.Product)
-    ))
-  ,
-  DESCRIPTOR = _BASICMATERIALINFO,
-  __module__ = 'Basic_pb2'
-  # @@protoc_insertion_point(class_scope:dfproto.BasicMaterialInfo)
-  ))
-_sym_db.RegisterMessage(BasicMaterialInfo)
-_sym_db.RegisterMessage(BasicMaterialInfo.Product)
-
-BasicMaterialInfoMask = _reflection.GeneratedProtocolMessageType('BasicMaterialInfoMask', (_message.Message,), dict(
-  DESCRIPTOR = _BASICMATERIALINFOMASK,
-  __module__ = 'Basic_pb2'
-  # @@protoc_insertion_point(class_scope:dfproto.BasicMaterialInfoMask)
-  ))
-_sym_db.RegisterMessage(BasicMaterialInfoMask)
-
-JobSkillAttr = _reflection.GeneratedProtocolMessageType('JobSkillAttr', (_message.Message,), dict(
-  DESCRIPTOR = _JOBSKILLATTR,
-  __module__ = 'Basic_pb2'
-  # @@protoc_insertion_point(class_scope:dfproto.JobSkillAttr)
-  ))
-_sym_db.RegisterMessage(JobSkillAttr)
-
-ProfessionAttr = _reflection.GeneratedProtocolMessageType('ProfessionAttr', (_message.Message,), dict(
-  DESCRIPTOR = _PROFESSIONATTR,
-  __module__ = 'Basic_pb2'
-  # @@protoc_insertion_point(class_scope:dfproto.ProfessionAttr)
-  ))
-_sym_db.RegisterMessage(ProfessionAttr)
-
-UnitLaborAttr = _reflection.GeneratedProtocolMessageType('UnitLaborAttr', (_message.Message,), dict(
-  DESCRIPTOR = _UNITLABORATTR,
-  __module__ = 'Basic_pb2'
-  # @@protoc_insertion_point(class_scope:dfproto.UnitLaborAttr)
-  ))
-_sym_db.RegisterMessage(UnitLaborAttr)
-
-NameInfo = _reflection.GeneratedProtocolMessageType('NameInfo', (_message.Message,), dict(
-  DESCRIPTOR = _NAMEINFO,
-  __module__ = 'Basic_pb2'
-  # @@protoc_insertion_point(class_scope:dfproto.NameInfo)
-  ))
-_sym_db.RegisterMessage(NameInfo)
-
-NameTriple = _reflection.GeneratedProtocolMessageType('NameTriple', (_message.Message,), dict(
-  DESCRIPTOR = _NAMETRIPLE,
-  __module__ = 'Basic_pb2'
-  # @@protoc_insertion_point(class_scope:dfproto.NameTriple)
-  ))
-_sym_db.RegisterMessage(NameTriple)
-
-UnitCurseInfo = _reflection.GeneratedProtocolMessageType('UnitCurseInfo', (_message.Message,), dict(
-  DESCRIPTOR = _UNITCURSEINFO,
-  __module__ = 'Basic_pb2'
-  # @@protoc_insertion_point(class_scope:dfproto.UnitCurseInfo)
-  ))
-_sym_db.RegisterMessage(UnitCurseInfo)
-
-SkillInfo = _reflection.GeneratedProtocolMessageType('SkillInfo', (_message.Message,), dict(
-  DESCRIPTOR = _SKILLINFO,
-  __module__ = 'Basic_pb2'
-  # @@protoc_insertion_point(class_scope:dfproto.SkillInfo)
-  ))
-_sym_db.RegisterMessage(SkillInfo)
-
-UnitMiscTrait = _reflection.GeneratedProtocolMessageType('UnitMiscTrait', (_message.Message,), dict(
-  DESCRIPTOR = _UNITMISCTRAIT,
-  __module__ = 'Basic_pb2'
-  # @@protoc_insertion_point(class_scope:dfproto.UnitMiscTrait)
-  ))
-_sym_db.RegisterMessage(UnitMiscTrait)
-
-BasicUnitInfo = _reflection.GeneratedProtocolMessageType('BasicUnitInfo', (_message.Message,), dict(
-  DESCRIPTOR = _BASICUNITINFO,
-  __module__ = 'Basic_pb2'
-  # @@protoc_insertion_point(class_scope:dfproto.BasicUnitInfo)
-  ))
-_sym_db.RegisterMessage(BasicUnitInfo)
-
-BasicUnitInfoMask = _reflection.GeneratedProtocolMessageType('BasicUnitInfoMask', (_message.Message,), dict(
-  DESCRIPTOR = _BASICUNITINFOMASK,
-  __module__ = 'Basic_pb2'
-  # @@protoc_insertion_point(class_scope:dfproto.BasicUnitInfoMask)
-  ))
-_sym_db.RegisterMessage(BasicUnitInfoMask)
-
-BasicSquadInfo = _reflection.GeneratedProtocolMessageType('BasicSquadInfo', (_message.Message,), dict(
-  DESCRIPTOR = _BASICSQUADINFO,
-  __module__ = 'Basic_pb2'
-  # @@protoc_insertion_point(class_scope:dfproto.BasicSquadInfo)
-  ))
-_sym_db.RegisterMessage(BasicSquadInfo)
-
-UnitLaborState = _reflection.GeneratedProtocolMessageType('UnitLaborState', (_message.Message,), dict(
-  DESCRIPTOR = _UNITLABORSTATE,
-  __module__ = 'Basic_pb2'
-  # @@protoc_insertion_point(class_scope:dfproto.UnitLaborState)
-  ))
-_sym_db.RegisterMessage(UnitLaborState)
-
-
-DESCRIPTOR.has_options = True
-DESCRIPTOR._options = _descriptor._ParseOptions(descriptor_pb2.FileOptions(), _b('H\003'))
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0b\x42\x61sic.proto\x12\x07\x64\x66proto\"@\n\x0c\x45numItemName\x12\r\n\x05value\x18\x01 \x02(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x08\x62it_size\x18\x03 \x01(\x05:\x01\x31\".\n\x0f\x42\x61sicMaterialId\x12\x0c\n\x04type\x18\x01 \x02(\x05\x12\r\n\x05index\x18\x02 \x02(\x11\"\xa0\x03\n\x11\x42\x61sicMaterialInfo\x12\x0c\n\x04type\x18\x01 \x02(\x05\x12\r\n\x05index\x18\x02 \x02(\x11\x12\r\n\x05token\x18\x03 \x02(\t\x12\r\n\x05\x66lags\x18\x04 \x03(\x05\x12\x13\n\x07subtype\x18\x05 \x01(\x05:\x02-1\x12\x17\n\x0b\x63reature_id\x18\x06 \x01(\x05:\x02-1\x12\x14\n\x08plant_id\x18\x07 \x01(\x05:\x02-1\x12\x16\n\nhistfig_id\x18\x08 \x01(\x05:\x02-1\x12\x15\n\x0bname_prefix\x18\t \x01(\t:\x00\x12\x13\n\x0bstate_color\x18\n \x03(\x07\x12\x12\n\nstate_name\x18\x0b \x03(\t\x12\x11\n\tstate_adj\x18\x0c \x03(\t\x12\x16\n\x0ereaction_class\x18\r \x03(\t\x12<\n\x10reaction_product\x18\x0e \x03(\x0b\x32\".dfproto.BasicMaterialInfo.Product\x12\x17\n\x0finorganic_flags\x18\x0f \x03(\x05\x1a\x32\n\x07Product\x12\n\n\x02id\x18\x01 \x02(\t\x12\x0c\n\x04type\x18\x02 \x02(\x05\x12\r\n\x05index\x18\x03 \x02(\x11\"\xed\x01\n\x15\x42\x61sicMaterialInfoMask\x12\x38\n\x06states\x18\x01 \x03(\x0e\x32(.dfproto.BasicMaterialInfoMask.StateType\x12\x1a\n\x0btemperature\x18\x04 \x01(\x05:\x05\x31\x30\x30\x31\x35\x12\x14\n\x05\x66lags\x18\x02 \x01(\x08:\x05\x66\x61lse\x12\x17\n\x08reaction\x18\x03 \x01(\x08:\x05\x66\x61lse\"O\n\tStateType\x12\t\n\x05Solid\x10\x00\x12\n\n\x06Liquid\x10\x01\x12\x07\n\x03Gas\x10\x02\x12\n\n\x06Powder\x10\x03\x12\t\n\x05Paste\x10\x04\x12\x0b\n\x07Pressed\x10\x05\"\x7f\n\x0cJobSkillAttr\x12\n\n\x02id\x18\x01 \x02(\x05\x12\x0b\n\x03key\x18\x02 \x02(\t\x12\x0f\n\x07\x63\x61ption\x18\x03 \x01(\t\x12\x14\n\x0c\x63\x61ption_noun\x18\x04 \x01(\t\x12\x12\n\nprofession\x18\x05 \x01(\x05\x12\r\n\x05labor\x18\x06 \x01(\x05\x12\x0c\n\x04type\x18\x07 \x01(\t\"v\n\x0eProfessionAttr\x12\n\n\x02id\x18\x01 \x02(\x05\x12\x0b\n\x03key\x18\x02 \x02(\t\x12\x0f\n\x07\x63\x61ption\x18\x03 \x01(\t\x12\x10\n\x08military\x18\x04 \x01(\x08\x12\x18\n\x10\x63\x61n_assign_labor\x18\x05 \x01(\x08\x12\x0e\n\x06parent\x18\x06 \x01(\x05\"9\n\rUnitLaborAttr\x12\n\n\x02id\x18\x01 \x02(\x05\x12\x0b\n\x03key\x18\x02 \x02(\t\x12\x0f\n\x07\x63\x61ption\x18\x03 \x01(\t\"r\n\x08NameInfo\x12\x12\n\nfirst_name\x18\x01 \x01(\t\x12\x10\n\x08nickname\x18\x02 \x01(\t\x12\x17\n\x0blanguage_id\x18\x03 \x01(\x05:\x02-1\x12\x11\n\tlast_name\x18\x04 \x01(\t\x12\x14\n\x0c\x65nglish_name\x18\x05 \x01(\t\"?\n\nNameTriple\x12\x0e\n\x06normal\x18\x01 \x02(\t\x12\x0e\n\x06plural\x18\x02 \x01(\t\x12\x11\n\tadjective\x18\x03 \x01(\t\"~\n\rUnitCurseInfo\x12\x11\n\tadd_tags1\x18\x01 \x02(\x07\x12\x11\n\trem_tags1\x18\x02 \x02(\x07\x12\x11\n\tadd_tags2\x18\x03 \x02(\x07\x12\x11\n\trem_tags2\x18\x04 \x02(\x07\x12!\n\x04name\x18\x05 \x01(\x0b\x32\x13.dfproto.NameTriple\":\n\tSkillInfo\x12\n\n\x02id\x18\x01 \x02(\x05\x12\r\n\x05level\x18\x02 \x02(\x05\x12\x12\n\nexperience\x18\x03 \x02(\x05\"*\n\rUnitMiscTrait\x12\n\n\x02id\x18\x01 \x02(\x05\x12\r\n\x05value\x18\x02 \x02(\x05\"\xa4\x04\n\rBasicUnitInfo\x12\x0f\n\x07unit_id\x18\x01 \x02(\x05\x12\r\n\x05pos_x\x18\r \x02(\x05\x12\r\n\x05pos_y\x18\x0e \x02(\x05\x12\r\n\x05pos_z\x18\x0f \x02(\x05\x12\x1f\n\x04name\x18\x02 \x01(\x0b\x32\x11.dfproto.NameInfo\x12\x0e\n\x06\x66lags1\x18\x03 \x02(\x07\x12\x0e\n\x06\x66lags2\x18\x04 \x02(\x07\x12\x0e\n\x06\x66lags3\x18\x05 \x02(\x07\x12\x0c\n\x04race\x18\x06 \x02(\x05\x12\r\n\x05\x63\x61ste\x18\x07 \x02(\x05\x12\x12\n\x06gender\x18\x08 \x01(\x05:\x02-1\x12\x12\n\x06\x63iv_id\x18\t \x01(\x05:\x02-1\x12\x16\n\nhistfig_id\x18\n \x01(\x05:\x02-1\x12\x14\n\x08\x64\x65\x61th_id\x18\x11 \x01(\x05:\x02-1\x12\x13\n\x0b\x64\x65\x61th_flags\x18\x12 \x01(\r\x12\x14\n\x08squad_id\x18\x13 \x01(\x05:\x02-1\x12\x1a\n\x0esquad_position\x18\x14 \x01(\x05:\x02-1\x12\x16\n\nprofession\x18\x16 \x01(\x05:\x02-1\x12\x19\n\x11\x63ustom_profession\x18\x17 \x01(\t\x12\x0e\n\x06labors\x18\x0b \x03(\x05\x12\"\n\x06skills\x18\x0c \x03(\x0b\x32\x12.dfproto.SkillInfo\x12+\n\x0bmisc_traits\x18\x18 \x03(\x0b\x32\x16.dfproto.UnitMiscTrait\x12%\n\x05\x63urse\x18\x10 \x01(\x0b\x32\x16.dfproto.UnitCurseInfo\x12\x0f\n\x07\x62urrows\x18\x15 \x03(\x05\"x\n\x11\x42\x61sicUnitInfoMask\x12\x15\n\x06labors\x18\x01 \x01(\x08:\x05\x66\x61lse\x12\x15\n\x06skills\x18\x02 \x01(\x08:\x05\x66\x61lse\x12\x19\n\nprofession\x18\x03 \x01(\x08:\x05\x66\x61lse\x12\x1a\n\x0bmisc_traits\x18\x04 \x01(\x08:\x05\x66\x61lse\"c\n\x0e\x42\x61sicSquadInfo\x12\x10\n\x08squad_id\x18\x01 \x02(\x05\x12\x1f\n\x04name\x18\x02 \x01(\x0b\x32\x11.dfproto.NameInfo\x12\r\n\x05\x61lias\x18\x03 \x01(\t\x12\x0f\n\x07members\x18\x04 \x03(\x11\"?\n\x0eUnitLaborState\x12\x0f\n\x07unit_id\x18\x01 \x02(\x05\x12\r\n\x05labor\x18\x02 \x02(\x05\x12\r\n\x05value\x18\x03 \x02(\x08\x42\x02H\x03')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'dfhack_rpc.proto.Basic_pb2', globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  DESCRIPTOR._serialized_options = b'H\003'
+  _ENUMITEMNAME._serialized_start=24
+  _ENUMITEMNAME._serialized_end=88
+  _BASICMATERIALID._serialized_start=90
+  _BASICMATERIALID._serialized_end=136
+  _BASICMATERIALINFO._serialized_start=139
+  _BASICMATERIALINFO._serialized_end=555
+  _BASICMATERIALINFO_PRODUCT._serialized_start=505
+  _BASICMATERIALINFO_PRODUCT._serialized_end=555
+  _BASICMATERIALINFOMASK._serialized_start=558
+  _BASICMATERIALINFOMASK._serialized_end=795
+  _BASICMATERIALINFOMASK_STATETYPE._serialized_start=716
+  _BASICMATERIALINFOMASK_STATETYPE._serialized_end=795
+  _JOBSKILLATTR._serialized_start=797
+  _JOBSKILLATTR._serialized_end=924
+  _PROFESSIONATTR._serialized_start=926
+  _PROFESSIONATTR._serialized_end=1044
+  _UNITLABORATTR._serialized_start=1046
+  _UNITLABORATTR._serialized_end=1103
+  _NAMEINFO._serialized_start=1105
+  _NAMEINFO._serialized_end=1219
+  _NAMETRIPLE._serialized_start=1221
+  _NAMETRIPLE._serialized_end=1284
+  _UNITCURSEINFO._serialized_start=1286
+  _UNITCURSEINFO._serialized_end=1412
+  _SKILLINFO._serialized_start=1414
+  _SKILLINFO._serialized_end=1472
+  _UNITMISCTRAIT._serialized_start=1474
+  _UNITMISCTRAIT._serialized_end=1516
+  _BASICUNITINFO._serialized_start=1519
+  _BASICUNITINFO._serialized_end=2067
+  _BASICUNITINFOMASK._serialized_start=2069
+  _BASICUNITINFOMASK._serialized_end=2189
+  _BASICSQUADINFO._serialized_start=2191
+  _BASICSQUADINFO._serialized_end=2290
+  _UNITLABORSTATE._serialized_start=2292
+  _UNITLABORSTATE._serialized_end=2355
 # @@protoc_insertion_point(module_scope)
@@ -1,13 +1,11 @@
+# -*- coding: utf-8 -*-
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
 # source: CoreProtocol.proto
-
-import sys
-_b=sys.version_info[0]<3 and (lambda x:x) or (lambda x:x.encode('latin1'))
+"""Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
 from google.protobuf import descriptor as _descriptor
-from google.protobuf import message as _message
-from google.protobuf import reflection as _reflection
+from google.protobuf import descriptor_pool as _descriptor_pool
 from google.protobuf import symbol_database as _symbol_database
-from google.protobuf import descriptor_pb2
 # @@protoc_insertion_point(imports)
 
 _sym_db = _symbol_database.Default()
@@ -15,655 +13,40 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor.FileDescriptor(
-  name='CoreProtocol.proto',
-  package='dfproto',
-  syntax='proto2',
-  serialized_pb=_b('\n\x12\x43oreProtocol.proto\x12\x07\x64\x66proto\"\x82\x03\n\x10\x43oreTextFragment\x12\x0c\n\x04text\x18\x01 \x02(\t\x12.\n\x05\x63olor\x18\x02 \x01(\x0e\x32\x1f.dfproto.CoreTextFragment.Color\"\xaf\x02\n\x05\x43olor\x12\x0f\n\x0b\x43OLOR_BLACK\x10\x00\x12\x0e\n\nCOLOR_BLUE\x10\x01\x12\x0f\n\x0b\x43OLOR_GREEN\x10\x02\x12\x0e\n\nCOLOR_CYAN\x10\x03\x12\r\n\tCOLOR_RED\x10\x04\x12\x11\n\rCOLOR_MAGENTA\x10\x05\x12\x0f\n\x0b\x43OLOR_BROWN\x10\x06\x12\x0e\n\nCOLOR_GREY\x10\x07\x12\x12\n\x0e\x43OLOR_DARKGREY\x10\x08\x12\x13\n\x0f\x43OLOR_LIGHTBLUE\x10\t\x12\x14\n\x10\x43OLOR_LIGHTGREEN\x10\n\x12\x13\n\x0f\x43OLOR_LIGHTCYAN\x10\x0b\x12\x12\n\x0e\x43OLOR_LIGHTRED\x10\x0c\x12\x16\n\x12\x43OLOR_LIGHTMAGENTA\x10\r\x12\x10\n\x0c\x43OLOR_YELLOW\x10\x0e\x12\x0f\n\x0b\x43OLOR_WHITE\x10\x0f\"D\n\x14\x43oreTextNotification\x12,\n\tfragments\x18\x01 \x03(\x0b\x32\x19.dfproto.CoreTextFragment\"\xfa\x01\n\x15\x43oreErrorNotification\x12\x36\n\x04\x63ode\x18\x01 \x02(\x0e\x32(.dfproto.CoreErrorNotification.ErrorCode\"\xa8\x01\n\tErrorCode\x12\x1c\n\x0f\x43R_LINK_FAILURE\x10\xfd\xff\xff\xff\xff\xff\xff\xff\xff\x01\x12\x1b\n\x0e\x43R_WOULD_BREAK\x10\xfe\xff\xff\xff\xff\xff\xff\xff\xff\x01\x12\x1f\n\x12\x43R_NOT_IMPLEMENTED\x10\xff\xff\xff\xff\xff\xff\xff\xff\xff\x01\x12\t\n\x05\x43R_OK\x10\x00\x12\x0e\n\nCR_FAILURE\x10\x01\x12\x12\n\x0e\x43R_WRONG_USAGE\x10\x02\x12\x10\n\x0c\x43R_NOT_FOUND\x10\x03\"\x0e\n\x0c\x45mptyMessage\"\x1b\n\nIntMessage\x12\r\n\x05value\x18\x01 \x02(\x05\"\x1f\n\x0eIntListMessage\x12\r\n\x05value\x18\x01 \x03(\x05\"\x1e\n\rStringMessage\x12\r\n\x05value\x18\x01 \x02(\t\"\"\n\x11StringListMessage\x12\r\n\x05value\x18\x01 \x03(\t\"X\n\x0f\x43oreBindRequest\x12\x0e\n\x06method\x18\x01 \x02(\t\x12\x11\n\tinput_msg\x18\x02 \x02(\t\x12\x12\n\noutput_msg\x18\x03 \x02(\t\x12\x0e\n\x06plugin\x18\x04 \x01(\t\"$\n\rCoreBindReply\x12\x13\n\x0b\x61ssigned_id\x18\x01 \x02(\x05\";\n\x15\x43oreRunCommandRequest\x12\x0f\n\x07\x63ommand\x18\x01 \x02(\t\x12\x11\n\targuments\x18\x02 \x03(\t\"H\n\x11\x43oreRunLuaRequest\x12\x0e\n\x06module\x18\x01 \x02(\t\x12\x10\n\x08\x66unction\x18\x02 \x02(\t\x12\x11\n\targuments\x18\x03 \x03(\tB\x02H\x03')
-)
-_sym_db.RegisterFileDescriptor(DESCRIPTOR)
-
-
-
-_CORETEXTFRAGMENT_COLOR = _descriptor.EnumDescriptor(
-  name='Color',
-  full_name='dfproto.CoreTextFragment.Color',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='COLOR_BLACK', index=0, number=0,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='COLOR_BLUE', index=1, number=1,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='COLOR_GREEN', index=2, number=2,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='COLOR_CYAN', index=3, number=3,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='COLOR_RED', index=4, number=4,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='COLOR_MAGENTA', index=5, number=5,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='COLOR_BROWN', index=6, number=6,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='COLOR_GREY', index=7, number=7,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='COLOR_DARKGREY', index=8, number=8,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='COLOR_LIGHTBLUE', index=9, number=9,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='COLOR_LIGHTGREEN', index=10, number=10,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='COLOR_LIGHTCYAN', index=11, number=11,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='COLOR_LIGHTRED', index=12, number=12,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='COLOR_LIGHTMAGENTA', index=13, number=13,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='COLOR_YELLOW', index=14, number=14,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='COLOR_WHITE', index=15, number=15,
-      options=None,
-      type=None),
-  ],
-  containing_type=None,
-  options=None,
-  serialized_start=115,
-  serialized_end=418,
-)
-_sym_db.RegisterEnumDescriptor(_CORETEXTFRAGMENT_COLOR)
-
-_COREERRORNOTIFICATION_ERRORCODE = _descriptor.EnumDescriptor(
-  name='ErrorCode',
-  full_name='dfproto.CoreErrorNotification.ErrorCode',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='CR_LINK_FAILURE', index=0, number=-3,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='CR_WOULD_BREAK', index=1, number=-2,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='CR_NOT_IMPLEMENTED', index=2, number=-1,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='CR_OK', index=3, number=0,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='CR_FAILURE', index=4, number=1,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='CR_WRONG_USAGE', index=5, number=2,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='CR_NOT_FOUND', index=6, number=3,
-      options=None,
-      type=None),
-  ],
-  containing_type=None,
-  options=None,
-  serialized_start=573,
-  serialized_end=741,
-)
-_sym_db.RegisterEnumDescriptor(_COREERRORNOTIFICATION_ERRORCODE)
-
-
-_CORETEXTFRAGMENT = _descriptor.Descriptor(
-  name='CoreTextFragment',
-  full_name='dfproto.CoreTextFragment',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='text', full_name='dfproto.CoreTextFragment.text', index=0,
-      number=1, type=9, cpp_type=9, label=2,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='color', full_name='dfproto.CoreTextFragment.color', index=1,
-      number=2, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-    _CORETEXTFRAGMENT_COLOR,
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=32,
-  serialized_end=418,
-)
-
-
-_CORETEXTNOTIFICATION = _descriptor.Descriptor(
-  name='CoreTextNotification',
-  full_name='dfproto.CoreTextNotification',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='fragments', full_name='dfproto.CoreTextNotification.fragments', index=0,
-      number=1, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=420,
-  serialized_end=488,
-)
-
-
-_COREERRORNOTIFICATION = _descriptor.Descriptor(
-  name='CoreErrorNotification',
-  full_name='dfproto.CoreErrorNotification',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='code', full_name='dfproto.CoreErrorNotification.code', index=0,
-      number=1, type=14, cpp_type=8, label=2,
-      has_default_value=False, default_value=-3,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-    _COREERRORNOTIFICATION_ERRORCODE,
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=491,
-  serialized_end=741,
-)
-
-
-_EMPTYMESSAGE = _descriptor.Descriptor(
-  name='EmptyMessage',
-  full_name='dfproto.EmptyMessage',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=743,
-  serialized_end=757,
-)
-
-
-_INTMESSAGE = _descriptor.Descriptor(
-  name='IntMessage',
-  full_name='dfproto.IntMessage',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='value', full_name='dfproto.IntMessage.value', index=0,
-      number=1, type=5, cpp_type=1, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=759,
-  serialized_end=786,
-)
-
-
-_INTLISTMESSAGE = _descriptor.Descriptor(
-  name='IntListMessage',
-  full_name='dfproto.IntListMessage',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='value', full_name='dfproto.IntListMessage.value', index=0,
-      number=1, type=5, cpp_type=1, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=788,
-  serialized_end=819,
-)
-
-
-_STRINGMESSAGE = _descriptor.Descriptor(
-  name='StringMessage',
-  full_name='dfproto.StringMessage',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='value', full_name='dfproto.StringMessage.value', index=0,
-      number=1, type=9, cpp_type=9, label=2,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=821,
-  serialized_end=851,
-)
-
-
-_STRINGLISTMESSAGE = _descriptor.Descriptor(
-  name='StringListMessage',
-  full_name='dfproto.StringListMessage',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='value', full_name='dfproto.StringListMessage.value', index=0,
-      number=1, type=9, cpp_type=9, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=853,
-  serialized_end=887,
-)
-
-
-_COREBINDREQUEST = _descriptor.Descriptor(
-  name='CoreBindRequest',
-  full_name='dfproto.CoreBindRequest',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='method', full_name='dfproto.CoreBindRequest.method', index=0,
-      number=1, type=9, cpp_type=9, label=2,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='input_msg', full_name='dfproto.CoreBindRequest.input_msg', index=1,
-      number=2, type=9, cpp_type=9, label=2,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='output_msg', full_name='dfproto.CoreBindRequest.output_msg', index=2,
-      number=3, type=9, cpp_type=9, label=2,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='plugin', full_name='dfproto.CoreBindRequest.plugin', index=3,
-      number=4, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=889,
-  serialized_end=977,
-)
-
-
-_COREBINDREPLY = _descriptor.Descriptor(
-  name='CoreBindReply',
-  full_name='dfproto.CoreBindReply',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='assigned_id', full_name='dfproto.CoreBindReply.assigned_id', index=0,
-      number=1, type=5, cpp_type=1, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=979,
-  serialized_end=1015,
-)
-
-
-_CORERUNCOMMANDREQUEST = _descriptor.Descriptor(
-  name='CoreRunCommandRequest',
-  full_name='dfproto.CoreRunCommandRequest',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='command', full_name='dfproto.CoreRunCommandRequest.command', index=0,
-      number=1, type=9, cpp_type=9, label=2,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='arguments', full_name='dfproto.CoreRunCommandRequest.arguments', index=1,
-      number=2, type=9, cpp_type=9, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1017,
-  serialized_end=1076,
-)
-
-
-_CORERUNLUAREQUEST = _descriptor.Descriptor(
-  name='CoreRunLuaRequest',
-  full_name='dfproto.CoreRunLuaRequest',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='module', full_name='dfproto.CoreRunLuaRequest.module', index=0,
-      number=1, type=9, cpp_type=9, label=2,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='function', full_name='dfproto.CoreRunLuaRequest.function', index=1,
-      number=2, type=9, cpp_type=9, label=2,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='arguments', full_name='dfproto.CoreRunLuaRequest.arguments', index=2,
-      number=3, type=9, cpp_type=9, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1078,
-  serialized_end=1150,
-)
-
-_CORETEXTFRAGMENT.fields_by_name['color'].enum_type = _CORETEXTFRAGMENT_COLOR
-_CORETEXTFRAGMENT_COLOR.containing_type = _CORETEXTFRAGMENT
-_CORETEXTNOTIFICATION.fields_by_name['fragments'].message_type = _CORETEXTFRAGMENT
-_COREERRORNOTIFICATION.fields_by_name['code'].enum_type = _COREERRORNOTIFICATION_ERRORCODE
-_COREERRORNOTIFICATION_ERRORCODE.containing_type = _COREERRORNOTIFICATION
-DESCRIPTOR.message_types_by_name['CoreTextFragment'] = _CORETEXTFRAGMENT
-DESCRIPTOR.message_types_by_name['CoreTextNotification'] = _CORETEXTNOTIFICATION
-DESCRIPTOR.message_types_by_name['CoreErrorNotification'] = _COREERRORNOTIFICATION
-DESCRIPTOR.message_types_by_name['EmptyMessage'] = _EMPTYMESSAGE
-DESCRIPTOR.message_types_by_name['IntMessage'] = _INTMESSAGE
-DESCRIPTOR.message_types_by_name['IntListMessage'] = _INTLISTMESSAGE
-DESCRIPTOR.message_types_by_name['StringMessage'] = _STRINGMESSAGE
-DESCRIPTOR.message_types_by_name['StringListMessage'] = _STRINGLISTMESSAGE
-DESCRIPTOR.message_types_by_name['CoreBindRequest'] = _COREBINDREQUEST
-DESCRIPTOR.message_types_by_name['CoreBindReply'] = _COREBINDREPLY
-DESCRIPTOR.message_types_by_name['CoreRunCommandRequest'] = _CORERUNCOMMANDREQUEST
-DESCRIPTOR.message_types_by_name['CoreRunLuaRequest'] = _CORERUNLUAREQUEST
-
-CoreTextFragment = _reflection.GeneratedProtocolMessageType('CoreTextFragment', (_message.Message,), dict(
-  DESCRIPTOR = _CORETEXTFRAGMENT,
-  __module__ = 'CoreProtocol_pb2'
-  # @@protoc_insertion_point(class_scope:dfproto.CoreTextFragment)
-  ))
-_sym_db.RegisterMessage(CoreTextFragment)
-
-CoreTextNotification = _reflection.GeneratedProtocolMessageType('CoreTextNotification', (_message.Message,), dict(
-  DESCRIPTOR = _CORETEXTNOTIFICATION,
-  __module__ = 'CoreProtocol_pb2'
-  # @@protoc_insertion_point(class_scope:dfproto.CoreTextNotification)
-  ))
-_sym_db.RegisterMessage(CoreTextNotification)
-
-CoreErrorNotification = _reflection.GeneratedProtocolMessageType('CoreErrorNotification', (_message.Message,), dict(
-  DESCRIPTOR = _COREERRORNOTIFICATION,
-  __module__ = 'CoreProtocol_pb2'
-  # @@protoc_insertion_point(class_scope:dfproto.CoreErrorNotification)
-  ))
-_sym_db.RegisterMessage(CoreErrorNotification)
-
-EmptyMessage = _reflection.GeneratedProtocolMessageType('EmptyMessage', (_message.Message,), dict(
-  DESCRIPTOR = _EMPTYMESSAGE,
-  __module__ = 'CoreProtocol_pb2'
-  # @@protoc_insertion_point(class_scope:dfproto.EmptyMessage)
-  ))
-_sym_db.RegisterMessage(EmptyMessage)
-
-IntMessage = _reflection.GeneratedProtocolMessageType('IntMessage', (_message.Message,), dict(
-  DESCRIPTOR = _INTMESSAGE,
-  __module__ = 'CoreProtocol_pb2'
-  # @@protoc_insertion_point(class_scope:dfproto.IntMessage)
-  ))
-_sym_db.RegisterMessage(IntMessage)
-
-IntListMessage = _reflection.GeneratedProtocolMessageType('IntListMessage', (_message.Message,), dict(
-  DESCRIPTOR = _INTLISTMESSAGE,
-  __module__ = 'CoreProtocol_pb2'
-  # @@protoc_insertion_point(class_scope:dfproto.IntListMessage)
-  ))
-_sym_db.RegisterMessage(IntListMessage)
-
-StringMessage = _reflection.GeneratedProtocolMessageType('StringMessage', (_message.Message,), dict(
-  DESCRIPTOR = _STRINGMESSAGE,
-  __module__ = 'CoreProtocol_pb2'
-  # @@protoc_insertion_point(class_scope:dfproto.StringMessage)
-  ))
-_sym_db.RegisterMessage(StringMessage)
-
-StringListMessage = _reflection.GeneratedProtocolMessageType('StringListMessage', (_message.Message,), dict(
-  DESCRIPTOR = _STRINGLISTMESSAGE,
-  __module__ = 'CoreProtocol_pb2'
-  # @@protoc_insertion_point(class_scope:dfproto.StringListMessage)
-  ))
-_sym_db.RegisterMessage(StringListMessage)
-
-CoreBindRequest = _reflection.GeneratedProtocolMessageType('CoreBindRequest', (_message.Message,), dict(
-  DESCRIPTOR = _COREBINDREQUEST,
-  __module__ = 'CoreProtocol_pb2'
-  # @@protoc_insertion_point(class_scope:dfproto.CoreBindRequest)
-  ))
-_sym_db.RegisterMessage(CoreBindRequest)
-
-CoreBindReply = _reflection.GeneratedProtocolMessageType('CoreBindReply', (_message.Message,), dict(
-  DESCRIPTOR = _COREBINDREPLY,
-  __module__ = 'CoreProtocol_pb2'
-  # @@protoc_insertion_point(class_scope:dfproto.CoreBindReply)
-  ))
-_sym_db.RegisterMessage(CoreBindReply)
-
-CoreRunCommandRequest = _reflection.GeneratedProtocolMessageType('CoreRunCommandRequest', (_message.Message,), dict(
-  DESCRIPTOR = _CORERUNCOMMANDREQUEST,
-  __module__ = 'CoreProtocol_pb2'
-  # @@protoc_insertion_point(class_scope:dfproto.CoreRunCommandRequest)
-  ))
-_sym_db.RegisterMessage(CoreRunCommandRequest)
-
-CoreRunLuaRequest = _reflection.GeneratedProtocolMessageType('CoreRunLuaRequest', (_message.Message,), dict(
-  DESCRIPTOR = _CORERUNLUAREQUEST,
-  __module__ = 'CoreProtocol_pb2'
-  # @@protoc_insertion_point(class_scope:dfproto.CoreRunLuaRequest)
-  ))
-_sym_db.RegisterMessage(CoreRunLuaRequest)
-
-
-DESCRIPTOR.has_options = True
-DESCRIPTOR._options = _descriptor._ParseOptions(descriptor_pb2.FileOptions(), _b('H\003'))
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x12\x43oreProtocol.proto\x12\x07\x64\x66proto\"\x82\x03\n\x10\x43oreTextFragment\x12\x0c\n\x04text\x18\x01 \x02(\t\x12.\n\x05\x63olor\x18\x02 \x01(\x0e\x32\x1f.dfproto.CoreTextFragment.Color\"\xaf\x02\n\x05\x43olor\x12\x0f\n\x0b\x43OLOR_BLACK\x10\x00\x12\x0e\n\nCOLOR_BLUE\x10\x01\x12\x0f\n\x0b\x43OLOR_GREEN\x10\x02\x12\x0e\n\nCOLOR_CYAN\x10\x03\x12\r\n\tCOLOR_RED\x10\x04\x12\x11\n\rCOLOR_MAGENTA\x10\x05\x12\x0f\n\x0b\x43OLOR_BROWN\x10\x06\x12\x0e\n\nCOLOR_GREY\x10\x07\x12\x12\n\x0e\x43OLOR_DARKGREY\x10\x08\x12\x13\n\x0f\x43OLOR_LIGHTBLUE\x10\t\x12\x14\n\x10\x43OLOR_LIGHTGREEN\x10\n\x12\x13\n\x0f\x43OLOR_LIGHTCYAN\x10\x0b\x12\x12\n\x0e\x43OLOR_LIGHTRED\x10\x0c\x12\x16\n\x12\x43OLOR_LIGHTMAGENTA\x10\r\x12\x10\n\x0c\x43OLOR_YELLOW\x10\x0e\x12\x0f\n\x0b\x43OLOR_WHITE\x10\x0f\"D\n\x14\x43oreTextNotification\x12,\n\tfragments\x18\x01 \x03(\x0b\x32\x19.dfproto.CoreTextFragment\"\xfa\x01\n\x15\x43oreErrorNotification\x12\x36\n\x04\x63ode\x18\x01 \x02(\x0e\x32(.dfproto.CoreErrorNotification.ErrorCode\"\xa8\x01\n\tErrorCode\x12\x1c\n\x0f\x43R_LINK_FAILURE\x10\xfd\xff\xff\xff\xff\xff\xff\xff\xff\x01\x12\x1b\n\x0e\x43R_WOULD_BREAK\x10\xfe\xff\xff\xff\xff\xff\xff\xff\xff\x01\x12\x1f\n\x12\x43R_NOT_IMPLEMENTED\x10\xff\xff\xff\xff\xff\xff\xff\xff\xff\x01\x12\t\n\x05\x43R_OK\x10\x00\x12\x0e\n\nCR_FAILURE\x10\x01\x12\x12\n\x0e\x43R_WRONG_USAGE\x10\x02\x12\x10\n\x0c\x43R_NOT_FOUND\x10\x03\"\x0e\n\x0c\x45mptyMessage\"\x1b\n\nIntMessage\x12\r\n\x05value\x18\x01 \x02(\x05\"\x1f\n\x0eIntListMessage\x12\r\n\x05value\x18\x01 \x03(\x05\"\x1e\n\rStringMessage\x12\r\n\x05value\x18\x01 \x02(\t\"\"\n\x11StringListMessage\x12\r\n\x05value\x18\x01 \x03(\t\"X\n\x0f\x43oreBindRequest\x12\x0e\n\x06method\x18\x01 \x02(\t\x12\x11\n\tinput_msg\x18\x02 \x02(\t\x12\x12\n\noutput_msg\x18\x03 \x02(\t\x12\x0e\n\x06plugin\x18\x04 \x01(\t\"$\n\rCoreBindReply\x12\x13\n\x0b\x61ssigned_id\x18\x01 \x02(\x05\";\n\x15\x43oreRunCommandRequest\x12\x0f\n\x07\x63ommand\x18\x01 \x02(\t\x12\x11\n\targuments\x18\x02 \x03(\t\"H\n\x11\x43oreRunLuaRequest\x12\x0e\n\x06module\x18\x01 \x02(\t\x12\x10\n\x08\x66unction\x18\x02 \x02(\t\x12\x11\n\targuments\x18\x03 \x03(\tB\x02H\x03')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'dfhack_rpc.proto.CoreProtocol_pb2', globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  DESCRIPTOR._serialized_options = b'H\003'
+  _CORETEXTFRAGMENT._serialized_start=32
+  _CORETEXTFRAGMENT._serialized_end=418
+  _CORETEXTFRAGMENT_COLOR._serialized_start=115
+  _CORETEXTFRAGMENT_COLOR._serialized_end=418
+  _CORETEXTNOTIFICATION._serialized_start=420
+  _CORETEXTNOTIFICATION._serialized_end=488
+  _COREERRORNOTIFICATION._serialized_start=491
+  _COREERRORNOTIFICATION._serialized_end=741
+  _COREERRORNOTIFICATION_ERRORCODE._serialized_start=573
+  _COREERRORNOTIFICATION_ERRORCODE._serialized_end=741
+  _EMPTYMESSAGE._serialized_start=743
+  _EMPTYMESSAGE._serialized_end=757
+  _INTMESSAGE._serialized_start=759
+  _INTMESSAGE._serialized_end=786
+  _INTLISTMESSAGE._serialized_start=788
+  _INTLISTMESSAGE._serialized_end=819
+  _STRINGMESSAGE._serialized_start=821
+  _STRINGMESSAGE._serialized_end=851
+  _STRINGLISTMESSAGE._serialized_start=853
+  _STRINGLISTMESSAGE._serialized_end=887
+  _COREBINDREQUEST._serialized_start=889
+  _COREBINDREQUEST._serialized_end=977
+  _COREBINDREPLY._serialized_start=979
+  _COREBINDREPLY._serialized_end=1015
+  _CORERUNCOMMANDREQUEST._serialized_start=1017
+  _CORERUNCOMMANDREQUEST._serialized_end=1076
+  _CORERUNLUAREQUEST._serialized_start=1078
+  _CORERUNLUAREQUEST._serialized_end=1150
 # @@protoc_insertion_point(module_scope)
@@ -1,14 +1,11 @@
+# -*- coding: utf-8 -*-
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
 # source: RemoteFortressReader.proto
-
-import sys
-_b=sys.version_info[0]<3 and (lambda x:x) or (lambda x:x.encode('latin1'))
-from google.protobuf.internal import enum_type_wrapper
+"""Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
 from google.protobuf import descriptor as _descriptor
-from google.protobuf import message as _message
-from google.protobuf import reflection as _reflection
+from google.protobuf import descriptor_pool as _descriptor_pool
 from google.protobuf import symbol_database as _symbol_database
-from google.protobuf import descriptor_pb2
 # @@protoc_insertion_point(imports)
 
 _sym_db = _symbol_database.Default()
@@ -17,7082 +14,202 @@ _sym_db = _symbol_database.Default()
 from . import ItemdefInstrument_pb2 as ItemdefInstrument__pb2
 
 
-DESCRIPTOR = _descriptor.FileDescriptor(
-  name='RemoteFortressReader.proto',
-  package='RemoteFortressReader',
-  syntax='proto2',
-  serialized_pb=_b('\n\x1aRemoteFortressReader.proto\x12\x14RemoteFortressReader\x1a\x17ItemdefInstrument.proto\"(\n\x05\x43oord\x12\t\n\x01x\x18\x01 \x01(\x05\x12\t\n\x01y\x18\x02 \x01(\x05\x12\t\n\x01z\x18\x03 \x01(\x05\"\xa6\x02\n\x08Tiletype\x12\n\n\x02id\x18\x01 \x02(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0f\n\x07\x63\x61ption\x18\x03 \x01(\t\x12\x32\n\x05shape\x18\x04 \x01(\x0e\x32#.RemoteFortressReader.TiletypeShape\x12\x36\n\x07special\x18\x05 \x01(\x0e\x32%.RemoteFortressReader.TiletypeSpecial\x12\x38\n\x08material\x18\x06 \x01(\x0e\x32&.RemoteFortressReader.TiletypeMaterial\x12\x36\n\x07variant\x18\x07 \x01(\x0e\x32%.RemoteFortressReader.TiletypeVariant\x12\x11\n\tdirection\x18\x08 \x01(\t\"E\n\x0cTiletypeList\x12\x35\n\rtiletype_list\x18\x01 \x03(\x0b\x32\x1e.RemoteFortressReader.Tiletype\"_\n\x0f\x42uildingExtents\x12\r\n\x05pos_x\x18\x01 \x02(\x05\x12\r\n\x05pos_y\x18\x02 \x02(\x05\x12\r\n\x05width\x18\x03 \x02(\x05\x12\x0e\n\x06height\x18\x04 \x02(\x05\x12\x0f\n\x07\x65xtents\x18\x05 \x03(\x05\"F\n\x0c\x42uildingItem\x12(\n\x04item\x18\x01 \x01(\x0b\x32\x1a.RemoteFortressReader.Item\x12\x0c\n\x04mode\x18\x02 \x01(\x05\"\xdc\x03\n\x10\x42uildingInstance\x12\r\n\x05index\x18\x01 \x02(\x05\x12\x11\n\tpos_x_min\x18\x02 \x01(\x05\x12\x11\n\tpos_y_min\x18\x03 \x01(\x05\x12\x11\n\tpos_z_min\x18\x04 \x01(\x05\x12\x11\n\tpos_x_max\x18\x05 \x01(\x05\x12\x11\n\tpos_y_max\x18\x06 \x01(\x05\x12\x11\n\tpos_z_max\x18\x07 \x01(\x05\x12\x39\n\rbuilding_type\x18\x08 \x01(\x0b\x32\".RemoteFortressReader.BuildingType\x12/\n\x08material\x18\t \x01(\x0b\x32\x1d.RemoteFortressReader.MatPair\x12\x16\n\x0e\x62uilding_flags\x18\n \x01(\r\x12\x0f\n\x07is_room\x18\x0b \x01(\x08\x12\x33\n\x04room\x18\x0c \x01(\x0b\x32%.RemoteFortressReader.BuildingExtents\x12:\n\tdirection\x18\r \x01(\x0e\x32\'.RemoteFortressReader.BuildingDirection\x12\x31\n\x05items\x18\x0e \x03(\x0b\x32\".RemoteFortressReader.BuildingItem\x12\x0e\n\x06\x61\x63tive\x18\x0f \x01(\x05\"P\n\tRiverEdge\x12\x0f\n\x07min_pos\x18\x01 \x01(\x05\x12\x0f\n\x07max_pos\x18\x02 \x01(\x05\x12\x0e\n\x06\x61\x63tive\x18\x03 \x01(\x05\x12\x11\n\televation\x18\x04 \x01(\x05\"\xc9\x01\n\tRiverTile\x12.\n\x05north\x18\x01 \x01(\x0b\x32\x1f.RemoteFortressReader.RiverEdge\x12.\n\x05south\x18\x02 \x01(\x0b\x32\x1f.RemoteFortressReader.RiverEdge\x12-\n\x04\x65\x61st\x18\x03 \x01(\x0b\x32\x1f.RemoteFortressReader.RiverEdge\x12-\n\x04west\x18\x04 \x01(\x0b\x32\x1f.RemoteFortressReader.RiverEdge\"\xa9\x01\n\x07Spatter\x12/\n\x08material\x18\x01 \x01(\x0b\x32\x1d.RemoteFortressReader.MatPair\x12\x0e\n\x06\x61mount\x18\x02 \x01(\x05\x12\x30\n\x05state\x18\x03 \x01(\x0e\x32!.RemoteFortressReader.MatterState\x12+\n\x04item\x18\x04 \x01(\x0b\x32\x1d.RemoteFortressReader.MatPair\">\n\x0bSpatterPile\x12/\n\x08spatters\x18\x01 \x03(\x0b\x32\x1d.RemoteFortressReader.Spatter\"\x84\x04\n\x04Item\x12\n\n\x02id\x18\x01 \x01(\x05\x12(\n\x03pos\x18\x02 \x01(\x0b\x32\x1b.RemoteFortressReader.Coord\x12\x0e\n\x06\x66lags1\x18\x03 \x01(\r\x12\x0e\n\x06\x66lags2\x18\x04 \x01(\r\x12+\n\x04type\x18\x05 \x01(\x0b\x32\x1d.RemoteFortressReader.MatPair\x12/\n\x08material\x18\x06 \x01(\x0b\x32\x1d.RemoteFortressReader.MatPair\x12\x32\n\x03\x64ye\x18\x07 \x01(\x0b\x32%.RemoteFortressReader.ColorDefinition\x12\x12\n\nstack_size\x18\x08 \x01(\x05\x12\x10\n\x08subpos_x\x18\t \x01(\x02\x12\x10\n\x08subpos_y\x18\n \x01(\x02\x12\x10\n\x08subpos_z\x18\x0b \x01(\x02\x12\x12\n\nprojectile\x18\x0c \x01(\x08\x12\x12\n\nvelocity_x\x18\r \x01(\x02\x12\x12\n\nvelocity_y\x18\x0e \x01(\x02\x12\x12\n\nvelocity_z\x18\x0f \x01(\x02\x12\x0e\n\x06volume\x18\x10 \x01(\x05\x12;\n\x0cimprovements\x18\x11 \x03(\x0b\x32%.RemoteFortressReader.ItemImprovement\x12-\n\x05image\x18\x12 \x01(\x0b\x32\x1e.RemoteFortressReader.ArtImage\"\xb4\x07\n\x08MapBlock\x12\r\n\x05map_x\x18\x01 \x02(\x05\x12\r\n\x05map_y\x18\x02 \x02(\x05\x12\r\n\x05map_z\x18\x03 \x02(\x05\x12\r\n\x05tiles\x18\x04 \x03(\x05\x12\x30\n\tmaterials\x18\x05 \x03(\x0b\x32\x1d.RemoteFortressReader.MatPair\x12\x36\n\x0flayer_materials\x18\x06 \x03(\x0b\x32\x1d.RemoteFortressReader.MatPair\x12\x35\n\x0evein_materials\x18\x07 \x03(\x0b\x32\x1d.RemoteFortressReader.MatPair\x12\x35\n\x0e\x62\x61se_materials\x18\x08 \x03(\x0b\x32\x1d.RemoteFortressReader.MatPair\x12\r\n\x05magma\x18\t \x03(\x05\x12\r\n\x05water\x18\n \x03(\x05\x12\x0e\n\x06hidden\x18\x0b \x03(\x08\x12\r\n\x05light\x18\x0c \x03(\x08\x12\x14\n\x0csubterranean\x18\r \x03(\x08\x12\x0f\n\x07outside\x18\x0e \x03(\x08\x12\x0f\n\x07\x61quifer\x18\x0f \x03(\x08\x12\x16\n\x0ewater_stagnant\x18\x10 \x03(\x08\x12\x12\n\nwater_salt\x18\x11 \x03(\x08\x12\x39\n\x12\x63onstruction_items\x18\x12 \x03(\x0b\x32\x1d.RemoteFortressReader.MatPair\x12\x39\n\tbuildings\x18\x13 \x03(\x0b\x32&.RemoteFortressReader.BuildingInstance\x12\x14\n\x0ctree_percent\x18\x14 \x03(\x05\x12\x0e\n\x06tree_x\x18\x15 \x03(\x05\x12\x0e\n\x06tree_y\x18\x16 \x03(\x05\x12\x0e\n\x06tree_z\x18\x17 \x03(\x05\x12\x46\n\x14tile_dig_designation\x18\x18 \x03(\x0e\x32(.RemoteFortressReader.TileDigDesignation\x12\x36\n\x0bspatterPile\x18\x19 \x03(\x0b\x32!.RemoteFortressReader.SpatterPile\x12)\n\x05items\x18\x1a \x03(\x0b\x32\x1a.RemoteFortressReader.Item\x12#\n\x1btile_dig_designation_marker\x18\x1b \x03(\x08\x12!\n\x19tile_dig_designation_auto\x18\x1c \x03(\x08\x12\x15\n\rgrass_percent\x18\x1d \x03(\x05\x12-\n\x05\x66lows\x18\x1e \x03(\x0b\x32\x1e.RemoteFortressReader.FlowInfo\".\n\x07MatPair\x12\x10\n\x08mat_type\x18\x01 \x02(\x05\x12\x11\n\tmat_index\x18\x02 \x02(\x05\";\n\x0f\x43olorDefinition\x12\x0b\n\x03red\x18\x01 \x02(\x05\x12\r\n\x05green\x18\x02 \x02(\x05\x12\x0c\n\x04\x62lue\x18\x03 \x02(\x05\"\xd1\x01\n\x12MaterialDefinition\x12/\n\x08mat_pair\x18\x01 \x02(\x0b\x32\x1d.RemoteFortressReader.MatPair\x12\n\n\x02id\x18\x02 \x01(\t\x12\x0c\n\x04name\x18\x03 \x01(\t\x12:\n\x0bstate_color\x18\x04 \x01(\x0b\x32%.RemoteFortressReader.ColorDefinition\x12\x34\n\ninstrument\x18\x05 \x01(\x0b\x32 .ItemdefInstrument.InstrumentDef\"X\n\x0c\x42uildingType\x12\x15\n\rbuilding_type\x18\x01 \x02(\x05\x12\x18\n\x10\x62uilding_subtype\x18\x02 \x02(\x05\x12\x17\n\x0f\x62uilding_custom\x18\x03 \x02(\x05\"i\n\x12\x42uildingDefinition\x12\x39\n\rbuilding_type\x18\x01 \x02(\x0b\x32\".RemoteFortressReader.BuildingType\x12\n\n\x02id\x18\x02 \x01(\t\x12\x0c\n\x04name\x18\x03 \x01(\t\"O\n\x0c\x42uildingList\x12?\n\rbuilding_list\x18\x01 \x03(\x0b\x32(.RemoteFortressReader.BuildingDefinition\"O\n\x0cMaterialList\x12?\n\rmaterial_list\x18\x01 \x03(\x0b\x32(.RemoteFortressReader.MaterialDefinition\"F\n\x04Hair\x12\x0e\n\x06length\x18\x01 \x01(\x05\x12.\n\x05style\x18\x02 \x01(\x0e\x32\x1f.RemoteFortressReader.HairStyle\"\x81\x01\n\x0c\x42odySizeInfo\x12\x10\n\x08size_cur\x18\x01 \x01(\x05\x12\x11\n\tsize_base\x18\x02 \x01(\x05\x12\x10\n\x08\x61rea_cur\x18\x03 \x01(\x05\x12\x11\n\tarea_base\x18\x04 \x01(\x05\x12\x12\n\nlength_cur\x18\x05 \x01(\x05\x12\x13\n\x0blength_base\x18\x06 \x01(\x05\"\x98\x02\n\x0eUnitAppearance\x12\x16\n\x0e\x62ody_modifiers\x18\x01 \x03(\x05\x12\x14\n\x0c\x62p_modifiers\x18\x02 \x03(\x05\x12\x15\n\rsize_modifier\x18\x03 \x01(\x05\x12\x0e\n\x06\x63olors\x18\x04 \x03(\x05\x12(\n\x04hair\x18\x05 \x01(\x0b\x32\x1a.RemoteFortressReader.Hair\x12)\n\x05\x62\x65\x61rd\x18\x06 \x01(\x0b\x32\x1a.RemoteFortressReader.Hair\x12-\n\tmoustache\x18\x07 \x01(\x0b\x32\x1a.RemoteFortressReader.Hair\x12-\n\tsideburns\x18\x08 \x01(\x0b\x32\x1a.RemoteFortressReader.Hair\"l\n\rInventoryItem\x12\x31\n\x04mode\x18\x01 \x01(\x0e\x32#.RemoteFortressReader.InventoryMode\x12(\n\x04item\x18\x02 \x01(\x0b\x32\x1a.RemoteFortressReader.Item\"\xe3\x04\n\x0eUnitDefinition\x12\n\n\x02id\x18\x01 \x02(\x05\x12\x0f\n\x07isValid\x18\x02 \x01(\x08\x12\r\n\x05pos_x\x18\x03 \x01(\x05\x12\r\n\x05pos_y\x18\x04 \x01(\x05\x12\r\n\x05pos_z\x18\x05 \x01(\x05\x12+\n\x04race\x18\x06 \x01(\x0b\x32\x1d.RemoteFortressReader.MatPair\x12?\n\x10profession_color\x18\x07 \x01(\x0b\x32%.RemoteFortressReader.ColorDefinition\x12\x0e\n\x06\x66lags1\x18\x08 \x01(\r\x12\x0e\n\x06\x66lags2\x18\t \x01(\r\x12\x0e\n\x06\x66lags3\x18\n \x01(\r\x12\x12\n\nis_soldier\x18\x0b \x01(\x08\x12\x35\n\tsize_info\x18\x0c \x01(\x0b\x32\".RemoteFortressReader.BodySizeInfo\x12\x0c\n\x04name\x18\r \x01(\t\x12\x11\n\tblood_max\x18\x0e \x01(\x05\x12\x13\n\x0b\x62lood_count\x18\x0f \x01(\x05\x12\x38\n\nappearance\x18\x10 \x01(\x0b\x32$.RemoteFortressReader.UnitAppearance\x12\x15\n\rprofession_id\x18\x11 \x01(\x05\x12\x17\n\x0fnoble_positions\x18\x12 \x03(\t\x12\x10\n\x08rider_id\x18\x13 \x01(\x05\x12\x36\n\tinventory\x18\x14 \x03(\x0b\x32#.RemoteFortressReader.InventoryItem\x12\x10\n\x08subpos_x\x18\x15 \x01(\x02\x12\x10\n\x08subpos_y\x18\x16 \x01(\x02\x12\x10\n\x08subpos_z\x18\x17 \x01(\x02\"G\n\x08UnitList\x12;\n\rcreature_list\x18\x01 \x03(\x0b\x32$.RemoteFortressReader.UnitDefinition\"\x7f\n\x0c\x42lockRequest\x12\x15\n\rblocks_needed\x18\x01 \x01(\x05\x12\r\n\x05min_x\x18\x02 \x01(\x05\x12\r\n\x05max_x\x18\x03 \x01(\x05\x12\r\n\x05min_y\x18\x04 \x01(\x05\x12\r\n\x05max_y\x18\x05 \x01(\x05\x12\r\n\x05min_z\x18\x06 \x01(\x05\x12\r\n\x05max_z\x18\x07 \x01(\x05\"\xc3\x01\n\tBlockList\x12\x32\n\nmap_blocks\x18\x01 \x03(\x0b\x32\x1e.RemoteFortressReader.MapBlock\x12\r\n\x05map_x\x18\x02 \x01(\x05\x12\r\n\x05map_y\x18\x03 \x01(\x05\x12\x33\n\nengravings\x18\x04 \x03(\x0b\x32\x1f.RemoteFortressReader.Engraving\x12/\n\x0bocean_waves\x18\x05 \x03(\x0b\x32\x1a.RemoteFortressReader.Wave\"F\n\x08PlantDef\x12\r\n\x05pos_x\x18\x01 \x02(\x05\x12\r\n\x05pos_y\x18\x02 \x02(\x05\x12\r\n\x05pos_z\x18\x03 \x02(\x05\x12\r\n\x05index\x18\x04 \x02(\x05\"?\n\tPlantList\x12\x32\n\nplant_list\x18\x01 \x03(\x0b\x32\x1e.RemoteFortressReader.PlantDef\"\xea\x01\n\x08ViewInfo\x12\x12\n\nview_pos_x\x18\x01 \x01(\x05\x12\x12\n\nview_pos_y\x18\x02 \x01(\x05\x12\x12\n\nview_pos_z\x18\x03 \x01(\x05\x12\x13\n\x0bview_size_x\x18\x04 \x01(\x05\x12\x13\n\x0bview_size_y\x18\x05 \x01(\x05\x12\x14\n\x0c\x63ursor_pos_x\x18\x06 \x01(\x05\x12\x14\n\x0c\x63ursor_pos_y\x18\x07 \x01(\x05\x12\x14\n\x0c\x63ursor_pos_z\x18\x08 \x01(\x05\x12\x1a\n\x0e\x66ollow_unit_id\x18\t \x01(\x05:\x02-1\x12\x1a\n\x0e\x66ollow_item_id\x18\n \x01(\x05:\x02-1\"\xcd\x01\n\x07MapInfo\x12\x14\n\x0c\x62lock_size_x\x18\x01 \x01(\x05\x12\x14\n\x0c\x62lock_size_y\x18\x02 \x01(\x05\x12\x14\n\x0c\x62lock_size_z\x18\x03 \x01(\x05\x12\x13\n\x0b\x62lock_pos_x\x18\x04 \x01(\x05\x12\x13\n\x0b\x62lock_pos_y\x18\x05 \x01(\x05\x12\x13\n\x0b\x62lock_pos_z\x18\x06 \x01(\x05\x12\x12\n\nworld_name\x18\x07 \x01(\t\x12\x1a\n\x12world_name_english\x18\x08 \x01(\t\x12\x11\n\tsave_name\x18\t \x01(\t\"\xdb\x01\n\x05\x43loud\x12.\n\x05\x66ront\x18\x01 \x01(\x0e\x32\x1f.RemoteFortressReader.FrontType\x12\x32\n\x07\x63umulus\x18\x02 \x01(\x0e\x32!.RemoteFortressReader.CumulusType\x12\x0e\n\x06\x63irrus\x18\x03 \x01(\x08\x12\x32\n\x07stratus\x18\x04 \x01(\x0e\x32!.RemoteFortressReader.StratusType\x12*\n\x03\x66og\x18\x05 \x01(\x0e\x32\x1d.RemoteFortressReader.FogType\"\xea\x04\n\x08WorldMap\x12\x13\n\x0bworld_width\x18\x01 \x02(\x05\x12\x14\n\x0cworld_height\x18\x02 \x02(\x05\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\x14\n\x0cname_english\x18\x04 \x01(\t\x12\x11\n\televation\x18\x05 \x03(\x05\x12\x10\n\x08rainfall\x18\x06 \x03(\x05\x12\x12\n\nvegetation\x18\x07 \x03(\x05\x12\x13\n\x0btemperature\x18\x08 \x03(\x05\x12\x10\n\x08\x65vilness\x18\t \x03(\x05\x12\x10\n\x08\x64rainage\x18\n \x03(\x05\x12\x11\n\tvolcanism\x18\x0b \x03(\x05\x12\x10\n\x08savagery\x18\x0c \x03(\x05\x12+\n\x06\x63louds\x18\r \x03(\x0b\x32\x1b.RemoteFortressReader.Cloud\x12\x10\n\x08salinity\x18\x0e \x03(\x05\x12\r\n\x05map_x\x18\x0f \x01(\x05\x12\r\n\x05map_y\x18\x10 \x01(\x05\x12\x10\n\x08\x63\x65nter_x\x18\x11 \x01(\x05\x12\x10\n\x08\x63\x65nter_y\x18\x12 \x01(\x05\x12\x10\n\x08\x63\x65nter_z\x18\x13 \x01(\x05\x12\x10\n\x08\x63ur_year\x18\x14 \x01(\x05\x12\x15\n\rcur_year_tick\x18\x15 \x01(\x05\x12\x35\n\x0bworld_poles\x18\x16 \x01(\x0e\x32 .RemoteFortressReader.WorldPoles\x12\x34\n\x0briver_tiles\x18\x17 \x03(\x0b\x32\x1f.RemoteFortressReader.RiverTile\x12\x17\n\x0fwater_elevation\x18\x18 \x03(\x05\x12\x36\n\x0cregion_tiles\x18\x19 \x03(\x0b\x32 .RemoteFortressReader.RegionTile\"}\n\x1bSiteRealizationBuildingWall\x12\x0f\n\x07start_x\x18\x01 \x01(\x05\x12\x0f\n\x07start_y\x18\x02 \x01(\x05\x12\x0f\n\x07start_z\x18\x03 \x01(\x05\x12\r\n\x05\x65nd_x\x18\x04 \x01(\x05\x12\r\n\x05\x65nd_y\x18\x05 \x01(\x05\x12\r\n\x05\x65nd_z\x18\x06 \x01(\x05\"M\n\x1cSiteRealizationBuildingTower\x12\x0e\n\x06roof_z\x18\x01 \x01(\x05\x12\r\n\x05round\x18\x02 \x01(\x08\x12\x0e\n\x06goblin\x18\x03 \x01(\x08\"_\n\x0bTrenchSpoke\x12\x13\n\x0bmound_start\x18\x01 \x01(\x05\x12\x14\n\x0ctrench_start\x18\x02 \x01(\x05\x12\x12\n\ntrench_end\x18\x03 \x01(\x05\x12\x11\n\tmound_end\x18\x04 \x01(\x05\"T\n\x1fSiteRealizationBuildingTrenches\x12\x31\n\x06spokes\x18\x01 \x03(\x0b\x32!.RemoteFortressReader.TrenchSpoke\"\xad\x03\n\x17SiteRealizationBuilding\x12\n\n\x02id\x18\x01 \x01(\x05\x12?\n\x04type\x18\x02 \x01(\x0e\x32\x31.RemoteFortressReader.SiteRealizationBuildingType\x12\r\n\x05min_x\x18\x03 \x01(\x05\x12\r\n\x05min_y\x18\x04 \x01(\x05\x12\r\n\x05max_x\x18\x05 \x01(\x05\x12\r\n\x05max_y\x18\x06 \x01(\x05\x12/\n\x08material\x18\x07 \x01(\x0b\x32\x1d.RemoteFortressReader.MatPair\x12\x44\n\twall_info\x18\x08 \x01(\x0b\x32\x31.RemoteFortressReader.SiteRealizationBuildingWall\x12\x46\n\ntower_info\x18\t \x01(\x0b\x32\x32.RemoteFortressReader.SiteRealizationBuildingTower\x12J\n\x0btrench_info\x18\n \x01(\x0b\x32\x35.RemoteFortressReader.SiteRealizationBuildingTrenches\"\xb4\x04\n\nRegionTile\x12\x11\n\televation\x18\x01 \x01(\x05\x12\x10\n\x08rainfall\x18\x02 \x01(\x05\x12\x12\n\nvegetation\x18\x03 \x01(\x05\x12\x13\n\x0btemperature\x18\x04 \x01(\x05\x12\x10\n\x08\x65vilness\x18\x05 \x01(\x05\x12\x10\n\x08\x64rainage\x18\x06 \x01(\x05\x12\x11\n\tvolcanism\x18\x07 \x01(\x05\x12\x10\n\x08savagery\x18\x08 \x01(\x05\x12\x10\n\x08salinity\x18\t \x01(\x05\x12\x34\n\x0briver_tiles\x18\n \x01(\x0b\x32\x1f.RemoteFortressReader.RiverTile\x12\x17\n\x0fwater_elevation\x18\x0b \x01(\x05\x12\x37\n\x10surface_material\x18\x0c \x01(\x0b\x32\x1d.RemoteFortressReader.MatPair\x12\x36\n\x0fplant_materials\x18\r \x03(\x0b\x32\x1d.RemoteFortressReader.MatPair\x12@\n\tbuildings\x18\x0e \x03(\x0b\x32-.RemoteFortressReader.SiteRealizationBuilding\x12\x36\n\x0fstone_materials\x18\x0f \x03(\x0b\x32\x1d.RemoteFortressReader.MatPair\x12\x35\n\x0etree_materials\x18\x10 \x03(\x0b\x32\x1d.RemoteFortressReader.MatPair\x12\x0c\n\x04snow\x18\x11 \x01(\x05\"~\n\tRegionMap\x12\r\n\x05map_x\x18\x01 \x01(\x05\x12\r\n\x05map_y\x18\x02 \x01(\x05\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\x14\n\x0cname_english\x18\x04 \x01(\t\x12/\n\x05tiles\x18\x05 \x03(\x0b\x32 .RemoteFortressReader.RegionTile\"v\n\nRegionMaps\x12\x32\n\nworld_maps\x18\x01 \x03(\x0b\x32\x1e.RemoteFortressReader.WorldMap\x12\x34\n\x0bregion_maps\x18\x02 \x03(\x0b\x32\x1f.RemoteFortressReader.RegionMap\"\x8a\x01\n\x11PatternDescriptor\x12\n\n\x02id\x18\x01 \x01(\t\x12\x35\n\x06\x63olors\x18\x02 \x03(\x0b\x32%.RemoteFortressReader.ColorDefinition\x12\x32\n\x07pattern\x18\x03 \x01(\x0e\x32!.RemoteFortressReader.PatternType\"\xb0\x01\n\x10\x43olorModifierRaw\x12\x39\n\x08patterns\x18\x01 \x03(\x0b\x32\'.RemoteFortressReader.PatternDescriptor\x12\x14\n\x0c\x62ody_part_id\x18\x02 \x03(\x05\x12\x17\n\x0ftissue_layer_id\x18\x03 \x03(\x05\x12\x12\n\nstart_date\x18\x04 \x01(\x05\x12\x10\n\x08\x65nd_date\x18\x05 \x01(\x05\x12\x0c\n\x04part\x18\x06 \x01(\t\"d\n\x10\x42odyPartLayerRaw\x12\x12\n\nlayer_name\x18\x01 \x01(\t\x12\x11\n\ttissue_id\x18\x02 \x01(\x05\x12\x13\n\x0blayer_depth\x18\x03 \x01(\x05\x12\x14\n\x0c\x62p_modifiers\x18\x04 \x03(\x05\"\x96\x01\n\x0b\x42odyPartRaw\x12\r\n\x05token\x18\x01 \x01(\t\x12\x10\n\x08\x63\x61tegory\x18\x02 \x01(\t\x12\x0e\n\x06parent\x18\x03 \x01(\x05\x12\r\n\x05\x66lags\x18\x04 \x03(\x08\x12\x36\n\x06layers\x18\x05 \x03(\x0b\x32&.RemoteFortressReader.BodyPartLayerRaw\x12\x0f\n\x07relsize\x18\x06 \x01(\x05\"F\n\x14\x42pAppearanceModifier\x12\x0c\n\x04type\x18\x01 \x01(\t\x12\x0f\n\x07mod_min\x18\x02 \x01(\x05\x12\x0f\n\x07mod_max\x18\x03 \x01(\x05\"u\n\tTissueRaw\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12/\n\x08material\x18\x03 \x01(\x0b\x32\x1d.RemoteFortressReader.MatPair\x12\x1d\n\x15subordinate_to_tissue\x18\x04 \x01(\t\"\xf7\x03\n\x08\x43\x61steRaw\x12\r\n\x05index\x18\x01 \x01(\x05\x12\x10\n\x08\x63\x61ste_id\x18\x02 \x01(\t\x12\x12\n\ncaste_name\x18\x03 \x03(\t\x12\x11\n\tbaby_name\x18\x04 \x03(\t\x12\x12\n\nchild_name\x18\x05 \x03(\t\x12\x0e\n\x06gender\x18\x06 \x01(\x05\x12\x35\n\nbody_parts\x18\x07 \x03(\x0b\x32!.RemoteFortressReader.BodyPartRaw\x12\x15\n\rtotal_relsize\x18\x08 \x01(\x05\x12=\n\tmodifiers\x18\t \x03(\x0b\x32*.RemoteFortressReader.BpAppearanceModifier\x12\x14\n\x0cmodifier_idx\x18\n \x03(\x05\x12\x10\n\x08part_idx\x18\x0b \x03(\x05\x12\x11\n\tlayer_idx\x18\x0c \x03(\x05\x12M\n\x19\x62ody_appearance_modifiers\x18\r \x03(\x0b\x32*.RemoteFortressReader.BpAppearanceModifier\x12?\n\x0f\x63olor_modifiers\x18\x0e \x03(\x0b\x32&.RemoteFortressReader.ColorModifierRaw\x12\x13\n\x0b\x64\x65scription\x18\x0f \x01(\t\x12\x12\n\nadult_size\x18\x10 \x01(\x05\"\xd6\x02\n\x0b\x43reatureRaw\x12\r\n\x05index\x18\x01 \x01(\x05\x12\x13\n\x0b\x63reature_id\x18\x02 \x01(\t\x12\x0c\n\x04name\x18\x03 \x03(\t\x12\x19\n\x11general_baby_name\x18\x04 \x03(\t\x12\x1a\n\x12general_child_name\x18\x05 \x03(\t\x12\x15\n\rcreature_tile\x18\x06 \x01(\x05\x12\x1d\n\x15\x63reature_soldier_tile\x18\x07 \x01(\x05\x12\x34\n\x05\x63olor\x18\x08 \x01(\x0b\x32%.RemoteFortressReader.ColorDefinition\x12\x11\n\tadultsize\x18\t \x01(\x05\x12-\n\x05\x63\x61ste\x18\n \x03(\x0b\x32\x1e.RemoteFortressReader.CasteRaw\x12\x30\n\x07tissues\x18\x0b \x03(\x0b\x32\x1f.RemoteFortressReader.TissueRaw\"K\n\x0f\x43reatureRawList\x12\x38\n\rcreature_raws\x18\x01 \x03(\x0b\x32!.RemoteFortressReader.CreatureRaw\"\xbb\x01\n\x04\x41rmy\x12\n\n\x02id\x18\x01 \x01(\x05\x12\r\n\x05pos_x\x18\x02 \x01(\x05\x12\r\n\x05pos_y\x18\x03 \x01(\x05\x12\r\n\x05pos_z\x18\x04 \x01(\x05\x12\x34\n\x06leader\x18\x05 \x01(\x0b\x32$.RemoteFortressReader.UnitDefinition\x12\x35\n\x07members\x18\x06 \x03(\x0b\x32$.RemoteFortressReader.UnitDefinition\x12\r\n\x05\x66lags\x18\x07 \x01(\r\"6\n\x08\x41rmyList\x12*\n\x06\x61rmies\x18\x01 \x03(\x0b\x32\x1a.RemoteFortressReader.Army\"f\n\x0bGrowthPrint\x12\x10\n\x08priority\x18\x01 \x01(\x05\x12\r\n\x05\x63olor\x18\x02 \x01(\x05\x12\x14\n\x0ctiming_start\x18\x03 \x01(\x05\x12\x12\n\ntiming_end\x18\x04 \x01(\x05\x12\x0c\n\x04tile\x18\x05 \x01(\x05\"\xef\x02\n\nTreeGrowth\x12\r\n\x05index\x18\x01 \x01(\x05\x12\n\n\x02id\x18\x02 \x01(\t\x12\x0c\n\x04name\x18\x03 \x01(\t\x12*\n\x03mat\x18\x04 \x01(\x0b\x32\x1d.RemoteFortressReader.MatPair\x12\x31\n\x06prints\x18\x05 \x03(\x0b\x32!.RemoteFortressReader.GrowthPrint\x12\x14\n\x0ctiming_start\x18\x06 \x01(\x05\x12\x12\n\ntiming_end\x18\x07 \x01(\x05\x12\r\n\x05twigs\x18\x08 \x01(\x08\x12\x16\n\x0elight_branches\x18\t \x01(\x08\x12\x16\n\x0eheavy_branches\x18\n \x01(\x08\x12\r\n\x05trunk\x18\x0b \x01(\x08\x12\r\n\x05roots\x18\x0c \x01(\x08\x12\x0b\n\x03\x63\x61p\x18\r \x01(\x08\x12\x0f\n\x07sapling\x18\x0e \x01(\x08\x12\x1a\n\x12trunk_height_start\x18\x0f \x01(\x05\x12\x18\n\x10trunk_height_end\x18\x10 \x01(\x05\"t\n\x08PlantRaw\x12\r\n\x05index\x18\x01 \x01(\x05\x12\n\n\x02id\x18\x02 \x01(\t\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\x31\n\x07growths\x18\x04 \x03(\x0b\x32 .RemoteFortressReader.TreeGrowth\x12\x0c\n\x04tile\x18\x05 \x01(\x05\"B\n\x0cPlantRawList\x12\x32\n\nplant_raws\x18\x01 \x03(\x0b\x32\x1e.RemoteFortressReader.PlantRaw\"G\n\nScreenTile\x12\x11\n\tcharacter\x18\x01 \x01(\r\x12\x12\n\nforeground\x18\x02 \x01(\r\x12\x12\n\nbackground\x18\x03 \x01(\r\"_\n\rScreenCapture\x12\r\n\x05width\x18\x01 \x01(\r\x12\x0e\n\x06height\x18\x02 \x01(\r\x12/\n\x05tiles\x18\x03 \x03(\x0b\x32 .RemoteFortressReader.ScreenTile\"x\n\rKeyboardEvent\x12\x0c\n\x04type\x18\x01 \x01(\r\x12\r\n\x05which\x18\x02 \x01(\r\x12\r\n\x05state\x18\x03 \x01(\r\x12\x10\n\x08scancode\x18\x04 \x01(\r\x12\x0b\n\x03sym\x18\x05 \x01(\r\x12\x0b\n\x03mod\x18\x06 \x01(\r\x12\x0f\n\x07unicode\x18\x07 \x01(\r\"{\n\nDigCommand\x12=\n\x0b\x64\x65signation\x18\x01 \x01(\x0e\x32(.RemoteFortressReader.TileDigDesignation\x12.\n\tlocations\x18\x02 \x03(\x0b\x32\x1b.RemoteFortressReader.Coord\"\x1b\n\nSingleBool\x12\r\n\x05Value\x18\x01 \x01(\x08\"m\n\x0bVersionInfo\x12\x1e\n\x16\x64warf_fortress_version\x18\x01 \x01(\t\x12\x16\n\x0e\x64\x66hack_version\x18\x02 \x01(\t\x12&\n\x1eremote_fortress_reader_version\x18\x03 \x01(\t\"3\n\x0bListRequest\x12\x12\n\nlist_start\x18\x01 \x01(\x05\x12\x10\n\x08list_end\x18\x02 \x01(\x05\"\x95\x02\n\x06Report\x12\x0c\n\x04type\x18\x01 \x01(\x05\x12\x0c\n\x04text\x18\x02 \x01(\t\x12\x34\n\x05\x63olor\x18\x03 \x01(\x0b\x32%.RemoteFortressReader.ColorDefinition\x12\x10\n\x08\x64uration\x18\x04 \x01(\x05\x12\x14\n\x0c\x63ontinuation\x18\x05 \x01(\x08\x12\x13\n\x0bunconscious\x18\x06 \x01(\x08\x12\x14\n\x0c\x61nnouncement\x18\x07 \x01(\x08\x12\x14\n\x0crepeat_count\x18\x08 \x01(\x05\x12(\n\x03pos\x18\t \x01(\x0b\x32\x1b.RemoteFortressReader.Coord\x12\n\n\x02id\x18\n \x01(\x05\x12\x0c\n\x04year\x18\x0b \x01(\x05\x12\x0c\n\x04time\x18\x0c \x01(\x05\"7\n\x06Status\x12-\n\x07reports\x18\x01 \x03(\x0b\x32\x1c.RemoteFortressReader.Report\",\n\x10ShapeDescriptior\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04tile\x18\x02 \x01(\x05\"B\n\x08Language\x12\x36\n\x06shapes\x18\x01 \x03(\x0b\x32&.RemoteFortressReader.ShapeDescriptior\"\xcc\x01\n\x0fItemImprovement\x12/\n\x08material\x18\x01 \x01(\x0b\x32\x1d.RemoteFortressReader.MatPair\x12\x33\n\x04type\x18\x02 \x01(\x0e\x32%.RemoteFortressReader.ImprovementType\x12\r\n\x05shape\x18\x03 \x01(\x05\x12\x15\n\rspecific_type\x18\x04 \x01(\x05\x12-\n\x05image\x18\x05 \x01(\x0b\x32\x1e.RemoteFortressReader.ArtImage\"\xcc\x01\n\x0f\x41rtImageElement\x12\r\n\x05\x63ount\x18\x01 \x01(\x05\x12\x37\n\x04type\x18\x02 \x01(\x0e\x32).RemoteFortressReader.ArtImageElementType\x12\x34\n\rcreature_item\x18\x03 \x01(\x0b\x32\x1d.RemoteFortressReader.MatPair\x12/\n\x08material\x18\x05 \x01(\x0b\x32\x1d.RemoteFortressReader.MatPair\x12\n\n\x02id\x18\x06 \x01(\x05\"\x9f\x01\n\x10\x41rtImageProperty\x12\x0f\n\x07subject\x18\x01 \x01(\x05\x12\x0e\n\x06object\x18\x02 \x01(\x05\x12\x30\n\x04verb\x18\x03 \x01(\x0e\x32\".RemoteFortressReader.ArtImageVerb\x12\x38\n\x04type\x18\x04 \x01(\x0e\x32*.RemoteFortressReader.ArtImagePropertyType\"\xaa\x01\n\x08\x41rtImage\x12\x37\n\x08\x65lements\x18\x01 \x03(\x0b\x32%.RemoteFortressReader.ArtImageElement\x12)\n\x02id\x18\x02 \x01(\x0b\x32\x1d.RemoteFortressReader.MatPair\x12:\n\nproperties\x18\x03 \x03(\x0b\x32&.RemoteFortressReader.ArtImageProperty\"\xa8\x02\n\tEngraving\x12(\n\x03pos\x18\x01 \x01(\x0b\x32\x1b.RemoteFortressReader.Coord\x12\x0f\n\x07quality\x18\x02 \x01(\x05\x12\x0c\n\x04tile\x18\x03 \x01(\x05\x12-\n\x05image\x18\x04 \x01(\x0b\x32\x1e.RemoteFortressReader.ArtImage\x12\r\n\x05\x66loor\x18\x05 \x01(\x08\x12\x0c\n\x04west\x18\x06 \x01(\x08\x12\x0c\n\x04\x65\x61st\x18\x07 \x01(\x08\x12\r\n\x05north\x18\x08 \x01(\x08\x12\r\n\x05south\x18\t \x01(\x08\x12\x0e\n\x06hidden\x18\n \x01(\x08\x12\x11\n\tnorthwest\x18\x0b \x01(\x08\x12\x11\n\tnortheast\x18\x0c \x01(\x08\x12\x11\n\tsouthwest\x18\r \x01(\x08\x12\x11\n\tsoutheast\x18\x0e \x01(\x08\"\xbf\x02\n\x08\x46lowInfo\x12\r\n\x05index\x18\x01 \x01(\x05\x12,\n\x04type\x18\x02 \x01(\x0e\x32\x1e.RemoteFortressReader.FlowType\x12\x0f\n\x07\x64\x65nsity\x18\x03 \x01(\x05\x12(\n\x03pos\x18\x04 \x01(\x0b\x32\x1b.RemoteFortressReader.Coord\x12)\n\x04\x64\x65st\x18\x05 \x01(\x0b\x32\x1b.RemoteFortressReader.Coord\x12\x11\n\texpanding\x18\x06 \x01(\x08\x12\r\n\x05reuse\x18\x07 \x01(\x08\x12\x10\n\x08guide_id\x18\x08 \x01(\x05\x12/\n\x08material\x18\t \x01(\x0b\x32\x1d.RemoteFortressReader.MatPair\x12+\n\x04item\x18\n \x01(\x0b\x32\x1d.RemoteFortressReader.MatPair\"[\n\x04Wave\x12)\n\x04\x64\x65st\x18\x01 \x01(\x0b\x32\x1b.RemoteFortressReader.Coord\x12(\n\x03pos\x18\x02 \x01(\x0b\x32\x1b.RemoteFortressReader.Coord*\xba\x02\n\rTiletypeShape\x12\x15\n\x08NO_SHAPE\x10\xff\xff\xff\xff\xff\xff\xff\xff\xff\x01\x12\t\n\x05\x45MPTY\x10\x00\x12\t\n\x05\x46LOOR\x10\x01\x12\x0b\n\x07\x42OULDER\x10\x02\x12\x0b\n\x07PEBBLES\x10\x03\x12\x08\n\x04WALL\x10\x04\x12\x11\n\rFORTIFICATION\x10\x05\x12\x0c\n\x08STAIR_UP\x10\x06\x12\x0e\n\nSTAIR_DOWN\x10\x07\x12\x10\n\x0cSTAIR_UPDOWN\x10\x08\x12\x08\n\x04RAMP\x10\t\x12\x0c\n\x08RAMP_TOP\x10\n\x12\r\n\tBROOK_BED\x10\x0b\x12\r\n\tBROOK_TOP\x10\x0c\x12\x0e\n\nTREE_SHAPE\x10\r\x12\x0b\n\x07SAPLING\x10\x0e\x12\t\n\x05SHRUB\x10\x0f\x12\x0f\n\x0b\x45NDLESS_PIT\x10\x10\x12\n\n\x06\x42RANCH\x10\x11\x12\x10\n\x0cTRUNK_BRANCH\x10\x12\x12\x08\n\x04TWIG\x10\x13*\xc4\x01\n\x0fTiletypeSpecial\x12\x17\n\nNO_SPECIAL\x10\xff\xff\xff\xff\xff\xff\xff\xff\xff\x01\x12\n\n\x06NORMAL\x10\x00\x12\x10\n\x0cRIVER_SOURCE\x10\x01\x12\r\n\tWATERFALL\x10\x02\x12\n\n\x06SMOOTH\x10\x03\x12\x0c\n\x08\x46URROWED\x10\x04\x12\x07\n\x03WET\x10\x05\x12\x08\n\x04\x44\x45\x41\x44\x10\x06\x12\n\n\x06WORN_1\x10\x07\x12\n\n\x06WORN_2\x10\x08\x12\n\n\x06WORN_3\x10\t\x12\t\n\x05TRACK\x10\n\x12\x0f\n\x0bSMOOTH_DEAD\x10\x0b*\x8a\x03\n\x10TiletypeMaterial\x12\x18\n\x0bNO_MATERIAL\x10\xff\xff\xff\xff\xff\xff\xff\xff\xff\x01\x12\x07\n\x03\x41IR\x10\x00\x12\x08\n\x04SOIL\x10\x01\x12\t\n\x05STONE\x10\x02\x12\x0b\n\x07\x46\x45\x41TURE\x10\x03\x12\x0e\n\nLAVA_STONE\x10\x04\x12\x0b\n\x07MINERAL\x10\x05\x12\x11\n\rFROZEN_LIQUID\x10\x06\x12\x10\n\x0c\x43ONSTRUCTION\x10\x07\x12\x0f\n\x0bGRASS_LIGHT\x10\x08\x12\x0e\n\nGRASS_DARK\x10\t\x12\r\n\tGRASS_DRY\x10\n\x12\x0e\n\nGRASS_DEAD\x10\x0b\x12\t\n\x05PLANT\x10\x0c\x12\x07\n\x03HFS\x10\r\x12\x0c\n\x08\x43\x41MPFIRE\x10\x0e\x12\x08\n\x04\x46IRE\x10\x0f\x12\t\n\x05\x41SHES\x10\x10\x12\t\n\x05MAGMA\x10\x11\x12\r\n\tDRIFTWOOD\x10\x12\x12\x08\n\x04POOL\x10\x13\x12\t\n\x05\x42ROOK\x10\x14\x12\t\n\x05RIVER\x10\x15\x12\x08\n\x04ROOT\x10\x16\x12\x11\n\rTREE_MATERIAL\x10\x17\x12\x0c\n\x08MUSHROOM\x10\x18\x12\x13\n\x0fUNDERWORLD_GATE\x10\x19*V\n\x0fTiletypeVariant\x12\x17\n\nNO_VARIANT\x10\xff\xff\xff\xff\xff\xff\xff\xff\xff\x01\x12\t\n\x05VAR_1\x10\x00\x12\t\n\x05VAR_2\x10\x01\x12\t\n\x05VAR_3\x10\x02\x12\t\n\x05VAR_4\x10\x03*J\n\nWorldPoles\x12\x0c\n\x08NO_POLES\x10\x00\x12\x0e\n\nNORTH_POLE\x10\x01\x12\x0e\n\nSOUTH_POLE\x10\x02\x12\x0e\n\nBOTH_POLES\x10\x03*G\n\x11\x42uildingDirection\x12\t\n\x05NORTH\x10\x00\x12\x08\n\x04\x45\x41ST\x10\x01\x12\t\n\x05SOUTH\x10\x02\x12\x08\n\x04WEST\x10\x03\x12\x08\n\x04NONE\x10\x04*\x8d\x01\n\x12TileDigDesignation\x12\n\n\x06NO_DIG\x10\x00\x12\x0f\n\x0b\x44\x45\x46\x41ULT_DIG\x10\x01\x12\x15\n\x11UP_DOWN_STAIR_DIG\x10\x02\x12\x0f\n\x0b\x43HANNEL_DIG\x10\x03\x12\x0c\n\x08RAMP_DIG\x10\x04\x12\x12\n\x0e\x44OWN_STAIR_DIG\x10\x05\x12\x10\n\x0cUP_STAIR_DIG\x10\x06*u\n\tHairStyle\x12\x14\n\x07UNKEMPT\x10\xff\xff\xff\xff\xff\xff\xff\xff\xff\x01\x12\x11\n\rNEATLY_COMBED\x10\x00\x12\x0b\n\x07\x42RAIDED\x10\x01\x12\x10\n\x0c\x44OUBLE_BRAID\x10\x02\x12\x0e\n\nPONY_TAILS\x10\x03\x12\x10\n\x0c\x43LEAN_SHAVEN\x10\x04*\x9c\x01\n\rInventoryMode\x12\n\n\x06Hauled\x10\x00\x12\n\n\x06Weapon\x10\x01\x12\x08\n\x04Worn\x10\x02\x12\x0c\n\x08Piercing\x10\x03\x12\t\n\x05\x46lask\x10\x04\x12\x11\n\rWrappedAround\x10\x05\x12\x0b\n\x07StuckIn\x10\x06\x12\x0b\n\x07InMouth\x10\x07\x12\x07\n\x03Pet\x10\x08\x12\x0c\n\x08SewnInto\x10\t\x12\x0c\n\x08Strapped\x10\n*Q\n\x0bMatterState\x12\t\n\x05Solid\x10\x00\x12\n\n\x06Liquid\x10\x01\x12\x07\n\x03Gas\x10\x02\x12\n\n\x06Powder\x10\x03\x12\t\n\x05Paste\x10\x04\x12\x0b\n\x07Pressed\x10\x05*O\n\tFrontType\x12\x0e\n\nFRONT_NONE\x10\x00\x12\x0e\n\nFRONT_WARM\x10\x01\x12\x0e\n\nFRONT_COLD\x10\x02\x12\x12\n\x0e\x46RONT_OCCLUDED\x10\x03*Z\n\x0b\x43umulusType\x12\x10\n\x0c\x43UMULUS_NONE\x10\x00\x12\x12\n\x0e\x43UMULUS_MEDIUM\x10\x01\x12\x11\n\rCUMULUS_MULTI\x10\x02\x12\x12\n\x0e\x43UMULUS_NIMBUS\x10\x03*Y\n\x0bStratusType\x12\x10\n\x0cSTRATUS_NONE\x10\x00\x12\x10\n\x0cSTRATUS_ALTO\x10\x01\x12\x12\n\x0eSTRATUS_PROPER\x10\x02\x12\x12\n\x0eSTRATUS_NIMBUS\x10\x03*D\n\x07\x46ogType\x12\x0c\n\x08\x46OG_NONE\x10\x00\x12\x0c\n\x08\x46OG_MIST\x10\x01\x12\x0e\n\nFOG_NORMAL\x10\x02\x12\r\n\tF0G_THICK\x10\x03*\xf8\x02\n\x1bSiteRealizationBuildingType\x12\x10\n\x0c\x63ottage_plot\x10\x00\x12\x0f\n\x0b\x63\x61stle_wall\x10\x01\x12\x10\n\x0c\x63\x61stle_tower\x10\x02\x12\x14\n\x10\x63\x61stle_courtyard\x10\x03\x12\t\n\x05house\x10\x04\x12\n\n\x06temple\x10\x05\x12\x08\n\x04tomb\x10\x06\x12\x0e\n\nshop_house\x10\x07\x12\r\n\twarehouse\x10\x08\x12\x11\n\rmarket_square\x10\t\x12\x0b\n\x07pasture\x10\n\x12\t\n\x05waste\x10\x0b\x12\r\n\tcourtyard\x10\x0c\x12\x08\n\x04well\x10\r\x12\t\n\x05vault\x10\x0e\x12\x0f\n\x0bgreat_tower\x10\x0f\x12\x0c\n\x08trenches\x10\x10\x12\x0e\n\ntree_house\x10\x11\x12\x11\n\rhillock_house\x10\x12\x12\r\n\tmead_hall\x10\x13\x12\x15\n\x11\x66ortress_entrance\x10\x14\x12\x0b\n\x07library\x10\x15\x12\n\n\x06tavern\x10\x16*]\n\x0bPatternType\x12\x0c\n\x08MONOTONE\x10\x00\x12\x0b\n\x07STRIPES\x10\x01\x12\x0c\n\x08IRIS_EYE\x10\x02\x12\t\n\x05SPOTS\x10\x03\x12\r\n\tPUPIL_EYE\x10\x04\x12\x0b\n\x07MOTTLED\x10\x05*\xd0\x01\n\x0fImprovementType\x12\r\n\tART_IMAGE\x10\x00\x12\x0b\n\x07\x43OVERED\x10\x01\x12\x11\n\rRINGS_HANGING\x10\x02\x12\t\n\x05\x42\x41NDS\x10\x03\x12\n\n\x06SPIKES\x10\x04\x12\x10\n\x0cITEMSPECIFIC\x10\x05\x12\n\n\x06THREAD\x10\x06\x12\t\n\x05\x43LOTH\x10\x07\x12\x0e\n\nSEWN_IMAGE\x10\x08\x12\t\n\x05PAGES\x10\t\x12\x10\n\x0cILLUSTRATION\x10\n\x12\x14\n\x10INSTRUMENT_PIECE\x10\x0b\x12\x0b\n\x07WRITING\x10\x0c*k\n\x13\x41rtImageElementType\x12\x12\n\x0eIMAGE_CREATURE\x10\x00\x12\x0f\n\x0bIMAGE_PLANT\x10\x01\x12\x0e\n\nIMAGE_TREE\x10\x02\x12\x0f\n\x0bIMAGE_SHAPE\x10\x03\x12\x0e\n\nIMAGE_ITEM\x10\x04*B\n\x14\x41rtImagePropertyType\x12\x13\n\x0fTRANSITIVE_VERB\x10\x00\x12\x15\n\x11INTRANSITIVE_VERB\x10\x01*\x95\x08\n\x0c\x41rtImageVerb\x12\x12\n\x0eVERB_WITHERING\x10\x00\x12\x15\n\x11VERB_SURROUNDEDBY\x10\x01\x12\x13\n\x0fVERB_MASSACRING\x10\x02\x12\x11\n\rVERB_FIGHTING\x10\x03\x12\x11\n\rVERB_LABORING\x10\x04\x12\x11\n\rVERB_GREETING\x10\x05\x12\x11\n\rVERB_REFUSING\x10\x06\x12\x11\n\rVERB_SPEAKING\x10\x07\x12\x12\n\x0eVERB_EMBRACING\x10\x08\x12\x15\n\x11VERB_STRIKINGDOWN\x10\t\x12\x15\n\x11VERB_MENACINGPOSE\x10\n\x12\x12\n\x0eVERB_TRAVELING\x10\x0b\x12\x10\n\x0cVERB_RAISING\x10\x0c\x12\x0f\n\x0bVERB_HIDING\x10\r\x12\x18\n\x14VERB_LOOKINGCONFUSED\x10\x0e\x12\x19\n\x15VERB_LOOKINGTERRIFIED\x10\x0f\x12\x12\n\x0eVERB_DEVOURING\x10\x10\x12\x11\n\rVERB_ADMIRING\x10\x11\x12\x10\n\x0cVERB_BURNING\x10\x12\x12\x10\n\x0cVERB_WEEPING\x10\x13\x12\x18\n\x14VERB_LOOKINGDEJECTED\x10\x14\x12\x11\n\rVERB_CRINGING\x10\x15\x12\x12\n\x0eVERB_SCREAMING\x10\x16\x12\x1a\n\x16VERB_SUBMISSIVEGESTURE\x10\x17\x12\x16\n\x12VERB_FETALPOSITION\x10\x18\x12\x1a\n\x16VERB_SMEAREDINTOSPIRAL\x10\x19\x12\x10\n\x0cVERB_FALLING\x10\x1a\x12\r\n\tVERB_DEAD\x10\x1b\x12\x11\n\rVERB_LAUGHING\x10\x1c\x12\x18\n\x14VERB_LOOKINGOFFENDED\x10\x1d\x12\x12\n\x0eVERB_BEINGSHOT\x10\x1e\x12\x19\n\x15VERB_PLAINTIVEGESTURE\x10\x1f\x12\x10\n\x0cVERB_MELTING\x10 \x12\x11\n\rVERB_SHOOTING\x10!\x12\x12\n\x0eVERB_TORTURING\x10\"\x12\x1e\n\x1aVERB_COMMITTINGDEPRAVEDACT\x10#\x12\x10\n\x0cVERB_PRAYING\x10$\x12\x16\n\x12VERB_CONTEMPLATING\x10%\x12\x10\n\x0cVERB_COOKING\x10&\x12\x12\n\x0eVERB_ENGRAVING\x10\'\x12\x14\n\x10VERB_PROSTRATING\x10(\x12\x12\n\x0eVERB_SUFFERING\x10)\x12\x15\n\x11VERB_BEINGIMPALED\x10*\x12\x17\n\x13VERB_BEINGCONTORTED\x10+\x12\x14\n\x10VERB_BEINGFLAYED\x10,\x12\x14\n\x10VERB_HANGINGFROM\x10-\x12\x17\n\x13VERB_BEINGMUTILATED\x10.\x12\x17\n\x13VERB_TRIUMPHANTPOSE\x10/*\xe0\x01\n\x08\x46lowType\x12\n\n\x06Miasma\x10\x00\x12\t\n\x05Steam\x10\x01\x12\x08\n\x04Mist\x10\x02\x12\x10\n\x0cMaterialDust\x10\x03\x12\r\n\tMagmaMist\x10\x04\x12\t\n\x05Smoke\x10\x05\x12\x0e\n\nDragonfire\x10\x06\x12\x08\n\x04\x46ire\x10\x07\x12\x07\n\x03Web\x10\x08\x12\x0f\n\x0bMaterialGas\x10\t\x12\x11\n\rMaterialVapor\x10\n\x12\r\n\tOceanWave\x10\x0b\x12\x0b\n\x07SeaFoam\x10\x0c\x12\r\n\tItemCloud\x10\r\x12\x15\n\x08\x43\x61mpFire\x10\xff\xff\xff\xff\xff\xff\xff\xff\xff\x01\x42\x02H\x03')
-  ,
-  dependencies=[ItemdefInstrument__pb2.DESCRIPTOR,])
-_sym_db.RegisterFileDescriptor(DESCRIPTOR)
-
-_TILETYPESHAPE = _descriptor.EnumDescriptor(
-  name='TiletypeShape',
-  full_name='RemoteFortressReader.TiletypeShape',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='NO_SHAPE', index=0, number=-1,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='EMPTY', index=1, number=0,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='FLOOR', index=2, number=1,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='BOULDER', index=3, number=2,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='PEBBLES', index=4, number=3,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='WALL', index=5, number=4,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='FORTIFICATION', index=6, number=5,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='STAIR_UP', index=7, number=6,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='STAIR_DOWN', index=8, number=7,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='STAIR_UPDOWN', index=9, number=8,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='RAMP', index=10, number=9,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='RAMP_TOP', index=11, number=10,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='BROOK_BED', index=12, number=11,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='BROOK_TOP', index=13, number=12,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='TREE_SHAPE', index=14, number=13,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='SAPLING', index=15, number=14,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='SHRUB', index=16, number=15,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='ENDLESS_PIT', index=17, number=16,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='BRANCH', index=18, number=17,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='TRUNK_BRANCH', index=19, number=18,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='TWIG', index=20, number=19,
-      options=None,
-      type=None),
-  ],
-  containing_type=None,
-  options=None,
-  serialized_start=13604,
-  serialized_end=13918,
-)
-_sym_db.RegisterEnumDescriptor(_TILETYPESHAPE)
-
-TiletypeShape = enum_type_wrapper.EnumTypeWrapper(_TILETYPESHAPE)
-_TILETYPESPECIAL = _descriptor.EnumDescriptor(
-  name='TiletypeSpecial',
-  full_name='RemoteFortressReader.TiletypeSpecial',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='NO_SPECIAL', index=0, number=-1,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='NORMAL', index=1, number=0,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='RIVER_SOURCE', index=2, number=1,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='WATERFALL', index=3, number=2,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='SMOOTH', index=4, number=3,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='FURROWED', index=5, number=4,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='WET', index=6, number=5,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='DEAD', index=7, number=6,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='WORN_1', index=8, number=7,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='WORN_2', index=9, number=8,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='WORN_3', index=10, number=9,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='TRACK', index=11, number=10,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='SMOOTH_DEAD', index=12, number=11,
-      options=None,
-      type=None),
-  ],
-  containing_type=None,
-  options=None,
-  serialized_start=13921,
-  serialized_end=14117,
-)
-_sym_db.RegisterEnumDescriptor(_TILETYPESPECIAL)
-
-TiletypeSpecial = enum_type_wrapper.EnumTypeWrapper(_TILETYPESPECIAL)
-_TILETYPEMATERIAL = _descriptor.EnumDescriptor(
-  name='TiletypeMaterial',
-  full_name='RemoteFortressReader.TiletypeMaterial',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='NO_MATERIAL', index=0, number=-1,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='AIR', index=1, number=0,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='SOIL', index=2, number=1,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='STONE', index=3, number=2,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='FEATURE', index=4, number=3,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='LAVA_STONE', index=5, number=4,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='MINERAL', index=6, number=5,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='FROZEN_LIQUID', index=7, number=6,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='CONSTRUCTION', index=8, number=7,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='GRASS_LIGHT', index=9, number=8,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='GRASS_DARK', index=10, number=9,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='GRASS_DRY', index=11, number=10,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='GRASS_DEAD', index=12, number=11,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='PLANT', index=13, number=12,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='HFS', index=14, number=13,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='CAMPFIRE', index=15, number=14,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='FIRE', index=16, number=15,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='ASHES', index=17, number=16,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='MAGMA', index=18, number=17,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='DRIFTWOOD', index=19, number=18,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='POOL', index=20, number=19,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='BROOK', index=21, number=20,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='RIVER', index=22, number=21,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='ROOT', index=23, number=22,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='TREE_MATERIAL', index=24, number=23,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='MUSHROOM', index=25, number=24,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='UNDERWORLD_GATE', index=26, number=25,
-      options=None,
-      type=None),
-  ],
-  containing_type=None,
-  options=None,
-  serialized_start=14120,
-  serialized_end=14514,
-)
-_sym_db.RegisterEnumDescriptor(_TILETYPEMATERIAL)
-
-TiletypeMaterial = enum_type_wrapper.EnumTypeWrapper(_TILETYPEMATERIAL)
-_TILETYPEVARIANT = _descriptor.EnumDescriptor(
-  name='TiletypeVariant',
-  full_name='RemoteFortressReader.TiletypeVariant',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='NO_VARIANT', index=0, number=-1,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='VAR_1', index=1, number=0,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='VAR_2', index=2, number=1,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='VAR_3', index=3, number=2,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='VAR_4', index=4, number=3,
-      options=None,
-      type=None),
-  ],
-  containing_type=None,
-  options=None,
-  serialized_start=14516,
-  serialized_end=14602,
-)
-_sym_db.RegisterEnumDescriptor(_TILETYPEVARIANT)
-
-TiletypeVariant = enum_type_wrapper.EnumTypeWrapper(_TILETYPEVARIANT)
-_WORLDPOLES = _descriptor.EnumDescriptor(
-  name='WorldPoles',
-  full_name='RemoteFortressReader.WorldPoles',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='NO_POLES', index=0, number=0,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='NORTH_POLE', index=1, number=1,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='SOUTH_POLE', index=2, number=2,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='BOTH_POLES', index=3, number=3,
-      options=None,
-      type=None),
-  ],
-  containing_type=None,
-  options=None,
-  serialized_start=14604,
-  serialized_end=14678,
-)
-_sym_db.RegisterEnumDescriptor(_WORLDPOLES)
-
-WorldPoles = enum_type_wrapper.EnumTypeWrapper(_WORLDPOLES)
-_BUILDINGDIRECTION = _descriptor.EnumDescriptor(
-  name='BuildingDirection',
-  full_name='RemoteFortressReader.BuildingDirection',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='NORTH', index=0, number=0,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='EAST', index=1, number=1,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='SOUTH', index=2, number=2,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='WEST', index=3, number=3,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='NONE', index=4, number=4,
-      options=None,
-      type=None),
-  ],
-  containing_type=None,
-  options=None,
-  serialized_start=14680,
-  serialized_end=14751,
-)
-_sym_db.RegisterEnumDescriptor(_BUILDINGDIRECTION)
-
-BuildingDirection = enum_type_wrapper.EnumTypeWrapper(_BUILDINGDIRECTION)
-_TILEDIGDESIGNATION = _descriptor.EnumDescriptor(
-  name='TileDigDesignation',
-  full_name='RemoteFortressReader.TileDigDesignation',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='NO_DIG', index=0, number=0,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='DEFAULT_DIG', index=1, number=1,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='UP_DOWN_STAIR_DIG', index=2, number=2,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='CHANNEL_DIG', index=3, number=3,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='RAMP_DIG', index=4, number=4,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='DOWN_STAIR_DIG', index=5, number=5,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='UP_STAIR_DIG', index=6, number=6,
-      options=None,
-      type=None),
-  ],
-  containing_type=None,
-  options=None,
-  serialized_start=14754,
-  serialized_end=14895,
-)
-_sym_db.RegisterEnumDescriptor(_TILEDIGDESIGNATION)
-
-TileDigDesignation = enum_type_wrapper.EnumTypeWrapper(_TILEDIGDESIGNATION)
-_HAIRSTYLE = _descriptor.EnumDescriptor(
-  name='HairStyle',
-  full_name='RemoteFortressReader.HairStyle',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='UNKEMPT', index=0, number=-1,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='NEATLY_COMBED', index=1, number=0,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='BRAIDED', index=2, number=1,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='DOUBLE_BRAID', index=3, number=2,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='PONY_TAILS', index=4, number=3,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='CLEAN_SHAVEN', index=5, number=4,
-      options=None,
-      type=None),
-  ],
-  containing_type=None,
-  options=None,
-  serialized_start=14897,
-  serialized_end=15014,
-)
-_sym_db.RegisterEnumDescriptor(_HAIRSTYLE)
-
-HairStyle = enum_type_wrapper.EnumTypeWrapper(_HAIRSTYLE)
-_INVENTORYMODE = _descriptor.EnumDescriptor(
-  name='InventoryMode',
-  full_name='RemoteFortressReader.InventoryMode',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='Hauled', index=0, number=0,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='Weapon', index=1, number=1,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='Worn', index=2, number=2,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='Piercing', index=3, number=3,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='Flask', index=4, number=4,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='WrappedAround', index=5, number=5,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='StuckIn', index=6, number=6,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='InMouth', index=7, number=7,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='Pet', index=8, number=8,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='SewnInto', index=9, number=9,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='Strapped', index=10, number=10,
-      options=None,
-      type=None),
-  ],
-  containing_type=None,
-  options=None,
-  serialized_start=15017,
-  serialized_end=15173,
-)
-_sym_db.RegisterEnumDescriptor(_INVENTORYMODE)
-
-InventoryMode = enum_type_wrapper.EnumTypeWrapper(_INVENTORYMODE)
-_MATTERSTATE = _descriptor.EnumDescriptor(
-  name='MatterState',
-  full_name='RemoteFortressReader.MatterState',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='Solid', index=0, number=0,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='Liquid', index=1, number=1,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='Gas', index=2, number=2,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='Powder', index=3, number=3,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='Paste', index=4, number=4,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='Pressed', index=5, number=5,
-      options=None,
-      type=None),
-  ],
-  containing_type=None,
-  options=None,
-  serialized_start=15175,
-  serialized_end=15256,
-)
-_sym_db.RegisterEnumDescriptor(_MATTERSTATE)
-
-MatterState = enum_type_wrapper.EnumTypeWrapper(_MATTERSTATE)
-_FRONTTYPE = _descriptor.EnumDescriptor(
-  name='FrontType',
-  full_name='RemoteFortressReader.FrontType',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='FRONT_NONE', index=0, number=0,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='FRONT_WARM', index=1, number=1,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='FRONT_COLD', index=2, number=2,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='FRONT_OCCLUDED', index=3, number=3,
-      options=None,
-      type=None),
-  ],
-  containing_type=None,
-  options=None,
-  serialized_start=15258,
-  serialized_end=15337,
-)
-_sym_db.RegisterEnumDescriptor(_FRONTTYPE)
-
-FrontType = enum_type_wrapper.EnumTypeWrapper(_FRONTTYPE)
-_CUMULUSTYPE = _descriptor.EnumDescriptor(
-  name='CumulusType',
-  full_name='RemoteFortressReader.CumulusType',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='CUMULUS_NONE', index=0, number=0,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='CUMULUS_MEDIUM', index=1, number=1,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='CUMULUS_MULTI', index=2, number=2,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='CUMULUS_NIMBUS', index=3, number=3,
-      options=None,
-      type=None),
-  ],
-  containing_type=None,
-  options=None,
-  serialized_start=15339,
-  serialized_end=15429,
-)
-_sym_db.RegisterEnumDescriptor(_CUMULUSTYPE)
-
-CumulusType = enum_type_wrapper.EnumTypeWrapper(_CUMULUSTYPE)
-_STRATUSTYPE = _descriptor.EnumDescriptor(
-  name='StratusType',
-  full_name='RemoteFortressReader.StratusType',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='STRATUS_NONE', index=0, number=0,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='STRATUS_ALTO', index=1, number=1,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='STRATUS_PROPER', index=2, number=2,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='STRATUS_NIMBUS', index=3, number=3,
-      options=None,
-      type=None),
-  ],
-  containing_type=None,
-  options=None,
-  serialized_start=15431,
-  serialized_end=15520,
-)
-_sym_db.RegisterEnumDescriptor(_STRATUSTYPE)
-
-StratusType = enum_type_wrapper.EnumTypeWrapper(_STRATUSTYPE)
-_FOGTYPE = _descriptor.EnumDescriptor(
-  name='FogType',
-  full_name='RemoteFortressReader.FogType',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='FOG_NONE', index=0, number=0,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='FOG_MIST', index=1, number=1,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='FOG_NORMAL', index=2, number=2,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='F0G_THICK', index=3, number=3,
-      options=None,
-      type=None),
-  ],
-  containing_type=None,
-  options=None,
-  serialized_start=15522,
-  serialized_end=15590,
-)
-_sym_db.RegisterEnumDescriptor(_FOGTYPE)
-
-FogType = enum_type_wrapper.EnumTypeWrapper(_FOGTYPE)
-_SITEREALIZATIONBUILDINGTYPE = _descriptor.EnumDescriptor(
-  name='SiteRealizationBuildingType',
-  full_name='RemoteFortressReader.SiteRealizationBuildingType',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='cottage_plot', index=0, number=0,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='castle_wall', index=1, number=1,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='castle_tower', index=2, number=2,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='castle_courtyard', index=3, number=3,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='house', index=4, number=4,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='temple', index=5, number=5,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='tomb', index=6, number=6,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='shop_house', index=7, number=7,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='warehouse', index=8, number=8,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='market_square', index=9, number=9,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='pasture', index=10, number=10,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='waste', index=11, number=11,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='courtyard', index=12, number=12,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='well', index=13, number=13,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='vault', index=14, number=14,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='great_tower', index=15, number=15,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='trenches', index=16, number=16,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='tree_house', index=17, number=17,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='hillock_house', index=18, number=18,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='mead_hall', index=19, number=19,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='fortress_entrance', index=20, number=20,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='library', index=21, number=21,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='tavern', index=22, number=22,
-      options=None,
-      type=None),
-  ],
-  containing_type=None,
-  options=None,
-  serialized_start=15593,
-  serialized_end=15969,
-)
-_sym_db.RegisterEnumDescriptor(_SITEREALIZATIONBUILDINGTYPE)
-
-SiteRealizationBuildingType = enum_type_wrapper.EnumTypeWrapper(_SITEREALIZATIONBUILDINGTYPE)
-_PATTERNTYPE = _descriptor.EnumDescriptor(
-  name='PatternType',
-  full_name='RemoteFortressReader.PatternType',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='MONOTONE', index=0, number=0,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='STRIPES', index=1, number=1,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='IRIS_EYE', index=2, number=2,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='SPOTS', index=3, number=3,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='PUPIL_EYE', index=4, number=4,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='MOTTLED', index=5, number=5,
-      options=None,
-      type=None),
-  ],
-  containing_type=None,
-  options=None,
-  serialized_start=15971,
-  serialized_end=16064,
-)
-_sym_db.RegisterEnumDescriptor(_PATTERNTYPE)
-
-PatternType = enum_type_wrapper.EnumTypeWrapper(_PATTERNTYPE)
-_IMPROVEMENTTYPE = _descriptor.EnumDescriptor(
-  name='ImprovementType',
-  full_name='RemoteFortressReader.ImprovementType',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='ART_IMAGE', index=0, number=0,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='COVERED', index=1, number=1,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='RINGS_HANGING', index=2, number=2,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='BANDS', index=3, number=3,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='SPIKES', index=4, number=4,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='ITEMSPECIFIC', index=5, number=5,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='THREAD', index=6, number=6,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='CLOTH', index=7, number=7,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='SEWN_IMAGE', index=8, number=8,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='PAGES', index=9, number=9,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='ILLUSTRATION', index=10, number=10,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='INSTRUMENT_PIECE', index=11, number=11,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='WRITING', index=12, number=12,
-      options=None,
-      type=None),
-  ],
-  containing_type=None,
-  options=None,
-  serialized_start=16067,
-  serialized_end=16275,
-)
-_sym_db.RegisterEnumDescriptor(_IMPROVEMENTTYPE)
-
-ImprovementType = enum_type_wrapper.EnumTypeWrapper(_IMPROVEMENTTYPE)
-_ARTIMAGEELEMENTTYPE = _descriptor.EnumDescriptor(
-  name='ArtImageElementType',
-  full_name='RemoteFortressReader.ArtImageElementType',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='IMAGE_CREATURE', index=0, number=0,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='IMAGE_PLANT', index=1, number=1,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='IMAGE_TREE', index=2, number=2,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='IMAGE_SHAPE', index=3, number=3,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='IMAGE_ITEM', index=4, number=4,
-      options=None,
-      type=None),
-  ],
-  containing_type=None,
-  options=None,
-  serialized_start=16277,
-  serialized_end=16384,
-)
-_sym_db.RegisterEnumDescriptor(_ARTIMAGEELEMENTTYPE)
-
-ArtImageElementType = enum_type_wrapper.EnumTypeWrapper(_ARTIMAGEELEMENTTYPE)
-_ARTIMAGEPROPERTYTYPE = _descriptor.EnumDescriptor(
-  name='ArtImagePropertyType',
-  full_name='RemoteFortressReader.ArtImagePropertyType',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='TRANSITIVE_VERB', index=0, number=0,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='INTRANSITIVE_VERB', index=1, number=1,
-      options=None,
-      type=None),
-  ],
-  containing_type=None,
-  options=None,
-  serialized_start=16386,
-  serialized_end=16452,
-)
-_sym_db.RegisterEnumDescriptor(_ARTIMAGEPROPERTYTYPE)
-
-ArtImagePropertyType = enum_type_wrapper.EnumTypeWrapper(_ARTIMAGEPROPERTYTYPE)
-_ARTIMAGEVERB = _descriptor.EnumDescriptor(
-  name='ArtImageVerb',
-  full_name='RemoteFortressReader.ArtImageVerb',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='VERB_WITHERING', index=0, number=0,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='VERB_SURROUNDEDBY', index=1, number=1,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='VERB_MASSACRING', index=2, number=2,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='VERB_FIGHTING', index=3, number=3,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='VERB_LABORING', index=4, number=4,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='VERB_GREETING', index=5, number=5,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='VERB_REFUSING', index=6, number=6,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='VERB_SPEAKING', index=7, number=7,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='VERB_EMBRACING', index=8, number=8,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='VERB_STRIKINGDOWN', index=9, number=9,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='VERB_MENACINGPOSE', index=10, number=10,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='VERB_TRAVELING', index=11, number=11,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='VERB_RAISING', index=12, number=12,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='VERB_HIDING', index=13, number=13,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='VERB_LOOKINGCONFUSED', index=14, number=14,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='VERB_LOOKINGTERRIFIED', index=15, number=15,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='VERB_DEVOURING', index=16, number=16,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='VERB_ADMIRING', index=17, number=17,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='VERB_BURNING', index=18, number=18,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='VERB_WEEPING', index=19, number=19,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='VERB_LOOKINGDEJECTED', index=20, number=20,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='VERB_CRINGING', index=21, number=21,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='VERB_SCREAMING', index=22, number=22,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='VERB_SUBMISSIVEGESTURE', index=23, number=23,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='VERB_FETALPOSITION', index=24, number=24,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='VERB_SMEAREDINTOSPIRAL', index=25, number=25,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='VERB_FALLING', index=26, number=26,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='VERB_DEAD', index=27, number=27,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='VERB_LAUGHING', index=28, number=28,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='VERB_LOOKINGOFFENDED', index=29, number=29,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='VERB_BEINGSHOT', index=30, number=30,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='VERB_PLAINTIVEGESTURE', index=31, number=31,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='VERB_MELTING', index=32, number=32,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='VERB_SHOOTING', index=33, number=33,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='VERB_TORTURING', index=34, number=34,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='VERB_COMMITTINGDEPRAVEDACT', index=35, number=35,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='VERB_PRAYING', index=36, number=36,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='VERB_CONTEMPLATING', index=37, number=37,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='VERB_COOKING', index=38, number=38,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='VERB_ENGRAVING', index=39, number=39,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='VERB_PROSTRATING', index=40, number=40,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='VERB_SUFFERING', index=41, number=41,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='VERB_BEINGIMPALED', index=42, number=42,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='VERB_BEINGCONTORTED', index=43, number=43,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='VERB_BEINGFLAYED', index=44, number=44,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='VERB_HANGINGFROM', index=45, number=45,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='VERB_BEINGMUTILATED', index=46, number=46,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='VERB_TRIUMPHANTPOSE', index=47, number=47,
-      options=None,
-      type=None),
-  ],
-  containing_type=None,
-  options=None,
-  serialized_start=16455,
-  serialized_end=17500,
-)
-_sym_db.RegisterEnumDescriptor(_ARTIMAGEVERB)
-
-ArtImageVerb = enum_type_wrapper.EnumTypeWrapper(_ARTIMAGEVERB)
-_FLOWTYPE = _descriptor.EnumDescriptor(
-  name='FlowType',
-  full_name='RemoteFortressReader.FlowType',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='Miasma', index=0, number=0,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='Steam', index=1, number=1,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='Mist', index=2, number=2,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='MaterialDust', index=3, number=3,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='MagmaMist', index=4, number=4,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='Smoke', index=5, number=5,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='Dragonfire', index=6, number=6,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='Fire', index=7, number=7,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='Web', index=8, number=8,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='MaterialGas', index=9, number=9,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='MaterialVapor', index=10, number=10,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='OceanWave', index=11, number=11,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='SeaFoam', index=12, number=12,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='ItemCloud', index=13, number=13,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='CampFire', index=14, number=-1,
-      options=None,
-      type=None),
-  ],
-  containing_type=None,
-  options=None,
-  serialized_start=17503,
-  serialized_end=17727,
-)
-_sym_db.RegisterEnumDescriptor(_FLOWTYPE)
-
-FlowType = enum_type_wrapper.EnumTypeWrapper(_FLOWTYPE)
-NO_SHAPE = -1
-EMPTY = 0
-FLOOR = 1
-BOULDER = 2
-PEBBLES = 3
-WALL = 4
-FORTIFICATION = 5
-STAIR_UP = 6
-STAIR_DOWN = 7
-STAIR_UPDOWN = 8
-RAMP = 9
-RAMP_TOP = 10
-BROOK_BED = 11
-BROOK_TOP = 12
-TREE_SHAPE = 13
-SAPLING = 14
-SHRUB = 15
-ENDLESS_PIT = 16
-BRANCH = 17
-TRUNK_BRANCH = 18
-TWIG = 19
-NO_SPECIAL = -1
-NORMAL = 0
-RIVER_SOURCE = 1
-WATERFALL = 2
-SMOOTH = 3
-FURROWED = 4
-WET = 5
-DEAD = 6
-WORN_1 = 7
-WORN_2 = 8
-WORN_3 = 9
-TRACK = 10
-SMOOTH_DEAD = 11
-NO_MATERIAL = -1
-AIR = 0
-SOIL = 1
-STONE = 2
-FEATURE = 3
-LAVA_STONE = 4
-MINERAL = 5
-FROZEN_LIQUID = 6
-CONSTRUCTION = 7
-GRASS_LIGHT = 8
-GRASS_DARK = 9
-GRASS_DRY = 10
-GRASS_DEAD = 11
-PLANT = 12
-HFS = 13
-CAMPFIRE = 14
-FIRE = 15
-ASHES = 16
-MAGMA = 17
-DRIFTWOOD = 18
-POOL = 19
-BROOK = 20
-RIVER = 21
-ROOT = 22
-TREE_MATERIAL = 23
-MUSHROOM = 24
-UNDERWORLD_GATE = 25
-NO_VARIANT = -1
-VAR_1 = 0
-VAR_2 = 1
-VAR_3 = 2
-VAR_4 = 3
-NO_POLES = 0
-NORTH_POLE = 1
-SOUTH_POLE = 2
-BOTH_POLES = 3
-NORTH = 0
-EAST = 1
-SOUTH = 2
-WEST = 3
-NONE = 4
-NO_DIG = 0
-DEFAULT_DIG = 1
-UP_DOWN_STAIR_DIG = 2
-CHANNEL_DIG = 3
-RAMP_DIG = 4
-DOWN_STAIR_DIG = 5
-UP_STAIR_DIG = 6
-UNKEMPT = -1
-NEATLY_COMBED = 0
-BRAIDED = 1
-DOUBLE_BRAID = 2
-PONY_TAILS = 3
-CLEAN_SHAVEN = 4
-Hauled = 0
-Weapon = 1
-Worn = 2
-Piercing = 3
-Flask = 4
-WrappedAround = 5
-StuckIn = 6
-InMouth = 7
-Pet = 8
-SewnInto = 9
-Strapped = 10
-Solid = 0
-Liquid = 1
-Gas = 2
-Powder = 3
-Paste = 4
-Pressed = 5
-FRONT_NONE = 0
-FRONT_WARM = 1
-FRONT_COLD = 2
-FRONT_OCCLUDED = 3
-CUMULUS_NONE = 0
-CUMULUS_MEDIUM = 1
-CUMULUS_MULTI = 2
-CUMULUS_NIMBUS = 3
-STRATUS_NONE = 0
-STRATUS_ALTO = 1
-STRATUS_PROPER = 2
-STRATUS_NIMBUS = 3
-FOG_NONE = 0
-FOG_MIST = 1
-FOG_NORMAL = 2
-F0G_THICK = 3
-cottage_plot = 0
-castle_wall = 1
-castle_tower = 2
-castle_courtyard = 3
-house = 4
-temple = 5
-tomb = 6
-shop_house = 7
-warehouse = 8
-market_square = 9
-pasture = 10
-waste = 11
-courtyard = 12
-well = 13
-vault = 14
-great_tower = 15
-trenches = 16
-tree_house = 17
-hillock_house = 18
-mead_hall = 19
-fortress_entrance = 20
-library = 21
-tavern = 22
-MONOTONE = 0
-STRIPES = 1
-IRIS_EYE = 2
-SPOTS = 3
-PUPIL_EYE = 4
-MOTTLED = 5
-ART_IMAGE = 0
-COVERED = 1
-RINGS_HANGING = 2
-BANDS = 3
-SPIKES = 4
-ITEMSPECIFIC = 5
-THREAD = 6
-CLOTH = 7
-SEWN_IMAGE = 8
-PAGES = 9
-ILLUSTRATION = 10
-INSTRUMENT_PIECE = 11
-WRITING = 12
-IMAGE_CREATURE = 0
-IMAGE_PLANT = 1
-IMAGE_TREE = 2
-IMAGE_SHAPE = 3
-IMAGE_ITEM = 4
-TRANSITIVE_VERB = 0
-INTRANSITIVE_VERB = 1
-VERB_WITHERING = 0
-VERB_SURROUNDEDBY = 1
-VERB_MASSACRING = 2
-VERB_FIGHTING = 3
-VERB_LABORING = 4
-VERB_GREETING = 5
-VERB_REFUSING = 6
-VERB_SPEAKING = 7
-VERB_EMBRACING = 8
-VERB_STRIKINGDOWN = 9
-VERB_MENACINGPOSE = 10
-VERB_TRAVELING = 11
-VERB_RAISING = 12
-VERB_HIDING = 13
-VERB_LOOKINGCONFUSED = 14
-VERB_LOOKINGTERRIFIED = 15
-VERB_DEVOURING = 16
-VERB_ADMIRING = 17
-VERB_BURNING = 18
-VERB_WEEPING = 19
-VERB_LOOKINGDEJECTED = 20
-VERB_CRINGING = 21
-VERB_SCREAMING = 22
-VERB_SUBMISSIVEGESTURE = 23
-VERB_FETALPOSITION = 24
-VERB_SMEAREDINTOSPIRAL = 25
-VERB_FALLING = 26
-VERB_DEAD = 27
-VERB_LAUGHING = 28
-VERB_LOOKINGOFFENDED = 29
-VERB_BEINGSHOT = 30
-VERB_PLAINTIVEGESTURE = 31
-VERB_MELTING = 32
-VERB_SHOOTING = 33
-VERB_TORTURING = 34
-VERB_COMMITTINGDEPRAVEDACT = 35
-VERB_PRAYING = 36
-VERB_CONTEMPLATING = 37
-VERB_COOKING = 38
-VERB_ENGRAVING = 39
-VERB_PROSTRATING = 40
-VERB_SUFFERING = 41
-VERB_BEINGIMPALED = 42
-VERB_BEINGCONTORTED = 43
-VERB_BEINGFLAYED = 44
-VERB_HANGINGFROM = 45
-VERB_BEINGMUTILATED = 46
-VERB_TRIUMPHANTPOSE = 47
-Miasma = 0
-Steam = 1
-Mist = 2
-MaterialDust = 3
-MagmaMist = 4
-Smoke = 5
-Dragonfire = 6
-Fire = 7
-Web = 8
-MaterialGas = 9
-MaterialVapor = 10
-OceanWave = 11
-SeaFoam = 12
-ItemCloud = 13
-CampFire = -1
-
-
-
-_COORD = _descriptor.Descriptor(
-  name='Coord',
-  full_name='RemoteFortressReader.Coord',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='x', full_name='RemoteFortressReader.Coord.x', index=0,
-      number=1, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='y', full_name='RemoteFortressReader.Coord.y', index=1,
-      number=2, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='z', full_name='RemoteFortressReader.Coord.z', index=2,
-      number=3, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=77,
-  serialized_end=117,
-)
-
-
-_TILETYPE = _descriptor.Descriptor(
-  name='Tiletype',
-  full_name='RemoteFortressReader.Tiletype',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='id', full_name='RemoteFortressReader.Tiletype.id', index=0,
-      number=1, type=5, cpp_type=1, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='name', full_name='RemoteFortressReader.Tiletype.name', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='caption', full_name='RemoteFortressReader.Tiletype.caption', index=2,
-      number=3, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='shape', full_name='RemoteFortressReader.Tiletype.shape', index=3,
-      number=4, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=-1,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='special', full_name='RemoteFortressReader.Tiletype.special', index=4,
-      number=5, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=-1,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='material', full_name='RemoteFortressReader.Tiletype.material', index=5,
-      number=6, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=-1,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='variant', full_name='RemoteFortressReader.Tiletype.variant', index=6,
-      number=7, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=-1,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='direction', full_name='RemoteFortressReader.Tiletype.direction', index=7,
-      number=8, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=120,
-  serialized_end=414,
-)
-
-
-_TILETYPELIST = _descriptor.Descriptor(
-  name='TiletypeList',
-  full_name='RemoteFortressReader.TiletypeList',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='tiletype_list', full_name='RemoteFortressReader.TiletypeList.tiletype_list', index=0,
-      number=1, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=416,
-  serialized_end=485,
-)
-
-
-_BUILDINGEXTENTS = _descriptor.Descriptor(
-  name='BuildingExtents',
-  full_name='RemoteFortressReader.BuildingExtents',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='pos_x', full_name='RemoteFortressReader.BuildingExtents.pos_x', index=0,
-      number=1, type=5, cpp_type=1, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='pos_y', full_name='RemoteFortressReader.BuildingExtents.pos_y', index=1,
-      number=2, type=5, cpp_type=1, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='width', full_name='RemoteFortressReader.BuildingExtents.width', index=2,
-      number=3, type=5, cpp_type=1, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='height', full_name='RemoteFortressReader.BuildingExtents.height', index=3,
-      number=4, type=5, cpp_type=1, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='extents', full_name='RemoteFortressReader.BuildingExtents.extents', index=4,
-      number=5, type=5, cpp_type=1, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=487,
-  serialized_end=582,
-)
-
-
-_BUILDINGITEM = _descriptor.Descriptor(
-  name='BuildingItem',
-  full_name='RemoteFortressReader.BuildingItem',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='item', full_name='RemoteFortressReader.BuildingItem.item', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='mode', full_name='RemoteFortressReader.BuildingItem.mode', index=1,
-      number=2, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=584,
-  serialized_end=654,
-)
-
-
-_BUILDINGINSTANCE = _descriptor.Descriptor(
-  name='BuildingInstance',
-  full_name='RemoteFortressReader.BuildingInstance',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='index', full_name='RemoteFortressReader.BuildingInstance.index', index=0,
-      number=1, type=5, cpp_type=1, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='pos_x_min', full_name='RemoteFortressReader.BuildingInstance.pos_x_min', index=1,
-      number=2, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='pos_y_min', full_name='RemoteFortressReader.BuildingInstance.pos_y_min', index=2,
-      number=3, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='pos_z_min', full_name='RemoteFortressReader.BuildingInstance.pos_z_min', index=3,
-      number=4, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='pos_x_max', full_name='RemoteFortressReader.BuildingInstance.pos_x_max', index=4,
-      number=5, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='pos_y_max', full_name='RemoteFortressReader.BuildingInstance.pos_y_max', index=5,
-      number=6, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='pos_z_max', full_name='RemoteFortressReader.BuildingInstance.pos_z_max', index=6,
-      number=7, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='building_type', full_name='RemoteFortressReader.BuildingInstance.building_type', index=7,
-      number=8, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='material', full_name='RemoteFortressReader.BuildingInstance.material', index=8,
-      number=9, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='building_flags', full_name='RemoteFortressReader.BuildingInstance.building_flags', index=9,
-      number=10, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='is_room', full_name='RemoteFortressReader.BuildingInstance.is_room', index=10,
-      number=11, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='room', full_name='RemoteFortressReader.BuildingInstance.room', index=11,
-      number=12, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='direction', full_name='RemoteFortressReader.BuildingInstance.direction', index=12,
-      number=13, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='items', full_name='RemoteFortressReader.BuildingInstance.items', index=13,
-      number=14, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='active', full_name='RemoteFortressReader.BuildingInstance.active', index=14,
-      number=15, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=657,
-  serialized_end=1133,
-)
-
-
-_RIVEREDGE = _descriptor.Descriptor(
-  name='RiverEdge',
-  full_name='RemoteFortressReader.RiverEdge',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='min_pos', full_name='RemoteFortressReader.RiverEdge.min_pos', index=0,
-      number=1, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='max_pos', full_name='RemoteFortressReader.RiverEdge.max_pos', index=1,
-      number=2, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='active', full_name='RemoteFortressReader.RiverEdge.active', index=2,
-      number=3, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='elevation', full_name='RemoteFortressReader.RiverEdge.elevation', index=3,
-      number=4, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1135,
-  serialized_end=1215,
-)
-
-
-_RIVERTILE = _descriptor.Descriptor(
-  name='RiverTile',
-  full_name='RemoteFortressReader.RiverTile',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='north', full_name='RemoteFortressReader.RiverTile.north', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='south', full_name='RemoteFortressReader.RiverTile.south', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='east', full_name='RemoteFortressReader.RiverTile.east', index=2,
-      number=3, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='west', full_name='RemoteFortressReader.RiverTile.west', index=3,
-      number=4, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1218,
-  serialized_end=1419,
-)
-
-
-_SPATTER = _descriptor.Descriptor(
-  name='Spatter',
-  full_name='RemoteFortressReader.Spatter',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='material', full_name='RemoteFortressReader.Spatter.material', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='amount', full_name='RemoteFortressReader.Spatter.amount', index=1,
-      number=2, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='state', full_name='RemoteFortressReader.Spatter.state', index=2,
-      number=3, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='item', full_name='RemoteFortressReader.Spatter.item', index=3,
-      number=4, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1422,
-  serialized_end=1591,
-)
-
-
-_SPATTERPILE = _descriptor.Descriptor(
-  name='SpatterPile',
-  full_name='RemoteFortressReader.SpatterPile',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='spatters', full_name='RemoteFortressReader.SpatterPile.spatters', index=0,
-      number=1, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1593,
-  serialized_end=1655,
-)
-
-
-_ITEM = _descriptor.Descriptor(
-  name='Item',
-  full_name='RemoteFortressReader.Item',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='id', full_name='RemoteFortressReader.Item.id', index=0,
-      number=1, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='pos', full_name='RemoteFortressReader.Item.pos', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='flags1', full_name='RemoteFortressReader.Item.flags1', index=2,
-      number=3, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='flags2', full_name='RemoteFortressReader.Item.flags2', index=3,
-      number=4, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='type', full_name='RemoteFortressReader.Item.type', index=4,
-      number=5, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='material', full_name='RemoteFortressReader.Item.material', index=5,
-      number=6, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='dye', full_name='RemoteFortressReader.Item.dye', index=6,
-      number=7, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='stack_size', full_name='RemoteFortressReader.Item.stack_size', index=7,
-      number=8, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='subpos_x', full_name='RemoteFortressReader.Item.subpos_x', index=8,
-      number=9, type=2, cpp_type=6, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='subpos_y', full_name='RemoteFortressReader.Item.subpos_y', index=9,
-      number=10, type=2, cpp_type=6, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='subpos_z', full_name='RemoteFortressReader.Item.subpos_z', index=10,
-      number=11, type=2, cpp_type=6, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='projectile', full_name='RemoteFortressReader.Item.projectile', index=11,
-      number=12, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='velocity_x', full_name='RemoteFortressReader.Item.velocity_x', index=12,
-      number=13, type=2, cpp_type=6, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='velocity_y', full_name='RemoteFortressReader.Item.velocity_y', index=13,
-      number=14, type=2, cpp_type=6, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='velocity_z', full_name='RemoteFortressReader.Item.velocity_z', index=14,
-      number=15, type=2, cpp_type=6, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='volume', full_name='RemoteFortressReader.Item.volume', index=15,
-      number=16, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='improvements', full_name='RemoteFortressReader.Item.improvements', index=16,
-      number=17, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='image', full_name='RemoteFortressReader.Item.image', index=17,
-      number=18, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1658,
-  serialized_end=2174,
-)
-
-
-_MAPBLOCK = _descriptor.Descriptor(
-  name='MapBlock',
-  full_name='RemoteFortressReader.MapBlock',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='map_x', full_name='RemoteFortressReader.MapBlock.map_x', index=0,
-      number=1, type=5, cpp_type=1, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='map_y', full_name='RemoteFortressReader.MapBlock.map_y', index=1,
-      number=2, type=5, cpp_type=1, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='map_z', full_name='RemoteFortressReader.MapBlock.map_z', index=2,
-      number=3, type=5, cpp_type=1, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='tiles', full_name='RemoteFortressReader.MapBlock.tiles', index=3,
-      number=4, type=5, cpp_type=1, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='materials', full_name='RemoteFortressReader.MapBlock.materials', index=4,
-      number=5, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='layer_materials', full_name='RemoteFortressReader.MapBlock.layer_materials', index=5,
-      number=6, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='vein_materials', full_name='RemoteFortressReader.MapBlock.vein_materials', index=6,
-      number=7, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='base_materials', full_name='RemoteFortressReader.MapBlock.base_materials', index=7,
-      number=8, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='magma', full_name='RemoteFortressReader.MapBlock.magma', index=8,
-      number=9, type=5, cpp_type=1, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='water', full_name='RemoteFortressReader.MapBlock.water', index=9,
-      number=10, type=5, cpp_type=1, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='hidden', full_name='RemoteFortressReader.MapBlock.hidden', index=10,
-      number=11, type=8, cpp_type=7, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='light', full_name='RemoteFortressReader.MapBlock.light', index=11,
-      number=12, type=8, cpp_type=7, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='subterranean', full_name='RemoteFortressReader.MapBlock.subterranean', index=12,
-      number=13, type=8, cpp_type=7, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='outside', full_name='RemoteFortressReader.MapBlock.outside', index=13,
-      number=14, type=8, cpp_type=7, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='aquifer', full_name='RemoteFortressReader.MapBlock.aquifer', index=14,
-      number=15, type=8, cpp_type=7, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='water_stagnant', full_name='RemoteFortressReader.MapBlock.water_stagnant', index=15,
-      number=16, type=8, cpp_type=7, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='water_salt', full_name='RemoteFortressReader.MapBlock.water_salt', index=16,
-      number=17, type=8, cpp_type=7, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='construction_items', full_name='RemoteFortressReader.MapBlock.construction_items', index=17,
-      number=18, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='buildings', full_name='RemoteFortressReader.MapBlock.buildings', index=18,
-      number=19, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='tree_percent', full_name='RemoteFortressReader.MapBlock.tree_percent', index=19,
-      number=20, type=5, cpp_type=1, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='tree_x', full_name='RemoteFortressReader.MapBlock.tree_x', index=20,
-      number=21, type=5, cpp_type=1, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='tree_y', full_name='RemoteFortressReader.MapBlock.tree_y', index=21,
-      number=22, type=5, cpp_type=1, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='tree_z', full_name='RemoteFortressReader.MapBlock.tree_z', index=22,
-      number=23, type=5, cpp_type=1, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='tile_dig_designation', full_name='RemoteFortressReader.MapBlock.tile_dig_designation', index=23,
-      number=24, type=14, cpp_type=8, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='spatterPile', full_name='RemoteFortressReader.MapBlock.spatterPile', index=24,
-      number=25, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='items', full_name='RemoteFortressReader.MapBlock.items', index=25,
-      number=26, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='tile_dig_designation_marker', full_name='RemoteFortressReader.MapBlock.tile_dig_designation_marker', index=26,
-      number=27, type=8, cpp_type=7, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='tile_dig_designation_auto', full_name='RemoteFortressReader.MapBlock.tile_dig_designation_auto', index=27,
-      number=28, type=8, cpp_type=7, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='grass_percent', full_name='RemoteFortressReader.MapBlock.grass_percent', index=28,
-      number=29, type=5, cpp_type=1, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='flows', full_name='RemoteFortressReader.MapBlock.flows', index=29,
-      number=30, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=2177,
-  serialized_end=3125,
-)
-
-
-_MATPAIR = _descriptor.Descriptor(
-  name='MatPair',
-  full_name='RemoteFortressReader.MatPair',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='mat_type', full_name='RemoteFortressReader.MatPair.mat_type', index=0,
-      number=1, type=5, cpp_type=1, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='mat_index', full_name='RemoteFortressReader.MatPair.mat_index', index=1,
-      number=2, type=5, cpp_type=1, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=3127,
-  serialized_end=3173,
-)
-
-
-_COLORDEFINITION = _descriptor.Descriptor(
-  name='ColorDefinition',
-  full_name='RemoteFortressReader.ColorDefinition',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='red', full_name='RemoteFortressReader.ColorDefinition.red', index=0,
-      number=1, type=5, cpp_type=1, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='green', full_name='RemoteFortressReader.ColorDefinition.green', index=1,
-      number=2, type=5, cpp_type=1, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='blue', full_name='RemoteFortressReader.ColorDefinition.blue', index=2,
-      number=3, type=5, cpp_type=1, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=3175,
-  serialized_end=3234,
-)
-
-
-_MATERIALDEFINITION = _descriptor.Descriptor(
-  name='MaterialDefinition',
-  full_name='RemoteFortressReader.MaterialDefinition',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='mat_pair', full_name='RemoteFortressReader.MaterialDefinition.mat_pair', index=0,
-      number=1, type=11, cpp_type=10, label=2,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='id', full_name='RemoteFortressReader.MaterialDefinition.id', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='name', full_name='RemoteFortressReader.MaterialDefinition.name', index=2,
-      number=3, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='state_color', full_name='RemoteFortressReader.MaterialDefinition.state_color', index=3,
-      number=4, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='instrument', full_name='RemoteFortressReader.MaterialDefinition.instrument', index=4,
-      number=5, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=3237,
-  serialized_end=3446,
-)
-
-
-_BUILDINGTYPE = _descriptor.Descriptor(
-  name='BuildingType',
-  full_name='RemoteFortressReader.BuildingType',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='building_type', full_name='RemoteFortressReader.BuildingType.building_type', index=0,
-      number=1, type=5, cpp_type=1, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='building_subtype', full_name='RemoteFortressReader.BuildingType.building_subtype', index=1,
-      number=2, type=5, cpp_type=1, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='building_custom', full_name='RemoteFortressReader.BuildingType.building_custom', index=2,
-      number=3, type=5, cpp_type=1, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=3448,
-  serialized_end=3536,
-)
-
-
-_BUILDINGDEFINITION = _descriptor.Descriptor(
-  name='BuildingDefinition',
-  full_name='RemoteFortressReader.BuildingDefinition',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='building_type', full_name='RemoteFortressReader.BuildingDefinition.building_type', index=0,
-      number=1, type=11, cpp_type=10, label=2,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='id', full_name='RemoteFortressReader.BuildingDefinition.id', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='name', full_name='RemoteFortressReader.BuildingDefinition.name', index=2,
-      number=3, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=3538,
-  serialized_end=3643,
-)
-
-
-_BUILDINGLIST = _descriptor.Descriptor(
-  name='BuildingList',
-  full_name='RemoteFortressReader.BuildingList',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='building_list', full_name='RemoteFortressReader.BuildingList.building_list', index=0,
-      number=1, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=3645,
-  serialized_end=3724,
-)
-
-
-_MATERIALLIST = _descriptor.Descriptor(
-  name='MaterialList',
-  full_name='RemoteFortressReader.MaterialList',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='material_list', full_name='RemoteFortressReader.MaterialList.material_list', index=0,
-      number=1, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=3726,
-  serialized_end=3805,
-)
-
-
-_HAIR = _descriptor.Descriptor(
-  name='Hair',
-  full_name='RemoteFortressReader.Hair',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='length', full_name='RemoteFortressReader.Hair.length', index=0,
-      number=1, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='style', full_name='RemoteFortressReader.Hair.style', index=1,
-      number=2, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=-1,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=3807,
-  serialized_end=3877,
-)
-
-
-_BODYSIZEINFO = _descriptor.Descriptor(
-  name='BodySizeInfo',
-  full_name='RemoteFortressReader.BodySizeInfo',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='size_cur', full_name='RemoteFortressReader.BodySizeInfo.size_cur', index=0,
-      number=1, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='size_base', full_name='RemoteFortressReader.BodySizeInfo.size_base', index=1,
-      number=2, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='area_cur', full_name='RemoteFortressReader.BodySizeInfo.area_cur', index=2,
-      number=3, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='area_base', full_name='RemoteFortressReader.BodySizeInfo.area_base', index=3,
-      number=4, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='length_cur', full_name='RemoteFortressReader.BodySizeInfo.length_cur', index=4,
-      number=5, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='length_base', full_name='RemoteFortressReader.BodySizeInfo.length_base', index=5,
-      number=6, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=3880,
-  serialized_end=4009,
-)
-
-
-_UNITAPPEARANCE = _descriptor.Descriptor(
-  name='UnitAppearance',
-  full_name='RemoteFortressReader.UnitAppearance',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='body_modifiers', full_name='RemoteFortressReader.UnitAppearance.body_modifiers', index=0,
-      number=1, type=5, cpp_type=1, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='bp_modifiers', full_name='RemoteFortressReader.UnitAppearance.bp_modifiers', index=1,
-      number=2, type=5, cpp_type=1, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='size_modifier', full_name='RemoteFortressReader.UnitAppearance.size_modifier', index=2,
-      number=3, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='colors', full_name='RemoteFortressReader.UnitAppearance.colors', index=3,
-      number=4, type=5, cpp_type=1, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='hair', full_name='RemoteFortressReader.UnitAppearance.hair', index=4,
-      number=5, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='beard', full_name='RemoteFortressReader.UnitAppearance.beard', index=5,
-      number=6, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='moustache', full_name='RemoteFortressReader.UnitAppearance.moustache', index=6,
-      number=7, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='sideburns', full_name='RemoteFortressReader.UnitAppearance.sideburns', index=7,
-      number=8, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=4012,
-  serialized_end=4292,
-)
-
-
-_INVENTORYITEM = _descriptor.Descriptor(
-  name='InventoryItem',
-  full_name='RemoteFortressReader.InventoryItem',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='mode', full_name='RemoteFortressReader.InventoryItem.mode', index=0,
-      number=1, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='item', full_name='RemoteFortressReader.InventoryItem.item', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=4294,
-  serialized_end=4402,
-)
-
-
-_UNITDEFINITION = _descriptor.Descriptor(
-  name='UnitDefinition',
-  full_name='RemoteFortressReader.UnitDefinition',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='id', full_name='RemoteFortressReader.UnitDefinition.id', index=0,
-      number=1, type=5, cpp_type=1, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='isValid', full_name='RemoteFortressReader.UnitDefinition.isValid', index=1,
-      number=2, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='pos_x', full_name='RemoteFortressReader.UnitDefinition.pos_x', index=2,
-      number=3, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='pos_y', full_name='RemoteFortressReader.UnitDefinition.pos_y', index=3,
-      number=4, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='pos_z', full_name='RemoteFortressReader.UnitDefinition.pos_z', index=4,
-      number=5, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='race', full_name='RemoteFortressReader.UnitDefinition.race', index=5,
-      number=6, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='profession_color', full_name='RemoteFortressReader.UnitDefinition.profession_color', index=6,
-      number=7, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='flags1', full_name='RemoteFortressReader.UnitDefinition.flags1', index=7,
-      number=8, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='flags2', full_name='RemoteFortressReader.UnitDefinition.flags2', index=8,
-      number=9, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='flags3', full_name='RemoteFortressReader.UnitDefinition.flags3', index=9,
-      number=10, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='is_soldier', full_name='RemoteFortressReader.UnitDefinition.is_soldier', index=10,
-      number=11, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='size_info', full_name='RemoteFortressReader.UnitDefinition.size_info', index=11,
-      number=12, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='name', full_name='RemoteFortressReader.UnitDefinition.name', index=12,
-      number=13, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='blood_max', full_name='RemoteFortressReader.UnitDefinition.blood_max', index=13,
-      number=14, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='blood_count', full_name='RemoteFortressReader.UnitDefinition.blood_count', index=14,
-      number=15, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='appearance', full_name='RemoteFortressReader.UnitDefinition.appearance', index=15,
-      number=16, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='profession_id', full_name='RemoteFortressReader.UnitDefinition.profession_id', index=16,
-      number=17, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='noble_positions', full_name='RemoteFortressReader.UnitDefinition.noble_positions', index=17,
-      number=18, type=9, cpp_type=9, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='rider_id', full_name='RemoteFortressReader.UnitDefinition.rider_id', index=18,
-      number=19, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='inventory', full_name='RemoteFortressReader.UnitDefinition.inventory', index=19,
-      number=20, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='subpos_x', full_name='RemoteFortressReader.UnitDefinition.subpos_x', index=20,
-      number=21, type=2, cpp_type=6, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='subpos_y', full_name='RemoteFortressReader.UnitDefinition.subpos_y', index=21,
-      number=22, type=2, cpp_type=6, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='subpos_z', full_name='RemoteFortressReader.UnitDefinition.subpos_z', index=22,
-      number=23, type=2, cpp_type=6, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=4405,
-  serialized_end=5016,
-)
-
-
-_UNITLIST = _descriptor.Descriptor(
-  name='UnitList',
-  full_name='RemoteFortressReader.UnitList',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='creature_list', full_name='RemoteFortressReader.UnitList.creature_list', index=0,
-      number=1, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=5018,
-  serialized_end=5089,
-)
-
-
-_BLOCKREQUEST = _descriptor.Descriptor(
-  name='BlockRequest',
-  full_name='RemoteFortressReader.BlockRequest',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='blocks_needed', full_name='RemoteFortressReader.BlockRequest.blocks_needed', index=0,
-      number=1, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='min_x', full_name='RemoteFortressReader.BlockRequest.min_x', index=1,
-      number=2, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='max_x', full_name='RemoteFortressReader.BlockRequest.max_x', index=2,
-      number=3, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='min_y', full_name='RemoteFortressReader.BlockRequest.min_y', index=3,
-      number=4, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='max_y', full_name='RemoteFortressReader.BlockRequest.max_y', index=4,
-      number=5, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='min_z', full_name='RemoteFortressReader.BlockRequest.min_z', index=5,
-      number=6, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='max_z', full_name='RemoteFortressReader.BlockRequest.max_z', index=6,
-      number=7, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=5091,
-  serialized_end=5218,
-)
-
-
-_BLOCKLIST = _descriptor.Descriptor(
-  name='BlockList',
-  full_name='RemoteFortressReader.BlockList',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='map_blocks', full_name='RemoteFortressReader.BlockList.map_blocks', index=0,
-      number=1, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='map_x', full_name='RemoteFortressReader.BlockList.map_x', index=1,
-      number=2, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='map_y', full_name='RemoteFortressReader.BlockList.map_y', index=2,
-      number=3, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='engravings', full_name='RemoteFortressReader.BlockList.engravings', index=3,
-      number=4, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='ocean_waves', full_name='RemoteFortressReader.BlockList.ocean_waves', index=4,
-      number=5, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=5221,
-  serialized_end=5416,
-)
-
-
-_PLANTDEF = _descriptor.Descriptor(
-  name='PlantDef',
-  full_name='RemoteFortressReader.PlantDef',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='pos_x', full_name='RemoteFortressReader.PlantDef.pos_x', index=0,
-      number=1, type=5, cpp_type=1, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='pos_y', full_name='RemoteFortressReader.PlantDef.pos_y', index=1,
-      number=2, type=5, cpp_type=1, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='pos_z', full_name='RemoteFortressReader.PlantDef.pos_z', index=2,
-      number=3, type=5, cpp_type=1, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='index', full_name='RemoteFortressReader.PlantDef.index', index=3,
-      number=4, type=5, cpp_type=1, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=5418,
-  serialized_end=5488,
-)
-
-
-_PLANTLIST = _descriptor.Descriptor(
-  name='PlantList',
-  full_name='RemoteFortressReader.PlantList',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='plant_list', full_name='RemoteFortressReader.PlantList.plant_list', index=0,
-      number=1, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=5490,
-  serialized_end=5553,
-)
-
-
-_VIEWINFO = _descriptor.Descriptor(
-  name='ViewInfo',
-  full_name='RemoteFortressReader.ViewInfo',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='view_pos_x', full_name='RemoteFortressReader.ViewInfo.view_pos_x', index=0,
-      number=1, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='view_pos_y', full_name='RemoteFortressReader.ViewInfo.view_pos_y', index=1,
-      number=2, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='view_pos_z', full_name='RemoteFortressReader.ViewInfo.view_pos_z', index=2,
-      number=3, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='view_size_x', full_name='RemoteFortressReader.ViewInfo.view_size_x', index=3,
-      number=4, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='view_size_y', full_name='RemoteFortressReader.ViewInfo.view_size_y', index=4,
-      number=5, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='cursor_pos_x', full_name='RemoteFortressReader.ViewInfo.cursor_pos_x', index=5,
-      number=6, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='cursor_pos_y', full_name='RemoteFortressReader.ViewInfo.cursor_pos_y', index=6,
-      number=7, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='cursor_pos_z', full_name='RemoteFortressReader.ViewInfo.cursor_pos_z', index=7,
-      number=8, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='follow_unit_id', full_name='RemoteFortressReader.ViewInfo.follow_unit_id', index=8,
-      number=9, type=5, cpp_type=1, label=1,
-      has_default_value=True, default_value=-1,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='follow_item_id', full_name='RemoteFortressReader.ViewInfo.follow_item_id', index=9,
-      number=10, type=5, cpp_type=1, label=1,
-      has_default_value=True, default_value=-1,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=5556,
-  serialized_end=5790,
-)
-
-
-_MAPINFO = _descriptor.Descriptor(
-  name='MapInfo',
-  full_name='RemoteFortressReader.MapInfo',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='block_size_x', full_name='RemoteFortressReader.MapInfo.block_size_x', index=0,
-      number=1, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='block_size_y', full_name='RemoteFortressReader.MapInfo.block_size_y', index=1,
-      number=2, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='block_size_z', full_name='RemoteFortressReader.MapInfo.block_size_z', index=2,
-      number=3, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='block_pos_x', full_name='RemoteFortressReader.MapInfo.block_pos_x', index=3,
-      number=4, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='block_pos_y', full_name='RemoteFortressReader.MapInfo.block_pos_y', index=4,
-      number=5, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='block_pos_z', full_name='RemoteFortressReader.MapInfo.block_pos_z', index=5,
-      number=6, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='world_name', full_name='RemoteFortressReader.MapInfo.world_name', index=6,
-      number=7, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='world_name_english', full_name='RemoteFortressReader.MapInfo.world_name_english', index=7,
-      number=8, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='save_name', full_name='RemoteFortressReader.MapInfo.save_name', index=8,
-      number=9, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=5793,
-  serialized_end=5998,
-)
-
-
-_CLOUD = _descriptor.Descriptor(
-  name='Cloud',
-  full_name='RemoteFortressReader.Cloud',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='front', full_name='RemoteFortressReader.Cloud.front', index=0,
-      number=1, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='cumulus', full_name='RemoteFortressReader.Cloud.cumulus', index=1,
-      number=2, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='cirrus', full_name='RemoteFortressReader.Cloud.cirrus', index=2,
-      number=3, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='stratus', full_name='RemoteFortressReader.Cloud.stratus', index=3,
-      number=4, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='fog', full_name='RemoteFortressReader.Cloud.fog', index=4,
-      number=5, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=6001,
-  serialized_end=6220,
-)
-
-
-_WORLDMAP = _descriptor.Descriptor(
-  name='WorldMap',
-  full_name='RemoteFortressReader.WorldMap',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='world_width', full_name='RemoteFortressReader.WorldMap.world_width', index=0,
-      number=1, type=5, cpp_type=1, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='world_height', full_name='RemoteFortressReader.WorldMap.world_height', index=1,
-      number=2, type=5, cpp_type=1, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='name', full_name='RemoteFortressReader.WorldMap.name', index=2,
-      number=3, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='name_english', full_name='RemoteFortressReader.WorldMap.name_english', index=3,
-      number=4, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='elevation', full_name='RemoteFortressReader.WorldMap.elevation', index=4,
-      number=5, type=5, cpp_type=1, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='rainfall', full_name='RemoteFortressReader.WorldMap.rainfall', index=5,
-      number=6, type=5, cpp_type=1, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='vegetation', full_name='RemoteFortressReader.WorldMap.vegetation', index=6,
-      number=7, type=5, cpp_type=1, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='temperature', full_name='RemoteFortressReader.WorldMap.temperature', index=7,
-      number=8, type=5, cpp_type=1, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='evilness', full_name='RemoteFortressReader.WorldMap.evilness', index=8,
-      number=9, type=5, cpp_type=1, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='drainage', full_name='RemoteFortressReader.WorldMap.drainage', index=9,
-      number=10, type=5, cpp_type=1, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='volcanism', full_name='RemoteFortressReader.WorldMap.volcanism', index=10,
-      number=11, type=5, cpp_type=1, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='savagery', full_name='RemoteFortressReader.WorldMap.savagery', index=11,
-      number=12, type=5, cpp_type=1, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='clouds', full_name='RemoteFortressReader.WorldMap.clouds', index=12,
-      number=13, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='salinity', full_name='RemoteFortressReader.WorldMap.salinity', index=13,
-      number=14, type=5, cpp_type=1, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='map_x', full_name='RemoteFortressReader.WorldMap.map_x', index=14,
-      number=15, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='map_y', full_name='RemoteFortressReader.WorldMap.map_y', index=15,
-      number=16, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='center_x', full_name='RemoteFortressReader.WorldMap.center_x', index=16,
-      number=17, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='center_y', full_name='RemoteFortressReader.WorldMap.center_y', index=17,
-      number=18, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='center_z', full_name='RemoteFortressReader.WorldMap.center_z', index=18,
-      number=19, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='cur_year', full_name='RemoteFortressReader.WorldMap.cur_year', index=19,
-      number=20, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='cur_year_tick', full_name='RemoteFortressReader.WorldMap.cur_year_tick', index=20,
-      number=21, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='world_poles', full_name='RemoteFortressReader.WorldMap.world_poles', index=21,
-      number=22, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='river_tiles', full_name='RemoteFortressReader.WorldMap.river_tiles', index=22,
-      number=23, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='water_elevation', full_name='RemoteFortressReader.WorldMap.water_elevation', index=23,
-      number=24, type=5, cpp_type=1, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='region_tiles', full_name='RemoteFortressReader.WorldMap.region_tiles', index=24,
-      number=25, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=6223,
-  serialized_end=6841,
-)
-
-
-_SITEREALIZATIONBUILDINGWALL = _descriptor.Descriptor(
-  name='SiteRealizationBuildingWall',
-  full_name='RemoteFortressReader.SiteRealizationBuildingWall',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='start_x', full_name='RemoteFortressReader.SiteRealizationBuildingWall.start_x', index=0,
-      number=1, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='start_y', full_name='RemoteFortressReader.SiteRealizationBuildingWall.start_y', index=1,
-      number=2, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='start_z', full_name='RemoteFortressReader.SiteRealizationBuildingWall.start_z', index=2,
-      number=3, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='end_x', full_name='RemoteFortressReader.SiteRealizationBuildingWall.end_x', index=3,
-      number=4, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='end_y', full_name='RemoteFortressReader.SiteRealizationBuildingWall.end_y', index=4,
-      number=5, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='end_z', full_name='RemoteFortressReader.SiteRealizationBuildingWall.end_z', index=5,
-      number=6, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=6843,
-  serialized_end=6968,
-)
-
-
-_SITEREALIZATIONBUILDINGTOWER = _descriptor.Descriptor(
-  name='SiteRealizationBuildingTower',
-  full_name='RemoteFortressReader.SiteRealizationBuildingTower',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='roof_z', full_name='RemoteFortressReader.SiteRealizationBuildingTower.roof_z', index=0,
-      number=1, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='round', full_name='RemoteFortressReader.SiteRealizationBuildingTower.round', index=1,
-      number=2, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='goblin', full_name='RemoteFortressReader.SiteRealizationBuildingTower.goblin', index=2,
-      number=3, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=6970,
-  serialized_end=7047,
-)
-
-
-_TRENCHSPOKE = _descriptor.Descriptor(
-  name='TrenchSpoke',
-  full_name='RemoteFortressReader.TrenchSpoke',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='mound_start', full_name='RemoteFortressReader.TrenchSpoke.mound_start', index=0,
-      number=1, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='trench_start', full_name='RemoteFortressReader.TrenchSpoke.trench_start', index=1,
-      number=2, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='trench_end', full_name='RemoteFortressReader.TrenchSpoke.trench_end', index=2,
-      number=3, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='mound_end', full_name='RemoteFortressReader.TrenchSpoke.mound_end', index=3,
-      number=4, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=7049,
-  serialized_end=7144,
-)
-
-
-_SITEREALIZATIONBUILDINGTRENCHES = _descriptor.Descriptor(
-  name='SiteRealizationBuildingTrenches',
-  full_name='RemoteFortressReader.SiteRealizationBuildingTrenches',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='spokes', full_name='RemoteFortressReader.SiteRealizationBuildingTrenches.spokes', index=0,
-      number=1, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=7146,
-  serialized_end=7230,
-)
-
-
-_SITEREALIZATIONBUILDING = _descriptor.Descriptor(
-  name='SiteRealizationBuilding',
-  full_name='RemoteFortressReader.SiteRealizationBuilding',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='id', full_name='RemoteFortressReader.SiteRealizationBuilding.id', index=0,
-      number=1, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='type', full_name='RemoteFortressReader.SiteRealizationBuilding.type', index=1,
-      number=2, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='min_x', full_name='RemoteFortressReader.SiteRealizationBuilding.min_x', index=2,
-      number=3, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='min_y', full_name='RemoteFortressReader.SiteRealizationBuilding.min_y', index=3,
-      number=4, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='max_x', full_name='RemoteFortressReader.SiteRealizationBuilding.max_x', index=4,
-      number=5, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='max_y', full_name='RemoteFortressReader.SiteRealizationBuilding.max_y', index=5,
-      number=6, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='material', full_name='RemoteFortressReader.SiteRealizationBuilding.material', index=6,
-      number=7, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='wall_info', full_name='RemoteFortressReader.SiteRealizationBuilding.wall_info', index=7,
-      number=8, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='tower_info', full_name='RemoteFortressReader.SiteRealizationBuilding.tower_info', index=8,
-      number=9, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='trench_info', full_name='RemoteFortressReader.SiteRealizationBuilding.trench_info', index=9,
-      number=10, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=7233,
-  serialized_end=7662,
-)
-
-
-_REGIONTILE = _descriptor.Descriptor(
-  name='RegionTile',
-  full_name='RemoteFortressReader.RegionTile',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='elevation', full_name='RemoteFortressReader.RegionTile.elevation', index=0,
-      number=1, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='rainfall', full_name='RemoteFortressReader.RegionTile.rainfall', index=1,
-      number=2, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='vegetation', full_name='RemoteFortressReader.RegionTile.vegetation', index=2,
-      number=3, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='temperature', full_name='RemoteFortressReader.RegionTile.temperature', index=3,
-      number=4, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='evilness', full_name='RemoteFortressReader.RegionTile.evilness', index=4,
-      number=5, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='drainage', full_name='RemoteFortressReader.RegionTile.drainage', index=5,
-      number=6, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='volcanism', full_name='RemoteFortressReader.RegionTile.volcanism', index=6,
-      number=7, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='savagery', full_name='RemoteFortressReader.RegionTile.savagery', index=7,
-      number=8, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='salinity', full_name='RemoteFortressReader.RegionTile.salinity', index=8,
-      number=9, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='river_tiles', full_name='RemoteFortressReader.RegionTile.river_tiles', index=9,
-      number=10, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='water_elevation', full_name='RemoteFortressReader.RegionTile.water_elevation', index=10,
-      number=11, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='surface_material', full_name='RemoteFortressReader.RegionTile.surface_material', index=11,
-      number=12, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='plant_materials', full_name='RemoteFortressReader.RegionTile.plant_materials', index=12,
-      number=13, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='buildings', full_name='RemoteFortressReader.RegionTile.buildings', index=13,
-      number=14, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='stone_materials', full_name='RemoteFortressReader.RegionTile.stone_materials', index=14,
-      number=15, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='tree_materials', full_name='RemoteFortressReader.RegionTile.tree_materials', index=15,
-      number=16, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='snow', full_name='RemoteFortressReader.RegionTile.snow', index=16,
-      number=17, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=7665,
-  serialized_end=8229,
-)
-
-
-_REGIONMAP = _descriptor.Descriptor(
-  name='RegionMap',
-  full_name='RemoteFortressReader.RegionMap',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='map_x', full_name='RemoteFortressReader.RegionMap.map_x', index=0,
-      number=1, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='map_y', full_name='RemoteFortressReader.RegionMap.map_y', index=1,
-      number=2, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='name', full_name='RemoteFortressReader.RegionMap.name', index=2,
-      number=3, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='name_english', full_name='RemoteFortressReader.RegionMap.name_english', index=3,
-      number=4, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='tiles', full_name='RemoteFortressReader.RegionMap.tiles', index=4,
-      number=5, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=8231,
-  serialized_end=8357,
-)
-
-
-_REGIONMAPS = _descriptor.Descriptor(
-  name='RegionMaps',
-  full_name='RemoteFortressReader.RegionMaps',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='world_maps', full_name='RemoteFortressReader.RegionMaps.world_maps', index=0,
-      number=1, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='region_maps', full_name='RemoteFortressReader.RegionMaps.region_maps', index=1,
-      number=2, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=8359,
-  serialized_end=8477,
-)
-
-
-_PATTERNDESCRIPTOR = _descriptor.Descriptor(
-  name='PatternDescriptor',
-  full_name='RemoteFortressReader.PatternDescriptor',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='id', full_name='RemoteFortressReader.PatternDescriptor.id', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='colors', full_name='RemoteFortressReader.PatternDescriptor.colors', index=1,
-      number=2, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='pattern', full_name='RemoteFortressReader.PatternDescriptor.pattern', index=2,
-      number=3, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=8480,
-  serialized_end=8618,
-)
-
-
-_COLORMODIFIERRAW = _descriptor.Descriptor(
-  name='ColorModifierRaw',
-  full_name='RemoteFortressReader.ColorModifierRaw',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='patterns', full_name='RemoteFortressReader.ColorModifierRaw.patterns', index=0,
-      number=1, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='body_part_id', full_name='RemoteFortressReader.ColorModifierRaw.body_part_id', index=1,
-      number=2, type=5, cpp_type=1, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='tissue_layer_id', full_name='RemoteFortressReader.ColorModifierRaw.tissue_layer_id', index=2,
-      number=3, type=5, cpp_type=1, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='start_date', full_name='RemoteFortressReader.ColorModifierRaw.start_date', index=3,
-      number=4, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='end_date', full_name='RemoteFortressReader.ColorModifierRaw.end_date', index=4,
-      number=5, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='part', full_name='RemoteFortressReader.ColorModifierRaw.part', index=5,
-      number=6, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=8621,
-  serialized_end=8797,
-)
-
-
-_BODYPARTLAYERRAW = _descriptor.Descriptor(
-  name='BodyPartLayerRaw',
-  full_name='RemoteFortressReader.BodyPartLayerRaw',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='layer_name', full_name='RemoteFortressReader.BodyPartLayerRaw.layer_name', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='tissue_id', full_name='RemoteFortressReader.BodyPartLayerRaw.tissue_id', index=1,
-      number=2, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='layer_depth', full_name='RemoteFortressReader.BodyPartLayerRaw.layer_depth', index=2,
-      number=3, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='bp_modifiers', full_name='RemoteFortressReader.BodyPartLayerRaw.bp_modifiers', index=3,
-      number=4, type=5, cpp_type=1, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=8799,
-  serialized_end=8899,
-)
-
-
-_BODYPARTRAW = _descriptor.Descriptor(
-  name='BodyPartRaw',
-  full_name='RemoteFortressReader.BodyPartRaw',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='token', full_name='RemoteFortressReader.BodyPartRaw.token', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='category', full_name='RemoteFortressReader.BodyPartRaw.category', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='parent', full_name='RemoteFortressReader.BodyPartRaw.parent', index=2,
-      number=3, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='flags', full_name='RemoteFortressReader.BodyPartRaw.flags', index=3,
-      number=4, type=8, cpp_type=7, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='layers', full_name='RemoteFortressReader.BodyPartRaw.layers', index=4,
-      number=5, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='relsize', full_name='RemoteFortressReader.BodyPartRaw.relsize', index=5,
-      number=6, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=8902,
-  serialized_end=9052,
-)
-
-
-_BPAPPEARANCEMODIFIER = _descriptor.Descriptor(
-  name='BpAppearanceModifier',
-  full_name='RemoteFortressReader.BpAppearanceModifier',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='type', full_name='RemoteFortressReader.BpAppearanceModifier.type', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='mod_min', full_name='RemoteFortressReader.BpAppearanceModifier.mod_min', index=1,
-      number=2, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='mod_max', full_name='RemoteFortressReader.BpAppearanceModifier.mod_max', index=2,
-      number=3, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=9054,
-  serialized_end=9124,
-)
-
-
-_TISSUERAW = _descriptor.Descriptor(
-  name='TissueRaw',
-  full_name='RemoteFortressReader.TissueRaw',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='id', full_name='RemoteFortressReader.TissueRaw.id', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='name', full_name='RemoteFortressReader.TissueRaw.name', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='material', full_name='RemoteFortressReader.TissueRaw.material', index=2,
-      number=3, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='subordinate_to_tissue', full_name='RemoteFortressReader.TissueRaw.subordinate_to_tissue', index=3,
-      number=4, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=9126,
-  serialized_end=9243,
-)
-
-
-_CASTERAW = _descriptor.Descriptor(
-  name='CasteRaw',
-  full_name='RemoteFortressReader.CasteRaw',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='index', full_name='RemoteFortressReader.CasteRaw.index', index=0,
-      number=1, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='caste_id', full_name='RemoteFortressReader.CasteRaw.caste_id', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='caste_name', full_name='RemoteFortressReader.CasteRaw.caste_name', index=2,
-      number=3, type=9, cpp_type=9, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='baby_name', full_name='RemoteFortressReader.CasteRaw.baby_name', index=3,
-      number=4, type=9, cpp_type=9, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='child_name', full_name='RemoteFortressReader.CasteRaw.child_name', index=4,
-      number=5, type=9, cpp_type=9, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='gender', full_name='RemoteFortressReader.CasteRaw.gender', index=5,
-      number=6, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='body_parts', full_name='RemoteFortressReader.CasteRaw.body_parts', index=6,
-      number=7, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='total_relsize', full_name='RemoteFortressReader.CasteRaw.total_relsize', index=7,
-      number=8, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='modifiers', full_name='RemoteFortressReader.CasteRaw.modifiers', index=8,
-      number=9, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='modifier_idx', full_name='RemoteFortressReader.CasteRaw.modifier_idx', index=9,
-      number=10, type=5, cpp_type=1, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='part_idx', full_name='RemoteFortressReader.CasteRaw.part_idx', index=10,
-      number=11, type=5, cpp_type=1, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='layer_idx', full_name='RemoteFortressReader.CasteRaw.layer_idx', index=11,
-      number=12, type=5, cpp_type=1, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='body_appearance_modifiers', full_name='RemoteFortressReader.CasteRaw.body_appearance_modifiers', index=12,
-      number=13, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='color_modifiers', full_name='RemoteFortressReader.CasteRaw.color_modifiers', index=13,
-      number=14, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='description', full_name='RemoteFortressReader.CasteRaw.description', index=14,
-      number=15, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='adult_size', full_name='RemoteFortressReader.CasteRaw.adult_size', index=15,
-      number=16, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=9246,
-  serialized_end=9749,
-)
-
-
-_CREATURERAW = _descriptor.Descriptor(
-  name='CreatureRaw',
-  full_name='RemoteFortressReader.CreatureRaw',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='index', full_name='RemoteFortressReader.CreatureRaw.index', index=0,
-      number=1, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='creature_id', full_name='RemoteFortressReader.CreatureRaw.creature_id', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='name', full_name='RemoteFortressReader.CreatureRaw.name', index=2,
-      number=3, type=9, cpp_type=9, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='general_baby_name', full_name='RemoteFortressReader.CreatureRaw.general_baby_name', index=3,
-      number=4, type=9, cpp_type=9, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='general_child_name', full_name='RemoteFortressReader.CreatureRaw.general_child_name', index=4,
-      number=5, type=9, cpp_type=9, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='creature_tile', full_name='RemoteFortressReader.CreatureRaw.creature_tile', index=5,
-      number=6, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='creature_soldier_tile', full_name='RemoteFortressReader.CreatureRaw.creature_soldier_tile', index=6,
-      number=7, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='color', full_name='RemoteFortressReader.CreatureRaw.color', index=7,
-      number=8, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='adultsize', full_name='RemoteFortressReader.CreatureRaw.adultsize', index=8,
-      number=9, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='caste', full_name='RemoteFortressReader.CreatureRaw.caste', index=9,
-      number=10, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='tissues', full_name='RemoteFortressReader.CreatureRaw.tissues', index=10,
-      number=11, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=9752,
-  serialized_end=10094,
-)
-
-
-_CREATURERAWLIST = _descriptor.Descriptor(
-  name='CreatureRawList',
-  full_name='RemoteFortressReader.CreatureRawList',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='creature_raws', full_name='RemoteFortressReader.CreatureRawList.creature_raws', index=0,
-      number=1, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=10096,
-  serialized_end=10171,
-)
-
-
-_ARMY = _descriptor.Descriptor(
-  name='Army',
-  full_name='RemoteFortressReader.Army',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='id', full_name='RemoteFortressReader.Army.id', index=0,
-      number=1, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='pos_x', full_name='RemoteFortressReader.Army.pos_x', index=1,
-      number=2, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='pos_y', full_name='RemoteFortressReader.Army.pos_y', index=2,
-      number=3, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='pos_z', full_name='RemoteFortressReader.Army.pos_z', index=3,
-      number=4, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='leader', full_name='RemoteFortressReader.Army.leader', index=4,
-      number=5, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='members', full_name='RemoteFortressReader.Army.members', index=5,
-      number=6, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='flags', full_name='RemoteFortressReader.Army.flags', index=6,
-      number=7, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=10174,
-  serialized_end=10361,
-)
-
-
-_ARMYLIST = _descriptor.Descriptor(
-  name='ArmyList',
-  full_name='RemoteFortressReader.ArmyList',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='armies', full_name='RemoteFortressReader.ArmyList.armies', index=0,
-      number=1, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=10363,
-  serialized_end=10417,
-)
-
-
-_GROWTHPRINT = _descriptor.Descriptor(
-  name='GrowthPrint',
-  full_name='RemoteFortressReader.GrowthPrint',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='priority', full_name='RemoteFortressReader.GrowthPrint.priority', index=0,
-      number=1, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='color', full_name='RemoteFortressReader.GrowthPrint.color', index=1,
-      number=2, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='timing_start', full_name='RemoteFortressReader.GrowthPrint.timing_start', index=2,
-      number=3, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='timing_end', full_name='RemoteFortressReader.GrowthPrint.timing_end', index=3,
-      number=4, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='tile', full_name='RemoteFortressReader.GrowthPrint.tile', index=4,
-      number=5, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=10419,
-  serialized_end=10521,
-)
-
-
-_TREEGROWTH = _descriptor.Descriptor(
-  name='TreeGrowth',
-  full_name='RemoteFortressReader.TreeGrowth',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='index', full_name='RemoteFortressReader.TreeGrowth.index', index=0,
-      number=1, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='id', full_name='RemoteFortressReader.TreeGrowth.id', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='name', full_name='RemoteFortressReader.TreeGrowth.name', index=2,
-      number=3, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='mat', full_name='RemoteFortressReader.TreeGrowth.mat', index=3,
-      number=4, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='prints', full_name='RemoteFortressReader.TreeGrowth.prints', index=4,
-      number=5, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='timing_start', full_name='RemoteFortressReader.TreeGrowth.timing_start', index=5,
-      number=6, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='timing_end', full_name='RemoteFortressReader.TreeGrowth.timing_end', index=6,
-      number=7, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='twigs', full_name='RemoteFortressReader.TreeGrowth.twigs', index=7,
-      number=8, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='light_branches', full_name='RemoteFortressReader.TreeGrowth.light_branches', index=8,
-      number=9, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='heavy_branches', full_name='RemoteFortressReader.TreeGrowth.heavy_branches', index=9,
-      number=10, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='trunk', full_name='RemoteFortressReader.TreeGrowth.trunk', index=10,
-      number=11, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='roots', full_name='RemoteFortressReader.TreeGrowth.roots', index=11,
-      number=12, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='cap', full_name='RemoteFortressReader.TreeGrowth.cap', index=12,
-      number=13, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='sapling', full_name='RemoteFortressReader.TreeGrowth.sapling', index=13,
-      number=14, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='trunk_height_start', full_name='RemoteFortressReader.TreeGrowth.trunk_height_start', index=14,
-      number=15, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='trunk_height_end', full_name='RemoteFortressReader.TreeGrowth.trunk_height_end', index=15,
-      number=16, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=10524,
-  serialized_end=10891,
-)
-
-
-_PLANTRAW = _descriptor.Descriptor(
-  name='PlantRaw',
-  full_name='RemoteFortressReader.PlantRaw',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='index', full_name='RemoteFortressReader.PlantRaw.index', index=0,
-      number=1, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='id', full_name='RemoteFortressReader.PlantRaw.id', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='name', full_name='RemoteFortressReader.PlantRaw.name', index=2,
-      number=3, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='growths', full_name='RemoteFortressReader.PlantRaw.growths', index=3,
-      number=4, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='tile', full_name='RemoteFortressReader.PlantRaw.tile', index=4,
-      number=5, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=10893,
-  serialized_end=11009,
-)
-
-
-_PLANTRAWLIST = _descriptor.Descriptor(
-  name='PlantRawList',
-  full_name='RemoteFortressReader.PlantRawList',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='plant_raws', full_name='RemoteFortressReader.PlantRawList.plant_raws', index=0,
-      number=1, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=11011,
-  serialized_end=11077,
-)
-
-
-_SCREENTILE = _descriptor.Descriptor(
-  name='ScreenTile',
-  full_name='RemoteFortressReader.ScreenTile',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='character', full_name='RemoteFortressReader.ScreenTile.character', index=0,
-      number=1, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='foreground', full_name='RemoteFortressReader.ScreenTile.foreground', index=1,
-      number=2, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='background', full_name='RemoteFortressReader.ScreenTile.background', index=2,
-      number=3, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=11079,
-  serialized_end=11150,
-)
-
-
-_SCREENCAPTURE = _descriptor.Descriptor(
-  name='ScreenCapture',
-  full_name='RemoteFortressReader.ScreenCapture',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='width', full_name='RemoteFortressReader.ScreenCapture.width', index=0,
-      number=1, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='height', full_name='RemoteFortressReader.ScreenCapture.height', index=1,
-      number=2, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='tiles', full_name='RemoteFortressReader.ScreenCapture.tiles', index=2,
-      number=3, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=11152,
-  serialized_end=11247,
-)
-
-
-_KEYBOARDEVENT = _descriptor.Descriptor(
-  name='KeyboardEvent',
-  full_name='RemoteFortressReader.KeyboardEvent',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='type', full_name='RemoteFortressReader.KeyboardEvent.type', index=0,
-      number=1, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='which', full_name='RemoteFortressReader.KeyboardEvent.which', index=1,
-      number=2, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='state', full_name='RemoteFortressReader.KeyboardEvent.state', index=2,
-      number=3, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='scancode', full_name='RemoteFortressReader.KeyboardEvent.scancode', index=3,
-      number=4, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='sym', full_name='RemoteFortressReader.KeyboardEvent.sym', index=4,
-      number=5, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='mod', full_name='RemoteFortressReader.KeyboardEvent.mod', index=5,
-      number=6, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='unicode', full_name='RemoteFortressReader.KeyboardEvent.unicode', index=6,
-      number=7, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=11249,
-  serialized_end=11369,
-)
-
-
-_DIGCOMMAND = _descriptor.Descriptor(
-  name='DigCommand',
-  full_name='RemoteFortressReader.DigCommand',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='designation', full_name='RemoteFortressReader.DigCommand.designation', index=0,
-      number=1, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='locations', full_name='RemoteFortressReader.DigCommand.locations', index=1,
-      number=2, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=11371,
-  serialized_end=11494,
-)
-
-
-_SINGLEBOOL = _descriptor.Descriptor(
-  name='SingleBool',
-  full_name='RemoteFortressReader.SingleBool',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='Value', full_name='RemoteFortressReader.SingleBool.Value', index=0,
-      number=1, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=11496,
-  serialized_end=11523,
-)
-
-
-_VERSIONINFO = _descriptor.Descriptor(
-  name='VersionInfo',
-  full_name='RemoteFortressReader.VersionInfo',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='dwarf_fortress_version', full_name='RemoteFortressReader.VersionInfo.dwarf_fortress_version', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='dfhack_version', full_name='RemoteFortressReader.VersionInfo.dfhack_version', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='remote_fortress_reader_version', full_name='RemoteFortressReader.VersionInfo.remote_fortress_reader_version', index=2,
-      number=3, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=11525,
-  serialized_end=11634,
-)
-
-
-_LISTREQUEST = _descriptor.Descriptor(
-  name='ListRequest',
-  full_name='RemoteFortressReader.ListRequest',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='list_start', full_name='RemoteFortressReader.ListRequest.list_start', index=0,
-      number=1, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='list_end', full_name='RemoteFortressReader.ListRequest.list_end', index=1,
-      number=2, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=11636,
-  serialized_end=11687,
-)
-
-
-_REPORT = _descriptor.Descriptor(
-  name='Report',
-  full_name='RemoteFortressReader.Report',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='type', full_name='RemoteFortressReader.Report.type', index=0,
-      number=1, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='text', full_name='RemoteFortressReader.Report.text', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='color', full_name='RemoteFortressReader.Report.color', index=2,
-      number=3, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='duration', full_name='RemoteFortressReader.Report.duration', index=3,
-      number=4, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='continuation', full_name='RemoteFortressReader.Report.continuation', index=4,
-      number=5, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='unconscious', full_name='RemoteFortressReader.Report.unconscious', index=5,
-      number=6, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='announcement', full_name='RemoteFortressReader.Report.announcement', index=6,
-      number=7, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='repeat_count', full_name='RemoteFortressReader.Report.repeat_count', index=7,
-      number=8, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='pos', full_name='RemoteFortressReader.Report.pos', index=8,
-      number=9, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='id', full_name='RemoteFortressReader.Report.id', index=9,
-      number=10, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='year', full_name='RemoteFortressReader.Report.year', index=10,
-      number=11, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='time', full_name='RemoteFortressReader.Report.time', index=11,
-      number=12, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=11690,
-  serialized_end=11967,
-)
-
-
-_STATUS = _descriptor.Descriptor(
-  name='Status',
-  full_name='RemoteFortressReader.Status',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='reports', full_name='RemoteFortressReader.Status.reports', index=0,
-      number=1, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=11969,
-  serialized_end=12024,
-)
-
-
-_SHAPEDESCRIPTIOR = _descriptor.Descriptor(
-  name='ShapeDescriptior',
-  full_name='RemoteFortressReader.ShapeDescriptior',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='id', full_name='RemoteFortressReader.ShapeDescriptior.id', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='tile', full_name='RemoteFortressReader.ShapeDescriptior.tile', index=1,
-      number=2, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=12026,
-  serialized_end=12070,
-)
-
-
-_LANGUAGE = _descriptor.Descriptor(
-  name='Language',
-  full_name='RemoteFortressReader.Language',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='shapes', full_name='RemoteFortressReader.Language.shapes', index=0,
-      number=1, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=12072,
-  serialized_end=12138,
-)
-
-
-_ITEMIMPROVEMENT = _descriptor.Descriptor(
-  name='ItemImprovement',
-  full_name='RemoteFortressReader.ItemImprovement',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='material', full_name='RemoteFortressReader.ItemImprovement.material', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='type', full_name='RemoteFortressReader.ItemImprovement.type', index=1,
-      number=2, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='shape', full_name='RemoteFortressReader.ItemImprovement.shape', index=2,
-      number=3, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='specific_type', full_name='RemoteFortressReader.ItemImprovement.specific_type', index=3,
-      number=4, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='image', full_name='RemoteFortressReader.ItemImprovement.image', index=4,
-      number=5, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=12141,
-  serialized_end=12345,
-)
-
-
-_ARTIMAGEELEMENT = _descriptor.Descriptor(
-  name='ArtImageElement',
-  full_name='RemoteFortressReader.ArtImageElement',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='count', full_name='RemoteFortressReader.ArtImageElement.count', index=0,
-      number=1, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='type', full_name='RemoteFortressReader.ArtImageElement.type', index=1,
-      number=2, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='creature_item', full_name='RemoteFortressReader.ArtImageElement.creature_item', index=2,
-      number=3, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='material', full_name='RemoteFortressReader.ArtImageElement.material', index=3,
-      number=5, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='id', full_name='RemoteFortressReader.ArtImageElement.id', index=4,
-      number=6, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=12348,
-  serialized_end=12552,
-)
-
-
-_ARTIMAGEPROPERTY = _descriptor.Descriptor(
-  name='ArtImageProperty',
-  full_name='RemoteFortressReader.ArtImageProperty',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='subject', full_name='RemoteFortressReader.ArtImageProperty.subject', index=0,
-      number=1, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='object', full_name='RemoteFortressReader.ArtImageProperty.object', index=1,
-      number=2, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='verb', full_name='RemoteFortressReader.ArtImageProperty.verb', index=2,
-      number=3, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='type', full_name='RemoteFortressReader.ArtImageProperty.type', index=3,
-      number=4, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=12555,
-  serialized_end=12714,
-)
-
-
-_ARTIMAGE = _descriptor.Descriptor(
-  name='ArtImage',
-  full_name='RemoteFortressReader.ArtImage',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='elements', full_name='RemoteFortressReader.ArtImage.elements', index=0,
-      number=1, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='id', full_name='RemoteFortressReader.ArtImage.id', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='properties', full_name='RemoteFortressReader.ArtImage.properties', index=2,
-      number=3, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=12717,
-  serialized_end=12887,
-)
-
-
-_ENGRAVING = _descriptor.Descriptor(
-  name='Engraving',
-  full_name='RemoteFortressReader.Engraving',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='pos', full_name='RemoteFortressReader.Engraving.pos', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='quality', full_name='RemoteFortressReader.Engraving.quality', index=1,
-      number=2, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='tile', full_name='RemoteFortressReader.Engraving.tile', index=2,
-      number=3, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='image', full_name='RemoteFortressReader.Engraving.image', index=3,
-      number=4, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='floor', full_name='RemoteFortressReader.Engraving.floor', index=4,
-      number=5, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='west', full_name='RemoteFortressReader.Engraving.west', index=5,
-      number=6, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='east', full_name='RemoteFortressReader.Engraving.east', index=6,
-      number=7, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='north', full_name='RemoteFortressReader.Engraving.north', index=7,
-      number=8, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='south', full_name='RemoteFortressReader.Engraving.south', index=8,
-      number=9, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='hidden', full_name='RemoteFortressReader.Engraving.hidden', index=9,
-      number=10, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='northwest', full_name='RemoteFortressReader.Engraving.northwest', index=10,
-      number=11, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='northeast', full_name='RemoteFortressReader.Engraving.northeast', index=11,
-      number=12, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='southwest', full_name='RemoteFortressReader.Engraving.southwest', index=12,
-      number=13, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='southeast', full_name='RemoteFortressReader.Engraving.southeast', index=13,
-      number=14, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=12890,
-  serialized_end=13186,
-)
-
-
-_FLOWINFO = _descriptor.Descriptor(
-  name='FlowInfo',
-  full_name='RemoteFortressReader.FlowInfo',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='index', full_name='RemoteFortressReader.FlowInfo.index', index=0,
-      number=1, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='type', full_name='RemoteFortressReader.FlowInfo.type', index=1,
-      number=2, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='density', full_name='RemoteFortressReader.FlowInfo.density', index=2,
-      number=3, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='pos', full_name='RemoteFortressReader.FlowInfo.pos', index=3,
-      number=4, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='dest', full_name='RemoteFortressReader.FlowInfo.dest', index=4,
-      number=5, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='expanding', full_name='RemoteFortressReader.FlowInfo.expanding', index=5,
-      number=6, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='reuse', full_name='RemoteFortressReader.FlowInfo.reuse', index=6,
-      number=7, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='guide_id', full_name='RemoteFortressReader.FlowInfo.guide_id', index=7,
-      number=8, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='material', full_name='RemoteFortressReader.FlowInfo.material', index=8,
-      number=9, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='item', full_name='RemoteFortressReader.FlowInfo.item', index=9,
-      number=10, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=13189,
-  serialized_end=13508,
-)
-
-
-_WAVE = _descriptor.Descriptor(
-  name='Wave',
-  full_name='RemoteFortressReader.Wave',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='dest', full_name='RemoteFortressReader.Wave.dest', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='pos', full_name='RemoteFortressReader.Wave.pos', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=13510,
-  serialized_end=13601,
-)
-
-_TILETYPE.fields_by_name['shape'].enum_type = _TILETYPESHAPE
-_TILETYPE.fields_by_name['special'].enum_type = _TILETYPESPECIAL
-_TILETYPE.fields_by_name['material'].enum_type = _TILETYPEMATERIAL
-_TILETYPE.fields_by_name['variant'].enum_type = _TILETYPEVARIANT
-_TILETYPELIST.fields_by_name['tiletype_list'].message_type = _TILETYPE
-_BUILDINGITEM.fields_by_name['item'].message_type = _ITEM
-_BUILDINGINSTANCE.fields_by_name['building_type'].message_type = _BUILDINGTYPE
-_BUILDINGINSTANCE.fields_by_name['material'].message_type = _MATPAIR
-_BUILDINGINSTANCE.fields_by_name['room'].message_type = _BUILDINGEXTENTS
-_BUILDINGINSTANCE.fields_by_name['direction'].enum_type = _BUILDINGDIRECTION
-_BUILDINGINSTANCE.fields_by_name['items'].message_type = _BUILDINGITEM
-_RIVERTILE.fields_by_name['north'].message_type = _RIVEREDGE
-_RIVERTILE.fields_by_name['south'].message_type = _RIVEREDGE
-_RIVERTILE.fields_by_name['east'].message_type = _RIVEREDGE
-_RIVERTILE.fields_by_name['west'].message_type = _RIVEREDGE
-_SPATTER.fields_by_name['material'].message_type = _MATPAIR
-_SPATTER.fields_by_name['state'].enum_type = _MATTERSTATE
-_SPATTER.fields_by_name['item'].message_type = _MATPAIR
-_SPATTERPILE.fields_by_name['spatters'].message_type = _SPATTER
-_ITEM.fields_by_name['pos'].message_type = _COORD
-_ITEM.fields_by_name['type'].message_type = _MATPAIR
-_ITEM.fields_by_name['material'].message_type = _MATPAIR
-_ITEM.fields_by_name['dye'].message_type = _COLORDEFINITION
-_ITEM.fields_by_name['improvements'].message_type = _ITEMIMPROVEMENT
-_ITEM.fields_by_name['image'].message_type = _ARTIMAGE
-_MAPBLOCK.fields_by_name['materials'].message_type = _MATPAIR
-_MAPBLOCK.fields_by_name['layer_materials'].message_type = _MATPAIR
-_MAPBLOCK.fields_by_name['vein_materials'].message_type = _MATPAIR
-_MAPBLOCK.fields_by_name['base_materials'].message_type = _MATPAIR
-_MAPBLOCK.fields_by_name['construction_items'].message_type = _MATPAIR
-_MAPBLOCK.fields_by_name['buildings'].message_type = _BUILDINGINSTANCE
-_MAPBLOCK.fields_by_name['tile_dig_designation'].enum_type = _TILEDIGDESIGNATION
-_MAPBLOCK.fields_by_name['spatterPile'].message_type = _SPATTERPILE
-_MAPBLOCK.fields_by_name['items'].message_type = _ITEM
-_MAPBLOCK.fields_by_name['flows'].message_type = _FLOWINFO
-_MATERIALDEFINITION.fields_by_name['mat_pair'].message_type = _MATPAIR
-_MATERIALDEFINITION.fields_by_name['state_color'].message_type = _COLORDEFINITION
-_MATERIALDEFINITION.fields_by_name['instrument'].message_type = ItemdefInstrument__pb2._INSTRUMENTDEF
-_BUILDINGDEFINITION.fields_by_name['building_type'].message_type = _BUILDINGTYPE
-_BUILDINGLIST.fields_by_name['building_list'].message_type = _BUILDINGDEFINITION
-_MATERIALLIST.fields_by_name['material_list'].message_type = _MATERIALDEFINITION
-_HAIR.fields_by_name['style'].enum_type = _HAIRSTYLE
-_UNITAPPEARANCE.fields_by_name['hair'].message_type = _HAIR
-_UNITAPPEARANCE.fields_by_name['beard'].message_type = _HAIR
-_UNITAPPEARANCE.fields_by_name['moustache'].message_type = _HAIR
-_UNITAPPEARANCE.fields_by_name['sideburns'].message_type = _HAIR
-_INVENTORYITEM.fields_by_name['mode'].enum_type = _INVENTORYMODE
-_INVENTORYITEM.fields_by_name['item'].message_type = _ITEM
-_UNITDEFINITION.fields_by_name['race'].message_type = _MATPAIR
-_UNITDEFINITION.fields_by_name['profession_color'].message_type = _COLORDEFINITION
-_UNITDEFINITION.fields_by_name['size_info'].message_type = _BODYSIZEINFO
-_UNITDEFINITION.fields_by_name['appearance'].message_type = _UNITAPPEARANCE
-_UNITDEFINITION.fields_by_name['inventory'].message_type = _INVENTORYITEM
-_UNITLIST.fields_by_name['creature_list'].message_type = _UNITDEFINITION
-_BLOCKLIST.fields_by_name['map_blocks'].message_type = _MAPBLOCK
-_BLOCKLIST.fields_by_name['engravings'].message_type = _ENGRAVING
-_BLOCKLIST.fields_by_name['ocean_waves'].message_type = _WAVE
-_PLANTLIST.fields_by_name['plant_list'].message_type = _PLANTDEF
-_CLOUD.fields_by_name['front'].enum_type = _FRONTTYPE
-_CLOUD.fields_by_name['cumulus'].enum_type = _CUMULUSTYPE
-_CLOUD.fields_by_name['stratus'].enum_type = _STRATUSTYPE
-_CLOUD.fields_by_name['fog'].enum_type = _FOGTYPE
-_WORLDMAP.fields_by_name['clouds'].message_type = _CLOUD
-_WORLDMAP.fields_by_name['world_poles'].enum_type = _WORLDPOLES
-_WORLDMAP.fields_by_name['river_tiles'].message_type = _RIVERTILE
-_WORLDMAP.fields_by_name['region_tiles'].message_type = _REGIONTILE
-_SITEREALIZATIONBUILDINGTRENCHES.fields_by_name['spokes'].message_type = _TRENCHSPOKE
-_SITEREALIZATIONBUILDING.fields_by_name['type'].enum_type = _SITEREALIZATIONBUILDINGTYPE
-_SITEREALIZATIONBUILDING.fields_by_name['material'].message_type = _MATPAIR
-_SITEREALIZATIONBUILDING.fields_by_name['wall_info'].message_type = _SITEREALIZATIONBUILDINGWALL
-_SITEREALIZATIONBUILDING.fields_by_name['tower_info'].message_type = _SITEREALIZATIONBUILDINGTOWER
-_SITEREALIZATIONBUILDING.fields_by_name['trench_info'].message_type = _SITEREALIZATIONBUILDINGTRENCHES
-_REGIONTILE.fields_by_name['river_tiles'].message_type = _RIVERTILE
-_REGIONTILE.fields_by_name['surface_material'].message_type = _MATPAIR
-_REGIONTILE.fields_by_name['plant_materials'].message_type = _MATPAIR
-_REGIONTILE.fields_by_name['buildings'].message_type = _SITEREALIZATIONBUILDING
-_REGIONTILE.fields_by_name['stone_materials'].message_type = _MATPAIR
-_REGIONTILE.fields_by_name['tree_materials'].message_type = _MATPAIR
-_REGIONMAP.fields_by_name['tiles'].message_type = _REGIONTILE
-_REGIONMAPS.fields_by_name['world_maps'].message_type = _WORLDMAP
-_REGIONMAPS.fields_by_name['region_maps'].message_type = _REGIONMAP
-_PATTERNDESCRIPTOR.fields_by_name['colors'].message_type = _COLORDEFINITION
-_PATTERNDESCRIPTOR.fields_by_name['pattern'].enum_type = _PATTERNTYPE
-_COLORMODIFIERRAW.fields_by_name['patterns'].message_type = _PATTERNDESCRIPTOR
-_BODYPARTRAW.fields_by_name['layers'].message_type = _BODYPARTLAYERRAW
-_TISSUERAW.fields_by_name['material'].message_type = _MATPAIR
-_CASTERAW.fields_by_name['body_parts'].message_type = _BODYPARTRAW
-_CASTERAW.fields_by_name['modifiers'].message_type = _BPAPPEARANCEMODIFIER
-_CASTERAW.fields_by_name['body_appearance_modifiers'].message_type = _BPAPPEARANCEMODIFIER
-_CASTERAW.fields_by_name['color_modifiers'].message_type = _COLORMODIFIERRAW
-_CREATURERAW.fields_by_name['color'].message_type = _COLORDEFINITION
-_CREATURERAW.fields_by_name['caste'].message_type = _CASTERAW
-_CREATURERAW.fields_by_name['tissues'].message_type = _TISSUERAW
-_CREATURERAWLIST.fields_by_name['creature_raws'].message_type = _CREATURERAW
-_ARMY.fields_by_name['leader'].message_type = _UNITDEFINITION
-_ARMY.fields_by_name['members'].message_type = _UNITDEFINITION
-_ARMYLIST.fields_by_name['armies'].message_type = _ARMY
-_TREEGROWTH.fields_by_name['mat'].message_type = _MATPAIR
-_TREEGROWTH.fields_by_name['prints'].message_type = _GROWTHPRINT
-_PLANTRAW.fields_by_name['growths'].message_type = _TREEGROWTH
-_PLANTRAWLIST.fields_by_name['plant_raws'].message_type = _PLANTRAW
-_SCREENCAPTURE.fields_by_name['tiles'].message_type = _SCREENTILE
-_DIGCOMMAND.fields_by_name['designation'].enum_type = _TILEDIGDESIGNATION
-_DIGCOMMAND.fields_by_name['locations'].message_type = _COORD
-_REPORT.fields_by_name['color'].message_type = _COLORDEFINITION
-_REPORT.fields_by_name['pos'].message_type = _COORD
-_STATUS.fields_by_name['reports'].message_type = _REPORT
-_LANGUAGE.fields_by_name['shapes'].message_type = _SHAPEDESCRIPTIOR
-_ITEMIMPROVEMENT.fields_by_name['material'].message_type = _MATPAIR
-_ITEMIMPROVEMENT.fields_by_name['type'].enum_type = _IMPROVEMENTTYPE
-_ITEMIMPROVEMENT.fields_by_name['image'].message_type = _ARTIMAGE
-_ARTIMAGEELEMENT.fields_by_name['type'].enum_type = _ARTIMAGEELEMENTTYPE
-_ARTIMAGEELEMENT.fields_by_name['creature_item'].message_type = _MATPAIR
-_ARTIMAGEELEMENT.fields_by_name['material'].message_type = _MATPAIR
-_ARTIMAGEPROPERTY.fields_by_name['verb'].enum_type = _ARTIMAGEVERB
-_ARTIMAGEPROPERTY.fields_by_name['type'].enum_type = _ARTIMAGEPROPERTYTYPE
-_ARTIMAGE.fields_by_name['elements'].message_type = _ARTIMAGEELEMENT
-_ARTIMAGE.fields_by_name['id'].message_type = _MATPAIR
-_ARTIMAGE.fields_by_name['properties'].message_type = _ARTIMAGEPROPERTY
-_ENGRAVING.fields_by_name['pos'].message_type = _COORD
-_ENGRAVING.fields_by_name['image'].message_type = _ARTIMAGE
-_FLOWINFO.fields_by_name['type'].enum_type = _FLOWTYPE
-_FLOWINFO.fields_by_name['pos'].message_type = _COORD
-_FLOWINFO.fields_by_name['dest'].message_type = _COORD
-_FLOWINFO.fields_by_name['material'].message_type = _MATPAIR
-_FLOWINFO.fields_by_name['item'].message_type = _MATPAIR
-_WAVE.fields_by_name['dest'].message_type = _COORD
-_WAVE.fields_by_name['pos'].message_type = _COORD
-DESCRIPTOR.message_types_by_name['Coord'] = _COORD
-DESCRIPTOR.message_types_by_name['Tiletype'] = _TILETYPE
-DESCRIPTOR.message_types_by_name['TiletypeList'] = _TILETYPELIST
-DESCRIPTOR.message_types_by_name['BuildingExtents'] = _BUILDINGEXTENTS
-DESCRIPTOR.message_types_by_name['BuildingItem'] = _BUILDINGITEM
-DESCRIPTOR.message_types_by_name['BuildingInstance'] = _BUILDINGINSTANCE
-DESCRIPTOR.message_types_by_name['RiverEdge'] = _RIVEREDGE
-DESCRIPTOR.message_types_by_name['RiverTile'] = _RIVERTILE
-DESCRIPTOR.message_types_by_name['Spatter'] = _SPATTER
-DESCRIPTOR.message_types_by_name['SpatterPile'] = _SPATTERPILE
-DESCRIPTOR.message_types_by_name['Item'] = _ITEM
-DESCRIPTOR.message_types_by_name['MapBlock'] = _MAPBLOCK
-DESCRIPTOR.message_types_by_name['MatPair'] = _MATPAIR
-DESCRIPTOR.message_types_by_name['ColorDefinition'] = _COLORDEFINITION
-DESCRIPTOR.message_types_by_name['MaterialDefinition'] = _MATERIALDEFINITION
-DESCRIPTOR.message_types_by_name['BuildingType'] = _BUILDINGTYPE
-DESCRIPTOR.message_types_by_name['BuildingDefinition'] = _BUILDINGDEFINITION
-DESCRIPTOR.message_types_by_name['BuildingList'] = _BUILDINGLIST
-DESCRIPTOR.message_types_by_name['MaterialList'] = _MATERIALLIST
-DESCRIPTOR.message_types_by_name['Hair'] = _HAIR
-DESCRIPTOR.message_types_by_name['BodySizeInfo'] = _BODYSIZEINFO
-DESCRIPTOR.message_types_by_name['UnitAppearance'] = _UNITAPPEARANCE
-DESCRIPTOR.message_types_by_name['InventoryItem'] = _INVENTORYITEM
-DESCRIPTOR.message_types_by_name['UnitDefinition'] = _UNITDEFINITION
-DESCRIPTOR.message_types_by_name['UnitList'] = _UNITLIST
-DESCRIPTOR.message_types_by_name['BlockRequest'] = _BLOCKREQUEST
-DESCRIPTOR.message_types_by_name['BlockList'] = _BLOCKLIST
-DESCRIPTOR.message_types_by_name['PlantDef'] = _PLANTDEF
-DESCRIPTOR.message_types_by_name['PlantList'] = _PLANTLIST
-DESCRIPTOR.message_types_by_name['ViewInfo'] = _VIEWINFO
-DESCRIPTOR.message_types_by_name['MapInfo'] = _MAPINFO
-DESCRIPTOR.message_types_by_name['Cloud'] = _CLOUD
-DESCRIPTOR.message_types_by_name['WorldMap'] = _WORLDMAP
-DESCRIPTOR.message_types_by_name['SiteRealizationBuildingWall'] = _SITEREALIZATIONBUILDINGWALL
-DESCRIPTOR.message_types_by_name['SiteRealizationBuildingTower'] = _SITEREALIZATIONBUILDINGTOWER
-DESCRIPTOR.message_types_by_name['TrenchSpoke'] = _TRENCHSPOKE
-DESCRIPTOR.message_types_by_name['SiteRealizationBuildingTrenches'] = _SITEREALIZATIONBUILDINGTRENCHES
-DESCRIPTOR.message_types_by_name['SiteRealizationBuilding'] = _SITEREALIZATIONBUILDING
-DESCRIPTOR.message_types_by_name['RegionTile'] = _REGIONTILE
-DESCRIPTOR.message_types_by_name['RegionMap'] = _REGIONMAP
-DESCRIPTOR.message_types_by_name['RegionMaps'] = _REGIONMAPS
-DESCRIPTOR.message_types_by_name['PatternDescriptor'] = _PATTERNDESCRIPTOR
-DESCRIPTOR.message_types_by_name['ColorModifierRaw'] = _COLORMODIFIERRAW
-DESCRIPTOR.message_types_by_name['BodyPartLayerRaw'] = _BODYPARTLAYERRAW
-DESCRIPTOR.message_types_by_name['BodyPartRaw'] = _BODYPARTRAW
-DESCRIPTOR.message_types_by_name['BpAppearanceModifier'] = _BPAPPEARANCEMODIFIER
-DESCRIPTOR.message_types_by_name['TissueRaw'] = _TISSUERAW
-DESCRIPTOR.message_types_by_name['CasteRaw'] = _CASTERAW
-DESCRIPTOR.message_types_by_name['CreatureRaw'] = _CREATURERAW
-DESCRIPTOR.message_types_by_name['CreatureRawList'] = _CREATURERAWLIST
-DESCRIPTOR.message_types_by_name['Army'] = _ARMY
-DESCRIPTOR.message_types_by_name['ArmyList'] = _ARMYLIST
-DESCRIPTOR.message_types_by_name['GrowthPrint'] = _GROWTHPRINT
-DESCRIPTOR.message_types_by_name['TreeGrowth'] = _TREEGROWTH
-DESCRIPTOR.message_types_by_name['PlantRaw'] = _PLANTRAW
-DESCRIPTOR.message_types_by_name['PlantRawList'] = _PLANTRAWLIST
-DESCRIPTOR.message_types_by_name['ScreenTile'] = _SCREENTILE
-DESCRIPTOR.message_types_by_name['ScreenCapture'] = _SCREENCAPTURE
-DESCRIPTOR.message_types_by_name['KeyboardEvent'] = _KEYBOARDEVENT
-DESCRIPTOR.message_types_by_name['DigCommand'] = _DIGCOMMAND
-DESCRIPTOR.message_types_by_name['SingleBool'] = _SINGLEBOOL
-DESCRIPTOR.message_types_by_name['VersionInfo'] = _VERSIONINFO
-DESCRIPTOR.message_types_by_name['ListRequest'] = _LISTREQUEST
-DESCRIPTOR.message_types_by_name['Report'] = _REPORT
-DESCRIPTOR.message_types_by_name['Status'] = _STATUS
-DESCRIPTOR.message_types_by_name['ShapeDescriptior'] = _SHAPEDESCRIPTIOR
-DESCRIPTOR.message_types_by_name['Language'] = _LANGUAGE
-DESCRIPTOR.message_types_by_name['ItemImprovement'] = _ITEMIMPROVEMENT
-DESCRIPTOR.message_types_by_name['ArtImageElement'] = _ARTIMAGEELEMENT
-DESCRIPTOR.message_types_by_name['ArtImageProperty'] = _ARTIMAGEPROPERTY
-DESCRIPTOR.message_types_by_name['ArtImage'] = _ARTIMAGE
-DESCRIPTOR.message_types_by_name['Engraving'] = _ENGRAVING
-DESCRIPTOR.message_types_by_name['FlowInfo'] = _FLOWINFO
-DESCRIPTOR.message_types_by_name['Wave'] = _WAVE
-DESCRIPTOR.enum_types_by_name['TiletypeShape'] = _TILETYPESHAPE
-DESCRIPTOR.enum_types_by_name['TiletypeSpecial'] = _TILETYPESPECIAL
-DESCRIPTOR.enum_types_by_name['TiletypeMaterial'] = _TILETYPEMATERIAL
-DESCRIPTOR.enum_types_by_name['TiletypeVariant'] = _TILETYPEVARIANT
-DESCRIPTOR.enum_types_by_name['WorldPoles'] = _WORLDPOLES
-DESCRIPTOR.enum_types_by_name['BuildingDirection'] = _BUILDINGDIRECTION
-DESCRIPTOR.enum_types_by_name['TileDigDesignation'] = _TILEDIGDESIGNATION
-DESCRIPTOR.enum_types_by_name['HairStyle'] = _HAIRSTYLE
-DESCRIPTOR.enum_types_by_name['InventoryMode'] = _INVENTORYMODE
-DESCRIPTOR.enum_types_by_name['MatterState'] = _MATTERSTATE
-DESCRIPTOR.enum_types_by_name['FrontType'] = _FRONTTYPE
-DESCRIPTOR.enum_types_by_name['CumulusType'] = _CUMULUSTYPE
-DESCRIPTOR.enum_types_by_name['StratusType'] = _STRATUSTYPE
-DESCRIPTOR.enum_types_by_name['FogType'] = _FOGTYPE
-DESCRIPTOR.enum_types_by_name['SiteRealizationBuildingType'] = _SITEREALIZATIONBUILDINGTYPE
-DESCRIPTOR.enum_types_by_name['PatternType'] = _PATTERNTYPE
-DESCRIPTOR.enum_types_by_name['ImprovementType'] = _IMPROVEMENTTYPE
-DESCRIPTOR.enum_types_by_name['ArtImageElementType'] = _ARTIMAGEELEMENTTYPE
-DESCRIPTOR.enum_types_by_name['ArtImagePropertyType'] = _ARTIMAGEPROPERTYTYPE
-DESCRIPTOR.enum_types_by_name['ArtImageVerb'] = _ARTIMAGEVERB
-DESCRIPTOR.enum_types_by_name['FlowType'] = _FLOWTYPE
-
-Coord = _reflection.GeneratedProtocolMessageType('Coord', (_message.Message,), dict(
-  DESCRIPTOR = _COORD,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.Coord)
-  ))
-_sym_db.RegisterMessage(Coord)
-
-Tiletype = _reflection.GeneratedProtocolMessageType('Tiletype', (_message.Message,), dict(
-  DESCRIPTOR = _TILETYPE,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.Tiletype)
-  ))
-_sym_db.RegisterMessage(Tiletype)
-
-TiletypeList = _reflection.GeneratedProtocolMessageType('TiletypeList', (_message.Message,), dict(
-  DESCRIPTOR = _TILETYPELIST,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.TiletypeList)
-  ))
-_sym_db.RegisterMessage(TiletypeList)
-
-BuildingExtents = _reflection.GeneratedProtocolMessageType('BuildingExtents', (_message.Message,), dict(
-  DESCRIPTOR = _BUILDINGEXTENTS,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.BuildingExtents)
-  ))
-_sym_db.RegisterMessage(BuildingExtents)
-
-BuildingItem = _reflection.GeneratedProtocolMessageType('BuildingItem', (_message.Message,), dict(
-  DESCRIPTOR = _BUILDINGITEM,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.BuildingItem)
-  ))
-_sym_db.RegisterMessage(BuildingItem)
-
-BuildingInstance = _reflection.GeneratedProtocolMessageType('BuildingInstance', (_message.Message,), dict(
-  DESCRIPTOR = _BUILDINGINSTANCE,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.BuildingInstance)
-  ))
-_sym_db.RegisterMessage(BuildingInstance)
-
-RiverEdge = _reflection.GeneratedProtocolMessageType('RiverEdge', (_message.Message,), dict(
-  DESCRIPTOR = _RIVEREDGE,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.RiverEdge)
-  ))
-_sym_db.RegisterMessage(RiverEdge)
-
-RiverTile = _reflection.GeneratedProtocolMessageType('RiverTile', (_message.Message,), dict(
-  DESCRIPTOR = _RIVERTILE,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.RiverTile)
-  ))
-_sym_db.RegisterMessage(RiverTile)
-
-Spatter = _reflection.GeneratedProtocolMessageType('Spatter', (_message.Message,), dict(
-  DESCRIPTOR = _SPATTER,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.Spatter)
-  ))
-_sym_db.RegisterMessage(Spatter)
-
-SpatterPile = _reflection.GeneratedProtocolMessageType('SpatterPile', (_message.Message,), dict(
-  DESCRIPTOR = _SPATTERPILE,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.SpatterPile)
-  ))
-_sym_db.RegisterMessage(SpatterPile)
-
-Item = _reflection.GeneratedProtocolMessageType('Item', (_message.Message,), dict(
-  DESCRIPTOR = _ITEM,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.Item)
-  ))
-_sym_db.RegisterMessage(Item)
-
-MapBlock = _reflection.GeneratedProtocolMessageType('MapBlock', (_message.Message,), dict(
-  DESCRIPTOR = _MAPBLOCK,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.MapBlock)
-  ))
-_sym_db.RegisterMessage(MapBlock)
-
-MatPair = _reflection.GeneratedProtocolMessageType('MatPair', (_message.Message,), dict(
-  DESCRIPTOR = _MATPAIR,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.MatPair)
-  ))
-_sym_db.RegisterMessage(MatPair)
-
-ColorDefinition = _reflection.GeneratedProtocolMessageType('ColorDefinition', (_message.Message,), dict(
-  DESCRIPTOR = _COLORDEFINITION,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.ColorDefinition)
-  ))
-_sym_db.RegisterMessage(ColorDefinition)
-
-MaterialDefinition = _reflection.GeneratedProtocolMessageType('MaterialDefinition', (_message.Message,), dict(
-  DESCRIPTOR = _MATERIALDEFINITION,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.MaterialDefinition)
-  ))
-_sym_db.RegisterMessage(MaterialDefinition)
-
-BuildingType = _reflection.GeneratedProtocolMessageType('BuildingType', (_message.Message,), dict(
-  DESCRIPTOR = _BUILDINGTYPE,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.BuildingType)
-  ))
-_sym_db.RegisterMessage(BuildingType)
-
-BuildingDefinition = _reflection.GeneratedProtocolMessageType('BuildingDefinition', (_message.Message,), dict(
-  DESCRIPTOR = _BUILDINGDEFINITION,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.BuildingDefinition)
-  ))
-_sym_db.RegisterMessage(BuildingDefinition)
-
-BuildingList = _reflection.GeneratedProtocolMessageType('BuildingList', (_message.Message,), dict(
-  DESCRIPTOR = _BUILDINGLIST,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.BuildingList)
-  ))
-_sym_db.RegisterMessage(BuildingList)
-
-MaterialList = _reflection.GeneratedProtocolMessageType('MaterialList', (_message.Message,), dict(
-  DESCRIPTOR = _MATERIALLIST,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.MaterialList)
-  ))
-_sym_db.RegisterMessage(MaterialList)
-
-Hair = _reflection.GeneratedProtocolMessageType('Hair', (_message.Message,), dict(
-  DESCRIPTOR = _HAIR,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.Hair)
-  ))
-_sym_db.RegisterMessage(Hair)
-
-BodySizeInfo = _reflection.GeneratedProtocolMessageType('BodySizeInfo', (_message.Message,), dict(
-  DESCRIPTOR = _BODYSIZEINFO,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.BodySizeInfo)
-  ))
-_sym_db.RegisterMessage(BodySizeInfo)
-
-UnitAppearance = _reflection.GeneratedProtocolMessageType('UnitAppearance', (_message.Message,), dict(
-  DESCRIPTOR = _UNITAPPEARANCE,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.UnitAppearance)
-  ))
-_sym_db.RegisterMessage(UnitAppearance)
-
-InventoryItem = _reflection.GeneratedProtocolMessageType('InventoryItem', (_message.Message,), dict(
-  DESCRIPTOR = _INVENTORYITEM,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.InventoryItem)
-  ))
-_sym_db.RegisterMessage(InventoryItem)
-
-UnitDefinition = _reflection.GeneratedProtocolMessageType('UnitDefinition', (_message.Message,), dict(
-  DESCRIPTOR = _UNITDEFINITION,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.UnitDefinition)
-  ))
-_sym_db.RegisterMessage(UnitDefinition)
-
-UnitList = _reflection.GeneratedProtocolMessageType('UnitList', (_message.Message,), dict(
-  DESCRIPTOR = _UNITLIST,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.UnitList)
-  ))
-_sym_db.RegisterMessage(UnitList)
-
-BlockRequest = _reflection.GeneratedProtocolMessageType('BlockRequest', (_message.Message,), dict(
-  DESCRIPTOR = _BLOCKREQUEST,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.BlockRequest)
-  ))
-_sym_db.RegisterMessage(BlockRequest)
-
-BlockList = _reflection.GeneratedProtocolMessageType('BlockList', (_message.Message,), dict(
-  DESCRIPTOR = _BLOCKLIST,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.BlockList)
-  ))
-_sym_db.RegisterMessage(BlockList)
-
-PlantDef = _reflection.GeneratedProtocolMessageType('PlantDef', (_message.Message,), dict(
-  DESCRIPTOR = _PLANTDEF,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.PlantDef)
-  ))
-_sym_db.RegisterMessage(PlantDef)
-
-PlantList = _reflection.GeneratedProtocolMessageType('PlantList', (_message.Message,), dict(
-  DESCRIPTOR = _PLANTLIST,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.PlantList)
-  ))
-_sym_db.RegisterMessage(PlantList)
-
-ViewInfo = _reflection.GeneratedProtocolMessageType('ViewInfo', (_message.Message,), dict(
-  DESCRIPTOR = _VIEWINFO,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.ViewInfo)
-  ))
-_sym_db.RegisterMessage(ViewInfo)
-
-MapInfo = _reflection.GeneratedProtocolMessageType('MapInfo', (_message.Message,), dict(
-  DESCRIPTOR = _MAPINFO,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.MapInfo)
-  ))
-_sym_db.RegisterMessage(MapInfo)
-
-Cloud = _reflection.GeneratedProtocolMessageType('Cloud', (_message.Message,), dict(
-  DESCRIPTOR = _CLOUD,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.Cloud)
-  ))
-_sym_db.RegisterMessage(Cloud)
-
-WorldMap = _reflection.GeneratedProtocolMessageType('WorldMap', (_message.Message,), dict(
-  DESCRIPTOR = _WORLDMAP,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.WorldMap)
-  ))
-_sym_db.RegisterMessage(WorldMap)
-
-SiteRealizationBuildingWall = _reflection.GeneratedProtocolMessageType('SiteRealizationBuildingWall', (_message.Message,), dict(
-  DESCRIPTOR = _SITEREALIZATIONBUILDINGWALL,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.SiteRealizationBuildingWall)
-  ))
-_sym_db.RegisterMessage(SiteRealizationBuildingWall)
-
-SiteRealizationBuildingTower = _reflection.GeneratedProtocolMessageType('SiteRealizationBuildingTower', (_message.Message,), dict(
-  DESCRIPTOR = _SITEREALIZATIONBUILDINGTOWER,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.SiteRealizationBuildingTower)
-  ))
-_sym_db.RegisterMessage(SiteRealizationBuildingTower)
-
-TrenchSpoke = _reflection.GeneratedProtocolMessageType('TrenchSpoke', (_message.Message,), dict(
-  DESCRIPTOR = _TRENCHSPOKE,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.TrenchSpoke)
-  ))
-_sym_db.RegisterMessage(TrenchSpoke)
-
-SiteRealizationBuildingTrenches = _reflection.GeneratedProtocolMessageType('SiteRealizationBuildingTrenches', (_message.Message,), dict(
-  DESCRIPTOR = _SITEREALIZATIONBUILDINGTRENCHES,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.SiteRealizationBuildingTrenches)
-  ))
-_sym_db.RegisterMessage(SiteRealizationBuildingTrenches)
-
-SiteRealizationBuilding = _reflection.GeneratedProtocolMessageType('SiteRealizationBuilding', (_message.Message,), dict(
-  DESCRIPTOR = _SITEREALIZATIONBUILDING,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.SiteRealizationBuilding)
-  ))
-_sym_db.RegisterMessage(SiteRealizationBuilding)
-
-RegionTile = _reflection.GeneratedProtocolMessageType('RegionTile', (_message.Message,), dict(
-  DESCRIPTOR = _REGIONTILE,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.RegionTile)
-  ))
-_sym_db.RegisterMessage(RegionTile)
-
-RegionMap = _reflection.GeneratedProtocolMessageType('RegionMap', (_message.Message,), dict(
-  DESCRIPTOR = _REGIONMAP,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.RegionMap)
-  ))
-_sym_db.RegisterMessage(RegionMap)
-
-RegionMaps = _reflection.GeneratedProtocolMessageType('RegionMaps', (_message.Message,), dict(
-  DESCRIPTOR = _REGIONMAPS,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.RegionMaps)
-  ))
-_sym_db.RegisterMessage(RegionMaps)
-
-PatternDescriptor = _reflection.GeneratedProtocolMessageType('PatternDescriptor', (_message.Message,), dict(
-  DESCRIPTOR = _PATTERNDESCRIPTOR,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.PatternDescriptor)
-  ))
-_sym_db.RegisterMessage(PatternDescriptor)
-
-ColorModifierRaw = _reflection.GeneratedProtocolMessageType('ColorModifierRaw', (_message.Message,), dict(
-  DESCRIPTOR = _COLORMODIFIERRAW,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.ColorModifierRaw)
-  ))
-_sym_db.RegisterMessage(ColorModifierRaw)
-
-BodyPartLayerRaw = _reflection.GeneratedProtocolMessageType('BodyPartLayerRaw', (_message.Message,), dict(
-  DESCRIPTOR = _BODYPARTLAYERRAW,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.BodyPartLayerRaw)
-  ))
-_sym_db.RegisterMessage(BodyPartLayerRaw)
-
-BodyPartRaw = _reflection.GeneratedProtocolMessageType('BodyPartRaw', (_message.Message,), dict(
-  DESCRIPTOR = _BODYPARTRAW,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.BodyPartRaw)
-  ))
-_sym_db.RegisterMessage(BodyPartRaw)
-
-BpAppearanceModifier = _reflection.GeneratedProtocolMessageType('BpAppearanceModifier', (_message.Message,), dict(
-  DESCRIPTOR = _BPAPPEARANCEMODIFIER,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.BpAppearanceModifier)
-  ))
-_sym_db.RegisterMessage(BpAppearanceModifier)
-
-TissueRaw = _reflection.GeneratedProtocolMessageType('TissueRaw', (_message.Message,), dict(
-  DESCRIPTOR = _TISSUERAW,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.TissueRaw)
-  ))
-_sym_db.RegisterMessage(TissueRaw)
-
-CasteRaw = _reflection.GeneratedProtocolMessageType('CasteRaw', (_message.Message,), dict(
-  DESCRIPTOR = _CASTERAW,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.CasteRaw)
-  ))
-_sym_db.RegisterMessage(CasteRaw)
-
-CreatureRaw = _reflection.GeneratedProtocolMessageType('CreatureRaw', (_message.Message,), dict(
-  DESCRIPTOR = _CREATURERAW,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.CreatureRaw)
-  ))
-_sym_db.RegisterMessage(CreatureRaw)
-
-CreatureRawList = _reflection.GeneratedProtocolMessageType('CreatureRawList', (_message.Message,), dict(
-  DESCRIPTOR = _CREATURERAWLIST,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.CreatureRawList)
-  ))
-_sym_db.RegisterMessage(CreatureRawList)
-
-Army = _reflection.GeneratedProtocolMessageType('Army', (_message.Message,), dict(
-  DESCRIPTOR = _ARMY,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.Army)
-  ))
-_sym_db.RegisterMessage(Army)
-
-ArmyList = _reflection.GeneratedProtocolMessageType('ArmyList', (_message.Message,), dict(
-  DESCRIPTOR = _ARMYLIST,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.ArmyList)
-  ))
-_sym_db.RegisterMessage(ArmyList)
-
-GrowthPrint = _reflection.GeneratedProtocolMessageType('GrowthPrint', (_message.Message,), dict(
-  DESCRIPTOR = _GROWTHPRINT,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.GrowthPrint)
-  ))
-_sym_db.RegisterMessage(GrowthPrint)
-
-TreeGrowth = _reflection.GeneratedProtocolMessageType('TreeGrowth', (_message.Message,), dict(
-  DESCRIPTOR = _TREEGROWTH,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.TreeGrowth)
-  ))
-_sym_db.RegisterMessage(TreeGrowth)
-
-PlantRaw = _reflection.GeneratedProtocolMessageType('PlantRaw', (_message.Message,), dict(
-  DESCRIPTOR = _PLANTRAW,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.PlantRaw)
-  ))
-_sym_db.RegisterMessage(PlantRaw)
-
-PlantRawList = _reflection.GeneratedProtocolMessageType('PlantRawList', (_message.Message,), dict(
-  DESCRIPTOR = _PLANTRAWLIST,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.PlantRawList)
-  ))
-_sym_db.RegisterMessage(PlantRawList)
-
-ScreenTile = _reflection.GeneratedProtocolMessageType('ScreenTile', (_message.Message,), dict(
-  DESCRIPTOR = _SCREENTILE,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.ScreenTile)
-  ))
-_sym_db.RegisterMessage(ScreenTile)
-
-ScreenCapture = _reflection.GeneratedProtocolMessageType('ScreenCapture', (_message.Message,), dict(
-  DESCRIPTOR = _SCREENCAPTURE,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.ScreenCapture)
-  ))
-_sym_db.RegisterMessage(ScreenCapture)
-
-KeyboardEvent = _reflection.GeneratedProtocolMessageType('KeyboardEvent', (_message.Message,), dict(
-  DESCRIPTOR = _KEYBOARDEVENT,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.KeyboardEvent)
-  ))
-_sym_db.RegisterMessage(KeyboardEvent)
-
-DigCommand = _reflection.GeneratedProtocolMessageType('DigCommand', (_message.Message,), dict(
-  DESCRIPTOR = _DIGCOMMAND,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.DigCommand)
-  ))
-_sym_db.RegisterMessage(DigCommand)
-
-SingleBool = _reflection.GeneratedProtocolMessageType('SingleBool', (_message.Message,), dict(
-  DESCRIPTOR = _SINGLEBOOL,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.SingleBool)
-  ))
-_sym_db.RegisterMessage(SingleBool)
-
-VersionInfo = _reflection.GeneratedProtocolMessageType('VersionInfo', (_message.Message,), dict(
-  DESCRIPTOR = _VERSIONINFO,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.VersionInfo)
-  ))
-_sym_db.RegisterMessage(VersionInfo)
-
-ListRequest = _reflection.GeneratedProtocolMessageType('ListRequest', (_message.Message,), dict(
-  DESCRIPTOR = _LISTREQUEST,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.ListRequest)
-  ))
-_sym_db.RegisterMessage(ListRequest)
-
-Report = _reflection.GeneratedProtocolMessageType('Report', (_message.Message,), dict(
-  DESCRIPTOR = _REPORT,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.Report)
-  ))
-_sym_db.RegisterMessage(Report)
-
-Status = _reflection.GeneratedProtocolMessageType('Status', (_message.Message,), dict(
-  DESCRIPTOR = _STATUS,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.Status)
-  ))
-_sym_db.RegisterMessage(Status)
-
-ShapeDescriptior = _reflection.GeneratedProtocolMessageType('ShapeDescriptior', (_message.Message,), dict(
-  DESCRIPTOR = _SHAPEDESCRIPTIOR,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.ShapeDescriptior)
-  ))
-_sym_db.RegisterMessage(ShapeDescriptior)
-
-Language = _reflection.GeneratedProtocolMessageType('Language', (_message.Message,), dict(
-  DESCRIPTOR = _LANGUAGE,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.Language)
-  ))
-_sym_db.RegisterMessage(Language)
-
-ItemImprovement = _reflection.GeneratedProtocolMessageType('ItemImprovement', (_message.Message,), dict(
-  DESCRIPTOR = _ITEMIMPROVEMENT,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.ItemImprovement)
-  ))
-_sym_db.RegisterMessage(ItemImprovement)
-
-ArtImageElement = _reflection.GeneratedProtocolMessageType('ArtImageElement', (_message.Message,), dict(
-  DESCRIPTOR = _ARTIMAGEELEMENT,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.ArtImageElement)
-  ))
-_sym_db.RegisterMessage(ArtImageElement)
-
-ArtImageProperty = _reflection.GeneratedProtocolMessageType('ArtImageProperty', (_message.Message,), dict(
-  DESCRIPTOR = _ARTIMAGEPROPERTY,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.ArtImageProperty)
-  ))
-_sym_db.RegisterMessage(ArtImageProperty)
-
-ArtImage = _reflection.GeneratedProtocolMessageType('ArtImage', (_message.Message,), dict(
-  DESCRIPTOR = _ARTIMAGE,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.ArtImage)
-  ))
-_sym_db.RegisterMessage(ArtImage)
-
-Engraving = _reflection.GeneratedProtocolMessageType('Engraving', (_message.Message,), dict(
-  DESCRIPTOR = _ENGRAVING,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.Engraving)
-  ))
-_sym_db.RegisterMessage(Engraving)
-
-FlowInfo = _reflection.GeneratedProtocolMessageType('FlowInfo', (_message.Message,), dict(
-  DESCRIPTOR = _FLOWINFO,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.FlowInfo)
-  ))
-_sym_db.RegisterMessage(FlowInfo)
-
-Wave = _reflection.GeneratedProtocolMessageType('Wave', (_message.Message,), dict(
-  DESCRIPTOR = _WAVE,
-  __module__ = 'RemoteFortressReader_pb2'
-  # @@protoc_insertion_point(class_scope:RemoteFortressReader.Wave)
-  ))
-_sym_db.RegisterMessage(Wave)
-
-
-DESCRIPTOR.has_options = True
-DESCRIPTOR._options = _descriptor._ParseOptions(descriptor_pb2.FileOptions(), _b('H\003'))
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1aRemoteFortressReader.proto\x12\x14RemoteFortressReader\x1a\x17ItemdefInstrument.proto\"(\n\x05\x43oord\x12\t\n\x01x\x18\x01 \x01(\x05\x12\t\n\x01y\x18\x02 \x01(\x05\x12\t\n\x01z\x18\x03 \x01(\x05\"\xa6\x02\n\x08Tiletype\x12\n\n\x02id\x18\x01 \x02(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0f\n\x07\x63\x61ption\x18\x03 \x01(\t\x12\x32\n\x05shape\x18\x04 \x01(\x0e\x32#.RemoteFortressReader.TiletypeShape\x12\x36\n\x07special\x18\x05 \x01(\x0e\x32%.RemoteFortressReader.TiletypeSpecial\x12\x38\n\x08material\x18\x06 \x01(\x0e\x32&.RemoteFortressReader.TiletypeMaterial\x12\x36\n\x07variant\x18\x07 \x01(\x0e\x32%.RemoteFortressReader.TiletypeVariant\x12\x11\n\tdirection\x18\x08 \x01(\t\"E\n\x0cTiletypeList\x12\x35\n\rtiletype_list\x18\x01 \x03(\x0b\x32\x1e.RemoteFortressReader.Tiletype\"_\n\x0f\x42uildingExtents\x12\r\n\x05pos_x\x18\x01 \x02(\x05\x12\r\n\x05pos_y\x18\x02 \x02(\x05\x12\r\n\x05width\x18\x03 \x02(\x05\x12\x0e\n\x06height\x18\x04 \x02(\x05\x12\x0f\n\x07\x65xtents\x18\x05 \x03(\x05\"F\n\x0c\x42uildingItem\x12(\n\x04item\x18\x01 \x01(\x0b\x32\x1a.RemoteFortressReader.Item\x12\x0c\n\x04mode\x18\x02 \x01(\x05\"\xdc\x03\n\x10\x42uildingInstance\x12\r\n\x05index\x18\x01 \x02(\x05\x12\x11\n\tpos_x_min\x18\x02 \x01(\x05\x12\x11\n\tpos_y_min\x18\x03 \x01(\x05\x12\x11\n\tpos_z_min\x18\x04 \x01(\x05\x12\x11\n\tpos_x_max\x18\x05 \x01(\x05\x12\x11\n\tpos_y_max\x18\x06 \x01(\x05\x12\x11\n\tpos_z_max\x18\x07 \x01(\x05\x12\x39\n\rbuilding_type\x18\x08 \x01(\x0b\x32\".RemoteFortressReader.BuildingType\x12/\n\x08material\x18\t \x01(\x0b\x32\x1d.RemoteFortressReader.MatPair\x12\x16\n\x0e\x62uilding_flags\x18\n \x01(\r\x12\x0f\n\x07is_room\x18\x0b \x01(\x08\x12\x33\n\x04room\x18\x0c \x01(\x0b\x32%.RemoteFortressReader.BuildingExtents\x12:\n\tdirection\x18\r \x01(\x0e\x32\'.RemoteFortressReader.BuildingDirection\x12\x31\n\x05items\x18\x0e \x03(\x0b\x32\".RemoteFortressReader.BuildingItem\x12\x0e\n\x06\x61\x63tive\x18\x0f \x01(\x05\"P\n\tRiverEdge\x12\x0f\n\x07min_pos\x18\x01 \x01(\x05\x12\x0f\n\x07max_pos\x18\x02 \x01(\x05\x12\x0e\n\x06\x61\x63tive\x18\x03 \x01(\x05\x12\x11\n\televation\x18\x04 \x01(\x05\"\xc9\x01\n\tRiverTile\x12.\n\x05north\x18\x01 \x01(\x0b\x32\x1f.RemoteFortressReader.RiverEdge\x12.\n\x05south\x18\x02 \x01(\x0b\x32\x1f.RemoteFortressReader.RiverEdge\x12-\n\x04\x65\x61st\x18\x03 \x01(\x0b\x32\x1f.RemoteFortressReader.RiverEdge\x12-\n\x04west\x18\x04 \x01(\x0b\x32\x1f.RemoteFortressReader.RiverEdge\"\xa9\x01\n\x07Spatter\x12/\n\x08material\x18\x01 \x01(\x0b\x32\x1d.RemoteFortressReader.MatPair\x12\x0e\n\x06\x61mount\x18\x02 \x01(\x05\x12\x30\n\x05state\x18\x03 \x01(\x0e\x32!.RemoteFortressReader.MatterState\x12+\n\x04item\x18\x04 \x01(\x0b\x32\x1d.RemoteFortressReader.MatPair\">\n\x0bSpatterPile\x12/\n\x08spatters\x18\x01 \x03(\x0b\x32\x1d.RemoteFortressReader.Spatter\"\x84\x04\n\x04Item\x12\n\n\x02id\x18\x01 \x01(\x05\x12(\n\x03pos\x18\x02 \x01(\x0b\x32\x1b.RemoteFortressReader.Coord\x12\x0e\n\x06\x66lags1\x18\x03 \x01(\r\x12\x0e\n\x06\x66lags2\x18\x04 \x01(\r\x12+\n\x04type\x18\x05 \x01(\x0b\x32\x1d.RemoteFortressReader.MatPair\x12/\n\x08material\x18\x06 \x01(\x0b\x32\x1d.RemoteFortressReader.MatPair\x12\x32\n\x03\x64ye\x18\x07 \x01(\x0b\x32%.RemoteFortressReader.ColorDefinition\x12\x12\n\nstack_size\x18\x08 \x01(\x05\x12\x10\n\x08subpos_x\x18\t \x01(\x02\x12\x10\n\x08subpos_y\x18\n \x01(\x02\x12\x10\n\x08subpos_z\x18\x0b \x01(\x02\x12\x12\n\nprojectile\x18\x0c \x01(\x08\x12\x12\n\nvelocity_x\x18\r \x01(\x02\x12\x12\n\nvelocity_y\x18\x0e \x01(\x02\x12\x12\n\nvelocity_z\x18\x0f \x01(\x02\x12\x0e\n\x06volume\x18\x10 \x01(\x05\x12;\n\x0cimprovements\x18\x11 \x03(\x0b\x32%.RemoteFortressReader.ItemImprovement\x12-\n\x05image\x18\x12 \x01(\x0b\x32\x1e.RemoteFortressReader.ArtImage\"\xb4\x07\n\x08MapBlock\x12\r\n\x05map_x\x18\x01 \x02(\x05\x12\r\n\x05map_y\x18\x02 \x02(\x05\x12\r\n\x05map_z\x18\x03 \x02(\x05\x12\r\n\x05tiles\x18\x04 \x03(\x05\x12\x30\n\tmaterials\x18\x05 \x03(\x0b\x32\x1d.RemoteFortressReader.MatPair\x12\x36\n\x0flayer_materials\x18\x06 \x03(\x0b\x32\x1d.RemoteFortressReader.MatPair\x12\x35\n\x0evein_materials\x18\x07 \x03(\x0b\x32\x1d.RemoteFortressReader.MatPair\x12\x35\n\x0e\x62\x61se_materials\x18\x08 \x03(\x0b\x32\x1d.RemoteFortressReader.MatPair\x12\r\n\x05magma\x18\t \x03(\x05\x12\r\n\x05water\x18\n \x03(\x05\x12\x0e\n\x06hidden\x18\x0b \x03(\x08\x12\r\n\x05light\x18\x0c \x03(\x08\x12\x14\n\x0csubterranean\x18\r \x03(\x08\x12\x0f\n\x07outside\x18\x0e \x03(\x08\x12\x0f\n\x07\x61quifer\x18\x0f \x03(\x08\x12\x16\n\x0ewater_stagnant\x18\x10 \x03(\x08\x12\x12\n\nwater_salt\x18\x11 \x03(\x08\x12\x39\n\x12\x63onstruction_items\x18\x12 \x03(\x0b\x32\x1d.RemoteFortressReader.MatPair\x12\x39\n\tbuildings\x18\x13 \x03(\x0b\x32&.RemoteFortressReader.BuildingInstance\x12\x14\n\x0ctree_percent\x18\x14 \x03(\x05\x12\x0e\n\x06tree_x\x18\x15 \x03(\x05\x12\x0e\n\x06tree_y\x18\x16 \x03(\x05\x12\x0e\n\x06tree_z\x18\x17 \x03(\x05\x12\x46\n\x14tile_dig_designation\x18\x18 \x03(\x0e\x32(.RemoteFortressReader.TileDigDesignation\x12\x36\n\x0bspatterPile\x18\x19 \x03(\x0b\x32!.RemoteFortressReader.SpatterPile\x12)\n\x05items\x18\x1a \x03(\x0b\x32\x1a.RemoteFortressReader.Item\x12#\n\x1btile_dig_designation_marker\x18\x1b \x03(\x08\x12!\n\x19tile_dig_designation_auto\x18\x1c \x03(\x08\x12\x15\n\rgrass_percent\x18\x1d \x03(\x05\x12-\n\x05\x66lows\x18\x1e \x03(\x0b\x32\x1e.RemoteFortressReader.FlowInfo\".\n\x07MatPair\x12\x10\n\x08mat_type\x18\x01 \x02(\x05\x12\x11\n\tmat_index\x18\x02 \x02(\x05\";\n\x0f\x43olorDefinition\x12\x0b\n\x03red\x18\x01 \x02(\x05\x12\r\n\x05green\x18\x02 \x02(\x05\x12\x0c\n\x04\x62lue\x18\x03 \x02(\x05\"\xd1\x01\n\x12MaterialDefinition\x12/\n\x08mat_pair\x18\x01 \x02(\x0b\x32\x1d.RemoteFortressReader.MatPair\x12\n\n\x02id\x18\x02 \x01(\t\x12\x0c\n\x04name\x18\x03 \x01(\t\x12:\n\x0bstate_color\x18\x04 \x01(\x0b\x32%.RemoteFortressReader.ColorDefinition\x12\x34\n\ninstrument\x18\x05 \x01(\x0b\x32 .ItemdefInstrument.InstrumentDef\"X\n\x0c\x42uildingType\x12\x15\n\rbuilding_type\x18\x01 \x02(\x05\x12\x18\n\x10\x62uilding_subtype\x18\x02 \x02(\x05\x12\x17\n\x0f\x62uilding_custom\x18\x03 \x02(\x05\"i\n\x12\x42uildingDefinition\x12\x39\n\rbuilding_type\x18\x01 \x02(\x0b\x32\".RemoteFortressReader.BuildingType\x12\n\n\x02id\x18\x02 \x01(\t\x12\x0c\n\x04name\x18\x03 \x01(\t\"O\n\x0c\x42uildingList\x12?\n\rbuilding_list\x18\x01 \x03(\x0b\x32(.RemoteFortressReader.BuildingDefinition\"O\n\x0cMaterialList\x12?\n\rmaterial_list\x18\x01 \x03(\x0b\x32(.RemoteFortressReader.MaterialDefinition\"F\n\x04Hair\x12\x0e\n\x06length\x18\x01 \x01(\x05\x12.\n\x05style\x18\x02 \x01(\x0e\x32\x1f.RemoteFortressReader.HairStyle\"\x81\x01\n\x0c\x42odySizeInfo\x12\x10\n\x08size_cur\x18\x01 \x01(\x05\x12\x11\n\tsize_base\x18\x02 \x01(\x05\x12\x10\n\x08\x61rea_cur\x18\x03 \x01(\x05\x12\x11\n\tarea_base\x18\x04 \x01(\x05\x12\x12\n\nlength_cur\x18\x05 \x01(\x05\x12\x13\n\x0blength_base\x18\x06 \x01(\x05\"\x98\x02\n\x0eUnitAppearance\x12\x16\n\x0e\x62ody_modifiers\x18\x01 \x03(\x05\x12\x14\n\x0c\x62p_modifiers\x18\x02 \x03(\x05\x12\x15\n\rsize_modifier\x18\x03 \x01(\x05\x12\x0e\n\x06\x63olors\x18\x04 \x03(\x05\x12(\n\x04hair\x18\x05 \x01(\x0b\x32\x1a.RemoteFortressReader.Hair\x12)\n\x05\x62\x65\x61rd\x18\x06 \x01(\x0b\x32\x1a.RemoteFortressReader.Hair\x12-\n\tmoustache\x18\x07 \x01(\x0b\x32\x1a.RemoteFortressReader.Hair\x12-\n\tsideburns\x18\x08 \x01(\x0b\x32\x1a.RemoteFortressReader.Hair\"l\n\rInventoryItem\x12\x31\n\x04mode\x18\x01 \x01(\x0e\x32#.RemoteFortressReader.InventoryMode\x12(\n\x04item\x18\x02 \x01(\x0b\x32\x1a.RemoteFortressReader.Item\"\xe3\x04\n\x0eUnitDefinition\x12\n\n\x02id\x18\x01 \x02(\x05\x12\x0f\n\x07isValid\x18\x02 \x01(\x08\x12\r\n\x05pos_x\x18\x03 \x01(\x05\x12\r\n\x05pos_y\x18\x04 \x01(\x05\x12\r\n\x05pos_z\x18\x05 \x01(\x05\x12+\n\x04race\x18\x06 \x01(\x0b\x32\x1d.RemoteFortressReader.MatPair\x12?\n\x10profession_color\x18\x07 \x01(\x0b\x32%.RemoteFortressReader.ColorDefinition\x12\x0e\n\x06\x66lags1\x18\x08 \x01(\r\x12\x0e\n\x06\x66lags2\x18\t \x01(\r\x12\x0e\n\x06\x66lags3\x18\n \x01(\r\x12\x12\n\nis_soldier\x18\x0b \x01(\x08\x12\x35\n\tsize_info\x18\x0c \x01(\x0b\x32\".RemoteFortressReader.BodySizeInfo\x12\x0c\n\x04name\x18\r \x01(\t\x12\x11\n\tblood_max\x18\x0e \x01(\x05\x12\x13\n\x0b\x62lood_count\x18\x0f \x01(\x05\x12\x38\n\nappearance\x18\x10 \x01(\x0b\x32$.RemoteFortressReader.UnitAppearance\x12\x15\n\rprofession_id\x18\x11 \x01(\x05\x12\x17\n\x0fnoble_positions\x18\x12 \x03(\t\x12\x10\n\x08rider_id\x18\x13 \x01(\x05\x12\x36\n\tinventory\x18\x14 \x03(\x0b\x32#.RemoteFortressReader.InventoryItem\x12\x10\n\x08subpos_x\x18\x15 \x01(\x02\x12\x10\n\x08subpos_y\x18\x16 \x01(\x02\x12\x10\n\x08subpos_z\x18\x17 \x01(\x02\"G\n\x08UnitList\x12;\n\rcreature_list\x18\x01 \x03(\x0b\x32$.RemoteFortressReader.UnitDefinition\"\x7f\n\x0c\x42lockRequest\x12\x15\n\rblocks_needed\x18\x01 \x01(\x05\x12\r\n\x05min_x\x18\x02 \x01(\x05\x12\r\n\x05max_x\x18\x03 \x01(\x05\x12\r\n\x05min_y\x18\x04 \x01(\x05\x12\r\n\x05max_y\x18\x05 \x01(\x05\x12\r\n\x05min_z\x18\x06 \x01(\x05\x12\r\n\x05max_z\x18\x07 \x01(\x05\"\xc3\x01\n\tBlockList\x12\x32\n\nmap_blocks\x18\x01 \x03(\x0b\x32\x1e.RemoteFortressReader.MapBlock\x12\r\n\x05map_x\x18\x02 \x01(\x05\x12\r\n\x05map_y\x18\x03 \x01(\x05\x12\x33\n\nengravings\x18\x04 \x03(\x0b\x32\x1f.RemoteFortressReader.Engraving\x12/\n\x0bocean_waves\x18\x05 \x03(\x0b\x32\x1a.RemoteFortressReader.Wave\"F\n\x08PlantDef\x12\r\n\x05pos_x\x18\x01 \x02(\x05\x12\r\n\x05pos_y\x18\x02 \x02(\x05\x12\r\n\x05pos_z\x18\x03 \x02(\x05\x12\r\n\x05index\x18\x04 \x02(\x05\"?\n\tPlantList\x12\x32\n\nplant_list\x18\x01 \x03(\x0b\x32\x1e.RemoteFortressReader.PlantDef\"\xea\x01\n\x08ViewInfo\x12\x12\n\nview_pos_x\x18\x01 \x01(\x05\x12\x12\n\nview_pos_y\x18\x02 \x01(\x05\x12\x12\n\nview_pos_z\x18\x03 \x01(\x05\x12\x13\n\x0bview_size_x\x18\x04 \x01(\x05\x12\x13\n\x0bview_size_y\x18\x05 \x01(\x05\x12\x14\n\x0c\x63ursor_pos_x\x18\x06 \x01(\x05\x12\x14\n\x0c\x63ursor_pos_y\x18\x07 \x01(\x05\x12\x14\n\x0c\x63ursor_pos_z\x18\x08 \x01(\x05\x12\x1a\n\x0e\x66ollow_unit_id\x18\t \x01(\x05:\x02-1\x12\x1a\n\x0e\x66ollow_item_id\x18\n \x01(\x05:\x02-1\"\xcd\x01\n\x07MapInfo\x12\x14\n\x0c\x62lock_size_x\x18\x01 \x01(\x05\x12\x14\n\x0c\x62lock_size_y\x18\x02 \x01(\x05\x12\x14\n\x0c\x62lock_size_z\x18\x03 \x01(\x05\x12\x13\n\x0b\x62lock_pos_x\x18\x04 \x01(\x05\x12\x13\n\x0b\x62lock_pos_y\x18\x05 \x01(\x05\x12\x13\n\x0b\x62lock_pos_z\x18\x06 \x01(\x05\x12\x12\n\nworld_name\x18\x07 \x01(\t\x12\x1a\n\x12world_name_english\x18\x08 \x01(\t\x12\x11\n\tsave_name\x18\t \x01(\t\"\xdb\x01\n\x05\x43loud\x12.\n\x05\x66ront\x18\x01 \x01(\x0e\x32\x1f.RemoteFortressReader.FrontType\x12\x32\n\x07\x63umulus\x18\x02 \x01(\x0e\x32!.RemoteFortressReader.CumulusType\x12\x0e\n\x06\x63irrus\x18\x03 \x01(\x08\x12\x32\n\x07stratus\x18\x04 \x01(\x0e\x32!.RemoteFortressReader.StratusType\x12*\n\x03\x66og\x18\x05 \x01(\x0e\x32\x1d.RemoteFortressReader.FogType\"\xea\x04\n\x08WorldMap\x12\x13\n\x0bworld_width\x18\x01 \x02(\x05\x12\x14\n\x0cworld_height\x18\x02 \x02(\x05\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\x14\n\x0cname_english\x18\x04 \x01(\t\x12\x11\n\televation\x18\x05 \x03(\x05\x12\x10\n\x08rainfall\x18\x06 \x03(\x05\x12\x12\n\nvegetation\x18\x07 \x03(\x05\x12\x13\n\x0btemperature\x18\x08 \x03(\x05\x12\x10\n\x08\x65vilness\x18\t \x03(\x05\x12\x10\n\x08\x64rainage\x18\n \x03(\x05\x12\x11\n\tvolcanism\x18\x0b \x03(\x05\x12\x10\n\x08savagery\x18\x0c \x03(\x05\x12+\n\x06\x63louds\x18\r \x03(\x0b\x32\x1b.RemoteFortressReader.Cloud\x12\x10\n\x08salinity\x18\x0e \x03(\x05\x12\r\n\x05map_x\x18\x0f \x01(\x05\x12\r\n\x05map_y\x18\x10 \x01(\x05\x12\x10\n\x08\x63\x65nter_x\x18\x11 \x01(\x05\x12\x10\n\x08\x63\x65nter_y\x18\x12 \x01(\x05\x12\x10\n\x08\x63\x65nter_z\x18\x13 \x01(\x05\x12\x10\n\x08\x63ur_year\x18\x14 \x01(\x05\x12\x15\n\rcur_year_tick\x18\x15 \x01(\x05\x12\x35\n\x0bworld_poles\x18\x16 \x01(\x0e\x32 .RemoteFortressReader.WorldPoles\x12\x34\n\x0briver_tiles\x18\x17 \x03(\x0b\x32\x1f.RemoteFortressReader.RiverTile\x12\x17\n\x0fwater_elevation\x18\x18 \x03(\x05\x12\x36\n\x0cregion_tiles\x18\x19 \x03(\x0b\x32 .RemoteFortressReader.RegionTile\"}\n\x1bSiteRealizationBuildingWall\x12\x0f\n\x07start_x\x18\x01 \x01(\x05\x12\x0f\n\x07start_y\x18\x02 \x01(\x05\x12\x0f\n\x07start_z\x18\x03 \x01(\x05\x12\r\n\x05\x65nd_x\x18\x04 \x01(\x05\x12\r\n\x05\x65nd_y\x18\x05 \x01(\x05\x12\r\n\x05\x65nd_z\x18\x06 \x01(\x05\"M\n\x1cSiteRealizationBuildingTower\x12\x0e\n\x06roof_z\x18\x01 \x01(\x05\x12\r\n\x05round\x18\x02 \x01(\x08\x12\x0e\n\x06goblin\x18\x03 \x01(\x08\"_\n\x0bTrenchSpoke\x12\x13\n\x0bmound_start\x18\x01 \x01(\x05\x12\x14\n\x0ctrench_start\x18\x02 \x01(\x05\x12\x12\n\ntrench_end\x18\x03 \x01(\x05\x12\x11\n\tmound_end\x18\x04 \x01(\x05\"T\n\x1fSiteRealizationBuildingTrenches\x12\x31\n\x06spokes\x18\x01 \x03(\x0b\x32!.RemoteFortressReader.TrenchSpoke\"\xad\x03\n\x17SiteRealizationBuilding\x12\n\n\x02id\x18\x01 \x01(\x05\x12?\n\x04type\x18\x02 \x01(\x0e\x32\x31.RemoteFortressReader.SiteRealizationBuildingType\x12\r\n\x05min_x\x18\x03 \x01(\x05\x12\r\n\x05min_y\x18\x04 \x01(\x05\x12\r\n\x05max_x\x18\x05 \x01(\x05\x12\r\n\x05max_y\x18\x06 \x01(\x05\x12/\n\x08material\x18\x07 \x01(\x0b\x32\x1d.RemoteFortressReader.MatPair\x12\x44\n\twall_info\x18\x08 \x01(\x0b\x32\x31.RemoteFortressReader.SiteRealizationBuildingWall\x12\x46\n\ntower_info\x18\t \x01(\x0b\x32\x32.RemoteFortressReader.SiteRealizationBuildingTower\x12J\n\x0btrench_info\x18\n \x01(\x0b\x32\x35.RemoteFortressReader.SiteRealizationBuildingTrenches\"\xb4\x04\n\nRegionTile\x12\x11\n\televation\x18\x01 \x01(\x05\x12\x10\n\x08rainfall\x18\x02 \x01(\x05\x12\x12\n\nvegetation\x18\x03 \x01(\x05\x12\x13\n\x0btemperature\x18\x04 \x01(\x05\x12\x10\n\x08\x65vilness\x18\x05 \x01(\x05\x12\x10\n\x08\x64rainage\x18\x06 \x01(\x05\x12\x11\n\tvolcanism\x18\x07 \x01(\x05\x12\x10\n\x08savagery\x18\x08 \x01(\x05\x12\x10\n\x08salinity\x18\t \x01(\x05\x12\x34\n\x0briver_tiles\x18\n \x01(\x0b\x32\x1f.RemoteFortressReader.RiverTile\x12\x17\n\x0fwater_elevation\x18\x0b \x01(\x05\x12\x37\n\x10surface_material\x18\x0c \x01(\x0b\x32\x1d.RemoteFortressReader.MatPair\x12\x36\n\x0fplant_materials\x18\r \x03(\x0b\x32\x1d.RemoteFortressReader.MatPair\x12@\n\tbuildings\x18\x0e \x03(\x0b\x32-.RemoteFortressReader.SiteRealizationBuilding\x12\x36\n\x0fstone_materials\x18\x0f \x03(\x0b\x32\x1d.RemoteFortressReader.MatPair\x12\x35\n\x0etree_materials\x18\x10 \x03(\x0b\x32\x1d.RemoteFortressReader.MatPair\x12\x0c\n\x04snow\x18\x11 \x01(\x05\"~\n\tRegionMap\x12\r\n\x05map_x\x18\x01 \x01(\x05\x12\r\n\x05map_y\x18\x02 \x01(\x05\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\x14\n\x0cname_english\x18\x04 \x01(\t\x12/\n\x05tiles\x18\x05 \x03(\x0b\x32 .RemoteFortressReader.RegionTile\"v\n\nRegionMaps\x12\x32\n\nworld_maps\x18\x01 \x03(\x0b\x32\x1e.RemoteFortressReader.WorldMap\x12\x34\n\x0bregion_maps\x18\x02 \x03(\x0b\x32\x1f.RemoteFortressReader.RegionMap\"\x8a\x01\n\x11PatternDescriptor\x12\n\n\x02id\x18\x01 \x01(\t\x12\x35\n\x06\x63olors\x18\x02 \x03(\x0b\x32%.RemoteFortressReader.ColorDefinition\x12\x32\n\x07pattern\x18\x03 \x01(\x0e\x32!.RemoteFortressReader.PatternType\"\xb0\x01\n\x10\x43olorModifierRaw\x12\x39\n\x08patterns\x18\x01 \x03(\x0b\x32\'.RemoteFortressReader.PatternDescriptor\x12\x14\n\x0c\x62ody_part_id\x18\x02 \x03(\x05\x12\x17\n\x0ftissue_layer_id\x18\x03 \x03(\x05\x12\x12\n\nstart_date\x18\x04 \x01(\x05\x12\x10\n\x08\x65nd_date\x18\x05 \x01(\x05\x12\x0c\n\x04part\x18\x06 \x01(\t\"d\n\x10\x42odyPartLayerRaw\x12\x12\n\nlayer_name\x18\x01 \x01(\t\x12\x11\n\ttissue_id\x18\x02 \x01(\x05\x12\x13\n\x0blayer_depth\x18\x03 \x01(\x05\x12\x14\n\x0c\x62p_modifiers\x18\x04 \x03(\x05\"\x96\x01\n\x0b\x42odyPartRaw\x12\r\n\x05token\x18\x01 \x01(\t\x12\x10\n\x08\x63\x61tegory\x18\x02 \x01(\t\x12\x0e\n\x06parent\x18\x03 \x01(\x05\x12\r\n\x05\x66lags\x18\x04 \x03(\x08\x12\x36\n\x06layers\x18\x05 \x03(\x0b\x32&.RemoteFortressReader.BodyPartLayerRaw\x12\x0f\n\x07relsize\x18\x06 \x01(\x05\"F\n\x14\x42pAppearanceModifier\x12\x0c\n\x04type\x18\x01 \x01(\t\x12\x0f\n\x07mod_min\x18\x02 \x01(\x05\x12\x0f\n\x07mod_max\x18\x03 \x01(\x05\"u\n\tTissueRaw\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12/\n\x08material\x18\x03 \x01(\x0b\x32\x1d.RemoteFortressReader.MatPair\x12\x1d\n\x15subordinate_to_tissue\x18\x04 \x01(\t\"\xf7\x03\n\x08\x43\x61steRaw\x12\r\n\x05index\x18\x01 \x01(\x05\x12\x10\n\x08\x63\x61ste_id\x18\x02 \x01(\t\x12\x12\n\ncaste_name\x18\x03 \x03(\t\x12\x11\n\tbaby_name\x18\x04 \x03(\t\x12\x12\n\nchild_name\x18\x05 \x03(\t\x12\x0e\n\x06gender\x18\x06 \x01(\x05\x12\x35\n\nbody_parts\x18\x07 \x03(\x0b\x32!.RemoteFortressReader.BodyPartRaw\x12\x15\n\rtotal_relsize\x18\x08 \x01(\x05\x12=\n\tmodifiers\x18\t \x03(\x0b\x32*.RemoteFortressReader.BpAppearanceModifier\x12\x14\n\x0cmodifier_idx\x18\n \x03(\x05\x12\x10\n\x08part_idx\x18\x0b \x03(\x05\x12\x11\n\tlayer_idx\x18\x0c \x03(\x05\x12M\n\x19\x62ody_appearance_modifiers\x18\r \x03(\x0b\x32*.RemoteFortressReader.BpAppearanceModifier\x12?\n\x0f\x63olor_modifiers\x18\x0e \x03(\x0b\x32&.RemoteFortressReader.ColorModifierRaw\x12\x13\n\x0b\x64\x65scription\x18\x0f \x01(\t\x12\x12\n\nadult_size\x18\x10 \x01(\x05\"\xd6\x02\n\x0b\x43reatureRaw\x12\r\n\x05index\x18\x01 \x01(\x05\x12\x13\n\x0b\x63reature_id\x18\x02 \x01(\t\x12\x0c\n\x04name\x18\x03 \x03(\t\x12\x19\n\x11general_baby_name\x18\x04 \x03(\t\x12\x1a\n\x12general_child_name\x18\x05 \x03(\t\x12\x15\n\rcreature_tile\x18\x06 \x01(\x05\x12\x1d\n\x15\x63reature_soldier_tile\x18\x07 \x01(\x05\x12\x34\n\x05\x63olor\x18\x08 \x01(\x0b\x32%.RemoteFortressReader.ColorDefinition\x12\x11\n\tadultsize\x18\t \x01(\x05\x12-\n\x05\x63\x61ste\x18\n \x03(\x0b\x32\x1e.RemoteFortressReader.CasteRaw\x12\x30\n\x07tissues\x18\x0b \x03(\x0b\x32\x1f.RemoteFortressReader.TissueRaw\"K\n\x0f\x43reatureRawList\x12\x38\n\rcreature_raws\x18\x01 \x03(\x0b\x32!.RemoteFortressReader.CreatureRaw\"\xbb\x01\n\x04\x41rmy\x12\n\n\x02id\x18\x01 \x01(\x05\x12\r\n\x05pos_x\x18\x02 \x01(\x05\x12\r\n\x05pos_y\x18\x03 \x01(\x05\x12\r\n\x05pos_z\x18\x04 \x01(\x05\x12\x34\n\x06leader\x18\x05 \x01(\x0b\x32$.RemoteFortressReader.UnitDefinition\x12\x35\n\x07members\x18\x06 \x03(\x0b\x32$.RemoteFortressReader.UnitDefinition\x12\r\n\x05\x66lags\x18\x07 \x01(\r\"6\n\x08\x41rmyList\x12*\n\x06\x61rmies\x18\x01 \x03(\x0b\x32\x1a.RemoteFortressReader.Army\"f\n\x0bGrowthPrint\x12\x10\n\x08priority\x18\x01 \x01(\x05\x12\r\n\x05\x63olor\x18\x02 \x01(\x05\x12\x14\n\x0ctiming_start\x18\x03 \x01(\x05\x12\x12\n\ntiming_end\x18\x04 \x01(\x05\x12\x0c\n\x04tile\x18\x05 \x01(\x05\"\xef\x02\n\nTreeGrowth\x12\r\n\x05index\x18\x01 \x01(\x05\x12\n\n\x02id\x18\x02 \x01(\t\x12\x0c\n\x04name\x18\x03 \x01(\t\x12*\n\x03mat\x18\x04 \x01(\x0b\x32\x1d.RemoteFortressReader.MatPair\x12\x31\n\x06prints\x18\x05 \x03(\x0b\x32!.RemoteFortressReader.GrowthPrint\x12\x14\n\x0ctiming_start\x18\x06 \x01(\x05\x12\x12\n\ntiming_end\x18\x07 \x01(\x05\x12\r\n\x05twigs\x18\x08 \x01(\x08\x12\x16\n\x0elight_branches\x18\t \x01(\x08\x12\x16\n\x0eheavy_branches\x18\n \x01(\x08\x12\r\n\x05trunk\x18\x0b \x01(\x08\x12\r\n\x05roots\x18\x0c \x01(\x08\x12\x0b\n\x03\x63\x61p\x18\r \x01(\x08\x12\x0f\n\x07sapling\x18\x0e \x01(\x08\x12\x1a\n\x12trunk_height_start\x18\x0f \x01(\x05\x12\x18\n\x10trunk_height_end\x18\x10 \x01(\x05\"t\n\x08PlantRaw\x12\r\n\x05index\x18\x01 \x01(\x05\x12\n\n\x02id\x18\x02 \x01(\t\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\x31\n\x07growths\x18\x04 \x03(\x0b\x32 .RemoteFortressReader.TreeGrowth\x12\x0c\n\x04tile\x18\x05 \x01(\x05\"B\n\x0cPlantRawList\x12\x32\n\nplant_raws\x18\x01 \x03(\x0b\x32\x1e.RemoteFortressReader.PlantRaw\"G\n\nScreenTile\x12\x11\n\tcharacter\x18\x01 \x01(\r\x12\x12\n\nforeground\x18\x02 \x01(\r\x12\x12\n\nbackground\x18\x03 \x01(\r\"_\n\rScreenCapture\x12\r\n\x05width\x18\x01 \x01(\r\x12\x0e\n\x06height\x18\x02 \x01(\r\x12/\n\x05tiles\x18\x03 \x03(\x0b\x32 .RemoteFortressReader.ScreenTile\"x\n\rKeyboardEvent\x12\x0c\n\x04type\x18\x01 \x01(\r\x12\r\n\x05which\x18\x02 \x01(\r\x12\r\n\x05state\x18\x03 \x01(\r\x12\x10\n\x08scancode\x18\x04 \x01(\r\x12\x0b\n\x03sym\x18\x05 \x01(\r\x12\x0b\n\x03mod\x18\x06 \x01(\r\x12\x0f\n\x07unicode\x18\x07 \x01(\r\"{\n\nDigCommand\x12=\n\x0b\x64\x65signation\x18\x01 \x01(\x0e\x32(.RemoteFortressReader.TileDigDesignation\x12.\n\tlocations\x18\x02 \x03(\x0b\x32\x1b.RemoteFortressReader.Coord\"\x1b\n\nSingleBool\x12\r\n\x05Value\x18\x01 \x01(\x08\"m\n\x0bVersionInfo\x12\x1e\n\x16\x64warf_fortress_version\x18\x01 \x01(\t\x12\x16\n\x0e\x64\x66hack_version\x18\x02 \x01(\t\x12&\n\x1eremote_fortress_reader_version\x18\x03 \x01(\t\"3\n\x0bListRequest\x12\x12\n\nlist_start\x18\x01 \x01(\x05\x12\x10\n\x08list_end\x18\x02 \x01(\x05\"\x95\x02\n\x06Report\x12\x0c\n\x04type\x18\x01 \x01(\x05\x12\x0c\n\x04text\x18\x02 \x01(\t\x12\x34\n\x05\x63olor\x18\x03 \x01(\x0b\x32%.RemoteFortressReader.ColorDefinition\x12\x10\n\x08\x64uration\x18\x04 \x01(\x05\x12\x14\n\x0c\x63ontinuation\x18\x05 \x01(\x08\x12\x13\n\x0bunconscious\x18\x06 \x01(\x08\x12\x14\n\x0c\x61nnouncement\x18\x07 \x01(\x08\x12\x14\n\x0crepeat_count\x18\x08 \x01(\x05\x12(\n\x03pos\x18\t \x01(\x0b\x32\x1b.RemoteFortressReader.Coord\x12\n\n\x02id\x18\n \x01(\x05\x12\x0c\n\x04year\x18\x0b \x01(\x05\x12\x0c\n\x04time\x18\x0c \x01(\x05\"7\n\x06Status\x12-\n\x07reports\x18\x01 \x03(\x0b\x32\x1c.RemoteFortressReader.Report\",\n\x10ShapeDescriptior\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04tile\x18\x02 \x01(\x05\"B\n\x08Language\x12\x36\n\x06shapes\x18\x01 \x03(\x0b\x32&.RemoteFortressReader.ShapeDescriptior\"\xcc\x01\n\x0fItemImprovement\x12/\n\x08material\x18\x01 \x01(\x0b\x32\x1d.RemoteFortressReader.MatPair\x12\x33\n\x04type\x18\x02 \x01(\x0e\x32%.RemoteFortressReader.ImprovementType\x12\r\n\x05shape\x18\x03 \x01(\x05\x12\x15\n\rspecific_type\x18\x04 \x01(\x05\x12-\n\x05image\x18\x05 \x01(\x0b\x32\x1e.RemoteFortressReader.ArtImage\"\xcc\x01\n\x0f\x41rtImageElement\x12\r\n\x05\x63ount\x18\x01 \x01(\x05\x12\x37\n\x04type\x18\x02 \x01(\x0e\x32).RemoteFortressReader.ArtImageElementType\x12\x34\n\rcreature_item\x18\x03 \x01(\x0b\x32\x1d.RemoteFortressReader.MatPair\x12/\n\x08material\x18\x05 \x01(\x0b\x32\x1d.RemoteFortressReader.MatPair\x12\n\n\x02id\x18\x06 \x01(\x05\"\x9f\x01\n\x10\x41rtImageProperty\x12\x0f\n\x07subject\x18\x01 \x01(\x05\x12\x0e\n\x06object\x18\x02 \x01(\x05\x12\x30\n\x04verb\x18\x03 \x01(\x0e\x32\".RemoteFortressReader.ArtImageVerb\x12\x38\n\x04type\x18\x04 \x01(\x0e\x32*.RemoteFortressReader.ArtImagePropertyType\"\xaa\x01\n\x08\x41rtImage\x12\x37\n\x08\x65lements\x18\x01 \x03(\x0b\x32%.RemoteFortressReader.ArtImageElement\x12)\n\x02id\x18\x02 \x01(\x0b\x32\x1d.RemoteFortressReader.MatPair\x12:\n\nproperties\x18\x03 \x03(\x0b\x32&.RemoteFortressReader.ArtImageProperty\"\xa8\x02\n\tEngraving\x12(\n\x03pos\x18\x01 \x01(\x0b\x32\x1b.RemoteFortressReader.Coord\x12\x0f\n\x07quality\x18\x02 \x01(\x05\x12\x0c\n\x04tile\x18\x03 \x01(\x05\x12-\n\x05image\x18\x04 \x01(\x0b\x32\x1e.RemoteFortressReader.ArtImage\x12\r\n\x05\x66loor\x18\x05 \x01(\x08\x12\x0c\n\x04west\x18\x06 \x01(\x08\x12\x0c\n\x04\x65\x61st\x18\x07 \x01(\x08\x12\r\n\x05north\x18\x08 \x01(\x08\x12\r\n\x05south\x18\t \x01(\x08\x12\x0e\n\x06hidden\x18\n \x01(\x08\x12\x11\n\tnorthwest\x18\x0b \x01(\x08\x12\x11\n\tnortheast\x18\x0c \x01(\x08\x12\x11\n\tsouthwest\x18\r \x01(\x08\x12\x11\n\tsoutheast\x18\x0e \x01(\x08\"\xbf\x02\n\x08\x46lowInfo\x12\r\n\x05index\x18\x01 \x01(\x05\x12,\n\x04type\x18\x02 \x01(\x0e\x32\x1e.RemoteFortressReader.FlowType\x12\x0f\n\x07\x64\x65nsity\x18\x03 \x01(\x05\x12(\n\x03pos\x18\x04 \x01(\x0b\x32\x1b.RemoteFortressReader.Coord\x12)\n\x04\x64\x65st\x18\x05 \x01(\x0b\x32\x1b.RemoteFortressReader.Coord\x12\x11\n\texpanding\x18\x06 \x01(\x08\x12\r\n\x05reuse\x18\x07 \x01(\x08\x12\x10\n\x08guide_id\x18\x08 \x01(\x05\x12/\n\x08material\x18\t \x01(\x0b\x32\x1d.RemoteFortressReader.MatPair\x12+\n\x04item\x18\n \x01(\x0b\x32\x1d.RemoteFortressReader.MatPair\"[\n\x04Wave\x12)\n\x04\x64\x65st\x18\x01 \x01(\x0b\x32\x1b.RemoteFortressReader.Coord\x12(\n\x03pos\x18\x02 \x01(\x0b\x32\x1b.RemoteFortressReader.Coord*\xba\x02\n\rTiletypeShape\x12\x15\n\x08NO_SHAPE\x10\xff\xff\xff\xff\xff\xff\xff\xff\xff\x01\x12\t\n\x05\x45MPTY\x10\x00\x12\t\n\x05\x46LOOR\x10\x01\x12\x0b\n\x07\x42OULDER\x10\x02\x12\x0b\n\x07PEBBLES\x10\x03\x12\x08\n\x04WALL\x10\x04\x12\x11\n\rFORTIFICATION\x10\x05\x12\x0c\n\x08STAIR_UP\x10\x06\x12\x0e\n\nSTAIR_DOWN\x10\x07\x12\x10\n\x0cSTAIR_UPDOWN\x10\x08\x12\x08\n\x04RAMP\x10\t\x12\x0c\n\x08RAMP_TOP\x10\n\x12\r\n\tBROOK_BED\x10\x0b\x12\r\n\tBROOK_TOP\x10\x0c\x12\x0e\n\nTREE_SHAPE\x10\r\x12\x0b\n\x07SAPLING\x10\x0e\x12\t\n\x05SHRUB\x10\x0f\x12\x0f\n\x0b\x45NDLESS_PIT\x10\x10\x12\n\n\x06\x42RANCH\x10\x11\x12\x10\n\x0cTRUNK_BRANCH\x10\x12\x12\x08\n\x04TWIG\x10\x13*\xc4\x01\n\x0fTiletypeSpecial\x12\x17\n\nNO_SPECIAL\x10\xff\xff\xff\xff\xff\xff\xff\xff\xff\x01\x12\n\n\x06NORMAL\x10\x00\x12\x10\n\x0cRIVER_SOURCE\x10\x01\x12\r\n\tWATERFALL\x10\x02\x12\n\n\x06SMOOTH\x10\x03\x12\x0c\n\x08\x46URROWED\x10\x04\x12\x07\n\x03WET\x10\x05\x12\x08\n\x04\x44\x45\x41\x44\x10\x06\x12\n\n\x06WORN_1\x10\x07\x12\n\n\x06WORN_2\x10\x08\x12\n\n\x06WORN_3\x10\t\x12\t\n\x05TRACK\x10\n\x12\x0f\n\x0bSMOOTH_DEAD\x10\x0b*\x8a\x03\n\x10TiletypeMaterial\x12\x18\n\x0bNO_MATERIAL\x10\xff\xff\xff\xff\xff\xff\xff\xff\xff\x01\x12\x07\n\x03\x41IR\x10\x00\x12\x08\n\x04SOIL\x10\x01\x12\t\n\x05STONE\x10\x02\x12\x0b\n\x07\x46\x45\x41TURE\x10\x03\x12\x0e\n\nLAVA_STONE\x10\x04\x12\x0b\n\x07MINERAL\x10\x05\x12\x11\n\rFROZEN_LIQUID\x10\x06\x12\x10\n\x0c\x43ONSTRUCTION\x10\x07\x12\x0f\n\x0bGRASS_LIGHT\x10\x08\x12\x0e\n\nGRASS_DARK\x10\t\x12\r\n\tGRASS_DRY\x10\n\x12\x0e\n\nGRASS_DEAD\x10\x0b\x12\t\n\x05PLANT\x10\x0c\x12\x07\n\x03HFS\x10\r\x12\x0c\n\x08\x43\x41MPFIRE\x10\x0e\x12\x08\n\x04\x46IRE\x10\x0f\x12\t\n\x05\x41SHES\x10\x10\x12\t\n\x05MAGMA\x10\x11\x12\r\n\tDRIFTWOOD\x10\x12\x12\x08\n\x04POOL\x10\x13\x12\t\n\x05\x42ROOK\x10\x14\x12\t\n\x05RIVER\x10\x15\x12\x08\n\x04ROOT\x10\x16\x12\x11\n\rTREE_MATERIAL\x10\x17\x12\x0c\n\x08MUSHROOM\x10\x18\x12\x13\n\x0fUNDERWORLD_GATE\x10\x19*V\n\x0fTiletypeVariant\x12\x17\n\nNO_VARIANT\x10\xff\xff\xff\xff\xff\xff\xff\xff\xff\x01\x12\t\n\x05VAR_1\x10\x00\x12\t\n\x05VAR_2\x10\x01\x12\t\n\x05VAR_3\x10\x02\x12\t\n\x05VAR_4\x10\x03*J\n\nWorldPoles\x12\x0c\n\x08NO_POLES\x10\x00\x12\x0e\n\nNORTH_POLE\x10\x01\x12\x0e\n\nSOUTH_POLE\x10\x02\x12\x0e\n\nBOTH_POLES\x10\x03*G\n\x11\x42uildingDirection\x12\t\n\x05NORTH\x10\x00\x12\x08\n\x04\x45\x41ST\x10\x01\x12\t\n\x05SOUTH\x10\x02\x12\x08\n\x04WEST\x10\x03\x12\x08\n\x04NONE\x10\x04*\x8d\x01\n\x12TileDigDesignation\x12\n\n\x06NO_DIG\x10\x00\x12\x0f\n\x0b\x44\x45\x46\x41ULT_DIG\x10\x01\x12\x15\n\x11UP_DOWN_STAIR_DIG\x10\x02\x12\x0f\n\x0b\x43HANNEL_DIG\x10\x03\x12\x0c\n\x08RAMP_DIG\x10\x04\x12\x12\n\x0e\x44OWN_STAIR_DIG\x10\x05\x12\x10\n\x0cUP_STAIR_DIG\x10\x06*u\n\tHairStyle\x12\x14\n\x07UNKEMPT\x10\xff\xff\xff\xff\xff\xff\xff\xff\xff\x01\x12\x11\n\rNEATLY_COMBED\x10\x00\x12\x0b\n\x07\x42RAIDED\x10\x01\x12\x10\n\x0c\x44OUBLE_BRAID\x10\x02\x12\x0e\n\nPONY_TAILS\x10\x03\x12\x10\n\x0c\x43LEAN_SHAVEN\x10\x04*\x9c\x01\n\rInventoryMode\x12\n\n\x06Hauled\x10\x00\x12\n\n\x06Weapon\x10\x01\x12\x08\n\x04Worn\x10\x02\x12\x0c\n\x08Piercing\x10\x03\x12\t\n\x05\x46lask\x10\x04\x12\x11\n\rWrappedAround\x10\x05\x12\x0b\n\x07StuckIn\x10\x06\x12\x0b\n\x07InMouth\x10\x07\x12\x07\n\x03Pet\x10\x08\x12\x0c\n\x08SewnInto\x10\t\x12\x0c\n\x08Strapped\x10\n*Q\n\x0bMatterState\x12\t\n\x05Solid\x10\x00\x12\n\n\x06Liquid\x10\x01\x12\x07\n\x03Gas\x10\x02\x12\n\n\x06Powder\x10\x03\x12\t\n\x05Paste\x10\x04\x12\x0b\n\x07Pressed\x10\x05*O\n\tFrontType\x12\x0e\n\nFRONT_NONE\x10\x00\x12\x0e\n\nFRONT_WARM\x10\x01\x12\x0e\n\nFRONT_COLD\x10\x02\x12\x12\n\x0e\x46RONT_OCCLUDED\x10\x03*Z\n\x0b\x43umulusType\x12\x10\n\x0c\x43UMULUS_NONE\x10\x00\x12\x12\n\x0e\x43UMULUS_MEDIUM\x10\x01\x12\x11\n\rCUMULUS_MULTI\x10\x02\x12\x12\n\x0e\x43UMULUS_NIMBUS\x10\x03*Y\n\x0bStratusType\x12\x10\n\x0cSTRATUS_NONE\x10\x00\x12\x10\n\x0cSTRATUS_ALTO\x10\x01\x12\x12\n\x0eSTRATUS_PROPER\x10\x02\x12\x12\n\x0eSTRATUS_NIMBUS\x10\x03*D\n\x07\x46ogType\x12\x0c\n\x08\x46OG_NONE\x10\x00\x12\x0c\n\x08\x46OG_MIST\x10\x01\x12\x0e\n\nFOG_NORMAL\x10\x02\x12\r\n\tF0G_THICK\x10\x03*\xf8\x02\n\x1bSiteRealizationBuildingType\x12\x10\n\x0c\x63ottage_plot\x10\x00\x12\x0f\n\x0b\x63\x61stle_wall\x10\x01\x12\x10\n\x0c\x63\x61stle_tower\x10\x02\x12\x14\n\x10\x63\x61stle_courtyard\x10\x03\x12\t\n\x05house\x10\x04\x12\n\n\x06temple\x10\x05\x12\x08\n\x04tomb\x10\x06\x12\x0e\n\nshop_house\x10\x07\x12\r\n\twarehouse\x10\x08\x12\x11\n\rmarket_square\x10\t\x12\x0b\n\x07pasture\x10\n\x12\t\n\x05waste\x10\x0b\x12\r\n\tcourtyard\x10\x0c\x12\x08\n\x04well\x10\r\x12\t\n\x05vault\x10\x0e\x12\x0f\n\x0bgreat_tower\x10\x0f\x12\x0c\n\x08trenches\x10\x10\x12\x0e\n\ntree_house\x10\x11\x12\x11\n\rhillock_house\x10\x12\x12\r\n\tmead_hall\x10\x13\x12\x15\n\x11\x66ortress_entrance\x10\x14\x12\x0b\n\x07library\x10\x15\x12\n\n\x06tavern\x10\x16*]\n\x0bPatternType\x12\x0c\n\x08MONOTONE\x10\x00\x12\x0b\n\x07STRIPES\x10\x01\x12\x0c\n\x08IRIS_EYE\x10\x02\x12\t\n\x05SPOTS\x10\x03\x12\r\n\tPUPIL_EYE\x10\x04\x12\x0b\n\x07MOTTLED\x10\x05*\xd0\x01\n\x0fImprovementType\x12\r\n\tART_IMAGE\x10\x00\x12\x0b\n\x07\x43OVERED\x10\x01\x12\x11\n\rRINGS_HANGING\x10\x02\x12\t\n\x05\x42\x41NDS\x10\x03\x12\n\n\x06SPIKES\x10\x04\x12\x10\n\x0cITEMSPECIFIC\x10\x05\x12\n\n\x06THREAD\x10\x06\x12\t\n\x05\x43LOTH\x10\x07\x12\x0e\n\nSEWN_IMAGE\x10\x08\x12\t\n\x05PAGES\x10\t\x12\x10\n\x0cILLUSTRATION\x10\n\x12\x14\n\x10INSTRUMENT_PIECE\x10\x0b\x12\x0b\n\x07WRITING\x10\x0c*k\n\x13\x41rtImageElementType\x12\x12\n\x0eIMAGE_CREATURE\x10\x00\x12\x0f\n\x0bIMAGE_PLANT\x10\x01\x12\x0e\n\nIMAGE_TREE\x10\x02\x12\x0f\n\x0bIMAGE_SHAPE\x10\x03\x12\x0e\n\nIMAGE_ITEM\x10\x04*B\n\x14\x41rtImagePropertyType\x12\x13\n\x0fTRANSITIVE_VERB\x10\x00\x12\x15\n\x11INTRANSITIVE_VERB\x10\x01*\x95\x08\n\x0c\x41rtImageVerb\x12\x12\n\x0eVERB_WITHERING\x10\x00\x12\x15\n\x11VERB_SURROUNDEDBY\x10\x01\x12\x13\n\x0fVERB_MASSACRING\x10\x02\x12\x11\n\rVERB_FIGHTING\x10\x03\x12\x11\n\rVERB_LABORING\x10\x04\x12\x11\n\rVERB_GREETING\x10\x05\x12\x11\n\rVERB_REFUSING\x10\x06\x12\x11\n\rVERB_SPEAKING\x10\x07\x12\x12\n\x0eVERB_EMBRACING\x10\x08\x12\x15\n\x11VERB_STRIKINGDOWN\x10\t\x12\x15\n\x11VERB_MENACINGPOSE\x10\n\x12\x12\n\x0eVERB_TRAVELING\x10\x0b\x12\x10\n\x0cVERB_RAISING\x10\x0c\x12\x0f\n\x0bVERB_HIDING\x10\r\x12\x18\n\x14VERB_LOOKINGCONFUSED\x10\x0e\x12\x19\n\x15VERB_LOOKINGTERRIFIED\x10\x0f\x12\x12\n\x0eVERB_DEVOURING\x10\x10\x12\x11\n\rVERB_ADMIRING\x10\x11\x12\x10\n\x0cVERB_BURNING\x10\x12\x12\x10\n\x0cVERB_WEEPING\x10\x13\x12\x18\n\x14VERB_LOOKINGDEJECTED\x10\x14\x12\x11\n\rVERB_CRINGING\x10\x15\x12\x12\n\x0eVERB_SCREAMING\x10\x16\x12\x1a\n\x16VERB_SUBMISSIVEGESTURE\x10\x17\x12\x16\n\x12VERB_FETALPOSITION\x10\x18\x12\x1a\n\x16VERB_SMEAREDINTOSPIRAL\x10\x19\x12\x10\n\x0cVERB_FALLING\x10\x1a\x12\r\n\tVERB_DEAD\x10\x1b\x12\x11\n\rVERB_LAUGHING\x10\x1c\x12\x18\n\x14VERB_LOOKINGOFFENDED\x10\x1d\x12\x12\n\x0eVERB_BEINGSHOT\x10\x1e\x12\x19\n\x15VERB_PLAINTIVEGESTURE\x10\x1f\x12\x10\n\x0cVERB_MELTING\x10 \x12\x11\n\rVERB_SHOOTING\x10!\x12\x12\n\x0eVERB_TORTURING\x10\"\x12\x1e\n\x1aVERB_COMMITTINGDEPRAVEDACT\x10#\x12\x10\n\x0cVERB_PRAYING\x10$\x12\x16\n\x12VERB_CONTEMPLATING\x10%\x12\x10\n\x0cVERB_COOKING\x10&\x12\x12\n\x0eVERB_ENGRAVING\x10\'\x12\x14\n\x10VERB_PROSTRATING\x10(\x12\x12\n\x0eVERB_SUFFERING\x10)\x12\x15\n\x11VERB_BEINGIMPALED\x10*\x12\x17\n\x13VERB_BEINGCONTORTED\x10+\x12\x14\n\x10VERB_BEINGFLAYED\x10,\x12\x14\n\x10VERB_HANGINGFROM\x10-\x12\x17\n\x13VERB_BEINGMUTILATED\x10.\x12\x17\n\x13VERB_TRIUMPHANTPOSE\x10/*\xe0\x01\n\x08\x46lowType\x12\n\n\x06Miasma\x10\x00\x12\t\n\x05Steam\x10\x01\x12\x08\n\x04Mist\x10\x02\x12\x10\n\x0cMaterialDust\x10\x03\x12\r\n\tMagmaMist\x10\x04\x12\t\n\x05Smoke\x10\x05\x12\x0e\n\nDragonfire\x10\x06\x12\x08\n\x04\x46ire\x10\x07\x12\x07\n\x03Web\x10\x08\x12\x0f\n\x0bMaterialGas\x10\t\x12\x11\n\rMaterialVapor\x10\n\x12\r\n\tOceanWave\x10\x0b\x12\x0b\n\x07SeaFoam\x10\x0c\x12\r\n\tItemCloud\x10\r\x12\x15\n\x08\x43\x61mpFire\x10\xff\xff\xff\xff\xff\xff\xff\xff\xff\x01\x42\x02H\x03')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'dfhack_rpc.proto.RemoteFortressReader_pb2', globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  DESCRIPTOR._serialized_options = b'H\003'
+  _TILETYPESHAPE._serialized_start=13604
+  _TILETYPESHAPE._serialized_end=13918
+  _TILETYPESPECIAL._serialized_start=13921
+  _TILETYPESPECIAL._serialized_end=14117
+  _TILETYPEMATERIAL._serialized_start=14120
+  _TILETYPEMATERIAL._serialized_end=14514
+  _TILETYPEVARIANT._serialized_start=14516
+  _TILETYPEVARIANT._serialized_end=14602
+  _WORLDPOLES._serialized_start=14604
+  _WORLDPOLES._serialized_end=14678
+  _BUILDINGDIRECTION._serialized_start=14680
+  _BUILDINGDIRECTION._serialized_end=14751
+  _TILEDIGDESIGNATION._serialized_start=14754
+  _TILEDIGDESIGNATION._serialized_end=14895
+  _HAIRSTYLE._serialized_start=14897
+  _HAIRSTYLE._serialized_end=15014
+  _INVENTORYMODE._serialized_start=15017
+  _INVENTORYMODE._serialized_end=15173
+  _MATTERSTATE._serialized_start=15175
+  _MATTERSTATE._serialized_end=15256
+  _FRONTTYPE._serialized_start=15258
+  _FRONTTYPE._serialized_end=15337
+  _CUMULUSTYPE._serialized_start=15339
+  _CUMULUSTYPE._serialized_end=15429
+  _STRATUSTYPE._serialized_start=15431
+  _STRATUSTYPE._serialized_end=15520
+  _FOGTYPE._serialized_start=15522
+  _FOGTYPE._serialized_end=15590
+  _SITEREALIZATIONBUILDINGTYPE._serialized_start=15593
+  _SITEREALIZATIONBUILDINGTYPE._serialized_end=15969
+  _PATTERNTYPE._serialized_start=15971
+  _PATTERNTYPE._serialized_end=16064
+  _IMPROVEMENTTYPE._serialized_start=16067
+  _IMPROVEMENTTYPE._serialized_end=16275
+  _ARTIMAGEELEMENTTYPE._serialized_start=16277
+  _ARTIMAGEELEMENTTYPE._serialized_end=16384
+  _ARTIMAGEPROPERTYTYPE._serialized_start=16386
+  _ARTIMAGEPROPERTYTYPE._serialized_end=16452
+  _ARTIMAGEVERB._serialized_start=16455
+  _ARTIMAGEVERB._serialized_end=17500
+  _FLOWTYPE._serialized_start=17503
+  _FLOWTYPE._serialized_end=17727
+  _COORD._serialized_start=77
+  _COORD._serialized_end=117
+  _TILETYPE._serialized_start=120
+  _TILETYPE._serialized_end=414
+  _TILETYPELIST._serialized_start=416
+  _TILETYPELIST._serialized_end=485
+  _BUILDINGEXTENTS._serialized_start=487
+  _BUILDINGEXTENTS._serialized_end=582
+  _BUILDINGITEM._serialized_start=584
+  _BUILDINGITEM._serialized_end=654
+  _BUILDINGINSTANCE._serialized_start=657
+  _BUILDINGINSTANCE._serialized_end=1133
+  _RIVEREDGE._serialized_start=1135
+  _RIVEREDGE._serialized_end=1215
+  _RIVERTILE._serialized_start=1218
+  _RIVERTILE._serialized_end=1419
+  _SPATTER._serialized_start=1422
+  _SPATTER._serialized_end=1591
+  _SPATTERPILE._serialized_start=1593
+  _SPATTERPILE._serialized_end=1655
+  _ITEM._serialized_start=1658
+  _ITEM._serialized_end=2174
+  _MAPBLOCK._serialized_start=2177
+  _MAPBLOCK._serialized_end=3125
+  _MATPAIR._serialized_start=3127
+  _MATPAIR._serialized_end=3173
+  _COLORDEFINITION._serialized_start=3175
+  _COLORDEFINITION._serialized_end=3234
+  _MATERIALDEFINITION._serialized_start=3237
+  _MATERIALDEFINITION._serialized_end=3446
+  _BUILDINGTYPE._serialized_start=3448
+  _BUILDINGTYPE._serialized_end=3536
+  _BUILDINGDEFINITION._serialized_start=3538
+  _BUILDINGDEFINITION._serialized_end=3643
+  _BUILDINGLIST._serialized_start=3645
+  _BUILDINGLIST._serialized_end=3724
+  _MATERIALLIST._serialized_start=3726
+  _MATERIALLIST._serialized_end=3805
+  _HAIR._serialized_start=3807
+  _HAIR._serialized_end=3877
+  _BODYSIZEINFO._serialized_start=3880
+  _BODYSIZEINFO._serialized_end=4009
+  _UNITAPPEARANCE._serialized_start=4012
+  _UNITAPPEARANCE._serialized_end=4292
+  _INVENTORYITEM._serialized_start=4294
+  _INVENTORYITEM._serialized_end=4402
+  _UNITDEFINITION._serialized_start=4405
+  _UNITDEFINITION._serialized_end=5016
+  _UNITLIST._serialized_start=5018
+  _UNITLIST._serialized_end=5089
+  _BLOCKREQUEST._serialized_start=5091
+  _BLOCKREQUEST._serialized_end=5218
+  _BLOCKLIST._serialized_start=5221
+  _BLOCKLIST._serialized_end=5416
+  _PLANTDEF._serialized_start=5418
+  _PLANTDEF._serialized_end=5488
+  _PLANTLIST._serialized_start=5490
+  _PLANTLIST._serialized_end=5553
+  _VIEWINFO._serialized_start=5556
+  _VIEWINFO._serialized_end=5790
+  _MAPINFO._serialized_start=5793
+  _MAPINFO._serialized_end=5998
+  _CLOUD._serialized_start=6001
+  _CLOUD._serialized_end=6220
+  _WORLDMAP._serialized_start=6223
+  _WORLDMAP._serialized_end=6841
+  _SITEREALIZATIONBUILDINGWALL._serialized_start=6843
+  _SITEREALIZATIONBUILDINGWALL._serialized_end=6968
+  _SITEREALIZATIONBUILDINGTOWER._serialized_start=6970
+  _SITEREALIZATIONBUILDINGTOWER._serialized_end=7047
+  _TRENCHSPOKE._serialized_start=7049
+  _TRENCHSPOKE._serialized_end=7144
+  _SITEREALIZATIONBUILDINGTRENCHES._serialized_start=7146
+  _SITEREALIZATIONBUILDINGTRENCHES._serialized_end=7230
+  _SITEREALIZATIONBUILDING._serialized_start=7233
+  _SITEREALIZATIONBUILDING._serialized_end=7662
+  _REGIONTILE._serialized_start=7665
+  _REGIONTILE._serialized_end=8229
+  _REGIONMAP._serialized_start=8231
+  _REGIONMAP._serialized_end=8357
+  _REGIONMAPS._serialized_start=8359
+  _REGIONMAPS._serialized_end=8477
+  _PATTERNDESCRIPTOR._serialized_start=8480
+  _PATTERNDESCRIPTOR._serialized_end=8618
+  _COLORMODIFIERRAW._serialized_start=8621
+  _COLORMODIFIERRAW._serialized_end=8797
+  _BODYPARTLAYERRAW._serialized_start=8799
+  _BODYPARTLAYERRAW._serialized_end=8899
+  _BODYPARTRAW._serialized_start=8902
+  _BODYPARTRAW._serialized_end=9052
+  _BPAPPEARANCEMODIFIER._serialized_start=9054
+  _BPAPPEARANCEMODIFIER._serialized_end=9124
+  _TISSUERAW._serialized_start=9126
+  _TISSUERAW._serialized_end=9243
+  _CASTERAW._serialized_start=9246
+  _CASTERAW._serialized_end=9749
+  _CREATURERAW._serialized_start=9752
+  _CREATURERAW._serialized_end=10094
+  _CREATURERAWLIST._serialized_start=10096
+  _CREATURERAWLIST._serialized_end=10171
+  _ARMY._serialized_start=10174
+  _ARMY._serialized_end=10361
+  _ARMYLIST._serialized_start=10363
+  _ARMYLIST._serialized_end=10417
+  _GROWTHPRINT._serialized_start=10419
+  _GROWTHPRINT._serialized_end=10521
+  _TREEGROWTH._serialized_start=10524
+  _TREEGROWTH._serialized_end=10891
+  _PLANTRAW._serialized_start=10893
+  _PLANTRAW._serialized_end=11009
+  _PLANTRAWLIST._serialized_start=11011
+  _PLANTRAWLIST._serialized_end=11077
+  _SCREENTILE._serialized_start=11079
+  _SCREENTILE._serialized_end=11150
+  _SCREENCAPTURE._serialized_start=11152
+  _SCREENCAPTURE._serialized_end=11247
+  _KEYBOARDEVENT._serialized_start=11249
+  _KEYBOARDEVENT._serialized_end=11369
+  _DIGCOMMAND._serialized_start=11371
+  _DIGCOMMAND._serialized_end=11494
+  _SINGLEBOOL._serialized_start=11496
+  _SINGLEBOOL._serialized_end=11523
+  _VERSIONINFO._serialized_start=11525
+  _VERSIONINFO._serialized_end=11634
+  _LISTREQUEST._serialized_start=11636
+  _LISTREQUEST._serialized_end=11687
+  _REPORT._serialized_start=11690
+  _REPORT._serialized_end=11967
+  _STATUS._serialized_start=11969
+  _STATUS._serialized_end=12024
+  _SHAPEDESCRIPTIOR._serialized_start=12026
+  _SHAPEDESCRIPTIOR._serialized_end=12070
+  _LANGUAGE._serialized_start=12072
+  _LANGUAGE._serialized_end=12138
+  _ITEMIMPROVEMENT._serialized_start=12141
+  _ITEMIMPROVEMENT._serialized_end=12345
+  _ARTIMAGEELEMENT._serialized_start=12348
+  _ARTIMAGEELEMENT._serialized_end=12552
+  _ARTIMAGEPROPERTY._serialized_start=12555
+  _ARTIMAGEPROPERTY._serialized_end=12714
+  _ARTIMAGE._serialized_start=12717
+  _ARTIMAGE._serialized_end=12887
+  _ENGRAVING._serialized_start=12890
+  _ENGRAVING._serialized_end=13186
+  _FLOWINFO._serialized_start=13189
+  _FLOWINFO._serialized_end=13508
+  _WAVE._serialized_start=13510
+  _WAVE._serialized_end=13601
 # @@protoc_insertion_point(module_scope)
@@ -5,27 +5,104 @@
 #   https://github.com/DFHack/dfhack/tree/master/library/proto
 #   https://github.com/DFHack/dfhack/tree/master/plugins/proto
 #
-# install compiler:
-#   sudo apt install protobuf-compiler
+# install compiler (protoc >= 3.20, older versions generate pure Python descriptors, which don't use
+# upb / C++ protobuf runtime):
+#   pip install grpcio-tools
 #
 # compile:
-#   protoc -I=./raw_proto --python_out=./ ./raw_proto/*.proto
+#   python -m grpc_tools.protoc -I=./raw_proto --python_out=./ ./raw_proto/*.proto
 #
 # fix imports:
 #   import ItemdefInstrument_pb2 as ItemdefInstrument__pb2
 #   from . import ItemdefInstrument_pb2 as ItemdefInstrument__pb2
 #
+# fix module names:
+#   _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'rename_pb2', globals())
+#   _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'dfhack_rpc.proto.rename_pb2', globals())
+#
 
 from google.protobuf import symbol_database
+from google.protobuf.internal import api_implementation
+
+import importlib
 
 proto_db = symbol_database.Default()
 
+# core protocol, needed by every connection
 from . import Basic_pb2
 from . import BasicApi_pb2
 from . import CoreProtocol_pb2
 
-from . import AdventureControl_pb2
-from . import ItemdefInstrument_pb2
-from . import rename_pb2
-from . import isoworldremote_pb2
-from . import RemoteFortressReader_pb2
+# plugin modules are imported on first use, see load_module
+# package: module
+PLUGIN_MODULES = {
+    'RemoteFortressReader': 'RemoteFortressReader_pb2',
+    'AdventureControl': 'AdventureControl_pb2',
+    'isoworldremote': 'isoworldremote_pb2',
+    'ItemdefInstrument': 'ItemdefInstrument_pb2',
+    'dfproto': 'rename_pb2',
+}
+
+# full name: message class
+_classes = {}
+
+
+def load_module(full_name):
+    """
+    Imports plugin module defining given message or enum. If another thread is importing the module,
+    waits until it's done.
+    :param full_name: full name, eg. 'RemoteFortressReader.BlockList'
+    :return: True if there is plugin module for the package
+    """
+    module = PLUGIN_MODULES.get(full_name.split('.', 1)[0])
+    if module is None:
+        return False
+    importlib.import_module('.' + module, __name__)
+    return True
+
+
+def load_all():
+    """
+    Imports all plugin modules
+    """
+    for module in sorted(set(PLUGIN_MODULES.values())):
+        importlib.import_module('.' + module, __name__)
+
+
+def get_proto(full_name):
+    """
+    :param full_name: full name of message, eg. 'RemoteFortressReader.BlockList'
+    :return: message class, resolved only once
+    """
+    try:
+        return _classes[full_name]
+    except KeyError:
+        pass
+    try:
+        data_cls = proto_db.GetSymbol(full_name)
+    except KeyError:
+        if not load_module(full_name):
+            raise
+        data_cls = proto_db.GetSymbol(full_name)
+    _classes[full_name] = data_cls
+    return data_cls
+
+
+def get_enum(full_name):
+    """
+    :param full_name: full name of enum, eg. 'RemoteFortressReader.TileDigDesignation'
+    :return: EnumDescriptor
+    """
+    try:
+        return proto_db.pool.FindEnumTypeByName(full_name)
+    except KeyError:
+        if not load_module(full_name):
+            raise
+        return proto_db.pool.FindEnumTypeByName(full_name)
+
+
+def backend():
+    """
+    :return: protobuf runtime used for parsing and serialization: 'upb', 'cpp' or 'python'
+    """
+    return api_implementation.Type()
@@ -1,14 +1,11 @@
+# -*- coding: utf-8 -*-
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
 # source: isoworldremote.proto
-
-import sys
-_b=sys.version_info[0]<3 and (lambda x:x) or (lambda x:x.encode('latin1'))
-from google.protobuf.internal import enum_type_wrapper
+"""Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
 from google.protobuf import descriptor as _descriptor
-from google.protobuf import message as _message
-from google.protobuf import reflection as _reflection
+from google.protobuf import descriptor_pool as _descriptor_pool
 from google.protobuf import symbol_database as _symbol_database
-from google.protobuf import descriptor_pb2
 # @@protoc_insertion_point(imports)
 
 _sym_db = _symbol_database.Default()
@@ -16,564 +13,38 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor.FileDescriptor(
-  name='isoworldremote.proto',
-  package='isoworldremote',
-  syntax='proto2',
-  serialized_pb=_b('\n\x14isoworldremote.proto\x12\x0eisoworldremote\";\n\x0f\x43olorDefinition\x12\x0b\n\x03red\x18\x01 \x02(\x05\x12\r\n\x05green\x18\x02 \x02(\x05\x12\x0c\n\x04\x62lue\x18\x03 \x02(\x05\"\xe0\x01\n\x0f\x45mbarkTileLayer\x12\x39\n\x0emat_type_table\x18\x04 \x03(\x0e\x32\x1d.isoworldremote.BasicMaterialB\x02\x10\x01\x12\x1d\n\x11mat_subtype_table\x18\x05 \x03(\x05\x42\x02\x10\x01\x12\x38\n\x10tile_shape_table\x18\x06 \x03(\x0e\x32\x1a.isoworldremote.BasicShapeB\x02\x10\x01\x12\x39\n\x10tile_color_table\x18\x07 \x03(\x0b\x32\x1f.isoworldremote.ColorDefinition\"\xb4\x01\n\nEmbarkTile\x12\x0f\n\x07world_x\x18\x01 \x02(\x05\x12\x0f\n\x07world_y\x18\x02 \x02(\x05\x12\x0f\n\x07world_z\x18\x03 \x02(\x11\x12\x33\n\ntile_layer\x18\x04 \x03(\x0b\x32\x1f.isoworldremote.EmbarkTileLayer\x12\x14\n\x0c\x63urrent_year\x18\x05 \x01(\x05\x12\x16\n\x0e\x63urrent_season\x18\x06 \x01(\x05\x12\x10\n\x08is_valid\x18\x07 \x01(\x08\"-\n\x0bTileRequest\x12\x0e\n\x06want_x\x18\x01 \x01(\x05\x12\x0e\n\x06want_y\x18\x02 \x01(\x05\"!\n\nMapRequest\x12\x13\n\x0bsave_folder\x18\x01 \x01(\t\"\x9d\x01\n\x08MapReply\x12\x11\n\tavailable\x18\x01 \x02(\x08\x12\x10\n\x08region_x\x18\x02 \x01(\x05\x12\x10\n\x08region_y\x18\x03 \x01(\x05\x12\x15\n\rregion_size_x\x18\x04 \x01(\x05\x12\x15\n\rregion_size_y\x18\x05 \x01(\x05\x12\x14\n\x0c\x63urrent_year\x18\x06 \x01(\x05\x12\x16\n\x0e\x63urrent_season\x18\x07 \x01(\x05\"A\n\x08RawNames\x12\x11\n\tavailable\x18\x01 \x02(\x08\x12\x11\n\tinorganic\x18\x02 \x03(\t\x12\x0f\n\x07organic\x18\x03 \x03(\t*S\n\rBasicMaterial\x12\x07\n\x03\x41IR\x10\x00\x12\t\n\x05OTHER\x10\x01\x12\r\n\tINORGANIC\x10\x02\x12\n\n\x06LIQUID\x10\x03\x12\t\n\x05PLANT\x10\x04\x12\x08\n\x04WOOD\x10\x05*+\n\nLiquidType\x12\x07\n\x03ICE\x10\x00\x12\t\n\x05WATER\x10\x01\x12\t\n\x05MAGMA\x10\x02*Q\n\nBasicShape\x12\x08\n\x04NONE\x10\x00\x12\x08\n\x04OPEN\x10\x01\x12\x08\n\x04WALL\x10\x03\x12\t\n\x05\x46LOOR\x10\x04\x12\x0b\n\x07RAMP_UP\x10\x05\x12\r\n\tRAMP_DOWN\x10\x06\x42\x02H\x03')
-)
-_sym_db.RegisterFileDescriptor(DESCRIPTOR)
-
-_BASICMATERIAL = _descriptor.EnumDescriptor(
-  name='BasicMaterial',
-  full_name='isoworldremote.BasicMaterial',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='AIR', index=0, number=0,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='OTHER', index=1, number=1,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='INORGANIC', index=2, number=2,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='LIQUID', index=3, number=3,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='PLANT', index=4, number=4,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='WOOD', index=5, number=5,
-      options=None,
-      type=None),
-  ],
-  containing_type=None,
-  options=None,
-  serialized_start=820,
-  serialized_end=903,
-)
-_sym_db.RegisterEnumDescriptor(_BASICMATERIAL)
-
-BasicMaterial = enum_type_wrapper.EnumTypeWrapper(_BASICMATERIAL)
-_LIQUIDTYPE = _descriptor.EnumDescriptor(
-  name='LiquidType',
-  full_name='isoworldremote.LiquidType',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='ICE', index=0, number=0,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='WATER', index=1, number=1,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='MAGMA', index=2, number=2,
-      options=None,
-      type=None),
-  ],
-  containing_type=None,
-  options=None,
-  serialized_start=905,
-  serialized_end=948,
-)
-_sym_db.RegisterEnumDescriptor(_LIQUIDTYPE)
-
-LiquidType = enum_type_wrapper.EnumTypeWrapper(_LIQUIDTYPE)
-_BASICSHAPE = _descriptor.EnumDescriptor(
-  name='BasicShape',
-  full_name='isoworldremote.BasicShape',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='NONE', index=0, number=0,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='OPEN', index=1, number=1,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='WALL', index=2, number=3,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='FLOOR', index=3, number=4,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='RAMP_UP', index=4, number=5,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='RAMP_DOWN', index=5, number=6,
-      options=None,
-      type=None),
-  ],
-  containing_type=None,
-  options=None,
-  serialized_start=950,
-  serialized_end=1031,
-)
-_sym_db.RegisterEnumDescriptor(_BASICSHAPE)
-
-BasicShape = enum_type_wrapper.EnumTypeWrapper(_BASICSHAPE)
-AIR = 0
-OTHER = 1
-INORGANIC = 2
-LIQUID = 3
-PLANT = 4
-WOOD = 5
-ICE = 0
-WATER = 1
-MAGMA = 2
-NONE = 0
-OPEN = 1
-WALL = 3
-FLOOR = 4
-RAMP_UP = 5
-RAMP_DOWN = 6
-
-
-
-_COLORDEFINITION = _descriptor.Descriptor(
-  name='ColorDefinition',
-  full_name='isoworldremote.ColorDefinition',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='red', full_name='isoworldremote.ColorDefinition.red', index=0,
-      number=1, type=5, cpp_type=1, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='green', full_name='isoworldremote.ColorDefinition.green', index=1,
-      number=2, type=5, cpp_type=1, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='blue', full_name='isoworldremote.ColorDefinition.blue', index=2,
-      number=3, type=5, cpp_type=1, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=40,
-  serialized_end=99,
-)
-
-
-_EMBARKTILELAYER = _descriptor.Descriptor(
-  name='EmbarkTileLayer',
-  full_name='isoworldremote.EmbarkTileLayer',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='mat_type_table', full_name='isoworldremote.EmbarkTileLayer.mat_type_table', index=0,
-      number=4, type=14, cpp_type=8, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\020\001'))),
-    _descriptor.FieldDescriptor(
-      name='mat_subtype_table', full_name='isoworldremote.EmbarkTileLayer.mat_subtype_table', index=1,
-      number=5, type=5, cpp_type=1, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\020\001'))),
-    _descriptor.FieldDescriptor(
-      name='tile_shape_table', full_name='isoworldremote.EmbarkTileLayer.tile_shape_table', index=2,
-      number=6, type=14, cpp_type=8, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\020\001'))),
-    _descriptor.FieldDescriptor(
-      name='tile_color_table', full_name='isoworldremote.EmbarkTileLayer.tile_color_table', index=3,
-      number=7, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=102,
-  serialized_end=326,
-)
-
-
-_EMBARKTILE = _descriptor.Descriptor(
-  name='EmbarkTile',
-  full_name='isoworldremote.EmbarkTile',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='world_x', full_name='isoworldremote.EmbarkTile.world_x', index=0,
-      number=1, type=5, cpp_type=1, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='world_y', full_name='isoworldremote.EmbarkTile.world_y', index=1,
-      number=2, type=5, cpp_type=1, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='world_z', full_name='isoworldremote.EmbarkTile.world_z', index=2,
-      number=3, type=17, cpp_type=1, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='tile_layer', full_name='isoworldremote.EmbarkTile.tile_layer', index=3,
-      number=4, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='current_year', full_name='isoworldremote.EmbarkTile.current_year', index=4,
-      number=5, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='current_season', full_name='isoworldremote.EmbarkTile.current_season', index=5,
-      number=6, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='is_valid', full_name='isoworldremote.EmbarkTile.is_valid', index=6,
-      number=7, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=329,
-  serialized_end=509,
-)
-
-
-_TILEREQUEST = _descriptor.Descriptor(
-  name='TileRequest',
-  full_name='isoworldremote.TileRequest',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='want_x', full_name='isoworldremote.TileRequest.want_x', index=0,
-      number=1, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='want_y', full_name='isoworldremote.TileRequest.want_y', index=1,
-      number=2, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=511,
-  serialized_end=556,
-)
-
-
-_MAPREQUEST = _descriptor.Descriptor(
-  name='MapRequest',
-  full_name='isoworldremote.MapRequest',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='save_folder', full_name='isoworldremote.MapRequest.save_folder', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=558,
-  serialized_end=591,
-)
-
-
-_MAPREPLY = _descriptor.Descriptor(
-  name='MapReply',
-  full_name='isoworldremote.MapReply',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='available', full_name='isoworldremote.MapReply.available', index=0,
-      number=1, type=8, cpp_type=7, label=2,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='region_x', full_name='isoworldremote.MapReply.region_x', index=1,
-      number=2, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='region_y', full_name='isoworldremote.MapReply.region_y', index=2,
-      number=3, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='region_size_x', full_name='isoworldremote.MapReply.region_size_x', index=3,
-      number=4, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='region_size_y', full_name='isoworldremote.MapReply.region_size_y', index=4,
-      number=5, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='current_year', full_name='isoworldremote.MapReply.current_year', index=5,
-      number=6, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='current_season', full_name='isoworldremote.MapReply.current_season', index=6,
-      number=7, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=594,
-  serialized_end=751,
-)
-
-
-_RAWNAMES = _descriptor.Descriptor(
-  name='RawNames',
-  full_name='isoworldremote.RawNames',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='available', full_name='isoworldremote.RawNames.available', index=0,
-      number=1, type=8, cpp_type=7, label=2,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='inorganic', full_name='isoworldremote.RawNames.inorganic', index=1,
-      number=2, type=9, cpp_type=9, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='organic', full_name='isoworldremote.RawNames.organic', index=2,
-      number=3, type=9, cpp_type=9, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=753,
-  serialized_end=818,
-)
-
-_EMBARKTILELAYER.fields_by_name['mat_type_table'].enum_type = _BASICMATERIAL
-_EMBARKTILELAYER.fields_by_name['tile_shape_table'].enum_type = _BASICSHAPE
-_EMBARKTILELAYER.fields_by_name['tile_color_table'].message_type = _COLORDEFINITION
-_EMBARKTILE.fields_by_name['tile_layer'].message_type = _EMBARKTILELAYER
-DESCRIPTOR.message_types_by_name['ColorDefinition'] = _COLORDEFINITION
-DESCRIPTOR.message_types_by_name['EmbarkTileLayer'] = _EMBARKTILELAYER
-DESCRIPTOR.message_types_by_name['EmbarkTile'] = _EMBARKTILE
-DESCRIPTOR.message_types_by_name['TileRequest'] = _TILEREQUEST
-DESCRIPTOR.message_types_by_name['MapRequest'] = _MAPREQUEST
-DESCRIPTOR.message_types_by_name['MapReply'] = _MAPREPLY
-DESCRIPTOR.message_types_by_name['RawNames'] = _RAWNAMES
-DESCRIPTOR.enum_types_by_name['BasicMaterial'] = _BASICMATERIAL
-DESCRIPTOR.enum_types_by_name['LiquidType'] = _LIQUIDTYPE
-DESCRIPTOR.enum_types_by_name['BasicShape'] = _BASICSHAPE
-
-ColorDefinition = _reflection.GeneratedProtocolMessageType('ColorDefinition', (_message.Message,), dict(
-  DESCRIPTOR = _COLORDEFINITION,
-  __module__ = 'isoworldremote_pb2'
-  # @@protoc_insertion_point(class_scope:isoworldremote.ColorDefinition)
-  ))
-_sym_db.RegisterMessage(ColorDefinition)
-
-EmbarkTileLayer = _reflection.GeneratedProtocolMessageType('EmbarkTileLayer', (_message.Message,), dict(
-  DESCRIPTOR = _EMBARKTILELAYER,
-  __module__ = 'isoworldremote_pb2'
-  # @@protoc_insertion_point(class_scope:isoworldremote.EmbarkTileLayer)
-  ))
-_sym_db.RegisterMessage(EmbarkTileLayer)
-
-EmbarkTile = _reflection.GeneratedProtocolMessageType('EmbarkTile', (_message.Message,), dict(
-  DESCRIPTOR = _EMBARKTILE,
-  __module__ = 'isoworldremote_pb2'
-  # @@protoc_insertion_point(class_scope:isoworldremote.EmbarkTile)
-  ))
-_sym_db.RegisterMessage(EmbarkTile)
-
-TileRequest = _reflection.GeneratedProtocolMessageType('TileRequest', (_message.Message,), dict(
-  DESCRIPTOR = _TILEREQUEST,
-  __module__ = 'isoworldremote_pb2'
-  # @@protoc_insertion_point(class_scope:isoworldremote.TileRequest)
-  ))
-_sym_db.RegisterMessage(TileRequest)
-
-MapRequest = _reflection.GeneratedProtocolMessageType('MapRequest', (_message.Message,), dict(
-  DESCRIPTOR = _MAPREQUEST,
-  __module__ = 'isoworldremote_pb2'
-  # @@protoc_insertion_point(class_scope:isoworldremote.MapRequest)
-  ))
-_sym_db.RegisterMessage(MapRequest)
-
-MapReply = _reflection.GeneratedProtocolMessageType('MapReply', (_message.Message,), dict(
-  DESCRIPTOR = _MAPREPLY,
-  __module__ = 'isoworldremote_pb2'
-  # @@protoc_insertion_point(class_scope:isoworldremote.MapReply)
-  ))
-_sym_db.RegisterMessage(MapReply)
-
-RawNames = _reflection.GeneratedProtocolMessageType('RawNames', (_message.Message,), dict(
-  DESCRIPTOR = _RAWNAMES,
-  __module__ = 'isoworldremote_pb2'
-  # @@protoc_insertion_point(class_scope:isoworldremote.RawNames)
-  ))
-_sym_db.RegisterMessage(RawNames)
-
-
-DESCRIPTOR.has_options = True
-DESCRIPTOR._options = _descriptor._ParseOptions(descriptor_pb2.FileOptions(), _b('H\003'))
-_EMBARKTILELAYER.fields_by_name['mat_type_table'].has_options = True
-_EMBARKTILELAYER.fields_by_name['mat_type_table']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\020\001'))
-_EMBARKTILELAYER.fields_by_name['mat_subtype_table'].has_options = True
-_EMBARKTILELAYER.fields_by_name['mat_subtype_table']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\020\001'))
-_EMBARKTILELAYER.fields_by_name['tile_shape_table'].has_options = True
-_EMBARKTILELAYER.fields_by_name['tile_shape_table']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\020\001'))
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x14isoworldremote.proto\x12\x0eisoworldremote\";\n\x0f\x43olorDefinition\x12\x0b\n\x03red\x18\x01 \x02(\x05\x12\r\n\x05green\x18\x02 \x02(\x05\x12\x0c\n\x04\x62lue\x18\x03 \x02(\x05\"\xe0\x01\n\x0f\x45mbarkTileLayer\x12\x39\n\x0emat_type_table\x18\x04 \x03(\x0e\x32\x1d.isoworldremote.BasicMaterialB\x02\x10\x01\x12\x1d\n\x11mat_subtype_table\x18\x05 \x03(\x05\x42\x02\x10\x01\x12\x38\n\x10tile_shape_table\x18\x06 \x03(\x0e\x32\x1a.isoworldremote.BasicShapeB\x02\x10\x01\x12\x39\n\x10tile_color_table\x18\x07 \x03(\x0b\x32\x1f.isoworldremote.ColorDefinition\"\xb4\x01\n\nEmbarkTile\x12\x0f\n\x07world_x\x18\x01 \x02(\x05\x12\x0f\n\x07world_y\x18\x02 \x02(\x05\x12\x0f\n\x07world_z\x18\x03 \x02(\x11\x12\x33\n\ntile_layer\x18\x04 \x03(\x0b\x32\x1f.isoworldremote.EmbarkTileLayer\x12\x14\n\x0c\x63urrent_year\x18\x05 \x01(\x05\x12\x16\n\x0e\x63urrent_season\x18\x06 \x01(\x05\x12\x10\n\x08is_valid\x18\x07 \x01(\x08\"-\n\x0bTileRequest\x12\x0e\n\x06want_x\x18\x01 \x01(\x05\x12\x0e\n\x06want_y\x18\x02 \x01(\x05\"!\n\nMapRequest\x12\x13\n\x0bsave_folder\x18\x01 \x01(\t\"\x9d\x01\n\x08MapReply\x12\x11\n\tavailable\x18\x01 \x02(\x08\x12\x10\n\x08region_x\x18\x02 \x01(\x05\x12\x10\n\x08region_y\x18\x03 \x01(\x05\x12\x15\n\rregion_size_x\x18\x04 \x01(\x05\x12\x15\n\rregion_size_y\x18\x05 \x01(\x05\x12\x14\n\x0c\x63urrent_year\x18\x06 \x01(\x05\x12\x16\n\x0e\x63urrent_season\x18\x07 \x01(\x05\"A\n\x08RawNames\x12\x11\n\tavailable\x18\x01 \x02(\x08\x12\x11\n\tinorganic\x18\x02 \x03(\t\x12\x0f\n\x07organic\x18\x03 \x03(\t*S\n\rBasicMaterial\x12\x07\n\x03\x41IR\x10\x00\x12\t\n\x05OTHER\x10\x01\x12\r\n\tINORGANIC\x10\x02\x12\n\n\x06LIQUID\x10\x03\x12\t\n\x05PLANT\x10\x04\x12\x08\n\x04WOOD\x10\x05*+\n\nLiquidType\x12\x07\n\x03ICE\x10\x00\x12\t\n\x05WATER\x10\x01\x12\t\n\x05MAGMA\x10\x02*Q\n\nBasicShape\x12\x08\n\x04NONE\x10\x00\x12\x08\n\x04OPEN\x10\x01\x12\x08\n\x04WALL\x10\x03\x12\t\n\x05\x46LOOR\x10\x04\x12\x0b\n\x07RAMP_UP\x10\x05\x12\r\n\tRAMP_DOWN\x10\x06\x42\x02H\x03')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'dfhack_rpc.proto.isoworldremote_pb2', globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  DESCRIPTOR._serialized_options = b'H\003'
+  _EMBARKTILELAYER.fields_by_name['mat_type_table']._options = None
+  _EMBARKTILELAYER.fields_by_name['mat_type_table']._serialized_options = b'\020\001'
+  _EMBARKTILELAYER.fields_by_name['mat_subtype_table']._options = None
+  _EMBARKTILELAYER.fields_by_name['mat_subtype_table']._serialized_options = b'\020\001'
+  _EMBARKTILELAYER.fields_by_name['tile_shape_table']._options = None
+  _EMBARKTILELAYER.fields_by_name['tile_shape_table']._serialized_options = b'\020\001'
+  _BASICMATERIAL._serialized_start=820
+  _BASICMATERIAL._serialized_end=903
+  _LIQUIDTYPE._serialized_start=905
+  _LIQUIDTYPE._serialized_end=948
+  _BASICSHAPE._serialized_start=950
+  _BASICSHAPE._serialized_end=1031
+  _COLORDEFINITION._serialized_start=40
+  _COLORDEFINITION._serialized_end=99
+  _EMBARKTILELAYER._serialized_start=102
+  _EMBARKTILELAYER._serialized_end=326
+  _EMBARKTILE._serialized_start=329
+  _EMBARKTILE._serialized_end=509
+  _TILEREQUEST._serialized_start=511
+  _TILEREQUEST._serialized_end=556
+  _MAPREQUEST._serialized_start=558
+  _MAPREQUEST._serialized_end=591
+  _MAPREPLY._serialized_start=594
+  _MAPREPLY._serialized_end=751
+  _RAWNAMES._serialized_start=753
+  _RAWNAMES._serialized_end=818
 # @@protoc_insertion_point(module_scope)
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+"""
+Query builders of ListUnits and ListMaterials.
+
+Caller names the fields it reads, the query requests the smallest BasicUnitInfoMask / BasicMaterialInfoMask
+covering them, sends all filters to DFHack and returns records (namedtuples) with just these fields:
+
+    units = UnitQuery(rpc).fields('unit_id', 'labors').civ(civ_id).alive().sane().fetch()
+    for unit in units:
+        print(unit.unit_id, unit.labors)
+
+    metals = MaterialQuery(rpc).fields('token', 'state_name').inorganic().states('Solid', 'Liquid').fetch()
+
+Repeated fields are returned as lists, message fields as proto objects.
+"""
+from collections import namedtuple
+
+import logging
+
+_logger = logging.getLogger(__name__)
+
+# BasicUnitInfoMask flag: BasicUnitInfo fields filled only when the flag is set
+UNIT_MASK_FIELDS = {
+    'labors': ['labors'],
+    'skills': ['skills'],
+    'profession': ['squad_id', 'squad_position', 'profession', 'custom_profession'],
+    'misc_traits': ['misc_traits'],
+}
+
+# BasicMaterialInfoMask flag: BasicMaterialInfo fields filled only when the flag is set
+MATERIAL_MASK_FIELDS = {
+    'flags': ['flags', 'inorganic_flags'],
+    'reaction': ['reaction_class', 'reaction_product'],
+}
+
+_record_types = {}
+
+
+def record_type(name, fields):
+    """
+    :return: namedtuple class with given fields, the same class for the same fields
+    """
+    key = (name, tuple(fields))
+    if key not in _record_types:
+        _record_types[key] = namedtuple(name, fields)
+    return _record_types[key]
+
+
+class Query(object):
+    """
+    Base of query builders. Builder methods return the query, so they can be chained.
+    """
+
+    METHOD = None
+    INPUT_MSG = None
+    RECORD_MSG = None
+    RECORD_NAME = None
+    MASK_FIELDS = {}
+    DEFAULT_FIELDS = []
+
+    def __init__(self, rpc):
+        """
+        :param rpc: DFHackRPC instance with bound METHOD
+        """
+        self.rpc = rpc
+        self.field_names = list(self.DEFAULT_FIELDS)
+        self.mask_fields = dict((field, flag) for flag, fields in self.MASK_FIELDS.items() for field in fields)
+
+    def fields(self, *names):
+        """
+        :param names: names of fields of returned records, fields of RECORD_MSG
+        """
+        known = self.rpc.get_proto(self.RECORD_MSG).DESCRIPTOR.fields_by_name
+        for name in names:
+            if name not in known:
+                raise Exception('Unknown field "{}" of {}'.format(name, self.RECORD_MSG))
+        self.field_names = list(names)
+        return self
+
+    def mask_flags(self):
+        """
+        :return: sorted names of mask flags needed by selected fields
+        """
+        return sorted(set(self.mask_fields[name] for name in self.field_names if name in self.mask_fields))
+
+    def request(self):
+        """
+        :return: INPUT_MSG proto object
+        """
+        data_obj = self.rpc.get_proto(self.INPUT_MSG)()
+        for flag in self.mask_flags():
+            setattr(data_obj.mask, flag, True)
+        return data_obj
+
+    def records(self, values):
+        """
+        :param values: repeated field of RECORD_MSG
+        :return: list of records
+        """
+        record_cls = record_type(self.RECORD_NAME, self.field_names)
+        descriptors = self.rpc.get_proto(self.RECORD_MSG).DESCRIPTOR.fields_by_name
+        repeated = [descriptors[name].label == descriptors[name].LABEL_REPEATED for name in self.field_names]
+
+        records = []
+        for value in values:
+            records.append(record_cls(*[
+                getattr(value, name)[:] if is_repeated else getattr(value, name)
+                for name, is_repeated in zip(self.field_names, repeated)
+            ]))
+        return records
+
+    def fetch(self):
+        """
+        :return: list of records
+        """
+        resp_obj, _ = self.rpc.call_method(self.METHOD, self.request())
+        return self.records(resp_obj.value)
+
+
+class UnitQuery(Query):
+    """
+    ListUnits query
+
+    DFHack applies race, civ, dead, alive and sane filters to scan of all units, they are not applied to units
+    listed by ids. Setting any of the filters turns scan on.
+    """
+
+    METHOD = 'ListUnits'
+    INPUT_MSG = 'dfproto.ListUnitsIn'
+    RECORD_MSG = 'dfproto.BasicUnitInfo'
+    RECORD_NAME = 'UnitRecord'
+    MASK_FIELDS = UNIT_MASK_FIELDS
+    DEFAULT_FIELDS = ['unit_id']
+
+    def __init__(self, rpc):
+        Query.__init__(self, rpc)
+        self.id_list = []
+        self.filters = {}
+
+    def ids(self, *unit_ids):
+        self.id_list.extend(unit_ids)
+        return self
+
+    def scan_all(self):
+        self.filters['scan_all'] = True
+        return self
+
+    def race(self, race):
+        self.filters.update(scan_all=True, race=race)
+        return self
+
+    def civ(self, civ_id):
+        self.filters.update(scan_all=True, civ_id=civ_id)
+        return self
+
+    def dead(self, value=True):
+        self.filters.update(scan_all=True, dead=value)
+        return self
+
+    def alive(self, value=True):
+        self.filters.update(scan_all=True, alive=value)
+        return self
+
+    def sane(self, value=True):
+        self.filters.update(scan_all=True, sane=value)
+        return self
+
+    def request(self):
+        data_obj = Query.request(self)
+        data_obj.id_list.extend(self.id_list)
+        for name, value in self.filters.items():
+            setattr(data_obj, name, value)
+        return data_obj
+
+
+class MaterialQuery(Query):
+    """
+    ListMaterials query
+
+    State fields (state_color, state_name, state_adj) contain one state matching temperature
+    unless states are selected.
+    """
+
+    METHOD = 'ListMaterials'
+    INPUT_MSG = 'dfproto.ListMaterialsIn'
+    RECORD_MSG = 'dfproto.BasicMaterialInfo'
+    RECORD_NAME = 'MaterialRecord'
+    MASK_FIELDS = MATERIAL_MASK_FIELDS
+    DEFAULT_FIELDS = ['type', 'index', 'token']
+
+    def __init__(self, rpc):
+        Query.__init__(self, rpc)
+        self.id_list = []
+        self.lists = {}
+        self.state_list = []
+        self.temperature_value = None
+
+    def ids(self, *materials):
+        """
+        :param materials: (type, index) pairs
+        """
+        self.id_list.extend(materials)
+        return self
+
+    def builtin(self):
+        self.lists['builtin'] = True
+        return self
+
+    def inorganic(self):
+        self.lists['inorganic'] = True
+        return self
+
+    def creatures(self):
+        self.lists['creatures'] = True
+        return self
+
+    def plants(self):
+        self.lists['plants'] = True
+        return self
+
+    def states(self, *states):
+        """
+        :param states: names of BasicMaterialInfoMask.StateType, eg. 'Solid', 'Liquid'
+        """
+        self.state_list.extend(states)
+        return self
+
+    def temperature(self, temperature):
+        """
+        :param temperature: temperature of the single returned state
+        """
+        self.temperature_value = temperature
+        return self
+
+    def request(self):
+        data_obj = Query.request(self)
+        for mat_type, mat_index in self.id_list:
+            data_obj.id_list.add(type=mat_type, index=mat_index)
+        for name, value in self.lists.items():
+            setattr(data_obj, name, value)
+
+        state_type = self.rpc.get_proto('dfproto.BasicMaterialInfoMask').StateType
+        for state in self.state_list:
+            data_obj.mask.states.append(state_type.Value(state))
+        if self.temperature_value is not None:
+            data_obj.mask.temperature = self.temperature_value
+        return data_obj
@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+"""
+Recording of RPC sessions and their replay over DFHack wire protocol.
+
+Session file layout:
+
+    magic b'DFHREC1\\n'
+    records: struct RECORD (start time, end time, sizes), method name, request data, reply messages
+    index (zlib compressed JSON)
+    trailer: uint64 index offset, uint32 index size, magic
+
+Record contains serialized request (without message header) and all reply messages of one call
+(text messages followed by result or fail message) exactly as they were received.
+
+Record session:
+
+    with SessionRecorder('session.rec') as recorder:
+        rpc = DFHackRPC(recorder=recorder)
+        ...
+
+Replay session (10x faster than recorded):
+
+    python -m dfhack_rpc.replay session.rec --port 5000 --pacing realtime --speed 10
+"""
+from .dfhack_rpc import DFHackRPC
+from .tracing import RPCHook
+from .exceptions import CR_NOT_IMPLEMENTED
+
+import argparse
+import hashlib
+import json
+import socketserver
+import struct
+import threading
+import time
+import zlib
+import logging
+
+_logger = logging.getLogger(__name__)
+
+MAGIC = b'DFHREC1\n'
+RECORD = struct.Struct('<ddHII')
+TRAILER = struct.Struct('<QI8s')
+
+
+def request_key(data):
+    return hashlib.sha1(data).hexdigest()
+
+
+class SessionRecorder(RPCHook):
+    """
+    Writes calls made by DFHackRPC into session file. Works as call hook, see DFHackRPC.add_hook.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.index = {
+            'created': time.time(),
+            'records': {},  # {method: {request sha1: [offset, ...]}}
+        }
+        self.file = open(path, 'wb')
+        self.file.write(MAGIC)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def record(self, method, request, reply_msgs, start_time, end_time):
+        """
+        :param method: method name
+        :param request: serialized request (without message header)
+        :param reply_msgs: list of reply messages
+        :param start_time: time when request was sent
+        :param end_time: time when last reply message was received
+        """
+        method_data = method.encode('utf-8')
+        reply = b''.join(reply_msgs)
+        with self.lock:
+            offset = self.file.tell()
+            self.file.write(RECORD.pack(start_time, end_time, len(method_data), len(request), len(reply)))
+            self.file.write(method_data + request + reply)
+            self.index['records'].setdefault(method, {}).setdefault(request_key(request), []).append(offset)
+
+    def on_call(self, trace):
+        if not trace.reply:
+            return
+        end_time = trace.start_time + trace.serialize_time + trace.network_time
+        self.record(trace.method, trace.request, trace.reply, trace.start_time, end_time)
+
+    def close(self):
+        with self.lock:
+            if self.file is None:
+                return
+            index_data = zlib.compress(json.dumps(self.index).encode('utf-8'))
+            offset = self.file.tell()
+            self.file.write(index_data)
+            self.file.write(TRAILER.pack(offset, len(index_data), MAGIC))
+            self.file.close()
+            self.file = None
+
+
+def import_streams(requests_data, responses_data, path):
+    """
+    Converts captured client and server TCP streams (eg. data/raw_messages) into session file.
+    Captured streams don't contain timestamps, so all records have zero duration.
+    :param requests_data: binary string sent by client, starting with handshake
+    :param responses_data: binary string sent by server, starting with handshake
+    :param path: session file path
+    """
+    protocol = DFHackRPC()
+    method_ids = {0: 'BindMethod', 1: 'RunCommand'}
+
+    def read_messages(data):
+        offset = 12  # handshake
+        while offset + 8 <= len(data):
+            id, size, _ = protocol.parse_header(data[offset:offset + 8])
+            size = 0 if id == -2 else size
+            yield data[offset:offset + 8 + size]
+            offset += 8 + size
+
+    replies = read_messages(responses_data)
+    with SessionRecorder(path) as recorder:
+        for request_msg in read_messages(requests_data):
+            request, id, _ = protocol.parse_message(request_msg)
+            if id == -4:
+                break
+
+            reply_msgs = []
+            for resp_msg in replies:
+                reply_msgs.append(resp_msg)
+                if protocol.parse_header(resp_msg)[0] in (-1, -2):
+                    break
+
+            method = method_ids.get(id, str(id))
+            if method == 'BindMethod':
+                resp, resp_id, _ = protocol.parse_message(reply_msgs[-1])
+                if resp_id == -1:
+                    bind_request = protocol.get_proto('dfproto.CoreBindRequest').FromString(request)
+                    method_ids[protocol.get_proto('dfproto.CoreBindReply').FromString(resp).assigned_id] = \
+                        bind_request.method
+
+            recorder.record(method, request, reply_msgs, 0.0, 0.0)
+
+
+class Session(object):
+    """
+    Read-only access to session file. Only index is kept in memory, records are read on demand.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.file = open(path, 'rb')
+
+        if self.file.read(len(MAGIC)) != MAGIC:
+            raise Exception('Not a session file: {}'.format(path))
+        self.file.seek(-TRAILER.size, 2)
+        offset, size, magic = TRAILER.unpack(self.file.read(TRAILER.size))
+        if magic != MAGIC:
+            raise Exception('Session file is incomplete: {}'.format(path))
+        self.file.seek(offset)
+        self.index = json.loads(zlib.decompress(self.file.read(size)).decode('utf-8'))
+
+        # all records of method in recorded order, used when request was not recorded
+        self.method_records = {
+            method: sorted(offset for offsets in requests.values() for offset in offsets)
+            for method, requests in self.index['records'].items()
+        }
+
+    def close(self):
+        self.file.close()
+
+    @property
+    def methods(self):
+        return sorted(self.index['records'])
+
+    def read_record(self, offset):
+        """
+        :return: (method, request, reply messages data, duration)
+        """
+        with self.lock:
+            self.file.seek(offset)
+            start_time, end_time, method_size, request_size, reply_size = RECORD.unpack(self.file.read(RECORD.size))
+            data = self.file.read(method_size + request_size + reply_size)
+        method = data[:method_size].decode('utf-8')
+        request = data[method_size:method_size + request_size]
+        reply = data[method_size + request_size:]
+        return method, request, reply, end_time - start_time
+
+    def candidates(self, method, request):
+        """
+        :return: offsets of records of method with the same request, or of all records of method
+        """
+        offsets = self.index['records'].get(method, {}).get(request_key(request))
+        return offsets or self.method_records.get(method, [])
+
+
+class ReplayHandler(socketserver.BaseRequestHandler):
+    """
+    Serves one client connection
+    """
+
+    def recv_exact(self, size):
+        data = b''
+        while len(data) < size:
+            chunk = self.request.recv(size - len(data))
+            if not chunk:
+                raise EOFError()
+            data += chunk
+        return data
+
+    def handle(self):
+        server = self.server
+        protocol = server.protocol
+        positions = {}  # replay position of every (method, request) in this connection
+
+        try:
+            magic, version, _ = protocol.parse_handshake(self.recv_exact(12))
+            self.request.sendall(protocol.build_handshake(b'DFHack!\n', version))
+
+            while True:
+                id, size, _ = protocol.parse_header(self.recv_exact(8))
+                if id == -4:
+                    return
+                request = self.recv_exact(size)
+
+                if id == 0:
+                    reply = server.bind(request)
+                    self.request.sendall(protocol.build_message(reply, -1))
+                    continue
+
+                method = server.method_names.get(id)
+                candidates = server.session.candidates(method, request)
+                if not candidates:
+                    _logger.debug('Method "{}" not recorded'.format(method))
+                    self.request.sendall(protocol.build_header(-2, CR_NOT_IMPLEMENTED))
+                    continue
+
+                key = (method, request_key(request))
+                position = positions.get(key, 0)
+                positions[key] = position + 1
+                _, _, reply, duration = server.session.read_record(candidates[position % len(candidates)])
+
+                if server.pacing == 'realtime' and duration > 0:
+                    time.sleep(duration / server.speed)
+                self.request.sendall(reply)
+        except (EOFError, ConnectionError):
+            pass
+
+
+class ReplayServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    """
+    Serves recorded session over DFHack wire protocol.
+
+    BindMethod assigns the same id to the same method name in all connections. Calls are answered
+    with recorded replies of the same method and request; repeated identical requests get recorded
+    replies in recorded order. Requests that were not recorded get any recorded reply of the method,
+    calls of methods missing in session fail with CR_NOT_IMPLEMENTED.
+
+    Pacing 'fast' replies as fast as possible, 'realtime' delays every reply by recorded duration
+    divided by speed.
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, path, host='127.0.0.1', port=5000, pacing='fast', speed=1.0):
+        """
+        :param path: session file path
+        :param host: listen address
+        :param port: listen port
+        :param pacing: 'fast' or 'realtime'
+        :param speed: realtime pacing speed multiplier
+        """
+        assert pacing in ['fast', 'realtime']
+        assert speed > 0
+
+        self.session = Session(path)
+        self.pacing = pacing
+        self.speed = speed
+        self.protocol = DFHackRPC()
+
+        self.bind_lock = threading.Lock()
+        self.method_ids = {'BindMethod': 0, 'RunCommand': 1}
+        self.method_names = {0: 'BindMethod', 1: 'RunCommand'}
+
+        socketserver.TCPServer.__init__(self, (host, port), ReplayHandler)
+
+    def bind(self, request):
+        """
+        :param request: serialized CoreBindRequest
+        :return: serialized CoreBindReply
+        """
+        bind_request = self.protocol.get_proto('dfproto.CoreBindRequest').FromString(request)
+        with self.bind_lock:
+            if bind_request.method not in self.method_ids:
+                assigned_id = len(self.method_ids)
+                self.method_ids[bind_request.method] = assigned_id
+                self.method_names[assigned_id] = bind_request.method
+            assigned_id = self.method_ids[bind_request.method]
+        return self.protocol.get_proto('dfproto.CoreBindReply')(assigned_id=assigned_id).SerializeToString()
+
+    def start(self):
+        """
+        Starts serving in background thread
+        :return: thread
+        """
+        thread = threading.Thread(target=self.serve_forever)
+        thread.daemon = True
+        thread.start()
+        return thread
+
+    def server_close(self):
+        socketserver.TCPServer.server_close(self)
+        self.session.close()
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+
+    parser = argparse.ArgumentParser(description='Replay recorded DFHack RPC session')
+    parser.add_argument('session', help='session file')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=5000)
+    parser.add_argument('--pacing', choices=['fast', 'realtime'], default='fast')
+    parser.add_argument('--speed', type=float, default=1.0)
+    parser.add_argument('--import-streams', nargs=2, metavar=('REQUESTS', 'RESPONSES'),
+                        help='create session file from captured client and server streams first')
+    args = parser.parse_args()
+
+    if args.import_streams:
+        with open(args.import_streams[0], 'rb') as f_req, open(args.import_streams[1], 'rb') as f_resp:
+            import_streams(f_req.read(), f_resp.read(), args.session)
+
+    server = ReplayServer(args.session, args.host, args.port, args.pacing, args.speed)
+    _logger.info('Replaying {} methods on {}:{}'.format(len(server.session.methods), args.host, args.port))
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
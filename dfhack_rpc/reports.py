@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+from .wire import submessage_offsets, read_varint_field, decode_signed
+
+import time
+import logging
+
+_logger = logging.getLogger(__name__)
+
+# RemoteFortressReader.Status
+STATUS_REPORTS_FIELD = 1
+# RemoteFortressReader.Report
+REPORT_ID_FIELD = 10
+
+
+class ReportTail(object):
+    """
+    Follows DF reports and announcements returned by GetReports, like "tail -f".
+
+    GetReports always returns whole report history, so ReportTail remembers the highest Report.id
+    it has seen (cursor) and returns only newer reports. Response is not decoded as a whole,
+    report ids are read directly from serialized response and only new reports are parsed.
+
+    Reports with continuation flag are merged into the preceding report. When continuation comes first
+    in a poll, its report returned by previous poll is returned again with the joined text (the same
+    Report.id), callers keeping reports by id just replace it.
+
+    Serialized last seen report is remembered too, next poll finds it in the response with bytes.rfind
+    and walks only reports after it, so polling doesn't depend on size of report history.
+
+    Usage:
+
+        tail = ReportTail(rpc)
+        for report in tail.follow(interval=1.0):
+            print(report.id, report.text)
+    """
+
+    def __init__(self, rpc, cursor=-1, merge_continuations=True):
+        """
+        :param rpc: DFHackRPC instance with bound GetReports method
+        :param cursor: highest already seen Report.id, -1 returns whole history on first poll
+        :param merge_continuations: merge continuation lines into whole messages
+        """
+        self.rpc = rpc
+        self.cursor = cursor
+        self.merge_continuations = merge_continuations
+        self.last_data = None  # serialized last seen report
+        self.last_report = None  # last returned report, continuations of the next poll are merged into it
+
+    def _report_id(self, data, start, end):
+        return decode_signed(read_varint_field(data, REPORT_ID_FIELD, start, end, default=-1))
+
+    def _first_new(self, data, offsets):
+        """
+        Binary search for the first report with id higher than cursor. Reports are ordered by id.
+        """
+        low, high = 0, len(offsets)
+        while low < high:
+            middle = (low + high) // 2
+            if self._report_id(data, *offsets[middle]) > self.cursor:
+                high = middle
+            else:
+                low = middle + 1
+        return low
+
+    def _offsets(self, data):
+        """
+        :return: (offsets of reports after last seen report, start of the first of them) if last seen report
+            is found in data, (offsets of all reports, 0) otherwise
+        """
+        if self.last_data is not None:
+            position = data.rfind(self.last_data)
+            if position >= 0:
+                start = position + len(self.last_data)
+                if self._report_id(data, position, start) == self.cursor:
+                    return submessage_offsets(data, STATUS_REPORTS_FIELD, start), start
+        return submessage_offsets(data, STATUS_REPORTS_FIELD), 0
+
+    def parse_new(self, data):
+        """
+        :param data: serialized RemoteFortressReader.Status
+        :return: list of RemoteFortressReader.Report objects newer than cursor
+        """
+        offsets, start = self._offsets(data)
+        if not offsets:
+            return []
+
+        last_id = self._report_id(data, *offsets[-1])
+        if last_id < self.cursor:
+            _logger.info('Report ids went back from {} to {}, resetting cursor'.format(self.cursor, last_id))
+            self.cursor = -1
+            self.last_report = None
+
+        first = self._first_new(data, offsets)
+        if first >= len(offsets):
+            return []
+
+        # Status contains only reports, so its tail starting with tag of first new report is valid Status
+        tail_start = offsets[first - 1][1] if first > 0 else start
+        status = self.rpc.get_proto('RemoteFortressReader.Status')()
+        status.ParseFromString(data[tail_start:])
+
+        self.cursor = max(self.cursor, last_id)
+        self.last_data = bytes(data[offsets[-1][0]:offsets[-1][1]])
+
+        if not self.merge_continuations:
+            return list(status.reports)
+        merged = self.merge(status.reports, self.last_report)
+        if merged:
+            self.last_report = merged[-1]
+        return merged
+
+    @classmethod
+    def merge(cls, reports, previous=None):
+        """
+        Merges reports with continuation flag into preceding report.
+        :param previous: report preceding the first one, continuation at the start of the list is merged into
+            its copy, which is returned first. Without previous report the continuation is returned as it is.
+        """
+        merged = []
+        for report in reports:
+            if report.continuation and not merged and previous is not None:
+                joined = type(previous)()
+                joined.CopyFrom(previous)
+                joined.text = '{} {}'.format(joined.text, report.text)
+                merged.append(joined)
+            elif report.continuation and merged:
+                merged[-1].text = '{} {}'.format(merged[-1].text, report.text)
+            else:
+                merged.append(report)
+        return merged
+
+    def poll(self):
+        """
+        :return: list of reports newer than cursor
+        """
+        data, _ = self.rpc.call_method_raw('GetReports')
+        return self.parse_new(data)
+
+    def follow(self, interval=1.0):
+        """
+        Generator yielding new reports forever
+        :param interval: seconds between polls
+        """
+        while True:
+            for report in self.poll():
+                yield report
+            time.sleep(interval)
+
+    async def afollow(self, interval=1.0):
+        """
+        Async generator yielding new reports forever. Polls are done in default executor.
+        :param interval: seconds between polls
+        """
+        import asyncio  # imported here, asyncio import is slower than the rest of dfhack_rpc
+
+        loop = asyncio.get_event_loop()
+        while True:
+            for report in await loop.run_in_executor(None, self.poll):
+                yield report
+            await asyncio.sleep(interval)
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+"""
+Retry of calls interrupted by broken connection.
+
+Only calls of methods which just read DF state are retried, calls changing it (SendDigCommand, SetUnitLabors,
+RunCommand, ...) could be executed twice and are never retried. When a pipelined batch breaks, calls which
+already got their replies are not sent again, the rest is retried only if all of them are idempotent.
+
+    rpc = DFHackRPC(retry=RetryPolicy(max_attempts=10, max_delay=30.0))
+"""
+import random
+
+# methods safe to call again when their reply was lost
+IDEMPOTENT_METHODS = frozenset([
+    'GetVersion', 'GetDFVersion', 'GetWorldInfo', 'ListEnums', 'ListJobSkills', 'ListMaterials', 'ListUnits',
+    'ListSquads', 'GetEmbarkTile', 'GetEmbarkInfo', 'GetRawNames', 'GetMaterialList', 'GetGrowthList',
+    'GetBlockList', 'CheckHashes', 'GetTiletypeList', 'GetPlantList', 'GetUnitList', 'GetUnitListInside',
+    'GetViewInfo', 'GetMapInfo', 'GetItemList', 'GetBuildingDefList', 'GetWorldMap', 'GetWorldMapNew',
+    'GetRegionMaps', 'GetRegionMapsNew', 'GetCreatureRaws', 'GetPartialCreatureRaws', 'GetWorldMapCenter',
+    'GetPlantRaws', 'GetPartialPlantRaws', 'CopyScreen', 'GetPauseState', 'GetVersionInfo', 'GetReports',
+    'MenuQuery', 'GetLanguage',
+])
+
+
+class RetryPolicy(object):
+    """
+    Exponential backoff with jitter
+    """
+
+    def __init__(self, max_attempts=5, initial_delay=0.1, max_delay=10.0, multiplier=2.0, jitter=0.1,
+                 methods=None):
+        """
+        :param max_attempts: max number of reconnect attempts after one failure
+        :param initial_delay: seconds before the first reconnect
+        :param max_delay: max seconds between reconnects
+        :param multiplier: delay is multiplied by it after every failed attempt
+        :param jitter: relative random change of every delay, so that many clients don't reconnect at once
+        :param methods: methods which can be retried, IDEMPOTENT_METHODS if None
+        """
+        self.max_attempts = max_attempts
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.methods = IDEMPOTENT_METHODS if methods is None else frozenset(methods)
+
+    def can_retry(self, methods):
+        """
+        :param methods: names of methods of calls without reply
+        """
+        return all(method in self.methods for method in methods)
+
+    def delay(self, attempt):
+        """
+        :param attempt: number of failed reconnect attempts
+        :return: seconds to wait before next attempt, None if there should be no more attempts
+        """
+        if attempt >= self.max_attempts:
+            return None
+        delay = min(self.initial_delay * self.multiplier ** attempt, self.max_delay)
+        return delay * (1 + random.uniform(-self.jitter, self.jitter))
@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+"""
+Binary snapshot file of fortress state.
+
+Layout:
+
+    magic b'DFHSNAP\\n', uint32 format version
+    message sections (MapInfo, MaterialList, TiletypeList, BuildingList, UnitList, PlantList, Status, ...)
+    z-level chunks
+    index (zlib compressed JSON)
+    trailer: uint64 index offset, uint32 index size, magic
+
+Every section and chunk is compressed separately with zlib. The index at the end of file stores offsets of
+all of them, so any single z-level can be read without reading the rest of the file.
+
+Z-level chunk stores per-tile MapBlock fields as columns, one [y, x] array per field for the whole map
+slab (see map_volume), followed by separately compressed BlockList with the rest of block data
+(buildings, items, flows, ...) of blocks on that z-level. Material and tiletype lists are stored only once
+as message sections, tile columns contain just the ids.
+"""
+from .proto import get_proto
+from .map_volume import map_shape, fill_volume, fill_matpair_volume, FIELD_DTYPES, MATPAIR_FIELDS
+
+import os
+import json
+import struct
+import time
+import zlib
+import numpy as np
+import logging
+
+_logger = logging.getLogger(__name__)
+
+MAGIC = b'DFHSNAP\n'
+VERSION = 1
+TRAILER = struct.Struct('<QI8s')
+
+# per-tile MapBlock fields stored as columns, MatPair fields are split into <field>_type and <field>_index columns
+DEFAULT_FIELDS = [
+    'tiles', 'materials', 'base_materials', 'magma', 'water', 'hidden', 'light', 'subterranean', 'outside',
+    'aquifer', 'water_stagnant', 'water_salt', 'tile_dig_designation', 'grass_percent',
+]
+
+# snapshot section name: method used by capture_snapshot
+SNAPSHOT_METHODS = {
+    'map_info': 'GetMapInfo',
+    'materials': 'GetMaterialList',
+    'tiletypes': 'GetTiletypeList',
+    'building_defs': 'GetBuildingDefList',
+    'units': 'GetUnitList',
+    'reports': 'GetReports',
+}
+
+
+def field_columns(fields):
+    """
+    :return: list of (column name, field, dtype) of given per-tile fields
+    """
+    columns = []
+    for field in fields:
+        if field in MATPAIR_FIELDS:
+            columns.append(('{}_type'.format(field), field, np.int32))
+            columns.append(('{}_index'.format(field), field, np.int32))
+        else:
+            columns.append((field, field, FIELD_DTYPES.get(field, np.int32)))
+    return columns
+
+
+class SnapshotWriter(object):
+    """
+    Writes snapshot file section by section.
+
+    Usage:
+
+        with SnapshotWriter(path, map_info) as writer:
+            writer.write_message('materials', material_list)
+            writer.write_blocks(blocks)
+    """
+
+    def __init__(self, path, map_info, fields=None, compression_level=3):
+        """
+        :param path: file path
+        :param map_info: RemoteFortressReader.MapInfo, defines shape of z-level slabs
+        :param fields: per-tile MapBlock fields stored as columns
+        :param compression_level: zlib compression level
+        """
+        self.path = path
+        self.shape = map_shape(map_info)
+        self.columns = field_columns(DEFAULT_FIELDS if fields is None else fields)
+        self.compression_level = compression_level
+
+        self.index = {
+            'version': VERSION,
+            'created': time.time(),
+            'shape': list(self.shape),
+            'columns': [[name, np.dtype(dtype).str] for name, _, dtype in self.columns],
+            'messages': {},
+            'z': {},
+        }
+
+        self.file = open(path, 'wb')
+        self.file.write(MAGIC + struct.pack('<I', VERSION))
+        self.write_message('map_info', map_info)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def _write(self, data):
+        offset = self.file.tell()
+        data = zlib.compress(data, self.compression_level)
+        self.file.write(data)
+        return [offset, len(data)]
+
+    def write_message(self, name, message):
+        """
+        :param name: section name, eg. 'materials'
+        :param message: proto object
+        """
+        self.index['messages'][name] = self._write(message.SerializeToString()) + [message.DESCRIPTOR.full_name]
+
+    def write_z(self, z, blocks):
+        """
+        Writes one z-level chunk
+        :param z: local map z coordinate
+        :param blocks: list of RemoteFortressReader.MapBlock on z-level z
+        """
+        origin = (0, 0, z)
+        slab_shape = (1,) + self.shape[1:]
+        slabs = {}
+        for name, field, dtype in self.columns:
+            if name in slabs:
+                continue
+            if field in MATPAIR_FIELDS:
+                types, indices = fill_matpair_volume(
+                    np.full(slab_shape, -1, dtype=dtype), np.full(slab_shape, -1, dtype=dtype), blocks, field, origin
+                )
+                slabs['{}_type'.format(field)], slabs['{}_index'.format(field)] = types, indices
+            else:
+                slabs[name] = fill_volume(np.zeros(slab_shape, dtype=dtype), blocks, field, origin)
+
+        columns_data = b''.join(np.ascontiguousarray(slabs[name]).tobytes() for name, _, _ in self.columns)
+
+        # rest of block data without per-tile columns
+        block_list = get_proto('RemoteFortressReader.BlockList')()
+        stored_fields = set(field for _, field, _ in self.columns)
+        for block in blocks:
+            rest = block_list.map_blocks.add()
+            for field_desc, value in block.ListFields():
+                if field_desc.name in stored_fields:
+                    continue
+                if field_desc.label == field_desc.LABEL_REPEATED:
+                    getattr(rest, field_desc.name).extend(value)
+                elif field_desc.type == field_desc.TYPE_MESSAGE:
+                    getattr(rest, field_desc.name).CopyFrom(value)
+                else:
+                    setattr(rest, field_desc.name, value)
+
+        self.index['z'][str(z)] = self._write(columns_data) + self._write(block_list.SerializeToString())
+
+    def write_blocks(self, blocks):
+        """
+        Writes z-level chunks of all z-levels present in blocks
+        :param blocks: iterable of RemoteFortressReader.MapBlock
+        """
+        by_z = {}
+        for block in blocks:
+            by_z.setdefault(block.map_z, []).append(block)
+        for z in sorted(by_z):
+            self.write_z(z, by_z[z])
+
+    def close(self):
+        if self.file is None:
+            return
+        index_data = zlib.compress(json.dumps(self.index).encode('utf-8'), self.compression_level)
+        offset = self.file.tell()
+        self.file.write(index_data)
+        self.file.write(TRAILER.pack(offset, len(index_data), MAGIC))
+        self.file.close()
+        self.file = None
+
+    def abort(self):
+        """
+        Closes and removes unfinished file, so that it isn't mistaken for a complete snapshot
+        """
+        if self.file is None:
+            return
+        self.file.close()
+        self.file = None
+        os.remove(self.path)
+        _logger.info('Removed unfinished snapshot {}'.format(self.path))
+
+
+class SnapshotReader(object):
+    """
+    Reads snapshot file. Only index is read on open, sections and z-level chunks are read on demand.
+
+    Usage:
+
+        with SnapshotReader(path) as snapshot:
+            materials = snapshot.message('materials')
+            slab = snapshot.read_z(120, ['tiles', 'water'])
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, 'rb')
+
+        magic = self.file.read(len(MAGIC) + 4)
+        if magic[:len(MAGIC)] != MAGIC:
+            raise Exception('Not a DFHack snapshot file: {}'.format(path))
+
+        self.file.seek(-TRAILER.size, 2)
+        offset, size, magic = TRAILER.unpack(self.file.read(TRAILER.size))
+        if magic != MAGIC:
+            raise Exception('Snapshot file is incomplete: {}'.format(path))
+
+        self.index = json.loads(self._read([offset, size]).decode('utf-8'))
+        if self.index['version'] > VERSION:
+            raise Exception('Unsupported snapshot version {}'.format(self.index['version']))
+
+        self.shape = tuple(self.index['shape'])
+        self.columns = [(name, np.dtype(dtype)) for name, dtype in self.index['columns']]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def _read(self, location):
+        self.file.seek(location[0])
+        return zlib.decompress(self.file.read(location[1]))
+
+    @property
+    def z_levels(self):
+        return sorted(int(z) for z in self.index['z'])
+
+    @property
+    def message_names(self):
+        return sorted(self.index['messages'])
+
+    def message(self, name):
+        """
+        :param name: section name, eg. 'map_info', 'materials'
+        :return: proto object
+        """
+        offset, size, full_name = self.index['messages'][name]
+        message = get_proto(full_name)()
+        message.ParseFromString(self._read([offset, size]))
+        return message
+
+    def read_z(self, z, columns=None):
+        """
+        :param z: local map z coordinate
+        :param columns: names of columns to return, all if None
+        :return: {column name: [y, x] array}
+        """
+        data = self._read(self.index['z'][str(z)][:2])
+        slab_size = self.shape[1] * self.shape[2]
+
+        result = {}
+        offset = 0
+        for name, dtype in self.columns:
+            size = slab_size * dtype.itemsize
+            if columns is None or name in columns:
+                result[name] = np.frombuffer(data, dtype=dtype, count=slab_size, offset=offset).reshape(self.shape[1:])
+            offset += size
+        return result
+
+    def read_z_blocks(self, z):
+        """
+        :return: RemoteFortressReader.BlockList with non-column data of blocks on z-level z
+        """
+        block_list = get_proto('RemoteFortressReader.BlockList')()
+        block_list.ParseFromString(self._read(self.index['z'][str(z)][2:]))
+        return block_list
+
+    def read_volume(self, column, z_min=None, z_max=None):
+        """
+        :return: [z, y, x] array of one column for z-levels z_min <= z < z_max, missing z-levels are zero
+        """
+        z_min = 0 if z_min is None else z_min
+        z_max = self.shape[0] if z_max is None else z_max
+        dtype = dict(self.columns)[column]
+        volume = np.zeros((z_max - z_min,) + self.shape[1:], dtype=dtype)
+        for z in self.z_levels:
+            if z_min <= z < z_max:
+                volume[z - z_min] = self.read_z(z, [column])[column]
+        return volume
+
+
+def capture_snapshot(rpc, path, fields=None, blocks_needed=1000000, compression_level=3):
+    """
+    Reads fortress state via RPC and writes it to snapshot file
+    :param rpc: DFHackRPC instance with bound RemoteFortressReader methods
+    :param path: file path
+    :param fields: per-tile MapBlock fields stored as columns
+    :param blocks_needed: max number of blocks requested with GetBlockList
+    """
+    names = sorted(SNAPSHOT_METHODS)
+    calls = [(SNAPSHOT_METHODS[name], None) for name in names] + [('ResetMapHashes', None)]
+    messages = dict(zip(names, [resp for resp, _ in rpc.call_methods(calls)]))
+    map_info = messages['map_info']
+
+    block_request = rpc.get_proto('RemoteFortressReader.BlockRequest')(
+        blocks_needed=blocks_needed,
+        min_x=0, max_x=map_info.block_size_x,
+        min_y=0, max_y=map_info.block_size_y,
+        min_z=0, max_z=map_info.block_size_z,
+    )
+    block_list, _ = rpc.call_method('GetBlockList', block_request)
+    plant_list, _ = rpc.call_method('GetPlantList', block_request)
+    messages['plants'] = plant_list
+
+    with SnapshotWriter(path, map_info, fields, compression_level) as writer:
+        for name in sorted(messages):
+            if name != 'map_info':
+                writer.write_message(name, messages[name])
+        writer.write_blocks(block_list.map_blocks)
+
+    _logger.info('Snapshot of {} blocks written to {}'.format(len(block_list.map_blocks), path))
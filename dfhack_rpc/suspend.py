@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+"""
+Consistent reads of several methods while DF is suspended.
+
+    with rpc.suspended() as batch:
+        blocks = batch.call('GetBlockList', block_request)
+        units = batch.call('GetUnitList')
+        plants = batch.call('GetPlantList', block_request)
+
+    block_list, _ = blocks.result()
+
+Calls are queued and sent on exit from the with block as one write: CoreSuspend, the calls, CoreResume.
+DF is suspended only while DFHack processes them, all of them see the same tick.
+
+batch.flush() sends queued calls earlier (preceded by CoreSuspend when it's the first write), when results
+are needed to decide about next calls. DF stays suspended until the with block ends.
+
+DF is always resumed: on exception in the with block CoreResume is sent, and if that fails or DFHack
+doesn't answer, connection is dropped. DFHack resumes all suspends of a connection when it's closed.
+
+If the connection is reopened after CoreSuspend (eg. calls were retried by retry policy after a broken
+connection), the calls weren't made in suspended DF anymore: their results are replaced with
+RPCConnectionError, which is also raised.
+"""
+from .exceptions import RPCError, RPCConnectionError
+
+import logging
+
+_logger = logging.getLogger(__name__)
+
+SUSPEND_METHODS = ['CoreSuspend', 'CoreResume']
+
+
+class PendingCall(object):
+    """
+    Result of a call queued in SuspendedBatch
+    """
+
+    def __init__(self, method, data_obj=None):
+        self.method = method
+        self.data_obj = data_obj
+        self.done = False
+        self.value = None  # (resp_obj, resp_text) or exception
+
+    def set(self, value):
+        self.value = value
+        self.done = True
+
+    def result(self):
+        """
+        :return: (resp_obj, resp_text), raises exception of failed call
+        """
+        if not self.done:
+            raise RPCError('Call was not sent yet, use result() after the with block or batch.flush()', self.method)
+        if isinstance(self.value, Exception):
+            raise self.value
+        return self.value
+
+
+class SuspendedBatch(object):
+    """
+    Calls sent while DF is suspended, see DFHackRPC.suspended
+    """
+
+    def __init__(self, rpc):
+        self.rpc = rpc
+        self.queue = []
+        self.suspended = False  # CoreSuspend was sent
+        self.connection_number = None  # DFHackRPC.connection_number of connection which sent CoreSuspend
+
+    def call(self, method, data_obj=None):
+        """
+        Queues call
+        :return: PendingCall
+        """
+        pending = PendingCall(method, data_obj)
+        self.queue.append(pending)
+        return pending
+
+    def _send(self, resume):
+        """
+        Sends queued calls with one write, preceded by CoreSuspend if it wasn't sent yet and followed by CoreResume
+        if resume is set
+        """
+        pending, self.queue = self.queue, []
+        calls = [(call.method, call.data_obj) for call in pending]
+        suspend = not self.suspended
+        if suspend:
+            calls.insert(0, ('CoreSuspend', None))
+        if resume:
+            calls.append(('CoreResume', None))
+        if not calls:
+            return
+
+        try:
+            if suspend:
+                self.rpc.ensure_connection()
+                self.connection_number = self.rpc.connection_number
+            results = self.rpc.call_methods(calls, return_exceptions=True)
+        except Exception as e:
+            # connection was dropped, which resumes DF
+            for call in pending:
+                call.set(e)
+            self.suspended = False
+            raise
+
+        if (suspend or self.suspended) and self.rpc.connection_number != self.connection_number:
+            # connection was reopened, DFHack resumed DF when the suspending connection was closed
+            error = RPCConnectionError('Connection was reopened while DF was suspended, suspend was lost')
+            for call in pending:
+                call.set(error)
+            self.suspended = False
+            raise error
+
+        if suspend:
+            suspend_result = results.pop(0)
+            self.suspended = not isinstance(suspend_result, Exception)
+        if resume:
+            resume_result = results.pop()
+            if self.suspended and isinstance(resume_result, Exception):
+                _logger.warning('CoreResume failed ({}), dropping connection to resume DF'.format(resume_result))
+                self.rpc.drop_connection()
+            self.suspended = False
+
+        for call, result in zip(pending, results):
+            call.set(result)
+
+        if suspend and isinstance(suspend_result, Exception):
+            raise suspend_result
+
+    def flush(self):
+        """
+        Sends queued calls now, DF stays suspended
+        """
+        self._send(resume=False)
+
+    def finish(self):
+        """
+        Sends queued calls and resumes DF
+        """
+        self._send(resume=True)
+
+    def abort(self):
+        """
+        Drops queued calls and resumes DF if it was suspended by flush
+        """
+        for call in self.queue:
+            call.set(RPCError('Suspended batch was aborted', call.method))
+        self.queue = []
+        if not self.suspended:
+            return
+
+        self.suspended = False
+        try:
+            self.rpc.call_method('CoreResume')
+        except Exception as e:
+            _logger.warning('CoreResume failed ({}), dropping connection to resume DF'.format(e))
+            self.rpc.drop_connection()
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+"""
+Instrumentation of DFHackRPC method calls.
+
+Every method call produces CallTrace, which is passed to all hooks registered with DFHackRPC.add_hook.
+Hooks are objects with on_call(trace) method, see RPCHook. StatsHook is registered by default and
+its snapshot is returned by DFHackRPC.stats().
+"""
+import threading
+import logging
+
+_logger = logging.getLogger(__name__)
+
+
+class CallTrace(object):
+    """
+    Measurements of one method call. Times are in seconds.
+
+    network_time is measured from sending the request (pipelined requests are sent together) until
+    the last reply message of this call is received, so it contains waiting for DF and for the network.
+    """
+
+    __slots__ = [
+        'method', 'request', 'reply', 'start_time', 'request_bytes', 'response_bytes', 'serialize_time',
+        'network_time', 'parse_time', 'text_frames', 'error',
+    ]
+
+    def __init__(self, method, request, start_time, serialize_time):
+        self.method = method
+        self.request = request  # serialized request without message header
+        self.reply = []  # reply messages
+        self.start_time = start_time
+        self.request_bytes = len(request) + 8
+        self.response_bytes = 0
+        self.serialize_time = serialize_time
+        self.network_time = 0.0
+        self.parse_time = 0.0
+        self.text_frames = 0
+        self.error = None
+
+    @property
+    def total_time(self):
+        return self.serialize_time + self.network_time + self.parse_time
+
+
+class RPCHook(object):
+    """
+    Base class of call hooks
+    """
+
+    def on_call(self, trace):
+        """
+        Called after every method call, also when the call failed (trace.error is set)
+        :param trace: CallTrace
+        """
+        pass
+
+
+class LatencyHistogram(object):
+    """
+    HDR-style histogram of latencies with microsecond resolution.
+
+    Values are stored in log-linear buckets: every power of two range is split into 2 ** (sub_bits - 1)
+    buckets, so relative error of reported percentiles is below 2 ** (1 - sub_bits) (3% for default).
+    """
+
+    def __init__(self, sub_bits=6):
+        self.sub_bits = sub_bits
+        self.counts = {}
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def _bucket(self, value):
+        shift = max(value.bit_length() - self.sub_bits, 0)
+        return (shift << self.sub_bits) + (value >> shift)
+
+    def _bucket_max(self, bucket):
+        shift = bucket >> self.sub_bits
+        mantissa = bucket & ((1 << self.sub_bits) - 1)
+        return ((mantissa + 1) << shift) - 1
+
+    def record(self, seconds):
+        bucket = self._bucket(int(seconds * 1000000))
+        self.counts[bucket] = self.counts.get(bucket, 0) + 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def percentile(self, percent):
+        """
+        :param percent: 0-100
+        :return: latency in seconds, upper bound of bucket containing the percentile
+        """
+        if not self.count:
+            return 0.0
+        wanted = percent / 100.0 * self.count
+        seen = 0
+        for bucket in sorted(self.counts):
+            seen += self.counts[bucket]
+            if seen >= wanted:
+                return min(self._bucket_max(bucket) / 1000000.0, self.max)
+        return self.max
+
+    def snapshot(self):
+        return {
+            'count': self.count,
+            'mean': self.total / self.count if self.count else 0.0,
+            'p50': self.percentile(50),
+            'p90': self.percentile(90),
+            'p99': self.percentile(99),
+            'p999': self.percentile(99.9),
+            'max': self.max,
+        }
+
+
+class MethodStats(object):
+    """
+    Aggregated measurements of one method
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.text_frames = 0
+        self.serialize_time = 0.0
+        self.network_time = 0.0
+        self.parse_time = 0.0
+        self.latency = LatencyHistogram()
+        self.network_latency = LatencyHistogram()
+
+    def add(self, trace):
+        self.calls += 1
+        self.errors += trace.error is not None
+        self.request_bytes += trace.request_bytes
+        self.response_bytes += trace.response_bytes
+        self.text_frames += trace.text_frames
+        self.serialize_time += trace.serialize_time
+        self.network_time += trace.network_time
+        self.parse_time += trace.parse_time
+        self.latency.record(trace.total_time)
+        self.network_latency.record(trace.network_time)
+
+    def snapshot(self):
+        return {
+            'calls': self.calls,
+            'errors': self.errors,
+            'request_bytes': self.request_bytes,
+            'response_bytes': self.response_bytes,
+            'text_frames': self.text_frames,
+            'serialize_time': self.serialize_time,
+            'network_time': self.network_time,
+            'parse_time': self.parse_time,
+            'latency': self.latency.snapshot(),
+            'network_latency': self.network_latency.snapshot(),
+        }
+
+
+class StatsHook(RPCHook):
+    """
+    Collects per-method statistics and latency histograms
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.methods = {}
+
+    def on_call(self, trace):
+        with self.lock:
+            if trace.method not in self.methods:
+                self.methods[trace.method] = MethodStats()
+            self.methods[trace.method].add(trace)
+
+    def snapshot(self):
+        """
+        :return: {method: stats dict}
+        """
+        with self.lock:
+            return {method: stats.snapshot() for method, stats in self.methods.items()}
+
+    def reset(self):
+        with self.lock:
+            self.methods = {}
+
+
+class LoggingHook(RPCHook):
+    """
+    Logs every call at debug level
+    """
+
+    def __init__(self, logger=None):
+        self.logger = logger or _logger
+
+    def on_call(self, trace):
+        self.logger.debug(
+            '{} req={}B resp={}B serialize={:.6f}s network={:.6f}s parse={:.6f}s text={}{}'.format(
+                trace.method, trace.request_bytes, trace.response_bytes, trace.serialize_time,
+                trace.network_time, trace.parse_time, trace.text_frames,
+                ' error={}'.format(trace.error) if trace.error else '',
+            )
+        )
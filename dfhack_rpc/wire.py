@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+"""
+Minimal protobuf wire format reader.
+
+Used to look into serialized messages (find offsets of repeated sub-messages, read a single
+field of a sub-message) without decoding whole messages with protobuf.
+
+https://developers.google.com/protocol-buffers/docs/encoding
+"""
+
+WIRE_VARINT = 0
+WIRE_FIXED64 = 1
+WIRE_LENGTH_DELIMITED = 2
+WIRE_FIXED32 = 5
+
+
+def decode_varint(data, pos=0):
+    """
+    :param data: binary string
+    :param pos: offset of varint in data
+    :return: (value, offset after varint)
+    """
+    result = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7f) << shift
+        if not byte & 0x80:
+            return result, pos
+        shift += 7
+
+
+def decode_signed(value, bits=32):
+    """
+    Converts varint decoded from int32/int64 field to signed value
+    """
+    if value >= 1 << 63:
+        value -= 1 << 64
+    if bits == 32 and value >= 1 << 31:
+        value -= 1 << 32
+    return value
+
+
+def skip_field(data, pos, wire_type):
+    """
+    :return: offset after value of field with given wire type, which starts at pos
+    """
+    if wire_type == WIRE_VARINT:
+        while data[pos] & 0x80:
+            pos += 1
+        return pos + 1
+    elif wire_type == WIRE_FIXED64:
+        return pos + 8
+    elif wire_type == WIRE_LENGTH_DELIMITED:
+        size, pos = decode_varint(data, pos)
+        return pos + size
+    elif wire_type == WIRE_FIXED32:
+        return pos + 4
+    raise Exception('Unsupported wire type {}'.format(wire_type))
+
+
+def iter_fields(data, start=0, end=None):
+    """
+    Iterates over fields of serialized message.
+    :param data: binary string
+    :param start: start offset of message in data
+    :param end: end offset of message in data
+    :return: generator of (field_number, wire_type, value_start, value_end),
+        for length-delimited fields value_start/value_end are offsets of the payload
+    """
+    pos = start
+    end = len(data) if end is None else end
+    while pos < end:
+        key, pos = decode_varint(data, pos)
+        field_number, wire_type = key >> 3, key & 0x07
+        if wire_type == WIRE_LENGTH_DELIMITED:
+            size, pos = decode_varint(data, pos)
+            yield field_number, wire_type, pos, pos + size
+            pos += size
+        else:
+            value_end = skip_field(data, pos, wire_type)
+            yield field_number, wire_type, pos, value_end
+            pos = value_end
+
+
+def submessage_offsets(data, field_number, start=0, end=None):
+    """
+    :return: list of (start, end) offsets of every sub-message stored in given (repeated) field
+    """
+    return [
+        (value_start, value_end)
+        for number, wire_type, value_start, value_end in iter_fields(data, start, end)
+        if number == field_number and wire_type == WIRE_LENGTH_DELIMITED
+    ]
+
+
+def read_varint_field(data, field_number, start=0, end=None, default=None):
+    """
+    :return: value of the last varint field with given number in message, or default if missing
+    """
+    value = default
+    for number, wire_type, value_start, _ in iter_fields(data, start, end):
+        if number == field_number and wire_type == WIRE_VARINT:
+            value, _ = decode_varint(data, value_start)
+    return value